@@ -0,0 +1,32 @@
+"""add google_folders.changes_page_token
+
+Stores the Drive Changes API page token per folder, so incremental syncs
+only touch files that changed since the last run. Nullable: existing
+folders do one listing-based sync to obtain a token.
+
+Revision ID: 20260710_google_folder_changes_token
+Revises: 20260702_session_segments
+Create Date: 2026-07-10
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260710_google_folder_changes_token"
+down_revision: Union[str, None] = "20260702_session_segments"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "google_folders",
+        sa.Column("changes_page_token", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("google_folders", "changes_page_token")
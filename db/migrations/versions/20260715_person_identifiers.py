@@ -0,0 +1,76 @@
+"""add person_identifiers lookup table
+
+Normalized (kind, workspace, lowercased value) -> person_id keys for
+display names, aliases, emails, Slack user ids and GitHub logins, so
+Person lookups are primary-key probes instead of table scans. Backfilled
+from the existing people rows; kept in sync by an ORM flush listener.
+
+Revision ID: 20260715_person_identifiers
+Revises: 20260710_google_folder_changes_token
+Create Date: 2026-07-15
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260715_person_identifiers"
+down_revision: Union[str, None] = "20260710_google_folder_changes_token"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BACKFILL = """
+INSERT INTO person_identifiers (kind, workspace, value, person_id)
+SELECT DISTINCT kind, workspace, value, person_id FROM (
+    SELECT 'name' AS kind, '' AS workspace,
+           lower(btrim(display_name)) AS value, id AS person_id
+    FROM people
+    UNION ALL
+    SELECT 'alias', '', lower(btrim(alias)), id
+    FROM people, unnest(aliases) AS alias
+    UNION ALL
+    SELECT 'email', '', lower(btrim(contact_info->>'email')), id
+    FROM people WHERE jsonb_typeof(contact_info->'email') = 'string'
+    UNION ALL
+    SELECT 'email', '', lower(btrim(email)), id
+    FROM people, jsonb_array_elements_text(contact_info->'email') AS email
+    WHERE jsonb_typeof(contact_info->'email') = 'array'
+    UNION ALL
+    SELECT 'github', '', lower(btrim(contact_info->>'github')), id
+    FROM people WHERE jsonb_typeof(contact_info->'github') = 'string'
+    UNION ALL
+    SELECT 'github', '', lower(btrim(login)), id
+    FROM people, jsonb_array_elements_text(contact_info->'github') AS login
+    WHERE jsonb_typeof(contact_info->'github') = 'array'
+    UNION ALL
+    SELECT 'slack', ws.key, lower(btrim(ws.value->>'user_id')), id
+    FROM people, jsonb_each(contact_info->'slack') AS ws
+    WHERE jsonb_typeof(contact_info->'slack') = 'object'
+      AND jsonb_typeof(ws.value) = 'object'
+) AS keys
+WHERE value IS NOT NULL AND value <> ''
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        "person_identifiers",
+        sa.Column("kind", sa.String(20), nullable=False),
+        sa.Column("workspace", sa.Text(), nullable=False, server_default=""),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("person_id", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["person_id"], ["people.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("kind", "workspace", "value", "person_id"),
+    )
+    op.create_index(
+        "person_identifiers_person_idx", "person_identifiers", ["person_id"]
+    )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    op.drop_index("person_identifiers_person_idx", table_name="person_identifiers")
+    op.drop_table("person_identifiers")
@@ -0,0 +1,48 @@
+"""add blog_post.normalized_url
+
+The key feed and archive syncs deduplicate new articles against, one
+indexed ``IN`` query per page of feed items. Backfilled from the existing
+urls; kept in sync by a validator on ``BlogPost.url``.
+
+Revision ID: 20260720_blog_post_normalized_url
+Revises: 20260715_person_identifiers
+Create Date: 2026-07-20
+
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20260720_blog_post_normalized_url"
+down_revision: Union[str, None] = "20260715_person_identifiers"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Only available at runtime
+    from memory.common.downloads import normalize_article_url
+
+    op.add_column("blog_post", sa.Column("normalized_url", sa.Text(), nullable=True))
+
+    connection = op.get_bind()
+    rows = connection.execute(
+        sa.text("SELECT id, url FROM blog_post WHERE url IS NOT NULL")
+    ).fetchall()
+    updates = [{"id": row.id, "url": normalize_article_url(row.url)} for row in rows]
+    if updates:
+        connection.execute(
+            sa.text("UPDATE blog_post SET normalized_url = :url WHERE id = :id"),
+            updates,
+        )
+
+    op.create_index(
+        "blog_post_normalized_url_idx", "blog_post", ["normalized_url"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("blog_post_normalized_url_idx", table_name="blog_post")
+    op.drop_column("blog_post", "normalized_url")
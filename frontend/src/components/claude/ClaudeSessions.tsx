@@ -23,8 +23,9 @@ const GITHUB_TOKEN_STORAGE_KEY = 'claude_session_github_token'
 const GITHUB_TOKEN_WRITE_STORAGE_KEY = 'claude_session_github_token_write'
 
 interface ScreenMessage {
-  type: 'screen' | 'error' | 'status' | 'panes'
+  type: 'screen' | 'screen_diff' | 'error' | 'status' | 'panes'
   data: string
+  changes?: [number, string][]
   timestamp: string
   cols?: number
   rows?: number
@@ -111,6 +112,8 @@ const ClaudeSessions = () => {
   const [wsConnected, setWsConnected] = useState(false)
   const [wsError, setWsError] = useState<string | null>(null)
   const wsRef = useRef<WebSocket | null>(null)
+  // Rows of the live screen, which screen_diff messages patch in place
+  const screenRowsRef = useRef<string[]>([])
 
   // Pane state
   const [paneCount, setPaneCount] = useState(1)
@@ -284,6 +287,7 @@ const ClaudeSessions = () => {
     }
 
     setScreenContent('')
+    screenRowsRef.current = []
     setWsError(null)
     setPaneCount(1)
     setActivePane('')
@@ -302,11 +306,20 @@ const ClaudeSessions = () => {
       try {
         const msg: ScreenMessage = JSON.parse(event.data)
         if (msg.type === 'screen') {
+          screenRowsRef.current = msg.data.split('\n')
           setScreenContent(msg.data)
           setScrollOffset(msg.scrolled || 0)
           // TCP relay includes pane_count with every capture
           if (msg.pane_count !== undefined) setPaneCount(msg.pane_count)
           if (msg.pane !== undefined) setActivePane(msg.pane)
+        } else if (msg.type === 'screen_diff') {
+          const rows = [...screenRowsRef.current]
+          for (const [index, row] of msg.changes || []) rows[index] = row
+          screenRowsRef.current = rows
+          setScreenContent(rows.join('\n'))
+          setScrollOffset(0)
+          if (msg.pane_count !== undefined) setPaneCount(msg.pane_count)
+          if (msg.pane !== undefined) setActivePane(msg.pane)
         } else if (msg.type === 'panes') {
           // Pane list update from the pane polling loop
           setPaneCount(msg.pane_count || 1)
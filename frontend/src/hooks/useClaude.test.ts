@@ -50,6 +50,7 @@ describe('getLogStreamUrl', () => {
     const url = getLogStreamUrl('sess-1')
     expect(url).toContain('/claude/sess-1/logs/stream?token=')
     expect(url).toContain('token=test-access-token')
+    expect(url).toContain('diff=1')
     expect(url?.startsWith('ws')).toBe(true)
   })
 
@@ -33,7 +33,8 @@ export const getLogStreamUrl = (sessionId: string): string | null => {
   // Convert http(s):// to ws(s)://
   const baseUrl = SERVER_URL || window.location.origin
   const wsUrl = baseUrl.replace(/^http/, 'ws')
-  return `${wsUrl}/claude/${sessionId}/logs/stream?token=${encodeURIComponent(token)}`
+  // diff=1: after the first full frame, only changed rows are sent
+  return `${wsUrl}/claude/${sessionId}/logs/stream?token=${encodeURIComponent(token)}&diff=1`
 }
 
 export interface DifferInfo {
@@ -18,13 +18,16 @@ from memory.common.dates import parse_iso_datetime
 from memory.common.db.connection import make_session
 from memory.common.db.models import UserSession, WatchedMarket
 from memory.common.markets import (
+    KALSHI_API_URL,
+    MANIFOLD_API_URL,
     MarketSource,
     cache_key,
+    cached_depth,
+    cached_history,
+    cached_search,
     clear_all_caches,
     compare_forecasts_data,
     fetch_market_info,
-    get_cached_depth,
-    get_cached_history,
     get_kalshi_history,
     get_kalshi_resolved,
     get_manifold_history,
@@ -32,10 +35,6 @@ from memory.common.markets import (
     get_polymarket_history,
     get_polymarket_resolved,
     search_markets,
-    set_cached_depth,
-    set_cached_history,
-    get_cached_search,
-    set_cached_search,
 )
 from memory.api.MCP.visibility import require_scopes, visible_when
 from memory.common.scopes import SCOPE_FORECAST, SCOPE_FORECAST_WRITE, has_scope
@@ -91,15 +90,10 @@ async def get_forecasts(
     if not _check_forecast_scope():
         return [{"error": "Missing 'forecast' scope"}]
 
-    # Check cache first
     key = cache_key("search", term, str(min_volume), str(binary), str(sources))
-    cached = get_cached_search(key)
-    if cached is not None:
-        return cached
-
-    results = await search_markets(term, min_volume, binary, sources)
-    set_cached_search(key, results)
-    return results
+    return await cached_search(
+        key, lambda: search_markets(term, min_volume, binary, sources)
+    )
 
 
 @forecast_mcp.tool()
@@ -122,38 +116,10 @@ async def clear_cache() -> dict:
 # --- History Tools ---
 
 
-@forecast_mcp.tool()
-@visible_when(require_scopes(SCOPE_FORECAST))
-async def history(
-    market_id: str,
-    source: MarketSource,
-    period: Literal["1d", "7d", "30d", "all"] = "7d",
+async def _fetch_history(
+    market_id: str, source: MarketSource, period: Literal["1d", "7d", "30d", "all"]
 ) -> dict:
-    """Get price history for a specific prediction market.
-
-    Args:
-        market_id: The market identifier (ticker for Kalshi, contract ID for others).
-        source: The prediction market source ("manifold", "polymarket", or "kalshi").
-        period: Time period for history ("1d", "7d", "30d", or "all").
-
-    Returns:
-        Dict with market_id, source, history (list of timestamp/probability/volume),
-        current price, and price changes (24h, 7d).
-
-    Source-specific notes:
-        - **Manifold**: Reliable history via bet aggregation. Good for all periods.
-        - **Kalshi**: Reliable history via candlestick API. Good for all periods.
-        - **Polymarket**: History often unavailable (requires auth). Returns empty
-          history in most cases. Use Manifold/Kalshi for historical analysis.
-    """
-    if not _check_forecast_scope():
-        return {"error": "Missing 'forecast' scope"}
-
-    key = cache_key("history", market_id, source, period)
-    cached = get_cached_history(key)
-    if cached is not None:
-        return cached
-
+    """Fetch price history and recent price changes for a market."""
     days_map = {"1d": 1, "7d": 7, "30d": 30, "all": 365}
     days = days_map.get(period, 7)
 
@@ -165,7 +131,7 @@ async def history(
         # Get current question
         async with aiohttp.ClientSession() as session:
             async with session.get(
-                f"https://api.manifold.markets/v0/market/{market_id}"
+                f"{MANIFOLD_API_URL}/market/{market_id}"
             ) as resp:
                 if resp.status == 200:
                     market = await resp.json()
@@ -175,7 +141,7 @@ async def history(
         # Get current question
         async with aiohttp.ClientSession() as session:
             async with session.get(
-                f"https://api.elections.kalshi.com/trade-api/v2/markets/{market_id}"
+                f"{KALSHI_API_URL}/markets/{market_id}"
             ) as resp:
                 if resp.status == 200:
                     data = await resp.json()
@@ -217,7 +183,7 @@ async def history(
             except (ValueError, TypeError, OSError):
                 continue
 
-    result = {
+    return {
         "market_id": market_id,
         "source": source,
         "question": question,
@@ -227,49 +193,48 @@ async def history(
         "change_7d": change_7d,
     }
 
-    set_cached_history(key, result)
-    return result
-
-
-# --- Depth Tools ---
-
 
 @forecast_mcp.tool()
 @visible_when(require_scopes(SCOPE_FORECAST))
-async def get_market_depth(
+async def history(
     market_id: str,
-    source: MarketSource = "kalshi",
+    source: MarketSource,
+    period: Literal["1d", "7d", "30d", "all"] = "7d",
 ) -> dict:
-    """Get order book depth for a prediction market.
-
-    Currently only Kalshi is supported (has public order book API).
-    Manifold uses an AMM (no order book). Polymarket's CLOB requires auth.
+    """Get price history for a specific prediction market.
 
     Args:
-        market_id: The market ticker (e.g., "TRUMP-WIN-2024").
-        source: The prediction market source. Only "kalshi" is currently supported.
+        market_id: The market identifier (ticker for Kalshi, contract ID for others).
+        source: The prediction market source ("manifold", "polymarket", or "kalshi").
+        period: Time period for history ("1d", "7d", "30d", or "all").
 
     Returns:
-        Dict with order book data: yes_bids, no_bids, spread, midpoint, depth_at_1pct.
+        Dict with market_id, source, history (list of timestamp/probability/volume),
+        current price, and price changes (24h, 7d).
+
+    Source-specific notes:
+        - **Manifold**: Reliable history via bet aggregation. Good for all periods.
+        - **Kalshi**: Reliable history via candlestick API. Good for all periods.
+        - **Polymarket**: History often unavailable (requires auth). Returns empty
+          history in most cases. Use Manifold/Kalshi for historical analysis.
     """
     if not _check_forecast_scope():
         return {"error": "Missing 'forecast' scope"}
 
-    if source != "kalshi":
-        return {
-            "error": f"Order book not available for {source}. Only Kalshi is supported.",
-            "market_id": market_id,
-            "source": source,
-        }
+    key = cache_key("history", market_id, source, period)
+    return await cached_history(
+        key, lambda: _fetch_history(market_id, source, period)
+    )
+
+
+# --- Depth Tools ---
 
-    key = cache_key("depth", market_id, source)
-    cached = get_cached_depth(key)
-    if cached is not None:
-        return cached
 
+async def _fetch_market_depth(market_id: str, source: MarketSource) -> dict:
+    """Fetch and summarise a Kalshi order book."""
     async with aiohttp.ClientSession() as session:
         async with session.get(
-            f"https://api.elections.kalshi.com/trade-api/v2/markets/{market_id}/orderbook"
+            f"{KALSHI_API_URL}/markets/{market_id}/orderbook"
         ) as resp:
             if resp.status != 200:
                 return {
@@ -321,7 +286,7 @@ async def get_market_depth(
             if lower <= implied_yes <= upper:
                 depth_at_1pct += bid["quantity"]
 
-    result = {
+    return {
         "market_id": market_id,
         "source": source,
         "yes_bids": yes_bids[:10],  # Top 10 levels
@@ -331,8 +296,37 @@ async def get_market_depth(
         "depth_at_1pct": depth_at_1pct,
     }
 
-    set_cached_depth(key, result)
-    return result
+
+@forecast_mcp.tool()
+@visible_when(require_scopes(SCOPE_FORECAST))
+async def get_market_depth(
+    market_id: str,
+    source: MarketSource = "kalshi",
+) -> dict:
+    """Get order book depth for a prediction market.
+
+    Currently only Kalshi is supported (has public order book API).
+    Manifold uses an AMM (no order book). Polymarket's CLOB requires auth.
+
+    Args:
+        market_id: The market ticker (e.g., "TRUMP-WIN-2024").
+        source: The prediction market source. Only "kalshi" is currently supported.
+
+    Returns:
+        Dict with order book data: yes_bids, no_bids, spread, midpoint, depth_at_1pct.
+    """
+    if not _check_forecast_scope():
+        return {"error": "Missing 'forecast' scope"}
+
+    if source != "kalshi":
+        return {
+            "error": f"Order book not available for {source}. Only Kalshi is supported.",
+            "market_id": market_id,
+            "source": source,
+        }
+
+    key = cache_key("depth", market_id, source)
+    return await cached_depth(key, lambda: _fetch_market_depth(market_id, source))
 
 
 # --- Analysis Tools ---
@@ -5,9 +5,10 @@ from datetime import datetime, timezone
 from typing import Any
 
 from fastmcp import FastMCP
-from sqlalchemy import Text, or_, text
+from sqlalchemy import Text, case, literal, or_, select, text, tuple_
 from sqlalchemy import cast as sql_cast
 from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 from memory.api.MCP.access import (
@@ -18,7 +19,7 @@ from memory.api.MCP.access import (
     require_project_membership,
 )
 from memory.api.MCP.visibility import require_scopes, visible_when
-from memory.common import settings
+from memory.common import qdrant, settings
 from memory.common.scopes import SCOPE_ADMIN, SCOPE_PEOPLE, SCOPE_PEOPLE_WRITE
 from memory.common.access_control import (
     get_accessible_project_ids,
@@ -40,7 +41,7 @@ from memory.common.db.models import (
 )
 from memory.common.db.models.discord import DiscordUser
 from memory.common.db.models.polls import PollResponse
-from memory.common.db.models.source_item import source_item_people
+from memory.common.db.models.source_item import Chunk, source_item_people
 from memory.common.db.models.sources import GithubUser
 
 logger = logging.getLogger(__name__)
@@ -697,164 +698,180 @@ def merge_contact_info(primary: Person, secondaries: list[Person]) -> None:
     primary.contact_info = merged_contact
 
 
+def _ids(people: list[Person]) -> list[int]:
+    return [p.id for p in people]
+
+
 def merge_tidbits(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
     """Move all tidbits from secondaries to primary. Returns count moved."""
-    total = 0
-    for sec in secondaries:
-        total += (
-            session.query(PersonTidbit)
-            .filter(PersonTidbit.person_id == sec.id)
-            .update({PersonTidbit.person_id: primary.id})
-        )
-    return total
+    return (
+        session.query(PersonTidbit)
+        .filter(PersonTidbit.person_id.in_(_ids(secondaries)))
+        .update({PersonTidbit.person_id: primary.id})
+    )
 
 
 ROLE_PRIORITY = {"admin": 3, "lead": 2, "member": 1}
 
 
 def merge_team_memberships(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
-    """Move team memberships, keeping the highest role per team. Returns count moved."""
-    total = 0
-    for sec in secondaries:
-        sec_memberships = session.execute(
-            team_members.select().where(team_members.c.person_id == sec.id)
-        ).fetchall()
-
-        for membership in sec_memberships:
-            team_id = membership.team_id
-            sec_role = membership.role
-
-            existing = session.execute(
-                team_members.select().where(
-                    team_members.c.team_id == team_id,
-                    team_members.c.person_id == primary.id,
-                )
-            ).fetchone()
-
-            if existing:
-                if ROLE_PRIORITY.get(sec_role, 0) > ROLE_PRIORITY.get(existing.role, 0):
-                    session.execute(
-                        team_members.update()
-                        .where(
-                            team_members.c.team_id == team_id,
-                            team_members.c.person_id == primary.id,
-                        )
-                        .values(role=sec_role)
-                    )
-                session.execute(
-                    team_members.delete().where(
-                        team_members.c.team_id == team_id,
-                        team_members.c.person_id == sec.id,
-                    )
-                )
-            else:
-                session.execute(
-                    team_members.update()
-                    .where(
-                        team_members.c.team_id == team_id,
-                        team_members.c.person_id == sec.id,
-                    )
-                    .values(person_id=primary.id)
-                )
-            total += 1
-    return total
+    """Move team memberships, keeping the highest role per team. Returns count moved.
+
+    Per team, the primary's membership is kept if it has one, otherwise the
+    first secondary's (in merge order) is moved to the primary. It gets the
+    highest role of them all, ties going to the earlier membership.
+    """
+    order = {person_id: i for i, person_id in enumerate([primary.id, *_ids(secondaries)])}
+    memberships = session.execute(
+        select(team_members.c.team_id, team_members.c.person_id, team_members.c.role)
+        .where(team_members.c.person_id.in_(list(order)))
+    ).fetchall()
+
+    kept: dict[int, tuple[int, str]] = {}  # team_id -> (person_id, role)
+    best_role: dict[int, str] = {}
+    for membership in sorted(memberships, key=lambda m: order[m.person_id]):
+        team_id = membership.team_id
+        if team_id not in kept:
+            kept[team_id] = (membership.person_id, membership.role)
+            best_role[team_id] = membership.role
+        elif ROLE_PRIORITY.get(membership.role, 0) > ROLE_PRIORITY.get(best_role[team_id], 0):
+            best_role[team_id] = membership.role
+
+    kept_rows = [(team_id, person_id) for team_id, (person_id, _) in kept.items()]
+    session.execute(
+        team_members.delete().where(
+            team_members.c.person_id.in_(_ids(secondaries)),
+            tuple_(team_members.c.team_id, team_members.c.person_id).not_in(kept_rows),
+        )
+        if kept_rows
+        else team_members.delete().where(team_members.c.person_id.in_(_ids(secondaries)))
+    )
+
+    changed = [
+        (team_id, person_id)
+        for team_id, (person_id, role) in kept.items()
+        if person_id != primary.id or role != best_role[team_id]
+    ]
+    if changed:
+        session.execute(
+            team_members.update()
+            .where(tuple_(team_members.c.team_id, team_members.c.person_id).in_(changed))
+            .values(
+                person_id=primary.id,
+                role=case(best_role, value=team_members.c.team_id),
+            )
+        )
+
+    return sum(1 for m in memberships if m.person_id != primary.id)
 
 
 def merge_source_items(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
     """Move source_item associations, deduplicating. Returns count moved."""
-    total = 0
-    for sec in secondaries:
-        sec_items = session.execute(
-            source_item_people.select().where(source_item_people.c.person_id == sec.id)
-        ).fetchall()
-
-        for item in sec_items:
-            source_item_id = item.source_item_id
-            existing = session.execute(
-                source_item_people.select().where(
-                    source_item_people.c.source_item_id == source_item_id,
-                    source_item_people.c.person_id == primary.id,
-                )
-            ).fetchone()
-
-            if existing:
-                session.execute(
-                    source_item_people.delete().where(
-                        source_item_people.c.source_item_id == source_item_id,
-                        source_item_people.c.person_id == sec.id,
-                    )
-                )
-            else:
-                session.execute(
-                    source_item_people.update()
-                    .where(
-                        source_item_people.c.source_item_id == source_item_id,
-                        source_item_people.c.person_id == sec.id,
-                    )
-                    .values(person_id=primary.id)
-                )
-            total += 1
-    return total
+    secondary_links = select(source_item_people.c.source_item_id).where(
+        source_item_people.c.person_id.in_(_ids(secondaries))
+    )
+    session.execute(
+        pg_insert(source_item_people)
+        .from_select(
+            ["source_item_id", "person_id"],
+            secondary_links.add_columns(literal(primary.id)).distinct(),
+        )
+        .on_conflict_do_nothing()
+    )
+    return session.execute(
+        source_item_people.delete().where(
+            source_item_people.c.person_id.in_(_ids(secondaries))
+        )
+    ).rowcount
 
 
 def merge_discord_users(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
     """Move Discord user links from secondaries to primary. Returns count moved."""
-    total = 0
-    for sec in secondaries:
-        total += (
-            session.query(DiscordUser)
-            .filter(DiscordUser.person_id == sec.id)
-            .update({DiscordUser.person_id: primary.id})
-        )
-    return total
+    return (
+        session.query(DiscordUser)
+        .filter(DiscordUser.person_id.in_(_ids(secondaries)))
+        .update({DiscordUser.person_id: primary.id})
+    )
 
 
 def merge_github_users(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
     """Move GitHub user links from secondaries to primary. Returns count moved."""
-    total = 0
-    for sec in secondaries:
-        total += (
-            session.query(GithubUser)
-            .filter(GithubUser.person_id == sec.id)
-            .update({GithubUser.person_id: primary.id})
-        )
-    return total
+    return (
+        session.query(GithubUser)
+        .filter(GithubUser.person_id.in_(_ids(secondaries)))
+        .update({GithubUser.person_id: primary.id})
+    )
 
 
 def merge_poll_responses(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
     """Move poll responses from secondaries to primary. Returns count moved."""
-    total = 0
-    for sec in secondaries:
-        total += (
-            session.query(PollResponse)
-            .filter(PollResponse.person_id == sec.id)
-            .update({PollResponse.person_id: primary.id})
-        )
-    return total
+    return (
+        session.query(PollResponse)
+        .filter(PollResponse.person_id.in_(_ids(secondaries)))
+        .update({PollResponse.person_id: primary.id})
+    )
 
 
 def merge_project_ownership(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
     """Transfer project ownership from secondaries to primary. Returns count moved."""
-    total = 0
-    for sec in secondaries:
-        total += (
-            session.query(Project)
-            .filter(Project.owner_id == sec.id)
-            .update({Project.owner_id: primary.id})
-        )
-    return total
+    return (
+        session.query(Project)
+        .filter(Project.owner_id.in_(_ids(secondaries)))
+        .update({Project.owner_id: primary.id})
+    )
 
 
 def merge_team_ownership(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
     """Transfer team ownership from secondaries to primary. Returns count moved."""
-    total = 0
-    for sec in secondaries:
-        total += (
-            session.query(Team)
-            .filter(Team.owner_id == sec.id)
-            .update({Team.owner_id: primary.id})
+    return (
+        session.query(Team)
+        .filter(Team.owner_id.in_(_ids(secondaries)))
+        .update({Team.owner_id: primary.id})
+    )
+
+
+def linked_source_item_ids(session: DBSession, people: list[Person]) -> list[int]:
+    """IDs of the source items associated with any of ``people``."""
+    return list(
+        session.scalars(
+            select(source_item_people.c.source_item_id)
+            .where(source_item_people.c.person_id.in_(_ids(people)))
+            .distinct()
         )
-    return total
+    )
+
+
+def sync_people_payloads(session: DBSession, item_ids: list[int]) -> int:
+    """Set the ``people`` payload of the items' chunks in Qdrant from the DB.
+
+    Chunks whose items end up with the same people are updated together,
+    so a merge costs one Qdrant call per distinct set of people (and
+    collection) rather than one per chunk. Returns the number of chunks updated.
+    """
+    if not item_ids:
+        return 0
+
+    people: dict[int, set[int]] = {item_id: set() for item_id in item_ids}
+    links = session.execute(
+        select(source_item_people.c.source_item_id, source_item_people.c.person_id)
+        .where(source_item_people.c.source_item_id.in_(item_ids))
+    )
+    for item_id, person_id in links:
+        people[item_id].add(person_id)
+
+    groups: dict[tuple[str, tuple[int, ...]], list[str]] = {}
+    chunks = session.execute(
+        select(Chunk.id, Chunk.collection_name, Chunk.source_id)
+        .where(Chunk.source_id.in_(item_ids), Chunk.collection_name.isnot(None))
+    )
+    for chunk_id, collection, item_id in chunks:
+        key = (collection, tuple(sorted(people[item_id])))
+        groups.setdefault(key, []).append(str(chunk_id))
+
+    client = qdrant.get_qdrant_client()
+    for (collection, person_ids), chunk_ids in groups.items():
+        qdrant.set_payloads(client, collection, chunk_ids, {"people": list(person_ids)})
+    return sum(len(chunk_ids) for chunk_ids in groups.values())
 
 
 def merge_user_links(session: DBSession, primary: Person, secondaries: list[Person]) -> int:
@@ -938,6 +955,10 @@ async def merge(
        - Project/team ownership
     4. Resolves User links (direct and via Discord accounts)
     5. Deletes the secondary person records
+    6. Points the people in affected chunks' search payloads at the primary
+
+    Each relationship is moved with a few bulk statements, however many
+    rows link to the people being merged.
 
     Only admins can merge people.
 
@@ -981,6 +1002,8 @@ async def merge(
         primary = people_by_id[primary_id]
         secondaries = [people_by_id[i] for i in secondary_ids]
 
+        affected_items = linked_source_item_ids(session, secondaries)
+
         merge_aliases(primary, secondaries)
         merge_contact_info(primary, secondaries)
 
@@ -1010,6 +1033,15 @@ async def merge(
 
         session.commit()
 
+        # Search filters on the people in chunk payloads, so they must stop
+        # pointing at the deleted people. The merge itself is already
+        # committed, so a failure here is only logged.
+        try:
+            stats["chunks_updated"] = sync_people_payloads(session, affected_items)
+        except Exception as e:
+            logger.error(f"Failed to update people in chunk payloads after merge: {e}")
+            stats["chunks_updated"] = 0
+
         return {
             "success": True,
             "primary": {
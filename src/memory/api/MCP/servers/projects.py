@@ -15,8 +15,8 @@ from datetime import datetime
 from typing import Any, Literal, cast
 
 from fastmcp import FastMCP
-from sqlalchemy import func
-from sqlalchemy.orm import selectinload
+from sqlalchemy import func, literal_column, or_, select
+from sqlalchemy.orm import aliased, selectinload
 
 from memory.api.MCP.access import get_mcp_current_user
 from memory.api.MCP.visibility import require_scopes, visible_when
@@ -138,6 +138,72 @@ def _creation_result_to_dict(
     return response
 
 
+def project_tree_page(
+    session, query, limit: int, offset: int, depth: int
+) -> tuple[list[dict[str, Any]], int, int]:
+    """Fetch one page of the project tree formed by the projects in ``query``.
+
+    Roots are the projects whose parent isn't in ``query``. One recursive
+    query fetches the ``limit`` roots after ``offset`` (by title) and their
+    descendants ``depth`` levels down, along with how many children each of
+    them has, so nodes at the bottom still report their children.
+
+    Children are always looked up through ``projects_parent_idx`` and then
+    checked against the visible set, rather than by scanning every visible
+    project for each node.
+
+    Returns:
+        The tree, the number of projects in it, and the total number of roots.
+    """
+    visible = query.with_entities(Project.id).cte("visible")
+    child = aliased(Project)
+    visible_parent = (
+        select(visible.c.id).where(visible.c.id == Project.parent_id).exists()
+    )
+    roots = query.filter(or_(Project.parent_id.is_(None), ~visible_parent))
+
+    page_rows = (
+        roots.with_entities(Project.id, func.count().over())
+        .order_by(Project.title, Project.id)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    if page_rows:
+        total_roots = page_rows[0][1]
+    else:
+        total_roots = roots.count() if offset else 0
+    page_ids = [project_id for project_id, _ in page_rows]
+
+    tree = (
+        select(Project.id, literal_column("0").label("depth"))
+        .where(Project.id.in_(page_ids))
+        .cte("tree", recursive=True)
+    )
+    tree = tree.union_all(
+        select(child.id, (tree.c.depth + 1).label("depth"))
+        .join(tree, child.parent_id == tree.c.id)
+        .where(child.id.in_(select(visible.c.id)), tree.c.depth < depth)
+    )
+    children_count = (
+        select(func.count())
+        .select_from(child)
+        .where(child.parent_id == Project.id, child.id.in_(select(visible.c.id)))
+        .scalar_subquery()
+    )
+
+    rows = (
+        session.query(Project, children_count)
+        .join(tree, tree.c.id == Project.id)
+        .options(selectinload(Project.repo))
+        .order_by(Project.title, Project.id)
+        .all()
+    )
+    projects = [project for project, _ in rows]
+    children_counts = {cast(int, project.id): count for project, count in rows}
+    return build_tree(projects, children_counts), len(projects), total_roots
+
+
 # ============== Project CRUD ==============
 
 
@@ -149,6 +215,7 @@ async def list_all(
     search: str | None = None,
     include_teams: bool = False,
     as_tree: bool = False,
+    tree_depth: int = 5,
     limit: int = 100,
     offset: int = 0,
 ) -> dict:
@@ -164,9 +231,13 @@ async def list_all(
         parent_id: Filter by parent (use 0 for root-level only)
         search: Filter by title (case-insensitive substring match)
         include_teams: If true, include team list for each project
-        as_tree: If true, return projects as a nested tree structure
-        limit: Maximum number of projects to return (default: 100)
-        offset: Number of projects to skip (default: 0)
+        as_tree: If true, return projects as a nested tree structure, paginated
+            by root project
+        tree_depth: Levels of descendants to include under each root in the
+            tree (default: 5). Every node has a children_count, so deeper
+            levels can be fetched with parent_id.
+        limit: Maximum number of projects (or tree roots) to return (default: 100)
+        offset: Number of projects (or tree roots) to skip (default: 0)
 
     Returns:
         List of projects with count and pagination info.
@@ -181,16 +252,6 @@ async def list_all(
         # Apply visibility filtering based on team membership
         query = filter_projects_query(session, user, query)
 
-        if include_teams:
-            query = query.options(
-                selectinload(Project.teams).selectinload(Team.members)
-            )
-
-        query = query.options(selectinload(Project.owner))
-
-        # Ensure no duplicates from joins
-        query = query.distinct()
-
         if state:
             query = query.filter(Project.state == state)
 
@@ -207,23 +268,32 @@ async def list_all(
         # Get total count before pagination
         total_count = query.count()
 
-        query = query.order_by(Project.title)
-
-        # For tree view, we need all projects (no pagination at query level)
-        # Pagination will be applied to root nodes
+        # For tree view, pagination is applied to root nodes
         if as_tree:
-            all_projects = query.all()
-            tree = build_tree(all_projects)
-            # Apply pagination to root nodes
-            paginated_tree = tree[offset : offset + limit]
+            tree, count, total_roots = project_tree_page(
+                session, query, limit, offset, tree_depth
+            )
             return {
-                "tree": paginated_tree,
-                "count": len(all_projects),
+                "tree": tree,
+                "count": count,
                 "total": total_count,
+                "total_roots": total_roots,
                 "limit": limit,
                 "offset": offset,
             }
 
+        if include_teams:
+            query = query.options(
+                selectinload(Project.teams).selectinload(Team.members)
+            )
+
+        query = query.options(selectinload(Project.owner))
+
+        # Ensure no duplicates from joins
+        query = query.distinct()
+
+        query = query.order_by(Project.title)
+
         # Apply pagination
         projects = query.offset(offset).limit(limit).all()
 
@@ -57,8 +57,15 @@ def project_to_dict(
     return result
 
 
-def build_tree(projects: list[Project]) -> list[dict[str, Any]]:
-    """Build a nested tree structure from a flat list of projects."""
+def build_tree(
+    projects: list[Project], children_counts: dict[int, int] | None = None
+) -> list[dict[str, Any]]:
+    """Build a nested tree structure from a flat list of projects.
+
+    ``children_counts`` gives each project's number of children, for trees
+    that don't include every child; by default the children in the tree
+    are counted.
+    """
     # Build a map of id -> project
     project_map: dict[int, Project] = {cast(int, p.id): p for p in projects}
 
@@ -74,20 +81,24 @@ def build_tree(projects: list[Project]) -> list[dict[str, Any]]:
             children_map[parent] = []
         children_map[parent].append(p)
 
+    def build_node(p: Project) -> dict[str, Any]:
+        children = build_subtree(cast(int, p.id))
+        children_count = len(children)
+        if children_counts is not None:
+            children_count = children_counts.get(cast(int, p.id), children_count)
+        return {
+            "id": p.id,
+            "title": p.title,
+            "description": p.description,
+            "state": p.state,
+            "doc_url": p.doc_url,
+            "repo_path": f"{p.repo.owner}/{p.repo.name}" if p.repo else None,
+            "parent_id": p.parent_id,
+            "children_count": children_count,
+            "children": children,
+        }
+
     def build_subtree(parent_id: int | None) -> list[dict[str, Any]]:
-        children = children_map.get(parent_id, [])
-        return [
-            {
-                "id": p.id,
-                "title": p.title,
-                "description": p.description,
-                "state": p.state,
-                "doc_url": p.doc_url,
-                "repo_path": f"{p.repo.owner}/{p.repo.name}" if p.repo else None,
-                "parent_id": p.parent_id,
-                "children": build_subtree(cast(int, p.id)),
-            }
-            for p in children
-        ]
+        return [build_node(p) for p in children_map.get(parent_id, [])]
 
     return build_subtree(None)
@@ -24,6 +24,7 @@ import websockets
 from fastapi import (
     APIRouter,
     Depends,
+    Header,
     HTTPException,
     Request,
     WebSocket,
@@ -49,11 +50,12 @@ from memory.api.orchestrator_client import (
     get_orchestrator_client,
 )
 from memory.api.request_body import read_request_body_with_cap
+from memory.api.sse import SSE_HEADERS, SSE_KEEPALIVE, sse_event
 from memory.api.terminal_relay_client import RelayClient
 from memory.api.tmux_session import (
+    attach_screen_stream,
     input_handler_loop,
     pane_poll_loop,
-    screen_capture_loop,
     send_ws_json,
 )
 from memory.common import paths, settings
@@ -1140,6 +1142,7 @@ async def transfer_push(request: Request) -> dict:
 async def get_session_logs(
     session_id: str,
     tail: int = 100,
+    offset: int | None = Query(None, ge=0),
     user: User = Depends(get_current_user),
 ) -> dict:
     """Get logs for a Claude session.
@@ -1151,18 +1154,21 @@ async def get_session_logs(
     Args:
         session_id: The session to get logs for
         tail: Number of lines from the end (default 100, 0 for all)
+        offset: Only return lines written after this byte offset (the
+            ``offset`` of a previous response), instead of the tail
 
     Returns:
         - session_id: The session ID
         - source: "file"
         - logs: The log content
+        - offset: Byte offset the logs end at, to poll for new lines from
     """
     # Format check is critical here: get_logs constructs LOG_DIR/{session_id}.log
     # on the host, so an unvalidated session_id is a path-traversal sink.
     require_session_access(user, session_id)
 
     client = get_orchestrator_client()
-    result = await client.get_logs(session_id, tail=tail)
+    result = await client.get_logs(session_id, tail=tail, offset=offset)
 
     if result is None:
         raise HTTPException(status_code=404, detail="No logs available")
@@ -1170,6 +1176,44 @@ async def get_session_logs(
     return result
 
 
+@router.get("/{session_id}/logs/follow")
+async def follow_session_logs(
+    session_id: str,
+    tail: int = 100,
+    offset: int | None = Query(None, ge=0),
+    last_event_id: str | None = Header(None),
+    user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream a Claude session's logs as server-sent events.
+
+    Sends the last ``tail`` lines, then new lines as they are written.
+    Each event's id is the byte offset it ends at; a reconnecting
+    ``EventSource`` sends it back as ``Last-Event-ID`` and picks up where
+    it left off (``offset`` does the same for other clients). Only the
+    bytes appended since the last event are read, however long the log.
+    """
+    require_session_access(user, session_id)
+    if last_event_id and last_event_id.isdigit():
+        offset = int(last_event_id)
+
+    client = get_orchestrator_client()
+    first = await client.get_logs(session_id, tail=tail, offset=offset)
+    if first is None:
+        raise HTTPException(status_code=404, detail="No logs available")
+
+    async def events() -> AsyncIterator[str]:
+        if first["logs"]:
+            yield sse_event(first["logs"], first["offset"])
+        async for text, position in client.follow_logs(
+            session_id, offset=first["offset"]
+        ):
+            yield sse_event(text, position) if text else SSE_KEEPALIVE
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers=SSE_HEADERS
+    )
+
+
 # --- Differ proxy ---
 
 # Headers that should not be forwarded between client and upstream
@@ -1445,16 +1489,24 @@ async def stream_session_logs(
     websocket: WebSocket,
     session_id: str,
     token: str = Query(..., description="Authentication token"),
+    diff: bool = Query(
+        False, description="Send changed rows as screen_diff messages"
+    ),
 ):
     """Bidirectional terminal session via WebSocket.
 
     Captures the tmux pane content periodically (every 0.5s) and sends it
-    when changed. Also receives input from client and sends to tmux.
+    when changed. Also receives input from client and sends to tmux. All
+    viewers of a session share one capture loop.
 
     Connect with: ws://host/claude/{session_id}/logs/stream?token=<auth_token>
 
     Server -> Client messages (JSON):
     - screen: Full terminal content (only sent when changed)
+    - screen_diff: With ``diff=true``, ``changes`` is a list of
+      ``[row_index, row_content]`` pairs to apply to the last screen. A full
+      ``screen`` is still sent first, and whenever the size changes or most
+      rows changed.
     - status: Connection/session state changes
     - error: Error messages
 
@@ -1483,25 +1535,26 @@ async def stream_session_logs(
 
     # Connect to the in-container terminal relay for fast tmux interaction.
     # Container hostname is claude-{session_id} on the shared Docker network.
-    relay = RelayClient(host=f"claude-{session_id}")
+    # The relay connection belongs to the session's shared screen stream.
+    stream = attach_screen_stream(
+        session_id,
+        client,
+        lambda: RelayClient(host=f"claude-{session_id}"),
+        websocket,
+        diff=diff,
+    )
+    relay = stream.relay
 
     try:
         await send_ws_json(websocket, "status", f"Connected to {session_id}")
 
-        # Shared state for adaptive polling - input handler updates last_input_time
-        # and sets input_event to wake up the capture loop immediately
-        input_event = asyncio.Event()
-        pane_event = asyncio.Event()
-        activity_state = {
-            "last_input_time": 0.0,
-            "input_event": input_event,
-            "pane_event": pane_event,
-        }
+        # Per-viewer state for adaptive polling - input handler updates
+        # last_input_time and sets the stream's shared input_event to wake
+        # up the capture loop immediately
+        activity_state = await stream.add_viewer(websocket)
 
         # Run screen capture, input handling, and pane polling concurrently
-        screen_task = asyncio.create_task(
-            screen_capture_loop(websocket, session_id, client, activity_state, relay)
-        )
+        screen_task = asyncio.create_task(stream.wait())
         input_task = asyncio.create_task(
             input_handler_loop(websocket, session_id, relay, activity_state, client)
         )
@@ -1533,4 +1586,4 @@ async def stream_session_logs(
         except Exception:
             pass
     finally:
-        await relay.close()
+        await stream.remove_viewer(websocket)
@@ -1,17 +1,24 @@
 """API endpoints for Docker container logs."""
 
+import asyncio
+import logging
 import os
 import re
+from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
+from typing import Any
 
 import httpx
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from memory.api.auth import require_scope
+from memory.api.sse import SSE_HEADERS, SSE_KEEPALIVE, sse_event
 from memory.common.db.models import User
 from memory.common.scopes import SCOPE_ADMIN
 
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/docker", tags=["docker"])
 
@@ -21,6 +28,13 @@ DOCKER_HOST = os.environ.get("DOCKER_HOST", "unix:///var/run/docker.sock")
 VALID_CONTAINER_PATTERN = re.compile(r"^memory-(api|worker|ingest)(-[a-z0-9]+)?(-\d+)?$")
 # Maximum lines to fetch when filtering (prevents OOM on large containers)
 MAX_FILTER_LINES = 50000
+# Follow streams: longest unterminated line held back waiting for its end,
+# and the largest multiplexed frame accepted (Docker splits output into
+# 16 KiB frames, so anything near this means the stream is corrupt).
+MAX_FOLLOW_LINE_BYTES = 256 * 1024
+MAX_FOLLOW_FRAME_BYTES = 1024 * 1024
+# Seconds a follow stream may stay silent before a keep-alive is sent
+FOLLOW_HEARTBEAT_SECONDS = 15.0
 
 
 class ContainerInfo(BaseModel):
@@ -56,6 +70,23 @@ def get_docker_client() -> httpx.Client:
         return httpx.Client(base_url=DOCKER_HOST, timeout=30.0)
 
 
+def get_async_docker_client() -> httpx.AsyncClient:
+    """Async Docker client for follow streams, with no read timeout."""
+    timeout = httpx.Timeout(30.0, read=None)
+    if DOCKER_HOST.startswith("tcp://"):
+        return httpx.AsyncClient(
+            base_url=DOCKER_HOST.replace("tcp://", "http://"), timeout=timeout
+        )
+    elif DOCKER_HOST.startswith("unix://"):
+        socket_path = DOCKER_HOST.replace("unix://", "")
+        transport = httpx.AsyncHTTPTransport(uds=socket_path)
+        return httpx.AsyncClient(
+            transport=transport, base_url="http://localhost", timeout=timeout
+        )
+    else:
+        return httpx.AsyncClient(base_url=DOCKER_HOST, timeout=timeout)
+
+
 def validate_container_name(name: str) -> str:
     """Validate container name using strict regex allowlist."""
     clean_name = name.strip()
@@ -106,6 +137,79 @@ def decode_docker_logs(data: bytes) -> str:
     return "".join(lines)
 
 
+class DockerLogDecoder:
+    """Incremental :func:`decode_docker_logs` for a followed log stream.
+
+    :meth:`feed` takes the chunks of the response as they arrive and returns
+    the complete lines decoded so far. A frame split across chunks, and a
+    line split across frames, are kept until the rest arrives, so memory is
+    bounded by one frame plus one line however long the stream runs.
+    """
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.line = bytearray()
+        self.multiplexed: bool | None = None
+
+    def feed(self, chunk: bytes) -> list[str]:
+        self.buffer += chunk
+        if self.multiplexed is None:
+            if len(self.buffer) < 8:
+                return []
+            self.multiplexed = (
+                self.buffer[0] in (0, 1, 2) and self.buffer[1:4] == b"\x00\x00\x00"
+            )
+
+        if not self.multiplexed:
+            self.line += self.buffer
+            self.buffer.clear()
+            return self._lines()
+
+        i = 0
+        while i + 8 <= len(self.buffer):
+            size = int.from_bytes(self.buffer[i + 4 : i + 8], "big")
+            if size > MAX_FOLLOW_FRAME_BYTES:
+                raise ValueError(f"Docker log frame of {size} bytes")
+            if i + 8 + size > len(self.buffer):
+                break
+            self.line += self.buffer[i + 8 : i + 8 + size]
+            i += 8 + size
+        del self.buffer[:i]
+        return self._lines()
+
+    def flush(self) -> list[str]:
+        """The last, unterminated line, once the stream has ended."""
+        if self.multiplexed is False or self.multiplexed is None:
+            self.line += self.buffer
+            self.buffer.clear()
+        rest = self.line.decode("utf-8", errors="replace")
+        self.line.clear()
+        return [rest] if rest else []
+
+    def _lines(self) -> list[str]:
+        end = self.line.rfind(b"\n") + 1
+        if not end and len(self.line) >= MAX_FOLLOW_LINE_BYTES:
+            end = len(self.line)
+        if not end:
+            return []
+        text = self.line[:end].decode("utf-8", errors="replace")
+        del self.line[:end]
+        return text.splitlines()
+
+
+def docker_since(timestamp: str) -> str:
+    """Docker's ``since`` value for an RFC 3339 log timestamp.
+
+    ``since`` takes Unix seconds with an optional nanosecond fraction; the
+    timestamps Docker prefixes log lines with carry nanoseconds, so resuming
+    from one is exact rather than rounded down to the second.
+    """
+    seconds, _, fraction = timestamp.rstrip("Z").partition(".")
+    when = datetime.fromisoformat(seconds).replace(tzinfo=timezone.utc)
+    nanos = (fraction + "000000000")[:9]
+    return f"{int(when.timestamp())}.{nanos}"
+
+
 @router.get("/containers")
 def list_containers(
     _user: User = require_scope(SCOPE_ADMIN),
@@ -226,3 +330,118 @@ def get_logs(
         until=until,
         lines=len(logs_text.splitlines()),
     )
+
+
+@router.get("/logs/{container}/follow")
+async def follow_logs(
+    container: str,
+    since: datetime | None = Query(None, description="Start time"),
+    tail: int = Query(100, ge=0, le=10000, description="Lines of backlog to send"),
+    filter_text: str | None = Query(None, description="Only lines containing text"),
+    timestamps: bool = Query(True, description="Include timestamps"),
+    last_event_id: str | None = Header(None),
+    _user: User = require_scope(SCOPE_ADMIN),
+) -> StreamingResponse:
+    """
+    Stream a Docker container's logs as server-sent events.
+
+    Admin-only, for the same reasons as :func:`get_logs`.
+
+    Sends the last ``tail`` lines, then new lines as Docker writes them,
+    from a single ``follow`` request rather than re-fetching the tail on
+    every refresh. Each event's id is the Docker timestamp of its last
+    line; a reconnecting ``EventSource`` sends it back as ``Last-Event-ID``
+    and resumes from exactly there, without the backlog or repeated lines.
+    Lines are relayed as they are decoded, so nothing is buffered beyond
+    the frame and line in progress.
+    """
+    container_name = validate_container_name(container)
+
+    params: dict[str, Any] = {
+        "stdout": True,
+        "stderr": True,
+        "follow": True,
+        # Always asked for, as the stream's resume position
+        "timestamps": True,
+        "tail": tail,
+    }
+    if last_event_id:
+        try:
+            params["since"] = docker_since(last_event_id)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid Last-Event-ID")
+        params["tail"] = "all"
+    elif since:
+        params["since"] = int(since.timestamp())
+
+    client = get_async_docker_client()
+    try:
+        request = client.build_request(
+            "GET", f"/containers/{container_name}/logs", params=params
+        )
+        response = await client.send(request, stream=True)
+    except httpx.ConnectError:
+        await client.aclose()
+        raise HTTPException(
+            status_code=503, detail="Docker socket not available. Is it mounted?"
+        )
+    if response.status_code >= 400:
+        await response.aclose()
+        await client.aclose()
+        if response.status_code == 404:
+            raise HTTPException(
+                status_code=404, detail=f"Container '{container_name}' not found"
+            )
+        raise HTTPException(
+            status_code=502, detail=f"Docker API error: {response.status_code}"
+        )
+
+    async def events() -> AsyncIterator[str]:
+        decoder = DockerLogDecoder()
+        last_seen = last_event_id
+        chunks = response.aiter_bytes()
+        pending: asyncio.Future | None = None
+
+        def relay(lines: list[str]) -> str | None:
+            nonlocal last_seen
+            out = []
+            for line in lines:
+                stamp, _, text = line.partition(" ")
+                if last_seen and stamp <= last_seen:
+                    continue  # already sent before a reconnect
+                last_seen = stamp
+                if filter_text and filter_text.lower() not in text.lower():
+                    continue
+                out.append(line if timestamps else text)
+            return sse_event("\n".join(out), last_seen) if out else None
+
+        try:
+            while True:
+                # Wait on the same read across keep-alives; cancelling it
+                # would drop whatever it had half-read
+                if pending is None:
+                    pending = asyncio.ensure_future(chunks.__anext__())
+                done, _ = await asyncio.wait({pending}, timeout=FOLLOW_HEARTBEAT_SECONDS)
+                if not done:
+                    yield SSE_KEEPALIVE
+                    continue
+                try:
+                    chunk = pending.result()
+                except StopAsyncIteration:
+                    break
+                pending = None
+                if event := relay(decoder.feed(chunk)):
+                    yield event
+            if event := relay(decoder.flush()):
+                yield event
+        except (httpx.HTTPError, ValueError) as e:
+            logger.warning(f"Stopped following logs for {container_name}: {e}")
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+            await response.aclose()
+            await client.aclose()
+
+    return StreamingResponse(
+        events(), media_type="text/event-stream", headers=SSE_HEADERS
+    )
@@ -718,6 +718,15 @@ def update_folder(
         raise HTTPException(status_code=404, detail="Folder not found")
 
     snap_pid, snap_sens = folder.project_id, folder.sensitivity
+    # Files newly brought into scope haven't necessarily changed, so the
+    # Changes API wouldn't report them: re-list the folder on the next sync.
+    if (
+        updates.recursive is not None and updates.recursive != folder.recursive
+    ) or (
+        updates.exclude_folder_ids is not None
+        and set(updates.exclude_folder_ids) != set(folder.exclude_folder_ids or [])
+    ):
+        folder.changes_page_token = None
     if updates.folder_name is not None:
         folder.folder_name = updates.folder_name
     if updates.recursive is not None:
@@ -2,7 +2,8 @@
 
 The orchestrator manages Claude containers and volumes via a REST API
 served over a Unix socket. This client wraps the HTTP endpoints into
-a clean interface for the Memory API.
+a clean interface for the Memory API, reusing keep-alive connections
+to the socket across requests (see :class:`UnixSocketPool`).
 
 See: compose/orchestrator/API.md for the full endpoint reference.
 """
@@ -12,6 +13,8 @@ import json
 import logging
 import os
 import re
+from collections import deque
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -26,6 +29,9 @@ ORCHESTRATOR_SOCKET = os.environ.get(
 # Timeout for HTTP operations in seconds
 HTTP_TIMEOUT = 30
 
+# Keep-alive connections to the orchestrator kept open between requests
+HTTP_POOL_SIZE = int(os.getenv("ORCHESTRATOR_POOL_SIZE", 8))
+
 # Log directory on host where orchestrator writes session logs
 LOG_DIR = Path("/var/log/claude-sessions")
 
@@ -40,13 +46,19 @@ _SESSION_ID_RE = re.compile(r"^u\d+-(e\d+|s\d+|x)-[a-fA-F0-9]+$")
 # returned payload to keep the response bounded regardless of caller.
 LOG_TAIL_MAX_BYTES = int(os.getenv("LOG_TAIL_MAX_BYTES", 10 * 1024 * 1024))
 
+# How often a follow (``OrchestratorClient.follow_logs``) checks the log
+# file for new output, and how long it may stay silent before yielding an
+# empty keep-alive so the caller can ping idle streams.
+LOG_FOLLOW_POLL_SECONDS = float(os.getenv("LOG_FOLLOW_POLL_SECONDS", 1.0))
+LOG_FOLLOW_HEARTBEAT_SECONDS = float(os.getenv("LOG_FOLLOW_HEARTBEAT_SECONDS", 15.0))
+
 # Chunk size for the seek-from-end tail. 64 KiB balances syscall count
 # against memory: very small chunks read many times, very large chunks
 # undermine the point of avoiding a big read.
 _TAIL_READ_CHUNK = 64 * 1024
 
 
-def tail_log_text(log_file: Path, tail: int) -> str:
+def tail_log_text(log_file: Path, tail: int, file_size: int | None = None) -> str:
     """Return the last ``tail`` lines of ``log_file`` as text.
 
     Reads the file backwards in :data:`_TAIL_READ_CHUNK`-sized chunks
@@ -61,8 +73,12 @@ def tail_log_text(log_file: Path, tail: int) -> str:
     against a multi-GB log. The final payload is always bounded by
     :data:`LOG_TAIL_MAX_BYTES`, regardless of ``tail`` value, for the
     same reason.
+
+    ``file_size`` (default: the current size) is where the tail ends, so
+    output appended while reading isn't included.
     """
-    file_size = log_file.stat().st_size
+    if file_size is None:
+        file_size = log_file.stat().st_size
     if tail <= 0:
         # Caller asked for the whole file. Still cap the payload to
         # keep the response bounded.
@@ -72,12 +88,16 @@ def tail_log_text(log_file: Path, tail: int) -> str:
                 # Drop the partial line at the start so callers get
                 # well-formed lines.
                 _ = f.readline()
-            return f.read().decode("utf-8", errors="replace")
+            # Stop at the size stat() saw, so the text ends exactly at the
+            # offset a follow-up ``read_log_from`` continues from.
+            return f.read(max(file_size - f.tell(), 0)).decode(
+                "utf-8", errors="replace"
+            )
 
     # Small files: just read everything (seek-loop overhead isn't worth it).
     if file_size <= _TAIL_READ_CHUNK:
         with log_file.open("rb") as f:
-            data = f.read()
+            data = f.read(file_size)
         return _last_n_lines(data, tail).decode("utf-8", errors="replace")
 
     # Seek-from-end loop: read backwards until we have ``tail+1`` newlines.
@@ -125,6 +145,47 @@ def _last_n_lines(data: bytes, tail: int) -> bytes:
     return out
 
 
+def read_log_from(log_file: Path, offset: int) -> tuple[str, int]:
+    """Return the lines written to ``log_file`` since byte ``offset``.
+
+    Returns ``(text, next_offset)``. Only complete lines are returned, so a
+    line still being written is picked up whole by the next call. Each call
+    reads just the bytes appended since ``offset``, which is what lets a
+    follower poll a long log cheaply rather than re-tailing it every time.
+
+    A file shorter than ``offset`` has been truncated or rotated, so reading
+    restarts from the beginning. The read is capped at
+    :data:`LOG_TAIL_MAX_BYTES`: when more than that has been written since
+    ``offset``, the oldest output is skipped (from a line boundary).
+    """
+    file_size = log_file.stat().st_size
+    if file_size < offset:
+        offset = 0
+    if file_size == offset:
+        return "", offset
+
+    start = max(offset, file_size - LOG_TAIL_MAX_BYTES)
+    with log_file.open("rb") as f:
+        f.seek(start)
+        data = f.read(file_size - start)
+    if start > offset:
+        # Drop the partial line we seeked into
+        skip = data.find(b"\n") + 1
+        data, start = data[skip:], start + skip
+
+    end = data.rfind(b"\n") + 1
+    if not end and len(data) >= LOG_TAIL_MAX_BYTES:
+        # A single line longer than the cap - return what fits
+        end = len(data)
+    return data[:end].decode("utf-8", errors="replace"), start + end
+
+
+def _tail_with_offset(log_file: Path, tail: int) -> tuple[str, int]:
+    """:func:`tail_log_text` plus the offset it ends at."""
+    file_size = log_file.stat().st_size
+    return tail_log_text(log_file, tail, file_size), file_size
+
+
 # Module-level alias used by :meth:`OrchestratorClient.get_logs` via
 # ``asyncio.to_thread``. Underscore-prefixed historically; the helper is
 # safe to call from anywhere so the prefix is misleading, but kept as
@@ -181,81 +242,221 @@ class HealthInfo:
     cpus: dict[str, float] = field(default_factory=dict)
 
 
-async def http_request(
-    socket_path: str,
-    method: str,
-    path: str,
-    body: dict[str, Any] | None = None,
-    timeout: float = HTTP_TIMEOUT,
-) -> tuple[int, dict[str, Any]]:
-    """Make an HTTP/1.1 request over a Unix socket.
+class _Connection:
+    """One keep-alive connection to the orchestrator socket."""
 
-    Returns (status_code, parsed_json_body).
-    """
-    if not os.path.exists(socket_path):
-        raise OrchestratorError(
-            f"Orchestrator socket not found: {socket_path}. "
-            "Is the orchestrator running?"
-        )
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+        self.reused = False
 
-    try:
-        reader, writer = await asyncio.wait_for(
-            asyncio.open_unix_connection(socket_path),
-            timeout=timeout,
-        )
-    except asyncio.TimeoutError:
-        raise OrchestratorError("Timeout connecting to orchestrator")
-    except OSError as e:
-        raise OrchestratorError(f"Failed to connect to orchestrator: {e}")
+    def close(self) -> None:
+        self.writer.close()
 
-    body_data = b""
-    try:
-        body_bytes = json.dumps(body).encode() if body else b""
 
-        request_lines = [
-            f"{method} {path} HTTP/1.1",
-            "Host: localhost",
-            "Connection: close",
-        ]
-        if body_bytes:
-            request_lines.append("Content-Type: application/json")
-            request_lines.append(f"Content-Length: {len(body_bytes)}")
+class _StaleConnection(Exception):
+    """A reused connection was closed by the server before it answered."""
 
-        request_str = "\r\n".join(request_lines) + "\r\n\r\n"
-        writer.write(request_str.encode() + body_bytes)
-        await writer.drain()
 
-        # Read full response (Connection: close means server closes when done)
+async def _read_body(
+    reader: asyncio.StreamReader, status_code: int, headers: dict[str, str]
+) -> bytes:
+    """Read a response body framed by Content-Length or chunked encoding.
+
+    A body with neither runs to EOF, after which the connection can't be
+    reused (the caller checks ``reader.at_eof()``).
+    """
+    if status_code in (204, 304):
+        return b""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
         chunks: list[bytes] = []
         while True:
-            try:
-                chunk = await asyncio.wait_for(reader.read(65536), timeout=timeout)
-            except asyncio.TimeoutError:
-                raise OrchestratorError("Timeout reading from orchestrator")
-            if not chunk:
+            size_line = await reader.readuntil(b"\r\n")
+            size = int(size_line.split(b";", 1)[0].strip(), 16)
+            if size == 0:
                 break
-            chunks.append(chunk)
+            chunks.append(await reader.readexactly(size))
+            await reader.readexactly(2)  # CRLF after each chunk
+        # Trailers, if any, end with an empty line
+        while await reader.readuntil(b"\r\n") != b"\r\n":
+            pass
+        return b"".join(chunks)
+
+    if "content-length" in headers:
+        return await reader.readexactly(int(headers["content-length"]))
+
+    return await reader.read()
+
 
-        if not chunks:
-            raise OrchestratorError("Empty response from orchestrator")
+async def _exchange(
+    conn: _Connection, method: str, path: str, body_bytes: bytes
+) -> tuple[int, bytes, bool]:
+    """Send one request and read its response as it arrives.
 
-        data = b"".join(chunks)
+    Returns (status_code, body, whether the connection can be reused).
+    """
+    request_lines = [f"{method} {path} HTTP/1.1", "Host: localhost"]
+    if body_bytes:
+        request_lines.append("Content-Type: application/json")
+    if body_bytes or method in ("POST", "PUT", "PATCH"):
+        request_lines.append(f"Content-Length: {len(body_bytes)}")
+    request_str = "\r\n".join(request_lines) + "\r\n\r\n"
+
+    try:
+        conn.writer.write(request_str.encode() + body_bytes)
+        await conn.writer.drain()
+        header_bytes = await conn.reader.readuntil(b"\r\n\r\n")
+    except (asyncio.IncompleteReadError, ConnectionError) as e:
+        partial = getattr(e, "partial", b"")
+        if conn.reused and not partial:
+            raise _StaleConnection() from e
+        if isinstance(e, asyncio.IncompleteReadError):
+            if not partial:
+                raise OrchestratorError("Empty response from orchestrator")
+            raise OrchestratorError(
+                "Malformed HTTP response: no header/body separator"
+            )
+        raise
+    except asyncio.LimitOverrunError:
+        raise OrchestratorError("Malformed HTTP response: headers too long")
 
-        # Split headers and body
-        separator = data.find(b"\r\n\r\n")
-        if separator == -1:
-            raise OrchestratorError("Malformed HTTP response: no header/body separator")
+    status_line, *header_lines = header_bytes.decode("latin-1").split("\r\n")
+    parts = status_line.split(" ", 2)
+    if len(parts) < 2 or not parts[1].isdigit():
+        raise OrchestratorError(f"Malformed status line: {status_line}")
+    status_code = int(parts[1])
 
-        header_bytes = data[:separator]
-        body_data = data[separator + 4 :]
+    headers: dict[str, str] = {}
+    for line in header_lines:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
 
-        # Parse status code from first line
-        status_line = header_bytes.split(b"\r\n", 1)[0].decode()
-        parts = status_line.split(" ", 2)
-        if len(parts) < 2:
-            raise OrchestratorError(f"Malformed status line: {status_line}")
-        status_code = int(parts[1])
+    body_data = await _read_body(conn.reader, status_code, headers)
+
+    connection = headers.get("connection", "").lower()
+    keep_alive = (
+        parts[0] == "HTTP/1.1" and connection != "close"
+    ) or connection == "keep-alive"
+    return status_code, body_data, keep_alive and not conn.reader.at_eof()
+
+
+class UnixSocketPool:
+    """Keep-alive HTTP/1.1 connections to a Unix socket, reused across requests.
+
+    Up to ``max_idle`` connections are kept open between requests; requests
+    beyond that open extra connections, which are closed afterwards. Idle
+    connections belong to the event loop that opened them and are dropped
+    when the pool is used from another loop.
+
+    A reused connection the server has closed in the meantime is replaced
+    and the request sent again, once.
+    """
 
+    def __init__(self, socket_path: str, max_idle: int = HTTP_POOL_SIZE):
+        self.socket_path = socket_path
+        self.max_idle = max_idle
+        self._idle: deque[_Connection] = deque()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    async def _connect(self) -> _Connection:
+        if not os.path.exists(self.socket_path):
+            raise OrchestratorError(
+                f"Orchestrator socket not found: {self.socket_path}. "
+                "Is the orchestrator running?"
+            )
+        try:
+            reader, writer = await asyncio.open_unix_connection(self.socket_path)
+        except OSError as e:
+            raise OrchestratorError(f"Failed to connect to orchestrator: {e}")
+        return _Connection(reader, writer)
+
+    def _acquire_idle(self) -> _Connection | None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections opened on another (probably finished) loop
+            self._idle.clear()
+            self._loop = loop
+        while self._idle:
+            conn = self._idle.pop()
+            if not conn.reader.at_eof() and not conn.writer.is_closing():
+                return conn
+            conn.close()
+        return None
+
+    def _release(self, conn: _Connection) -> None:
+        if len(self._idle) < self.max_idle:
+            conn.reused = True
+            self._idle.append(conn)
+        else:
+            conn.close()
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        body: dict[str, Any] | None = None,
+        timeout: float = HTTP_TIMEOUT,
+    ) -> tuple[int, bytes]:
+        """Send a request, returning (status_code, raw_body).
+
+        ``timeout`` covers the whole request: connecting, sending and
+        reading the response.
+        """
+        body_bytes = json.dumps(body).encode() if body else b""
+        try:
+            async with asyncio.timeout(timeout):
+                conn = self._acquire_idle() or await self._connect()
+                try:
+                    return await self._send(conn, method, path, body_bytes)
+                except _StaleConnection:
+                    conn = await self._connect()
+                    return await self._send(conn, method, path, body_bytes)
+        except TimeoutError:
+            raise OrchestratorError("Timeout talking to orchestrator")
+
+    async def _send(
+        self, conn: _Connection, method: str, path: str, body_bytes: bytes
+    ) -> tuple[int, bytes]:
+        try:
+            status_code, body_data, reusable = await _exchange(
+                conn, method, path, body_bytes
+            )
+        except BaseException:
+            conn.close()
+            raise
+        if reusable:
+            self._release(conn)
+        else:
+            conn.close()
+        return status_code, body_data
+
+    async def close(self) -> None:
+        """Close the idle connections."""
+        while self._idle:
+            self._idle.pop().close()
+
+
+async def http_request(
+    socket_path: str,
+    method: str,
+    path: str,
+    body: dict[str, Any] | None = None,
+    timeout: float = HTTP_TIMEOUT,
+    pool: UnixSocketPool | None = None,
+) -> tuple[int, dict[str, Any]]:
+    """Make an HTTP/1.1 request over a Unix socket.
+
+    Uses ``pool``'s keep-alive connections if given, otherwise a connection
+    of its own. Returns (status_code, parsed_json_body).
+    """
+    one_off = pool is None
+    if pool is None:
+        pool = UnixSocketPool(socket_path, max_idle=0)
+
+    body_data = b""
+    try:
+        status_code, body_data = await pool.request(method, path, body, timeout)
         parsed_body = json.loads(body_data) if body_data.strip() else {}
         return status_code, parsed_body
 
@@ -272,24 +473,42 @@ async def http_request(
         logger.error("Orchestrator %s %s failed: %s", method, path, e)
         raise OrchestratorError(f"HTTP request failed: {e}")
     finally:
-        writer.close()
-        await writer.wait_closed()
+        if one_off:
+            await pool.close()
 
 
 class OrchestratorClient:
     """Async HTTP client for the Claude Session Orchestrator."""
 
-    def __init__(self, socket_path: str = ORCHESTRATOR_SOCKET):
+    def __init__(
+        self,
+        socket_path: str = ORCHESTRATOR_SOCKET,
+        timeout: float = HTTP_TIMEOUT,
+    ):
         self.socket_path = socket_path
+        self.timeout = timeout
+        self._pool = UnixSocketPool(socket_path)
+
+    async def close(self) -> None:
+        """Close the pooled connections to the orchestrator."""
+        await self._pool.close()
 
     async def _request(
         self,
         method: str,
         path: str,
         body: dict[str, Any] | None = None,
+        timeout: float | None = None,
     ) -> tuple[int, Any]:
         """Make an HTTP request, raising OrchestratorError on 5xx."""
-        status, data = await http_request(self.socket_path, method, path, body)
+        status, data = await http_request(
+            self.socket_path,
+            method,
+            path,
+            body,
+            timeout=timeout or self.timeout,
+            pool=self._pool,
+        )
         log_detail = data.get("detail", data) if isinstance(data, dict) else data
         if status == 404:
             logger.debug("Orchestrator %s %s -> 404: %s", method, path, log_detail)
@@ -677,13 +896,18 @@ class OrchestratorClient:
     # -------------------------------------------------------------------------
 
     async def get_logs(
-        self, session_id: str, tail: int = 100
-    ) -> dict[str, str] | None:
+        self, session_id: str, tail: int = 100, offset: int | None = None
+    ) -> dict[str, Any] | None:
         """Read session logs from the host log directory.
 
         The orchestrator writes logs to LOG_DIR/{session_id}.log.
         Returns None if no logs are available.
 
+        The result's ``offset`` is the byte position the returned text ends
+        at. Passing it back as ``offset`` returns only the lines written
+        since (see :func:`read_log_from`) instead of the last ``tail``
+        lines, so a poller pays for new output rather than the whole tail.
+
         Uses a seek-from-end tail so a multi-GB log file doesn't OOM the
         API container. ``read_text()`` would buffer the entire file
         (peak ~3× file size after splitlines + join) before discarding
@@ -703,7 +927,14 @@ class OrchestratorClient:
             return None
 
         try:
-            content = await asyncio.to_thread(_tail_log_file, log_file, tail)
+            if offset is None:
+                content, offset = await asyncio.to_thread(
+                    _tail_with_offset, log_file, tail
+                )
+            else:
+                content, offset = await asyncio.to_thread(
+                    read_log_from, log_file, offset
+                )
         except OSError as e:
             logger.warning(f"Failed to read log file {log_file}: {e}")
             return None
@@ -712,8 +943,60 @@ class OrchestratorClient:
             "session_id": session_id,
             "source": "file",
             "logs": content,
+            "offset": offset,
         }
 
+    async def follow_logs(
+        self,
+        session_id: str,
+        tail: int = 100,
+        offset: int | None = None,
+        poll_interval: float | None = None,
+    ) -> AsyncGenerator[tuple[str, int], None]:
+        """Follow a session's log file, yielding ``(text, next_offset)``.
+
+        Starts with the last ``tail`` lines, or with whatever was written
+        after ``offset`` when resuming, then yields each batch of new lines
+        as it is appended. Every poll only stats the file and reads the new
+        bytes. After :data:`LOG_FOLLOW_HEARTBEAT_SECONDS` without output an
+        empty text is yielded, so callers can keep idle connections alive.
+
+        Runs until the caller stops iterating or the file can't be read.
+        Yields nothing for a malformed ``session_id`` or a missing log file.
+        """
+        if not _SESSION_ID_RE.match(session_id):
+            logger.warning("follow_logs: rejecting malformed session_id")
+            return
+
+        log_file = LOG_DIR / f"{session_id}.log"
+        if not log_file.exists():
+            return
+
+        if poll_interval is None:
+            poll_interval = LOG_FOLLOW_POLL_SECONDS
+        loop = asyncio.get_running_loop()
+        try:
+            if offset is None:
+                text, offset = await asyncio.to_thread(
+                    _tail_with_offset, log_file, tail
+                )
+                if text:
+                    yield text, offset
+
+            last_sent = loop.time()
+            while True:
+                text, offset = await asyncio.to_thread(read_log_from, log_file, offset)
+                if text:
+                    yield text, offset
+                    last_sent = loop.time()
+                    continue
+                if loop.time() - last_sent >= LOG_FOLLOW_HEARTBEAT_SECONDS:
+                    yield "", offset
+                    last_sent = loop.time()
+                await asyncio.sleep(poll_interval)
+        except OSError as e:
+            logger.warning(f"Stopped following log file {log_file}: {e}")
+
 
 # Singleton client instance
 _client: OrchestratorClient | None = None
@@ -1,12 +1,13 @@
 import asyncio
 import logging
+import re
 from collections.abc import Sequence
 
 from bs4 import BeautifulSoup
 from PIL import Image
 
 from memory.common.db.models.source_item import Chunk
-from memory.common import llms, settings
+from memory.common import llms, settings, tokens
 
 logger = logging.getLogger(__name__)
 
@@ -33,6 +34,32 @@ Please always return a summary of any images provided.
 """
 
 
+SCORE_BATCH_SYSTEM_PROMPT = """
+You are a helpful assistant that scores how relevant each of several chunks of text is to a query.
+
+You are given a query and a numbered list of chunks. Most chunks won't be relevant to the query. Score each chunk on its own, based on how relevant it is to the query, and assign a score on a gradient between 0 and 1, which is the probability that the chunk is relevant to the query.
+"""
+
+SCORE_BATCH_PROMPT = """
+Here is the query:
+<query>{query}</query>
+
+Here are the chunks:
+{chunks}
+
+Please return a score for every chunk, as a number between 0 and 1, formatted as:
+<score id="chunk id">your score</score>
+"""
+
+BATCH_CHUNK_TEMPLATE = """<chunk id="{id}">
+{text}
+</chunk>"""
+
+BATCH_SCORE_RE = re.compile(
+    r"<score\s+id=[\"']?(\d+)[\"']?\s*>([^<]*)</score>", re.IGNORECASE
+)
+
+
 async def score_chunk(query: str, chunk: Chunk) -> Chunk:
     try:
         data = chunk.data
@@ -71,11 +98,124 @@ async def score_chunk(query: str, chunk: Chunk) -> Chunk:
     return chunk
 
 
+def parse_batch_scores(response: str | None, count: int) -> dict[int, float]:
+    """Map chunk ids in a batch scoring reply to their scores.
+
+    Ids outside the batch, repeated ids and scores that aren't numbers in
+    [0, 1] are ignored, so the chunks they belong to count as unscored.
+    """
+    scores: dict[int, float] = {}
+    for chunk_id, value in BATCH_SCORE_RE.findall(response or ""):
+        index = int(chunk_id)
+        if index >= count or index in scores:
+            continue
+        try:
+            score = float(value.strip())
+        except ValueError:
+            continue
+        if 0 <= score <= 1:
+            scores[index] = score
+    return scores
+
+
+def pack_batches(items: Sequence[tuple[Chunk, str]]) -> list[list[tuple[Chunk, str]]]:
+    """Split (chunk, text) pairs into batches within the size and token limits."""
+    batches: list[list[tuple[Chunk, str]]] = []
+    current: list[tuple[Chunk, str]] = []
+    used = 0
+    for chunk, text in items:
+        cost = tokens.approx_token_count(text)
+        if current and (
+            len(current) >= settings.SEARCH_SCORING_BATCH_SIZE
+            or used + cost > settings.SEARCH_SCORING_BATCH_TOKENS
+        ):
+            batches.append(current)
+            current, used = [], 0
+        current.append((chunk, text))
+        used += cost
+    if current:
+        batches.append(current)
+    return batches
+
+
+async def score_batch(query: str, batch: Sequence[tuple[Chunk, str]]) -> None:
+    """Score a batch of text chunks with a single LLM call.
+
+    Chunks the reply has no usable score for, or every chunk if the call
+    fails, are scored one at a time with ``score_chunk`` instead.
+    """
+    chunks = "\n".join(
+        BATCH_CHUNK_TEMPLATE.format(id=i, text=text)
+        for i, (_, text) in enumerate(batch)
+    )
+    prompt = SCORE_BATCH_PROMPT.format(query=query, chunks=chunks)
+    try:
+        response = await asyncio.to_thread(
+            llms.summarize,
+            prompt,
+            settings.RANKER_MODEL,
+            system_prompt=SCORE_BATCH_SYSTEM_PROMPT,
+        )
+        scores = parse_batch_scores(response, len(batch))
+    except Exception as e:
+        logger.error(f"Error scoring batch of {len(batch)} chunks: {e}")
+        scores = {}
+
+    unscored = []
+    for i, (chunk, _) in enumerate(batch):
+        if i in scores:
+            chunk.relevance_score = scores[i]
+        else:
+            unscored.append(chunk)
+    if unscored:
+        logger.warning(
+            f"No batch score for {len(unscored)} of {len(batch)} chunks, "
+            "scoring them individually"
+        )
+        await asyncio.gather(*[score_chunk(query, chunk) for chunk in unscored])
+
+
+async def score_chunks_batched(query: str, chunks: Sequence[Chunk]) -> list[Chunk]:
+    """Score text chunks in batches, each cut to SEARCH_SCORING_CHUNK_TOKENS.
+
+    Chunks with images, or whose data can't be loaded, go through
+    ``score_chunk`` as before.
+    """
+    texts: list[tuple[Chunk, str]] = []
+    singles: list[Chunk] = []
+    for chunk in chunks:
+        try:
+            data = chunk.data
+        except Exception:
+            singles.append(chunk)
+            continue
+        if any(isinstance(item, Image.Image) for item in data):
+            singles.append(chunk)
+            continue
+        text = "\n".join(item for item in data if isinstance(item, str))
+        texts.append((chunk, llms.truncate(text, settings.SEARCH_SCORING_CHUNK_TOKENS)))
+
+    await asyncio.gather(
+        *[score_batch(query, batch) for batch in pack_batches(texts)],
+        *[score_chunk(query, chunk) for chunk in singles],
+    )
+    return list(chunks)
+
+
 async def rank_chunks(
-    query: str, chunks: Sequence[Chunk], min_score: float = 0
+    query: str,
+    chunks: Sequence[Chunk],
+    min_score: float = 0,
+    mode: str | None = None,
 ) -> list[Chunk]:
-    calls = [score_chunk(query, chunk) for chunk in chunks]
-    scored = await asyncio.gather(*calls)
+    """Score chunks against the query and return those above ``min_score``, best first.
+
+    ``mode`` is "batch" or "chunk", defaulting to SEARCH_SCORING_MODE.
+    """
+    if (mode or settings.SEARCH_SCORING_MODE) == "batch":
+        scored = await score_chunks_batched(query, chunks)
+    else:
+        scored = await asyncio.gather(*[score_chunk(query, chunk) for chunk in chunks])
     return sorted(
         [chunk for chunk in scored if chunk.relevance_score >= min_score],
         key=lambda x: x.relevance_score or 0,
@@ -7,6 +7,8 @@ Provides endpoints for:
 - Retrieving session transcripts
 """
 
+import base64
+import binascii
 import fcntl
 import json
 import logging
@@ -25,7 +27,7 @@ from sqlalchemy.orm import joinedload
 from sqlalchemy.orm import Session as DBSession
 
 from memory.api.auth import get_current_user, resolve_user_filter
-from memory.common import settings
+from memory.common import session_index, settings
 from memory.common.dates import parse_iso_datetime
 from memory.common.db.connection import get_session, make_session
 from memory.common.db.models import CodingProject, Session, TelemetryEvent, User
@@ -34,6 +36,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
+# Bump if the cursor encoding changes, so stale cursors are rejected
+# rather than misread.
+CURSOR_VERSION = "v1"
+
 
 class SessionEvent(BaseModel):
     """A single event/message from a session transcript."""
@@ -127,6 +133,7 @@ class TranscriptResponse(BaseModel):
     offset: int
     limit: int
     events: list[dict[str, Any]]
+    next_cursor: str | None = None
 
 
 class ToolCallStats(BaseModel):
@@ -193,10 +200,10 @@ def iter_transcript_events(
     immediately discarded.
 
     ``start`` and ``end`` are 0-indexed line numbers; ``end`` is
-    exclusive (``read_transcript`` passes ``offset + limit``, so
-    using ``>`` here was off-by-one and returned one extra row per
-    request). Blank lines do not advance the index (preserving prior
-    ``safe_loads`` behaviour).
+    exclusive (using ``>`` here was off-by-one and returned one extra
+    row per request). Blank lines do not advance the index (preserving
+    prior ``safe_loads`` behaviour). Paginated API reads go through
+    ``read_transcript`` instead, which can seek via the sidecar index.
 
     Malformed JSON lines are counted and surfaced via a single
     warning at the end (avoids silently dropping rows).
@@ -228,8 +235,7 @@ def iter_transcript_events(
 def safe_loads(file: Path, start: int = 0, end: int | None = None) -> list[dict[str, Any]]:
     """Materialise the streamed events into a list.
 
-    Kept for callers that genuinely need random access to all events
-    (currently just ``read_transcript`` for the API response). New
+    Kept for callers that genuinely need random access to all events. New
     callers should prefer ``iter_transcript_events`` directly so they
     don't materialise the whole transcript at once.
     """
@@ -307,17 +313,21 @@ def extract_tool_calls_from_message(message: dict[str, Any]) -> list[ToolCall]:
 
 
 def count_transcript_events(transcript_path: str) -> int:
-    """Count total events in a transcript file."""
+    """Count total events in a transcript file.
+
+    Answered from the sidecar index when it covers the whole file;
+    otherwise counts non-blank lines.
+    """
     transcript_file = settings.SESSIONS_STORAGE_DIR / transcript_path
     if not transcript_file.exists():
         return 0
 
-    count = 0
-    with open(transcript_file) as f:
-        for line in f:
-            if line.strip():
-                count += 1
-    return count
+    with open(transcript_file, "rb") as f:
+        with session_index.read_index(transcript_file, f) as index:
+            if index and index.complete:
+                return index.indexed_events
+
+        return sum(1 for line in f if line.strip())
 
 
 def get_or_create_project(
@@ -403,7 +413,10 @@ def get_or_create_session(
 def append_events_to_transcript(session: Session, events: list[SessionEvent]) -> int:
     """Append events to the session's JSONL transcript file.
 
-    Uses file locking to prevent concurrent write races.
+    Uses file locking to prevent concurrent write races. Duplicate
+    detection goes through the transcript's sidecar UUID index (see
+    ``memory.common.session_index``) rather than re-reading the whole
+    JSONL, so an append costs O(batch) regardless of transcript length.
 
     Returns the number of events appended (excluding duplicates).
 
@@ -411,61 +424,150 @@ def append_events_to_transcript(session: Session, events: list[SessionEvent]) ->
     as the application runs in Linux Docker containers. If Windows support is
     needed, consider using the 'filelock' library instead.
     """
-    if not session.transcript_path:
+    if not session.transcript_path or not events:
         return 0
 
     transcript_file = settings.SESSIONS_STORAGE_DIR / session.transcript_path
     transcript_file.parent.mkdir(parents=True, exist_ok=True)
 
-    event_ids = {e.uuid for e in events}
-
     # Use file locking to prevent concurrent writes
-    # Open with 'a+' to create if not exists, then lock
-    with open(transcript_file, "a+") as f:
+    # Open with 'a+b' to create if not exists, then lock
+    with open(transcript_file, "a+b") as f:
         # Acquire exclusive lock (blocks until available)
         fcntl.flock(f.fileno(), fcntl.LOCK_EX)
         try:
-            # Read existing UUIDs while holding lock
-            f.seek(0)
-            existing_uuids = set()
-            if event_ids:
-                for line in f:
-                    if line.strip():
-                        try:
-                            data = json.loads(line)
-                            if uuid := data.get("uuid"):
-                                existing_uuids.add(uuid)
-                        except json.JSONDecodeError:
-                            pass
-
-            # Filter out duplicates and write new events
-            items = [
-                json.dumps(event.model_dump(), default=str)
-                for event in events
-                if event.uuid not in existing_uuids
-            ]
-
-            if items:
-                # Seek to end and append
-                f.seek(0, 2)  # Seek to end
-                f.write("\n".join(items) + "\n")
+            with session_index.open_index(transcript_file) as index:
+                indexed_bytes = session_index.sync_index(index, f)
+                existing = session_index.existing_uuids(
+                    index, (e.uuid for e in events)
+                )
+
+                # Filter out duplicates (including repeats within the batch)
+                new_events = {
+                    event.uuid: event
+                    for event in events
+                    if event.uuid not in existing
+                }
+                if not new_events:
+                    return 0
+
+                payload = "".join(
+                    json.dumps(event.model_dump(), default=str) + "\n"
+                    for event in new_events.values()
+                ).encode()
+                # A previous write cut off mid-line leaves a partial tail;
+                # start on a fresh line so it doesn't swallow our first event.
+                start = f.seek(0, 2)
+                if start != indexed_bytes:
+                    payload = b"\n" + payload
+
+                f.write(payload)
                 f.flush()
+                session_index.record_append(index, new_events, payload, start)
 
-            return len(items)
+            return len(new_events)
         finally:
             # Release lock
             fcntl.flock(f.fileno(), fcntl.LOCK_UN)
 
 
+def encode_cursor(position: int) -> str:
+    """Opaque transcript cursor for a byte offset at the start of a line."""
+    return base64.urlsafe_b64encode(f"{CURSOR_VERSION}:{position}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> int:
+    """Byte offset from a cursor made by ``encode_cursor``.
+
+    Raises ValueError for anything that isn't one of our cursors.
+    """
+    try:
+        version, position = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        )
+        offset = int(position)
+    except (ValueError, UnicodeDecodeError, binascii.Error) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if version != CURSOR_VERSION or offset < 0:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return offset
+
+
+@dataclass
+class TranscriptPage:
+    events: list[dict[str, Any]]
+    next_cursor: str
+
+
 def read_transcript(
-    transcript_path: str, offset: int = 0, limit: int = 100
-) -> list[dict[str, Any]]:
-    """Read events from a transcript file with pagination."""
+    transcript_path: str,
+    offset: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+) -> TranscriptPage:
+    """Read events from a transcript file with pagination.
+
+    Pages start either at a ``cursor`` returned by a previous read, which
+    is a byte offset we can seek to directly, or at line ``offset``, which
+    seeks to the nearest checkpoint in the sidecar index and skips the few
+    lines after it (the whole prefix when there's no index yet). ``limit``
+    counts lines, as line offsets always have.
+
+    ``next_cursor`` points just past the last line read, so a client
+    tailing a live session can keep polling with it and only ever receive
+    new events. A trailing line still being written is left for the next
+    read.
+
+    Raises ValueError for a cursor that is malformed or doesn't point at
+    the start of a line in this transcript.
+    """
     transcript_file = settings.SESSIONS_STORAGE_DIR / transcript_path
     if not transcript_file.exists():
-        return []
+        if cursor is not None and decode_cursor(cursor) != 0:
+            raise ValueError("Cursor is past the end of the transcript")
+        return TranscriptPage(events=[], next_cursor=encode_cursor(0))
+
+    with open(transcript_file, "rb") as f:
+        if cursor is not None:
+            position, skip = decode_cursor(cursor), 0
+            size = f.seek(0, 2)
+            if position > size:
+                raise ValueError("Cursor is past the end of the transcript")
+            if position:
+                f.seek(position - 1)
+                if f.read(1) != b"\n":
+                    raise ValueError("Cursor does not point at a line boundary")
+        else:
+            with session_index.read_index(transcript_file, f) as index:
+                line, position = index.checkpoint_before(offset) if index else (0, 0)
+            skip = offset - line
+
+        f.seek(position)
+        events: list[dict[str, Any]] = []
+        lines_read = 0
+        bad_lines = 0
+        for line_bytes in f:
+            if not line_bytes.endswith(b"\n") or lines_read >= limit:
+                break
+            position += len(line_bytes)
+            if skip:
+                skip -= 1
+                continue
+            lines_read += 1
+            if not line_bytes.strip():
+                continue
+            try:
+                events.append(json.loads(line_bytes))
+            except json.JSONDecodeError:
+                bad_lines += 1
 
-    return safe_loads(transcript_file, offset, offset + limit)
+    if bad_lines:
+        logger.warning(
+            "transcript %s: %d unparseable JSON line(s) skipped",
+            transcript_file,
+            bad_lines,
+        )
+    return TranscriptPage(events=events, next_cursor=encode_cursor(position))
 
 
 def extract_tool_usage_telemetry(
@@ -687,12 +789,17 @@ def get_session_transcript(
     session_id: str,
     limit: int = Query(100, ge=1, le=1000),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(
+        None, description="Opaque next_cursor from a previous page; overrides offset"
+    ),
     user: User = Depends(get_current_user),
 ) -> TranscriptResponse:
     """
     Get session transcript with pagination.
 
-    Returns events ordered by their position in the transcript.
+    Returns events ordered by their position in the transcript. Pass the
+    returned ``next_cursor`` back to fetch the following page (or to poll
+    for new events) without the server re-reading earlier lines.
     """
     try:
         session_uuid = UUID(session_id)
@@ -721,7 +828,10 @@ def get_session_transcript(
                 events=[],
             )
 
-        events = read_transcript(session.transcript_path, offset, limit)
+        try:
+            page = read_transcript(session.transcript_path, offset, limit, cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         total = count_transcript_events(session.transcript_path)
 
         return TranscriptResponse(
@@ -729,7 +839,8 @@ def get_session_transcript(
             total_events=total,
             offset=offset,
             limit=limit,
-            events=events,
+            events=page.events,
+            next_cursor=page.next_cursor,
         )
 
 
@@ -0,0 +1,20 @@
+"""Server-sent event framing for the log follow endpoints.
+
+Each event carries an ``id`` that is the position to resume from, which
+browsers send back as ``Last-Event-ID`` when an ``EventSource`` reconnects.
+"""
+
+# Sent on idle streams so proxies don't time the connection out
+SSE_KEEPALIVE = ": keep-alive\n\n"
+
+# Response headers for event streams: don't cache them, and ask nginx not to
+# buffer them (it would otherwise hold events back until its buffer fills).
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+
+def sse_event(text: str, event_id: str | int | None = None) -> str:
+    """Frame ``text`` as one event, one ``data:`` field per line."""
+    lines = [f"id: {event_id}"] if event_id is not None else []
+    # splitlines() also breaks on bare \r, which would otherwise end a field
+    lines += [f"data: {line}" for line in text.splitlines() or [""]]
+    return "\n".join(lines) + "\n\n"
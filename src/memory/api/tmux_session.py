@@ -4,6 +4,8 @@ This module handles the bidirectional terminal communication with tmux sessions
 running inside Claude Code containers. It provides:
 
 - Screen capture with adaptive polling (fast when active, slow when idle)
+- One capture loop per session, shared by every attached viewer
+- Optional row-level screen diffs instead of full-screen resends
 - Input forwarding from WebSocket to tmux
 - Lifecycle phase management (startup -> running -> exit)
 
@@ -13,8 +15,10 @@ The orchestrator client is only used for container logs during startup/exit.
 
 import asyncio
 import logging
+from collections.abc import Callable
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Protocol
+
 from fastapi import WebSocket
 
 from memory.api.orchestrator_client import OrchestratorClient, OrchestratorError
@@ -30,6 +34,10 @@ SCREEN_FAST_DURATION = 3.0  # Stay fast for 3s after last keystroke
 SCREEN_BACKOFF_UNCHANGED_THRESHOLD = 4  # Start slowing after this many unchanged polls
 SCREEN_BACKOFF_MULTIPLIER = 1.5  # Multiply interval by this on each idle poll
 
+# Send a full screen instead of a diff when more than this fraction of rows
+# changed — the diff would be about as big and the client does more work.
+SCREEN_DIFF_MAX_CHANGED_FRACTION = 0.5
+
 SCROLL_LINES = 3  # Lines per scroll wheel event
 PANE_POLL_INTERVAL = 5.0  # Poll orchestrator for pane list every 5s
 
@@ -55,6 +63,63 @@ def coerce_int(value: object, default: int) -> int:
         return default
 
 
+class JsonSink(Protocol):
+    """Anything messages can be sent to: a WebSocket, or a ScreenStream
+    broadcasting to all of its viewers."""
+
+    async def send_json(self, data: Any) -> None: ...
+
+
+def diff_screen_rows(
+    previous: list[str] | None, current: list[str]
+) -> list[tuple[int, str]] | None:
+    """Row-level changes turning ``previous`` into ``current``.
+
+    Returns ``None`` when a full screen should be sent instead: nothing to
+    diff against, the row count changed, or most rows changed anyway.
+    """
+    if previous is None or len(previous) != len(current):
+        return None
+    changes = [
+        (i, row) for i, (old, row) in enumerate(zip(previous, current)) if old != row
+    ]
+    if len(changes) > len(current) * SCREEN_DIFF_MAX_CHANGED_FRACTION:
+        return None
+    return changes
+
+
+async def send_screen_update(
+    websocket: JsonSink,
+    activity_state: dict,
+    screen: str,
+    cols: int,
+    rows: int,
+    **extra: Any,
+) -> None:
+    """Send the live screen to one viewer, as a diff if it asked for them.
+
+    ``activity_state["sent_rows"]`` remembers what the viewer is showing;
+    clear it whenever something else is put on their screen (e.g.
+    scrollback) so the next update is a full frame.
+    """
+    new_rows = screen.split("\n")
+    changes = None
+    if activity_state.get("diff") and activity_state.get("sent_dims") == (cols, rows):
+        changes = diff_screen_rows(activity_state.get("sent_rows"), new_rows)
+
+    if changes is None:
+        await send_ws_json(
+            websocket, "screen", screen, cols=cols, rows=rows, scrolled=0, **extra
+        )
+    else:
+        await send_ws_json(
+            websocket, "screen_diff", None,
+            changes=changes, cols=cols, rows=rows, scrolled=0, **extra,
+        )
+    activity_state["sent_rows"] = new_rows
+    activity_state["sent_dims"] = (cols, rows)
+
+
 async def send_live_screen(
     websocket: WebSocket,
     relay: RelayClient,
@@ -69,12 +134,11 @@ async def send_live_screen(
         # Only reset scroll_offset after a successful capture,
         # so the "jump to bottom" button stays visible if capture fails.
         activity_state["scroll_offset"] = 0
-        screen = str(result["screen"])
-        cols = result.get("cols", 80)
-        rows = result.get("rows", 24)
-        await send_ws_json(
-            websocket, "screen", screen,
-            cols=cols, rows=rows, scrolled=0,
+        # The client is showing scrollback, so this must be a full frame
+        activity_state["sent_rows"] = None
+        await send_screen_update(
+            websocket, activity_state, str(result["screen"]),
+            cols=result.get("cols", 80), rows=result.get("rows", 24),
         )
         return True
     error = result.get("error", result["status"])
@@ -83,7 +147,7 @@ async def send_live_screen(
 
 
 async def send_ws_json(
-    websocket: WebSocket,
+    websocket: JsonSink,
     msg_type: str,
     data: str | None = None,
     **extra: Any,
@@ -100,7 +164,7 @@ async def send_ws_json(
 
 
 async def fetch_and_send_exit_logs(
-    websocket: WebSocket,
+    websocket: JsonSink,
     session_id: str,
     client: "OrchestratorClient",
 ) -> None:
@@ -118,39 +182,195 @@ async def fetch_and_send_exit_logs(
 
 
 async def fetch_startup_logs(
-    websocket: WebSocket,
+    websocket: JsonSink,
     session_id: str,
     client: "OrchestratorClient",
-    last_log_lines: int,
-) -> int:
-    """Fetch and send new startup log lines. Returns updated line count."""
+    log_offset: int | None,
+) -> int | None:
+    """Fetch and send new startup log lines. Returns the updated log offset.
+
+    The first call (``log_offset`` None) sends the last 100 lines; later
+    calls only read what was written after ``log_offset``.
+    """
     try:
-        logs_result = await client.get_logs(session_id, tail=100)
+        logs_result = await client.get_logs(session_id, tail=100, offset=log_offset)
     except Exception as e:
         logger.debug(f"Failed to fetch startup logs: {e}")
-        return last_log_lines
+        return log_offset
 
-    if not logs_result or not logs_result.get("logs"):
-        return last_log_lines
+    if not logs_result:
+        return log_offset
 
-    log_lines = logs_result["logs"].split("\n")
-    if len(log_lines) <= last_log_lines:
-        return last_log_lines
-
-    new_lines = "\n".join(log_lines[last_log_lines:])
+    new_lines = logs_result.get("logs") or ""
     if new_lines.strip():
         await send_ws_json(websocket, "log", new_lines)
-    return len(log_lines)
+    return logs_result.get("offset", log_offset)
 
 
-async def screen_capture_loop(
-    websocket: WebSocket,
+class ScreenStream:
+    """A tmux screen capture loop shared by every viewer of one session.
+
+    Each attached WebSocket used to run its own capture loop against its
+    own relay connection, so N viewers meant N captures per tick. Now the
+    first viewer starts a single loop and later viewers join it; the loop
+    stops (and the relay connection closes) when the last viewer leaves.
+
+    Every viewer keeps its own ``activity_state`` dict, as before, for
+    per-connection state such as ``scroll_offset`` and the diff baseline.
+    Session-wide state (phase, terminal size, history size) is written to
+    all of them, and they share one ``input_event`` so a keystroke from
+    any viewer wakes the loop. The stream implements ``send_json`` so it
+    can be handed to the log helpers to broadcast.
+    """
+
+    def __init__(
+        self, session_id: str, client: "OrchestratorClient", relay: RelayClient
+    ):
+        self.session_id = session_id
+        self.client = client
+        self.relay = relay
+        self.viewers: dict[WebSocket, dict] = {}
+        self.input_event = asyncio.Event()
+        self.shared_state: dict[str, Any] = {}
+        self.last_screen: dict[str, Any] | None = None
+        self.task: asyncio.Task | None = None
+
+    def join(self, websocket: WebSocket, diff: bool = False) -> dict:
+        """Register a viewer, starting the capture loop if needed.
+
+        Doesn't await anything, so a viewer registered straight after the
+        stream is looked up can't miss a concurrent last-viewer teardown.
+        Returns the viewer's ``activity_state``.
+        """
+        activity_state = {
+            "last_input_time": 0.0,
+            "input_event": self.input_event,
+            "pane_event": asyncio.Event(),
+            "diff": diff,
+            **self.shared_state,
+        }
+        self.viewers[websocket] = activity_state
+        if self.task is None:
+            self.task = asyncio.create_task(screen_capture_loop(self))
+        return activity_state
+
+    async def add_viewer(self, websocket: WebSocket, diff: bool = False) -> dict:
+        """Attach a viewer (unless it already joined) and catch it up.
+
+        Returns the viewer's ``activity_state``. A viewer joining a running
+        stream is sent the current phase and screen straight away rather
+        than waiting for the next change.
+        """
+        activity_state = self.viewers.get(websocket) or self.join(websocket, diff)
+        if self.shared_state.get("phase") == "running":
+            await send_ws_json(websocket, "phase", "running")
+            if self.last_screen:
+                await send_screen_update(websocket, activity_state, **self.last_screen)
+        return activity_state
+
+    async def remove_viewer(self, websocket: WebSocket) -> None:
+        """Detach a viewer; the last one out stops the loop."""
+        self.viewers.pop(websocket, None)
+        if self.viewers:
+            return
+        if _screen_streams.get(self.session_id) is self:
+            del _screen_streams[self.session_id]
+        if self.task and not self.task.done():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+        await self.relay.close()
+
+    async def wait(self) -> None:
+        """Wait for the capture loop to end (i.e. the session exited).
+
+        Shielded, so cancelling one viewer's wait leaves the shared loop
+        running for everyone else.
+        """
+        if self.task:
+            await asyncio.shield(self.task)
+
+    def update_state(self, **values: Any) -> None:
+        """Set session-wide state on every viewer (and future ones)."""
+        self.shared_state.update(values)
+        for activity_state in self.viewers.values():
+            activity_state.update(values)
+
+    def last_input_time(self) -> float:
+        return max(
+            (float(s.get("last_input_time", 0)) for s in self.viewers.values()),
+            default=0.0,
+        )
+
+    def pop_pending_resize(self) -> tuple[int, int] | None:
+        pending = None
+        for activity_state in self.viewers.values():
+            pending = activity_state.pop("pending_resize", None) or pending
+        return pending
+
+    async def _deliver(self, websocket: WebSocket, send) -> bool:
+        # One viewer's dead socket mustn't kill the loop for the others;
+        # drop it here and let its own handler notice the disconnect.
+        try:
+            await send
+            return True
+        except Exception as e:
+            logger.debug("Dropping screen viewer for %s: %s", self.session_id, e)
+            self.viewers.pop(websocket, None)
+            return False
+
+    async def send_json(self, data: Any) -> None:
+        for websocket in list(self.viewers):
+            await self._deliver(websocket, websocket.send_json(data))
+
+    async def send_screen(self, screen: str, cols: int, rows: int, **extra: Any) -> bool:
+        """Send a changed screen to every viewer at the live position.
+
+        Returns True if at least one viewer received it.
+        """
+        self.last_screen = {"screen": screen, "cols": cols, "rows": rows, **extra}
+        sent = False
+        for websocket, activity_state in list(self.viewers.items()):
+            if activity_state.get("scroll_offset", 0) != 0:
+                continue
+            sent |= await self._deliver(
+                websocket,
+                send_screen_update(
+                    websocket, activity_state, screen, cols=cols, rows=rows, **extra
+                ),
+            )
+        return sent
+
+
+_screen_streams: dict[str, ScreenStream] = {}
+
+
+def attach_screen_stream(
     session_id: str,
     client: "OrchestratorClient",
-    activity_state: dict,
-    relay: RelayClient,
-) -> None:
-    """Stream terminal content with lifecycle phases.
+    relay_factory: Callable[[], RelayClient],
+    websocket: WebSocket | None = None,
+    diff: bool = False,
+) -> ScreenStream:
+    """Return the live screen stream for a session, creating it if needed.
+
+    With ``websocket``, it is registered as a viewer in the same step (see
+    :meth:`ScreenStream.join`), so the stream can't be torn down between
+    the lookup and the viewer joining.
+    """
+    stream = _screen_streams.get(session_id)
+    if stream is None or (stream.task is not None and stream.task.done()):
+        stream = ScreenStream(session_id, client, relay_factory())
+        _screen_streams[session_id] = stream
+    if websocket is not None:
+        stream.join(websocket, diff)
+    return stream
+
+
+async def screen_capture_loop(stream: ScreenStream) -> None:
+    """Stream terminal content with lifecycle phases to all of ``stream``'s viewers.
 
     Phases:
     1. STARTUP: Relay not yet reachable, stream container logs
@@ -161,148 +381,153 @@ async def screen_capture_loop(
     - Fast (50ms) for 3 seconds after any keystroke
     - Normal (500ms) when screen is changing
     - Slow (up to 2s) when idle
+
+    The relay only offers ``capture-pane`` snapshots (no tmux control-mode
+    ``%output`` feed), so this still polls; changed screens go out as
+    row diffs to viewers that asked for them.
     """
+    session_id, client, relay = stream.session_id, stream.client, stream.relay
     last_screen = ""
-    last_log_lines = 0
+    log_offset: int | None = None
     consecutive_errors = 0
     max_startup_attempts = 60  # 30 seconds at 0.5s interval
     consecutive_unchanged = 0
     interval = SCREEN_NORMAL_INTERVAL
     phase = "startup"  # startup -> running -> exit
 
-    while True:
-        try:
-            result = await relay.capture_screen()
-        except RelayError as e:
-            # Relay unreachable
-            logger.debug("Relay failed, falling back to orchestrator: %s", e)
-            if phase == "running":
-                # Was running, relay died → container exited
-                phase = "exit"
-                await send_ws_json(websocket, "phase", "exit")
-                await fetch_and_send_exit_logs(websocket, session_id, client)
-                break
-            # Still in startup — relay not ready yet
-            consecutive_errors += 1
-            last_log_lines = await fetch_startup_logs(
-                websocket, session_id, client, last_log_lines,
-            )
-            if consecutive_errors >= max_startup_attempts:
-                await send_ws_json(
-                    websocket, "status", "Terminal relay not available after 30s"
+    try:
+        while True:
+            try:
+                result = await relay.capture_screen()
+            except RelayError as e:
+                # Relay unreachable
+                logger.debug("Relay failed, falling back to orchestrator: %s", e)
+                if phase == "running":
+                    # Was running, relay died → container exited
+                    phase = "exit"
+                    await send_ws_json(stream, "phase", "exit")
+                    await fetch_and_send_exit_logs(stream, session_id, client)
+                    break
+                # Still in startup — relay not ready yet
+                consecutive_errors += 1
+                log_offset = await fetch_startup_logs(
+                    stream, session_id, client, log_offset,
                 )
-                break
-            interval = SCREEN_NORMAL_INTERVAL
-            await asyncio.sleep(interval)
-            continue
-
-        status = result["status"]
-        now = asyncio.get_running_loop().time()
-        last_input = float(activity_state.get("last_input_time", 0))
-        recently_active = (now - last_input) < SCREEN_FAST_DURATION
-
-        if status == "ok":
-            # Tmux is ready - switch to running phase
-            if phase == "startup":
-                phase = "running"
-                activity_state["phase"] = "running"
-                await send_ws_json(websocket, "phase", "running")
-                # Apply any resize that arrived before the relay was ready
-                pending = activity_state.pop("pending_resize", None)
-                if pending:
-                    try:
-                        await relay.resize(*pending)
-                    except RelayError:
-                        pass
-
-            consecutive_errors = 0
-            screen = str(result["screen"])
-            cols = result.get("cols", 80)
-            rows = result.get("rows", 24)
-            history_size = result.get("history_size", 0)
-            activity_state["history_size"] = history_size
-            activity_state["terminal_rows"] = rows
-            activity_state["terminal_cols"] = cols
-
-            # The TCP relay returns pane info with every capture
-            pane_count = result.get("pane_count", 1)
-            pane_id = result.get("pane", "")
-            command = result.get("command", "")
-
-            # Only send if screen changed and user isn't scrolled back
-            if screen and screen != last_screen:
-                if activity_state.get("scroll_offset", 0) == 0:
+                if consecutive_errors >= max_startup_attempts:
                     await send_ws_json(
-                        websocket, "screen", screen,
-                        cols=cols, rows=rows, scrolled=0,
-                        pane_count=pane_count, pane=pane_id, command=command,
+                        stream, "status", "Terminal relay not available after 30s"
                     )
-                    # Only update last_screen when actually sent to client,
-                    # so the backoff timer doesn't reset while user is scrolled back
-                    last_screen = screen
-                    consecutive_unchanged = 0
-                    interval = (
-                        SCREEN_FAST_INTERVAL if recently_active else SCREEN_NORMAL_INTERVAL
-                    )
-                else:
-                    # Scrolled back: screen is changing but we're not sending it.
-                    # Use normal interval — no need to poll fast, but don't backoff
-                    # since we'll want a fresh screen when the user scrolls back to live.
-                    interval = SCREEN_NORMAL_INTERVAL
-            else:
-                if recently_active:
-                    interval = SCREEN_FAST_INTERVAL
-                else:
-                    consecutive_unchanged += 1
-                    if consecutive_unchanged >= SCREEN_BACKOFF_UNCHANGED_THRESHOLD:
-                        interval = min(
-                            interval * SCREEN_BACKOFF_MULTIPLIER, SCREEN_SLOW_INTERVAL
-                        )
-
-        elif status == "tmux_not_ready":
-            # Relay is running but tmux session isn't up yet
-            if phase == "running":
-                # tmux died during running - transition to exit
-                logger.info("Tmux became unavailable during running phase, transitioning to exit")
-                phase = "exit"
-                await send_ws_json(websocket, "phase", "exit")
-                await fetch_and_send_exit_logs(websocket, session_id, client)
-                break
-            consecutive_errors += 1
-            if phase == "startup":
-                last_log_lines = await fetch_startup_logs(
-                    websocket, session_id, client, last_log_lines,
-                )
-            if consecutive_errors >= max_startup_attempts:
-                await send_ws_json(
-                    websocket, "status", "Tmux session not available after 30s"
+                    break
+                interval = SCREEN_NORMAL_INTERVAL
+                await asyncio.sleep(interval)
+                continue
+
+            status = result["status"]
+            now = asyncio.get_running_loop().time()
+            recently_active = (now - stream.last_input_time()) < SCREEN_FAST_DURATION
+
+            if status == "ok":
+                # Tmux is ready - switch to running phase
+                if phase == "startup":
+                    phase = "running"
+                    stream.update_state(phase="running")
+                    await send_ws_json(stream, "phase", "running")
+                    # Apply any resize that arrived before the relay was ready
+                    pending = stream.pop_pending_resize()
+                    if pending:
+                        try:
+                            await relay.resize(*pending)
+                        except RelayError:
+                            pass
+
+                consecutive_errors = 0
+                screen = str(result["screen"])
+                cols = result.get("cols", 80)
+                rows = result.get("rows", 24)
+                stream.update_state(
+                    history_size=result.get("history_size", 0),
+                    terminal_rows=rows,
+                    terminal_cols=cols,
                 )
-                break
-            interval = SCREEN_NORMAL_INTERVAL
 
-        else:
-            # Generic error from relay
-            await send_ws_json(
-                websocket, "error", str(result.get("error", "Unknown error"))
-            )
-            consecutive_errors += 1
-            if consecutive_errors >= 5:
+                # Only send if screen changed, and only to viewers who aren't
+                # scrolled back
+                if screen and screen != last_screen:
+                    # The TCP relay returns pane info with every capture
+                    sent = await stream.send_screen(
+                        screen, cols=cols, rows=rows,
+                        pane_count=result.get("pane_count", 1),
+                        pane=result.get("pane", ""),
+                        command=result.get("command", ""),
+                    )
+                    if sent:
+                        # Only update last_screen when actually sent to a client,
+                        # so the backoff timer doesn't reset while everyone is
+                        # scrolled back
+                        last_screen = screen
+                        consecutive_unchanged = 0
+                        interval = (
+                            SCREEN_FAST_INTERVAL if recently_active else SCREEN_NORMAL_INTERVAL
+                        )
+                    else:
+                        # Scrolled back: screen is changing but we're not sending it.
+                        # Use normal interval — no need to poll fast, but don't backoff
+                        # since we'll want a fresh screen when the user scrolls back to live.
+                        interval = SCREEN_NORMAL_INTERVAL
+                else:
+                    if recently_active:
+                        interval = SCREEN_FAST_INTERVAL
+                    else:
+                        consecutive_unchanged += 1
+                        if consecutive_unchanged >= SCREEN_BACKOFF_UNCHANGED_THRESHOLD:
+                            interval = min(
+                                interval * SCREEN_BACKOFF_MULTIPLIER, SCREEN_SLOW_INTERVAL
+                            )
+
+            elif status == "tmux_not_ready":
+                # Relay is running but tmux session isn't up yet
                 if phase == "running":
+                    # tmux died during running - transition to exit
+                    logger.info("Tmux became unavailable during running phase, transitioning to exit")
                     phase = "exit"
-                    await send_ws_json(websocket, "phase", "exit")
-                    await fetch_and_send_exit_logs(websocket, session_id, client)
-                break
+                    await send_ws_json(stream, "phase", "exit")
+                    await fetch_and_send_exit_logs(stream, session_id, client)
+                    break
+                consecutive_errors += 1
+                if phase == "startup":
+                    log_offset = await fetch_startup_logs(
+                        stream, session_id, client, log_offset,
+                    )
+                if consecutive_errors >= max_startup_attempts:
+                    await send_ws_json(
+                        stream, "status", "Tmux session not available after 30s"
+                    )
+                    break
+                interval = SCREEN_NORMAL_INTERVAL
 
-        # Wait for either the interval OR an input event (whichever comes first)
-        input_event = activity_state.get("input_event")
-        if input_event:
+            else:
+                # Generic error from relay
+                await send_ws_json(
+                    stream, "error", str(result.get("error", "Unknown error"))
+                )
+                consecutive_errors += 1
+                if consecutive_errors >= 5:
+                    if phase == "running":
+                        phase = "exit"
+                        await send_ws_json(stream, "phase", "exit")
+                        await fetch_and_send_exit_logs(stream, session_id, client)
+                    break
+
+            # Wait for either the interval OR an input event (whichever comes first)
             try:
-                await asyncio.wait_for(input_event.wait(), timeout=interval)
-                input_event.clear()  # Reset for next input
+                await asyncio.wait_for(stream.input_event.wait(), timeout=interval)
+                stream.input_event.clear()  # Reset for next input
             except asyncio.TimeoutError:
                 pass  # Normal timeout, continue polling
-        else:
-            await asyncio.sleep(interval)
+    finally:
+        # A finished stream can't be rejoined; the next viewer starts afresh
+        if _screen_streams.get(session_id) is stream:
+            del _screen_streams[session_id]
 
 
 async def input_handler_loop(
@@ -412,6 +637,8 @@ async def _dispatch_input_message(
             try:
                 result = await relay.capture_range(start, end)
                 if result["status"] == "ok":
+                    # Client now shows scrollback; diffs no longer apply
+                    activity_state["sent_rows"] = None
                     await send_ws_json(
                         websocket, "screen", result["content"],
                         scrolled=offset,
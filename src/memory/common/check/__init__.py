@@ -1,8 +1,10 @@
 from memory.common.check.redis_client import (
+    done_key,
     get_check_redis,
     job_key,
     jobs_index_key,
     lease_key,
+    mode_open_key,
     open_key,
     wake_key,
 )
@@ -25,10 +27,12 @@ from memory.common.check import store, callbacks
 from memory.common.check.store import submit_rate_limit_ok, wait_for_answer
 
 __all__ = [
+    "done_key",
     "get_check_redis",
     "job_key",
     "jobs_index_key",
     "lease_key",
+    "mode_open_key",
     "open_key",
     "wake_key",
     "JobRecord",
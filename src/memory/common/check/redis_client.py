@@ -20,6 +20,16 @@ def open_key(user_id: int | str) -> str:
     return f"check:open:{user_id}"
 
 
+def mode_open_key(user_id: int | str, mode: str) -> str:
+    """ZSET of a user's claimable job ids of one mode; mirrors ``open_key``."""
+    return f"check:open:{user_id}:{mode}"
+
+
+def mode_sets_ready_key(user_id: int | str) -> str:
+    """STRING marking a user's per-mode open sets as backfilled from ``open_key``."""
+    return f"check:open_modes:{user_id}"
+
+
 def lease_key(job_id: str) -> str:
     """STRING (value = lease_id) marking a job in-flight; auto-expires via TTL."""
     return f"check:lease:{job_id}"
@@ -30,6 +40,11 @@ def wake_key(user_id: int | str) -> str:
     return f"check:wake:{user_id}"
 
 
+def done_key(job_id: str) -> str:
+    """LIST doorbell: a job reaching a final state RPUSHes, waiters BLPOP."""
+    return f"check:done:{job_id}"
+
+
 def jobs_index_key(user_id: int | str) -> str:
     return f"check:jobs:{user_id}"
 
@@ -1,15 +1,20 @@
 """Redis-backed logic for the check job queue.
 
 Every function takes the async redis client ``r`` explicitly so the layer is
-trivially testable with fakeredis. No Lua, no reaper, no Celery:
+trivially testable with fakeredis. No reaper, no Celery:
 
-- An ``open`` ZSET holds claimable job ids (FIFO by submit time).
+- An ``open`` ZSET holds claimable job ids (FIFO by submit time), mirrored by
+  one ZSET per (user, mode) so mode-filtered workers only ever look at jobs
+  they could take.
 - A per-job ``lease`` STRING with a TTL is the "in flight" marker; its value is
-  the fencing token. Claiming is ``SET NX EX`` on that key, so exactly one
-  worker wins; the TTL auto-expires to make a stuck job claimable again with no
+  the fencing token. Claiming is a single Lua script that picks the oldest job
+  without a live lease and sets one, so exactly one worker wins in one
+  round-trip; the TTL auto-expires to make a stuck job claimable again with no
   background sweeper.
 - A per-user ``wake`` LIST is a doorbell: submit RPUSHes a token, a blocked
   ``/check/next`` BLPOPs it and re-scans.
+- A per-job ``done`` LIST is the answer doorbell: completion, poisoning and
+  deletion RPUSH a token, and ``wait_for_answer`` BLPOPs it instead of polling.
 """
 
 # redis-py types every async command as ``Awaitable[T] | T`` (the client class
@@ -24,15 +29,20 @@ import json
 import logging
 import time
 import uuid
+import weakref
 from datetime import datetime, timezone
 from typing import Any, cast
 
 import redis.asyncio as aioredis
+from redis.commands.core import AsyncScript
 
 from memory.common.check.redis_client import (
+    done_key,
     job_key,
     jobs_index_key,
     lease_key,
+    mode_open_key,
+    mode_sets_ready_key,
     open_key,
     wake_key,
 )
@@ -52,6 +62,8 @@ logger = logging.getLogger(__name__)
 
 _WAKE_LIST_MAX = 16
 _MAX_TX_RETRIES = 5
+# Open-set members the claim script reads per ZRANGE while skipping leased jobs
+_CLAIM_SCAN_BATCH = 64
 
 
 def submit_rate_limit_ok(user_id: int) -> bool:
@@ -113,6 +125,8 @@ async def submit_job(r: aioredis.Redis, user_id: int, req: SubmitRequest) -> str
     pipe.expire(job_key(job_id), settings.CHECK_JOB_TTL_SEC)
     pipe.zadd(open_key(user_id), {job_id: now})
     pipe.expire(open_key(user_id), settings.CHECK_JOB_TTL_SEC)
+    pipe.zadd(mode_open_key(user_id, req.mode), {job_id: now})
+    pipe.expire(mode_open_key(user_id, req.mode), settings.CHECK_JOB_TTL_SEC)
     pipe.zadd(jobs_index_key(user_id), {job_id: now})
     pipe.expire(jobs_index_key(user_id), settings.CHECK_JOB_TTL_SEC)
     # Doorbell: wake one blocked claimer; keep the list bounded.
@@ -131,20 +145,38 @@ async def get_job(r: aioredis.Redis, job_id: str) -> JobRecord | None:
 TERMINAL_STATUSES = ("ok", "error", "expired")
 
 
+def _ring_done(pipe: Any, job_id: str) -> None:
+    """Queue an answer-doorbell RPUSH for ``job_id`` on ``pipe``.
+
+    The token only has to outlive the longest wait, so it expires with
+    CHECK_MAX_WAIT_SEC rather than the job.
+    """
+    pipe.rpush(done_key(job_id), "1")
+    pipe.expire(done_key(job_id), max(1, settings.CHECK_MAX_WAIT_SEC))
+
+
 async def wait_for_answer(
     r: aioredis.Redis,
     job_id: str,
     timeout: float,
     interval: float | None = None,
 ) -> JobRecord | None:
-    """Poll a job until it reaches a terminal status or ``timeout`` elapses.
+    """Wait until a job reaches a terminal status or ``timeout`` elapses.
 
     Returns the job record (terminal, or still-pending if the wait ran out), or
     None if the job doesn't exist. ``timeout`` is clamped to
     [0, CHECK_MAX_WAIT_SEC]; ``timeout=0`` means a single immediate read. The
     caller inspects ``status`` to tell answered (ok/error) from pending. A
     bounded wait is intentional — callers re-invoke if still pending rather than
-    hold one long blocking call."""
+    hold one long blocking call.
+
+    Between reads the waiter BLPOPs the job's ``done`` doorbell, so an answer is
+    seen as soon as it lands and an idle waiter issues no commands. A woken
+    waiter pushes the token back so every other waiter on the job wakes too.
+    ``interval`` (default CHECK_WAIT_POLL_INTERVAL_SEC) caps each block, which
+    only matters if a signal is missed. Like ``claim_next``, a sub-second
+    remainder can't be spent in BLPOP and is slept instead.
+    """
     interval = interval if interval is not None else settings.CHECK_WAIT_POLL_INTERVAL_SEC
     timeout = max(0.0, min(float(timeout), float(settings.CHECK_MAX_WAIT_SEC)))
     deadline = _now() + timeout
@@ -157,78 +189,174 @@ async def wait_for_answer(
         remaining = deadline - _now()
         if remaining <= 0:
             return rec  # still pending; caller may re-wait
-        await asyncio.sleep(min(interval, remaining))
+        block = min(interval, remaining)
+        if block < 1:
+            await asyncio.sleep(block)
+            continue
+        if await r.blpop([done_key(job_id)], timeout=int(block)):
+            pipe = r.pipeline(transaction=False)
+            _ring_done(pipe, job_id)
+            await pipe.execute()
+
+
+# Lua: lease the oldest job without a live lease, in one atomic step.
+#
+# KEYS[1] is the user's open zset; KEYS[2..] are the zsets to claim from,
+# merged oldest-first (the open zset itself when unfiltered, else one per
+# allowed mode). Job, lease and mode-set keys are derived from the ARGV
+# prefixes, which is fine on a single Redis but not cluster-safe.
+#
+# A filtered claim first makes sure the per-mode sets hold every open job:
+# jobs submitted before they existed are only in the open zset. Once per
+# CHECK_JOB_TTL_SEC (the longest such a job can live) per user, the first
+# filtered claim copies the open zset into the mode sets, reading each mode
+# from the job hash.
+#
+# Per candidate, mirroring the lease rules:
+# - live lease: in flight elsewhere, skip;
+# - hash gone: tombstone (TTL-expired), drop it from the open sets;
+# - attempts past the limit: poison, mark expired, drop it and ring its
+#   answer doorbell;
+# - otherwise set the lease, mark in_flight and return the job hash.
+# Members removed behind a cursor shift the zset down, so its offset follows.
+_CLAIM_SCRIPT = """
+local job_prefix, lease_prefix, mode_prefix = ARGV[1], ARGV[2], ARGV[3]
+local lease_id, lease_ttl = ARGV[4], tonumber(ARGV[5])
+local max_attempts, now_iso = tonumber(ARGV[6]), ARGV[7]
+local batch = tonumber(ARGV[8])
+local done_prefix, done_ttl = ARGV[9], tonumber(ARGV[10])
+local ready_key, job_ttl = ARGV[11], tonumber(ARGV[12])
+
+if ready_key ~= "" and redis.call("SET", ready_key, "1", "NX", "EX", job_ttl) then
+    local open = redis.call("ZRANGE", KEYS[1], 0, -1, "WITHSCORES")
+    for i = 1, #open, 2 do
+        local mode = redis.call("HGET", job_prefix .. open[i], "mode")
+        if mode then
+            redis.call("ZADD", mode_prefix .. mode, open[i + 1], open[i])
+            redis.call("EXPIRE", mode_prefix .. mode, job_ttl)
+        end
+    end
+end
+
+local cursors = {}
+for i = 2, #KEYS do
+    cursors[#cursors + 1] = {key = KEYS[i], offset = 0, items = {}, pos = 1}
+end
+
+local function head(c)
+    if c.pos > #c.items then
+        if c.done then return nil end
+        c.items = redis.call(
+            "ZRANGE", c.key, c.offset, c.offset + batch - 1, "WITHSCORES")
+        c.offset = c.offset + batch
+        c.pos = 1
+        c.done = #c.items < 2 * batch
+        if #c.items == 0 then return nil end
+    end
+    return tonumber(c.items[c.pos + 1])
+end
+
+local function drop(c, job_id, mode)
+    if redis.call("ZREM", c.key, job_id) == 1 then c.offset = c.offset - 1 end
+    redis.call("ZREM", KEYS[1], job_id)
+    if mode then redis.call("ZREM", mode_prefix .. mode, job_id) end
+end
+
+while true do
+    local best, best_score
+    for _, c in ipairs(cursors) do
+        local score = head(c)
+        if score and (best == nil or score < best_score) then
+            best, best_score = c, score
+        end
+    end
+    if best == nil then return nil end
+
+    local job_id = best.items[best.pos]
+    best.pos = best.pos + 2
+    local jkey, lkey = job_prefix .. job_id, lease_prefix .. job_id
+    if redis.call("EXISTS", lkey) == 0 then
+        local mode = redis.call("HGET", jkey, "mode")
+        if not mode then
+            drop(best, job_id, nil)
+        elseif redis.call("HINCRBY", jkey, "attempts", 1) > max_attempts then
+            redis.call("HSET", jkey,
+                "status", "expired", "completed_at", now_iso, "lease_id", "")
+            drop(best, job_id, mode)
+            redis.call("RPUSH", done_prefix .. job_id, "1")
+            redis.call("EXPIRE", done_prefix .. job_id, done_ttl)
+        else
+            redis.call("SET", lkey, lease_id, "EX", lease_ttl)
+            redis.call("HSET", jkey, "status", "in_flight", "lease_id", lease_id)
+            return redis.call("HGETALL", jkey)
+        end
+    end
+end
+"""
+
+# Registered once per client: register_script hashes the source locally, and
+# the returned script falls back from EVALSHA to EVAL only on a cache miss.
+_claim_scripts: "weakref.WeakKeyDictionary[aioredis.Redis, AsyncScript]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _claim_script(r: aioredis.Redis) -> AsyncScript:
+    script = _claim_scripts.get(r)
+    if script is None:
+        script = _claim_scripts[r] = r.register_script(_CLAIM_SCRIPT)
+    return script
 
 
 async def _try_claim_one(
     r: aioredis.Redis, user_id: int, modes: frozenset[str] | None = None
 ) -> NextJob | None:
-    """Scan the open zset oldest-first and lease the first free job.
-
-    The lease is acquired with ``SET NX EX``, so among concurrent claimers
-    exactly one creates the key and proceeds; the rest skip to the next id.
+    """Lease the oldest free job in one round-trip (see ``_CLAIM_SCRIPT``).
 
     ``modes`` restricts the claim to jobs whose mode is in the set, so distinct
     worker pools can each pull their own check type(s); ``None``/empty claims
-    any. The mode is read (cheap HGET) and compared *before* the lease, never
-    after: leasing a non-matching job would churn its lease and, worse, bump its
-    ``attempts`` toward the poison threshold for work this worker was never
-    going to do. Mode is immutable after submit, so there's no TOCTOU between
-    the HGET and the lease.
+    any. A filtered claim reads only the per-mode open sets, so jobs of other
+    modes are never scanned, leased, or charged an attempt toward the poison
+    threshold for work this worker was never going to do. Jobs that are only
+    in the user's open set (submitted before the per-mode sets existed) are
+    copied into them by the first filtered claim.
+
+    The attempts increment happens inside the script before the lease is set,
+    so a crash can't lose the count: at worst the lease TTL-expires and the
+    next claim counts again.
     """
-    ids = await r.zrange(open_key(user_id), 0, -1)  # oldest-first
-    for job_id in ids:
-        if modes:
-            job_mode = await r.hget(job_key(job_id), "mode")
-            if job_mode is None:
-                # Tombstone: hash TTL-expired but id lingered in open. Clean up.
-                await r.zrem(open_key(user_id), job_id)
-                continue
-            if job_mode not in modes:
-                continue
-
-        lease_id = uuid.uuid4().hex
-        ok = await r.set(
-            lease_key(job_id), lease_id, nx=True, ex=settings.CHECK_LEASE_TTL_SEC
-        )
-        if not ok:
-            continue  # someone else holds the lease
-
-        job = await r.hgetall(job_key(job_id))
-        if not job:
-            # Tombstone: hash TTL-expired but id lingered in open. Clean up.
-            await r.zrem(open_key(user_id), job_id)
-            await r.delete(lease_key(job_id))
-            continue
-
-        # Atomic increment: a crash between the SET NX lease and this HINCRBY
-        # leaves the lease to TTL-expire, and the count is durable rather than a
-        # lost read-modify-write.
-        attempts = await r.hincrby(job_key(job_id), "attempts", 1)
-        if attempts > settings.CHECK_MAX_REQUEUE_ATTEMPTS:
-            # Poison job: too many claims without completion. Give up.
-            await r.hset(
-                job_key(job_id),
-                mapping={
-                    "status": "expired",
-                    "completed_at": _iso(_now()),
-                    "lease_id": "",
-                },
-            )
-            await r.zrem(open_key(user_id), job_id)
-            await r.delete(lease_key(job_id))
-            continue
-
-        await r.hset(
-            job_key(job_id),
-            mapping={"status": "in_flight", "lease_id": lease_id},
-        )
-        return NextJob.from_record(
-            cast(JobRecord, job),
+    claim_keys = (
+        [mode_open_key(user_id, mode) for mode in sorted(modes)]
+        if modes
+        else [open_key(user_id)]
+    )
+    lease_id = uuid.uuid4().hex
+    record = await _claim_script(r)(
+        keys=[open_key(user_id), *claim_keys],
+        args=[
+            job_key(""),
+            lease_key(""),
+            mode_open_key(user_id, ""),
             lease_id,
-            _iso(_now() + settings.CHECK_LEASE_TTL_SEC),
-        )
-    return None
+            settings.CHECK_LEASE_TTL_SEC,
+            settings.CHECK_MAX_REQUEUE_ATTEMPTS,
+            _iso(_now()),
+            _CLAIM_SCAN_BATCH,
+            done_key(""),
+            max(1, settings.CHECK_MAX_WAIT_SEC),
+            mode_sets_ready_key(user_id) if modes else "",
+            settings.CHECK_JOB_TTL_SEC,
+        ],
+    )
+    if not record:
+        return None
+
+    job = dict(zip(record[::2], record[1::2]))
+    return NextJob.from_record(
+        cast(JobRecord, job),
+        lease_id,
+        _iso(_now() + settings.CHECK_LEASE_TTL_SEC),
+    )
 
 
 async def claim_next(
@@ -236,8 +364,8 @@ async def claim_next(
 ) -> NextJob | None:
     """Claim the next free job for ``user_id``, blocking up to ``wait`` seconds.
 
-    Each pass scans the open zset and tries to ``SET NX`` a lease on the first
-    free id. If none is free we BLPOP the user's doorbell, which a concurrent
+    Each pass runs the claim script, which leases the oldest free id. If none
+    is free we BLPOP the user's doorbell, which a concurrent
     submit RPUSHes into; that wakes us to re-scan. The re-scan is the source of
     truth — the woken job may already have been taken by another worker, so we
     never trust the doorbell token itself.
@@ -329,7 +457,9 @@ async def complete_job(
                     },
                 )
                 pipe.zrem(open_key(current["user_id"]), job_id)
+                pipe.zrem(mode_open_key(current["user_id"], current["mode"]), job_id)
                 pipe.delete(lkey)
+                _ring_done(pipe, job_id)
                 await pipe.execute()
                 break
             except aioredis.WatchError:
@@ -375,7 +505,7 @@ async def list_jobs(
 
 
 async def delete_job(r: aioredis.Redis, job: JobRecord) -> None:
-    """Hard-delete a job from every structure: hash, open set, index, lease.
+    """Hard-delete a job from every structure: hash, open sets, index, lease.
 
     Idempotent on the set/index/lease members. Does NOT abort a worker already
     running the job — its later complete_job sees the hash/lease gone and raises
@@ -386,5 +516,7 @@ async def delete_job(r: aioredis.Redis, job: JobRecord) -> None:
     pipe.delete(job_key(job_id))
     pipe.delete(lease_key(job_id))
     pipe.zrem(open_key(user_id), job_id)
+    pipe.zrem(mode_open_key(user_id, job["mode"]), job_id)
     pipe.zrem(jobs_index_key(user_id), job_id)
+    _ring_done(pipe, job_id)  # waiters re-read and see the job gone
     await pipe.execute()
@@ -178,6 +178,12 @@ from memory.common.db.models.deadlines import (
 from memory.common.db.models.access_control_events import (
     ACCESS_CONTROLLED_SOURCE_MODELS,
 )
+# Importing this registers the after_flush listener that keeps the Person
+# lookup index in sync.
+from memory.common.db.models.person_identifiers import (
+    PersonIdentifier,
+    rebuild_person_identifiers,
+)
 
 Payload = (
     SourceItemPayload
@@ -243,6 +249,8 @@ __all__ = [
     "PersonPayload",
     "PersonTidbit",
     "PersonTidbitPayload",
+    "PersonIdentifier",
+    "rebuild_person_identifiers",
     # Teams
     "Team",
     "team_members",
@@ -0,0 +1,178 @@
+"""Normalized, indexed lookup keys for Person records.
+
+Ingest resolves every message author, attendee and participant to a Person,
+by display name, alias, email, Slack user id or GitHub login. Those live in
+``Person.aliases`` (an array) and ``Person.contact_info`` (JSONB), which no
+btree index can serve for case-insensitive equality, so each lookup used to
+scan the people table.
+
+``person_identifiers`` holds one ``(kind, workspace, value) -> person_id`` row
+per key, with ``value`` lowercased, so every lookup is a single primary-key
+probe. ``workspace`` scopes platform ids that are only unique per workspace
+(Slack) and is ``""`` otherwise.
+
+The rows are derived data: an ``after_flush`` listener rewrites a Person's
+rows whenever it is created or its ``display_name``/``aliases``/
+``contact_info`` change, and the foreign key cascades deletes. Bulk UPDATEs
+that bypass the ORM don't fire the listener; ``rebuild_person_identifiers``
+repairs the table after those.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Iterable
+
+from sqlalchemy import (
+    BigInteger,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    delete,
+    event,
+    inspect,
+    select,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, Session, mapped_column
+
+from memory.common.db.models.base import Base
+from memory.common.db.models.sources import Person
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+    from sqlalchemy.orm.scoping import scoped_session
+
+# Identifier kinds
+NAME = "name"  # Person.display_name
+ALIAS = "alias"  # Person.aliases
+EMAIL = "email"  # contact_info["email"]
+SLACK = "slack"  # contact_info["slack"][workspace]["user_id"]
+GITHUB = "github"  # contact_info["github"]
+
+# Person columns the identifier rows are derived from
+SOURCE_FIELDS = ("display_name", "aliases", "contact_info")
+
+IdentifierKey = tuple[str, str, str]  # (kind, workspace, value)
+
+
+class PersonIdentifier(Base):
+    """One normalized lookup key for a Person."""
+
+    __tablename__ = "person_identifiers"
+
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    workspace: Mapped[str] = mapped_column(Text, primary_key=True, server_default="")
+    value: Mapped[str] = mapped_column(Text, primary_key=True)
+    person_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("people.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    __table_args__ = (Index("person_identifiers_person_idx", "person_id"),)
+
+
+def normalize(value: Any) -> str | None:
+    """Lookup form of an identifier value: stripped and lowercased."""
+    if not isinstance(value, str):
+        return None
+    return value.strip().lower() or None
+
+
+def _as_list(value: Any) -> list[Any]:
+    if isinstance(value, list):
+        return value
+    return [value] if value else []
+
+
+def identifier_keys(
+    display_name: str | None,
+    aliases: Iterable[str] | None,
+    contact_info: dict[str, Any] | None,
+) -> set[IdentifierKey]:
+    """All ``(kind, workspace, value)`` keys for a Person's fields."""
+    contact_info = contact_info or {}
+    raw: list[tuple[str, str, Any]] = [(NAME, "", display_name)]
+    raw += [(ALIAS, "", alias) for alias in aliases or []]
+    raw += [(EMAIL, "", email) for email in _as_list(contact_info.get("email"))]
+    raw += [(GITHUB, "", login) for login in _as_list(contact_info.get("github"))]
+
+    slack = contact_info.get("slack")
+    if isinstance(slack, dict):
+        for workspace_id, info in slack.items():
+            if isinstance(info, dict):
+                raw.append((SLACK, workspace_id, info.get("user_id")))
+
+    return {
+        (kind, workspace, value)
+        for kind, workspace, raw_value in raw
+        if (value := normalize(raw_value))
+    }
+
+
+def person_keys(person: Person) -> set[IdentifierKey]:
+    return identifier_keys(person.display_name, person.aliases, person.contact_info)
+
+
+def write_person_identifiers(
+    connection: Connection | Session | scoped_session[Session],
+    keys_by_person: dict[int, set[IdentifierKey]],
+) -> None:
+    """Replace the identifier rows of each person with the given keys."""
+    if not keys_by_person:
+        return
+    connection.execute(
+        delete(PersonIdentifier).where(
+            PersonIdentifier.person_id.in_(keys_by_person)
+        )
+    )
+    values = [
+        {"kind": k, "workspace": w, "value": v, "person_id": person_id}
+        for person_id, keys in keys_by_person.items()
+        for k, w, v in keys
+    ]
+    if values:
+        connection.execute(insert(PersonIdentifier).on_conflict_do_nothing(), values)
+
+
+def rebuild_person_identifiers(session: Session) -> int:
+    """Recompute every Person's identifier rows. Returns the number of people."""
+    rows = session.execute(
+        select(Person.id, Person.display_name, Person.aliases, Person.contact_info)
+    ).all()
+    session.execute(delete(PersonIdentifier))
+    values = [
+        {"kind": k, "workspace": w, "value": v, "person_id": person_id}
+        for person_id, display_name, aliases, contact_info in rows
+        for k, w, v in identifier_keys(display_name, aliases, contact_info)
+    ]
+    if values:
+        session.execute(insert(PersonIdentifier).on_conflict_do_nothing(), values)
+    return len(rows)
+
+
+def _identifiers_changed(person: Person) -> bool:
+    state = inspect(person)
+    return any(state.attrs[field].history.has_changes() for field in SOURCE_FIELDS)
+
+
+@event.listens_for(Session, "after_flush")
+def sync_person_identifiers(session: Session, flush_context) -> None:
+    """Rewrite identifier rows for People created or edited in this flush.
+
+    ``after_flush`` rather than ``before_flush`` so new People have ids;
+    the attribute history consulted is still the pre-flush one. Rows are
+    written with Core statements on the flush's connection, so they commit
+    or roll back with the Person change itself.
+    """
+    changed = [obj for obj in session.new if isinstance(obj, Person)]
+    changed += [
+        obj
+        for obj in session.dirty
+        if isinstance(obj, Person) and _identifiers_changed(obj)
+    ]
+    if not changed:
+        return
+
+    write_person_identifiers(
+        session.connection(), {person.id: person_keys(person) for person in changed}
+    )
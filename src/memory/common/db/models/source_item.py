@@ -157,7 +157,10 @@ def image_filenames(chunk_id: str, images: list[Image.Image]) -> list[str]:
     for i, image in enumerate(images):
         if not getattr(image, "filename", None):  # type: ignore
             filename = settings.CHUNK_STORAGE_DIR / f"{chunk_id}_{i}.{image.format}"  # type: ignore
-            image.save(filename)
+            if isinstance(image, extract.SpilledImage):
+                image.persist(filename)
+            else:
+                image.save(filename)
             image.filename = str(filename)  # type: ignore
 
     return [image.filename for image in images]  # type: ignore
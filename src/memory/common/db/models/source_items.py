@@ -29,10 +29,11 @@ from sqlalchemy import (
 )
 from sqlalchemy.dialects import postgresql
 from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR, UUID
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 from uuid import UUID as PyUUID
 
 from memory.common import paths, settings
+from memory.common.downloads import normalize_article_url
 import memory.common.extract as extract
 import memory.common.summarizer as summarizer
 import memory.common.formatters.observation as observation
@@ -856,6 +857,9 @@ class BlogPost(SourceItem):
         BigInteger, ForeignKey("source_item.id", ondelete="CASCADE"), primary_key=True
     )
     url: Mapped[str | None] = mapped_column(Text, unique=True)
+    # normalize_article_url(url), set whenever url is; what feed and archive
+    # syncs deduplicate against
+    normalized_url: Mapped[str | None] = mapped_column(Text, nullable=True)
     title: Mapped[str | None] = mapped_column(Text)  # type: ignore[assignment]
     author: Mapped[str | None] = mapped_column(Text, nullable=True)
     published: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -887,8 +891,14 @@ class BlogPost(SourceItem):
         Index("blog_post_published_idx", "published"),
         Index("blog_post_word_count_idx", "word_count"),
         Index("blog_post_feed_idx", "feed_id"),
+        Index("blog_post_normalized_url_idx", "normalized_url"),
     )
 
+    @validates("url")
+    def _set_normalized_url(self, key: str, url: str | None) -> str | None:
+        self.normalized_url = normalize_article_url(url) if url else None
+        return url
+
     def get_data_source(self) -> Any:
         """Get the article feed for access control inheritance."""
         return self.feed
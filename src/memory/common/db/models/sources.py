@@ -940,6 +940,8 @@ class GoogleFolder(Base):
     last_sync_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
+    # Drive Changes API cursor; NULL means the next sync lists the folder
+    changes_page_token: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Status
     active: Mapped[bool] = mapped_column(Boolean, nullable=False, server_default="true")
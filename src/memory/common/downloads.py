@@ -160,6 +160,45 @@ def canonicalize_url_for_loop_detection(url: str) -> str:
     )
 
 
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_article_url(url: str) -> str:
+    """Return the key two links to the same article are deduplicated on.
+
+    Looser than :func:`canonicalize_url_for_loop_detection`, because feeds
+    and archive pages link the same post in different ways: the scheme,
+    a ``www.`` prefix, a default port, a trailing slash, the fragment and
+    ``utm_*`` tracking parameters are all dropped, the host is lowercased
+    and the remaining query parameters are sorted. The result is not a
+    fetchable URL (it has no scheme), e.g.
+    ``HTTPS://www.Example.com/post/?utm_source=rss`` becomes
+    ``example.com/post``.
+    """
+    parsed = urlparse(url.strip())
+    host = (parsed.hostname or "").lower().removeprefix("www.")
+    try:
+        port = parsed.port
+    except ValueError:
+        port = None
+    if port and port != _DEFAULT_PORTS.get(parsed.scheme.lower()):
+        host = f"{host}:{port}"
+
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+            if not key.lower().startswith("utm_")
+        )
+    )
+    normalized = host + parsed.path.rstrip("/")
+    if parsed.params:
+        normalized += f";{parsed.params}"
+    if query:
+        normalized += f"?{query}"
+    return normalized
+
+
 def _strip_sensitive_headers(
     headers: Mapping[str, Any] | None,
 ) -> dict[str, Any] | None:
@@ -239,6 +278,7 @@ def safe_get(
     validate_url: bool = True,
     follow_redirects: bool = True,
     max_redirects: int = DEFAULT_MAX_REDIRECTS,
+    session: requests.Session | None = None,
     **kwargs: Any,
 ) -> requests.Response:
     """GET ``url`` with redirect-aware SSRF validation.
@@ -254,7 +294,8 @@ def safe_get(
     that already validated may opt out to avoid double DNS lookup; intermediate
     redirect targets are still validated). The kwargs are passed through
     to ``requests.get`` (``stream``, ``timeout``, ``headers``, ...);
-    ``allow_redirects`` is forced off internally.
+    ``allow_redirects`` is forced off internally. Pass a ``session`` to
+    reuse its pooled keep-alive connections across calls.
 
     On a cross-host redirect (different scheme, hostname, or port), the
     ``Authorization``, ``Proxy-Authorization``, and ``Cookie`` headers
@@ -294,7 +335,7 @@ def safe_get(
     visited: set[str] = {canonicalize_url_for_loop_detection(url)}
 
     for _ in range(max_redirects + 1):
-        response = requests.get(current_url, **kwargs)
+        response = (session or requests).get(current_url, **kwargs)
 
         if not follow_redirects or response.status_code not in _REDIRECT_STATUS_CODES:
             return response
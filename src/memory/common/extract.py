@@ -4,11 +4,14 @@ import logging
 import mimetypes
 import os
 import pathlib
+import shutil
 import tempfile
+import weakref
 from contextlib import contextmanager
-from typing import Any, Generator, Sequence, cast
+from typing import Any, Generator, Iterator, Sequence, cast
 
 from memory.common import chunker, settings, summarizer
+from memory.common.pdf_render import RenderedPage, render_pages
 from memory.parsers import ebook
 import pymupdf  # PyMuPDF
 from PIL import Image
@@ -159,35 +162,102 @@ def as_file(content: bytes | str | pathlib.Path) -> Generator[pathlib.Path, None
             yield pathlib.Path(f.name)
 
 
-def page_to_image(page: pymupdf.Page) -> Image.Image:
-    pix = page.get_pixmap()  # type: ignore
+def page_to_image(page: pymupdf.Page, dpi: int | None = None) -> Image.Image:
+    pix = page.get_pixmap(dpi=dpi or settings.PDF_RENDER_DPI)  # type: ignore
     image = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
     image.format = "jpeg"
     return image
 
 
-def page_image_chunk(page: pymupdf.Page, modality: str = "doc") -> DataChunk:
-    """One multimodal image chunk for a PDF page, carrying its page geometry as
-    metadata. Shared by ``doc_to_images`` and ``extract_pdf`` so the two paths
-    can't drift."""
+class SpilledImage(Image.Image):
+    """A rendered image spilled to a temporary file, decoded only when used.
+
+    Holds the path and header but neither the raster nor an open file, so a
+    long PDF's rendered pages cost next to nothing until each one is used.
+    ``copy``, ``convert``, ``tobytes`` and ``save`` decode a fresh raster for
+    the caller rather than keeping one here, so using a page (e.g. encoding it
+    for an embedding request) doesn't leave its pixels behind.
+
+    The spill file is deleted with the image unless ``persist`` moves it into
+    the chunk store first, which ``image_filenames`` does when the image
+    becomes part of a chunk.
+    """
+
+    def __init__(
+        self, path: pathlib.Path, size: tuple[int, int], mode: str = "RGB"
+    ) -> None:
+        super().__init__()
+        self._mode = mode
+        self._size = size
+        self.format = "png"
+        self.filename = ""
+        self.path = path
+        self._cleanup = weakref.finalize(self, path.unlink, missing_ok=True)
+
+    def persist(self, target: pathlib.Path) -> None:
+        """Move the spill file to ``target`` and keep it there."""
+        self._cleanup.detach()
+        shutil.move(self.path, target)
+        self.path = target
+        self.filename = str(target)
+
+    def _decode(self) -> Image.Image:
+        with Image.open(self.path) as image:
+            image.load()
+            return image
+
+    def load(self):
+        if self.im is None:
+            self.im = self._decode().im
+        return super().load()
+
+    def copy(self) -> Image.Image:
+        return self._decode()
+
+    def convert(self, *args, **kwargs) -> Image.Image:  # type: ignore[override]
+        return self._decode().convert(*args, **kwargs)
+
+    def tobytes(self, *args, **kwargs) -> bytes:  # type: ignore[override]
+        return self._decode().tobytes(*args, **kwargs)
+
+    def save(self, fp, format=None, **params) -> None:  # type: ignore[override]
+        self._decode().save(fp, format, **params)
+
+
+def rendered_page_chunk(page: RenderedPage, modality: str = "doc") -> DataChunk:
+    """One multimodal image chunk for a rendered PDF page, carrying its page
+    geometry as metadata. Shared by ``doc_to_images`` and ``extract_pdf`` so the
+    two paths can't drift."""
     return DataChunk(
-        data=[page_to_image(page)],
+        data=[SpilledImage(page.path, page.pixel_size)],
         metadata={
             "page": page.number,
-            "width": page.rect.width,
-            "height": page.rect.height,
+            "width": page.width,
+            "height": page.height,
         },
-        mime_type="image/jpeg",
+        mime_type="image/png",
         modality=modality,
     )
 
 
+def render_pdf(
+    content: bytes | str | pathlib.Path, with_text: bool = False
+) -> Iterator[RenderedPage]:
+    """Render a PDF's pages to files in ``PDF_SPILL_DIR``, lazily."""
+    with as_file(content) as file_path:
+        yield from render_pages(
+            file_path,
+            settings.PDF_SPILL_DIR,
+            dpi=settings.PDF_RENDER_DPI,
+            workers=settings.PDF_RENDER_WORKERS,
+            with_text=with_text,
+        )
+
+
 def doc_to_images(
     content: bytes | str | pathlib.Path, modality: str = "doc"
 ) -> list[DataChunk]:
-    with as_file(content) as file_path:
-        with pymupdf.open(file_path) as pdf:
-            return [page_image_chunk(page, modality) for page in pdf.pages()]
+    return [rendered_page_chunk(page, modality) for page in render_pdf(content)]
 
 
 # A PDF page whose embedded text layer strips to fewer than this many characters
@@ -198,7 +268,7 @@ MIN_PDF_PAGE_TEXT_CHARS = 16
 
 def extract_pdf(
     content: bytes | str | pathlib.Path, modality: str = "doc"
-) -> list[DataChunk]:
+) -> Iterator[DataChunk]:
     """Chunk a PDF into one image per page, plus a text chunk for every page
     that has a real embedded text layer.
 
@@ -206,31 +276,22 @@ def extract_pdf(
     free and exactly, while scanned pages — whose ``get_text()`` is empty — fall
     back to image-only multimodal chunks, preserving the previous behaviour.
     The text and image chunks for a page share its ``page`` metadata.
+
+    Chunks are yielded page by page as the pages are rendered. Page images are
+    spilled to disk (see ``SpilledImage``), so memory doesn't grow with the
+    page count.
     """
-    chunks: list[DataChunk] = []
-    with as_file(content) as file_path:
-        with pymupdf.open(file_path) as pdf:
-            for page in pdf.pages():
-                image_chunk = page_image_chunk(page, modality)
-                chunks.append(image_chunk)
-                try:
-                    text = page.get_text().strip()
-                except Exception:
-                    logger.warning(
-                        "get_text failed for page %s; ingesting image-only",
-                        page.number,
-                    )
-                    text = ""
-                if len(text) >= MIN_PDF_PAGE_TEXT_CHARS:
-                    chunks.extend(
-                        extract_text(
-                            text,
-                            metadata=image_chunk.metadata,
-                            modality=modality,
-                            skip_summary=True,
-                        )
-                    )
-    return chunks
+    for page in render_pdf(content, with_text=True):
+        image_chunk = rendered_page_chunk(page, modality)
+        yield image_chunk
+        text = page.text or ""
+        if len(text) >= MIN_PDF_PAGE_TEXT_CHARS:
+            yield from extract_text(
+                text,
+                metadata=image_chunk.metadata,
+                modality=modality,
+                skip_summary=True,
+            )
 
 
 def docx_to_pdf(
@@ -378,7 +439,8 @@ def extract_data_chunks(
     chunks = []
     logger.info(f"Extracting content from {mime_type}")
     if mime_type == "application/pdf":
-        chunks = extract_pdf(content)
+        # Only paths are held per page (see SpilledImage), so listing is cheap
+        chunks = list(extract_pdf(content))
     elif mime_type in [
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
         "application/msword",
@@ -20,6 +20,7 @@ Example:
         print(team["name"])
 """
 
+from .conditional import ConditionalResult
 from .core import GithubClientCore
 from .issues import IssuesMixin
 from .projects import ProjectsMixin, extract_status_priority
@@ -27,6 +28,7 @@ from .teams import TeamsMixin
 from .types import (
     GITHUB_API_URL,
     GITHUB_GRAPHQL_URL,
+    PROJECT_FIELDS_BATCH_SIZE,
     GithubComment,
     GithubCredentials,
     GithubFileChange,
@@ -49,7 +51,7 @@ class GithubClient(IssuesMixin, ProjectsMixin, TeamsMixin, GithubClientCore):
     """Complete GitHub API client combining all functionality.
 
     Inherits from:
-    - GithubClientCore: Authentication, GraphQL, rate limiting
+    - GithubClientCore: Authentication, GraphQL, conditional REST, rate limiting
     - IssuesMixin: Issue/PR fetching, parsing, mutations
     - ProjectsMixin: GitHub Projects (v2) management
     - TeamsMixin: Team management and membership
@@ -74,6 +76,7 @@ __all__ = [
     "GithubTeamMember",
     "GithubTeamData",
     "GithubIssueData",
+    "ConditionalResult",
     # Utilities
     "parse_github_date",
     "compute_content_hash",
@@ -82,4 +85,5 @@ __all__ = [
     # Constants
     "GITHUB_API_URL",
     "GITHUB_GRAPHQL_URL",
+    "PROJECT_FIELDS_BATCH_SIZE",
 ]
@@ -0,0 +1,150 @@
+"""Conditional-request support for the GitHub REST API.
+
+GitHub answers a request carrying ``If-None-Match``/``If-Modified-Since``
+with ``304 Not Modified`` when the resource hasn't changed, and an
+authorised 304 does not count against the primary rate limit. Repo syncs
+mostly re-read things that haven't changed, so remembering validators
+turns most of a sync into free calls.
+
+Validators (and the JSON body they describe, so a 304 can still be
+answered) live in Redis, keyed by the credential identity and the full
+request URL: workers share them, and a token never sees a body fetched
+by another token. Redis being unavailable just means unconditional
+requests.
+"""
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable, cast
+
+import redis
+import requests
+
+from memory.common import settings
+
+from .types import GithubCredentials
+
+logger = logging.getLogger(__name__)
+
+VALIDATOR_KEY_PREFIX = "github:validators"
+# Long enough to span the slowest sync interval; stale entries only cost
+# one unconditional request.
+VALIDATOR_TTL_SECONDS = 7 * 24 * 3600
+
+
+@dataclass
+class CachedResource:
+    """Validators and body of the last 200 response for a URL."""
+
+    etag: str | None
+    last_modified: str | None
+    body: Any
+
+    def request_headers(self) -> dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @classmethod
+    def from_response(cls, response: requests.Response) -> "CachedResource | None":
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return None
+        return cls(etag=etag, last_modified=last_modified, body=response.json())
+
+
+def credential_identity(credentials: GithubCredentials) -> str:
+    """Stable, non-secret identity for a set of credentials."""
+    if credentials.auth_type == "app":
+        return f"app:{credentials.app_id}:{credentials.installation_id}"
+    token = credentials.access_token or ""
+    return "pat:" + hashlib.sha256(token.encode()).hexdigest()[:16]
+
+
+class ValidatorCache:
+    """Redis-backed store of ``CachedResource`` entries for one credential."""
+
+    def __init__(self, identity: str, client: redis.Redis | None = None):
+        self.identity = identity
+        self._client = client
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = redis.from_url(settings.REDIS_URL)
+        return self._client
+
+    def key(self, url: str) -> str:
+        digest = hashlib.sha256(f"{self.identity} {url}".encode()).hexdigest()
+        return f"{VALIDATOR_KEY_PREFIX}:{digest}"
+
+    def get(self, url: str) -> CachedResource | None:
+        try:
+            raw = self.client.get(self.key(url))
+        except redis.RedisError as e:
+            logger.debug(f"GitHub validator cache unavailable: {e}")
+            return None
+        if not raw:
+            return None
+        try:
+            data = json.loads(cast(bytes, raw))
+            return CachedResource(
+                etag=data.get("etag"),
+                last_modified=data.get("last_modified"),
+                body=data.get("body"),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def set(self, url: str, resource: CachedResource) -> None:
+        payload = json.dumps(
+            {
+                "etag": resource.etag,
+                "last_modified": resource.last_modified,
+                "body": resource.body,
+            }
+        )
+        try:
+            self.client.set(self.key(url), payload, ex=VALIDATOR_TTL_SECONDS)
+        except redis.RedisError as e:
+            logger.debug(f"GitHub validator cache unavailable: {e}")
+
+
+@dataclass
+class ConditionalResult:
+    """Outcome of a conditional GET.
+
+    ``body`` is the parsed JSON, taken from the cache when GitHub answered
+    304. ``status`` is the HTTP status actually received.
+    """
+
+    url: str
+    status: int
+    body: Any
+    resource: CachedResource | None = None
+    _save: Callable[[], None] | None = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+    @property
+    def changed(self) -> bool:
+        return not self.not_modified
+
+    def commit(self) -> None:
+        """Persist the new validators, if saving was deferred.
+
+        Change probes defer this until the caller has finished processing
+        whatever the probe said had changed, so a crash mid-sync means the
+        next probe still reports the change.
+        """
+        if self._save:
+            self._save()
+            self._save = None
@@ -6,6 +6,12 @@ from typing import Any
 
 import requests
 
+from .conditional import (
+    CachedResource,
+    ConditionalResult,
+    ValidatorCache,
+    credential_identity,
+)
 from .types import (
     GITHUB_API_URL,
     GITHUB_GRAPHQL_URL,
@@ -21,8 +27,13 @@ logger = logging.getLogger(__name__)
 class GithubClientCore:
     """Base client with authentication and core API methods."""
 
-    def __init__(self, credentials: GithubCredentials):
+    def __init__(
+        self,
+        credentials: GithubCredentials,
+        validators: ValidatorCache | None = None,
+    ):
         self.credentials = credentials
+        self.validators = validators or ValidatorCache(credential_identity(credentials))
         self.session = requests.Session()
         self._setup_auth()
 
@@ -203,6 +214,63 @@ class GithubClientCore:
             logger.warning(f"Rate limit low ({remaining}), sleeping for {sleep_time}s")
             time.sleep(sleep_time)
 
+    def _conditional_get(
+        self,
+        url: str,
+        params: dict[str, Any] | None = None,
+        *,
+        timeout: int = 30,
+        defer_commit: bool = False,
+    ) -> ConditionalResult | None:
+        """GET a REST resource, revalidating against any stored ETag/Last-Modified.
+
+        A 304 answer is served from the cached body and doesn't count against
+        the rate limit. Returns None on 404.
+
+        Args:
+            url: Full REST API URL
+            params: Query parameters
+            timeout: Request timeout in seconds
+            defer_commit: Don't store the new validators until the caller
+                calls ``result.commit()``
+
+        Returns:
+            ConditionalResult with the (possibly cached) JSON body, or None
+        """
+        cache_key = requests.Request("GET", url, params=params).prepare().url or url
+        cached = self.validators.get(cache_key)
+        response = self.session.get(
+            url,
+            params=params,
+            headers=cached.request_headers() if cached else None,
+            timeout=timeout,
+        )
+        if response.status_code == 404:
+            return None
+        if response.status_code == 304 and cached is not None:
+            self._handle_rate_limit(response)
+            return ConditionalResult(url=cache_key, status=304, body=cached.body)
+
+        response.raise_for_status()
+        self._handle_rate_limit(response)
+
+        resource = CachedResource.from_response(response)
+        if resource is None:
+            return ConditionalResult(
+                url=cache_key, status=response.status_code, body=response.json()
+            )
+
+        result = ConditionalResult(
+            url=cache_key,
+            status=response.status_code,
+            body=resource.body,
+            resource=resource,
+            _save=lambda: self.validators.set(cache_key, resource),
+        )
+        if not defer_commit:
+            result.commit()
+        return result
+
     def get_authenticated_user(self) -> dict[str, Any]:
         """Get information about the authenticated user."""
         response = self.session.get(f"{GITHUB_API_URL}/user", timeout=30)
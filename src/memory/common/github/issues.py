@@ -3,10 +3,13 @@
 from __future__ import annotations
 import logging
 from datetime import datetime
-from typing import Any, Generator, TYPE_CHECKING
+from itertools import batched
+from typing import Any, Generator, Iterable, TYPE_CHECKING
 
 from .types import (
     GITHUB_API_URL,
+    MAX_REST_PAGE_SIZE,
+    PROJECT_FIELDS_BATCH_SIZE,
     GithubComment,
     GithubFileChange,
     GithubIssueData,
@@ -19,6 +22,7 @@ from .types import (
 )
 
 if TYPE_CHECKING:
+    from .conditional import ConditionalResult
     from .core import GithubClientCore
 
 logger = logging.getLogger(__name__)
@@ -727,6 +731,109 @@ class IssuesMixin(GithubClientCore if TYPE_CHECKING else object):
         """Fetch GitHub Projects v2 field values for a PR."""
         return self._fetch_item_project_fields(owner, repo, pr_number, "pullRequest")
 
+    def fetch_project_fields_batch(
+        self,
+        owner: str,
+        repo: str,
+        numbers: Iterable[int],
+        kind: str = "issue",
+    ) -> dict[int, dict[str, Any] | None]:
+        """Fetch Projects v2 field values for many issues or PRs.
+
+        Uses GraphQL aliasing to fetch up to PROJECT_FIELDS_BATCH_SIZE items
+        per query instead of one query per item.
+
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            numbers: Issue or PR numbers
+            kind: GraphQL field name, 'issue' or 'pullRequest'
+
+        Returns:
+            Dict mapping each number to its field values (None if it has none
+            or the query failed)
+        """
+        results: dict[int, dict[str, Any] | None] = {}
+        for chunk in batched(dict.fromkeys(numbers), PROJECT_FIELDS_BATCH_SIZE):
+            fields = "\n".join(
+                f"item_{number}: {kind}(number: {number}) {{ "
+                f"projectItems(first: 10) {{ ...ProjectFieldValues }} }}"
+                for number in chunk
+            )
+            query = f"""
+            query($owner: String!, $repo: String!) {{
+              repository(owner: $owner, name: $repo) {{
+                {fields}
+              }}
+            }}
+            {self._PROJECT_ITEM_VALUES_FRAGMENT}
+            """
+
+            data, errors = self._graphql(
+                query,
+                {"owner": owner, "repo": repo},
+                operation_name=f"fetch_{kind}_project_fields_batch",
+            )
+            # Partial errors (e.g. one deleted item) still return the rest,
+            # but an item with an error is treated as missing, the same as
+            # a failed single-item query. An error without a path fails all.
+            failed = set()
+            for error in errors or []:
+                path = error.get("path") or []
+                if len(path) < 2 or path[0] != "repository":
+                    failed = {f"item_{number}" for number in chunk}
+                    break
+                failed.add(path[1])
+            repo_data = self._extract_nested(data, "repository") or {}
+            for number in chunk:
+                if f"item_{number}" in failed:
+                    results[number] = None
+                    continue
+                items = self._extract_nested(
+                    repo_data, f"item_{number}", "projectItems", "nodes", default=[]
+                )
+                results[number] = self._parse_project_items(items)
+        return results
+
+    # =========================================================================
+    # Change probes
+    # =========================================================================
+
+    def probe_issues(self, owner: str, repo: str) -> ConditionalResult | None:
+        """Cheaply check whether any issue or PR changed since the last probe.
+
+        Conditionally requests the single most recently updated issue (the
+        issues endpoint includes PRs). Any edit, comment, push or new item
+        changes that response, so a 304 means nothing changed.
+
+        The new validators are only stored once the caller calls
+        ``commit()`` on the result, after it has synced the changes.
+
+        Returns:
+            ConditionalResult, or None if the repo wasn't found
+        """
+        return self._conditional_get(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/issues",
+            {"state": "all", "sort": "updated", "direction": "desc", "per_page": 1},
+            defer_commit=True,
+        )
+
+    def probe_milestones(self, owner: str, repo: str) -> ConditionalResult | None:
+        """Cheaply check whether any milestone changed since the last probe.
+
+        Same commit-after-sync semantics as ``probe_issues``. Repos with more
+        milestones than fit in one page always report a change.
+        """
+        result = self._conditional_get(
+            f"{GITHUB_API_URL}/repos/{owner}/{repo}/milestones",
+            {"state": "all", "per_page": MAX_REST_PAGE_SIZE},
+            defer_commit=True,
+        )
+        if result and len(result.body or []) >= MAX_REST_PAGE_SIZE:
+            # Later pages aren't covered by the validators, so assume a change
+            result.status = 200
+        return result
+
     # =========================================================================
     # GraphQL Methods for Issue Creation/Update
     # =========================================================================
@@ -542,11 +542,8 @@ class ProjectsMixin(GithubClientCore if TYPE_CHECKING else object):
 
         Returns:
             Repository data dict with id, owner, name, etc., or None if not found.
+            Revalidated with a conditional request, so an unchanged repo costs
+            no rate limit.
         """
-        url = f"{GITHUB_API_URL}/repos/{owner}/{name}"
-        response = self.session.get(url, timeout=30)
-        if response.status_code == 404:
-            return None
-        response.raise_for_status()
-        self._handle_rate_limit(response)
-        return response.json()
+        result = self._conditional_get(f"{GITHUB_API_URL}/repos/{owner}/{name}")
+        return result.body if result else None
@@ -16,6 +16,11 @@ RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
 RATE_LIMIT_RESET_HEADER = "X-RateLimit-Reset"
 MIN_RATE_LIMIT_REMAINING = 10
 
+# Issues/PRs whose project fields are fetched in one aliased GraphQL query
+PROJECT_FIELDS_BATCH_SIZE = 50
+# The REST API's maximum page size; used by the milestone change probe
+MAX_REST_PAGE_SIZE = 100
+
 
 @dataclass
 class GithubCredentials:
@@ -1,40 +1,65 @@
-"""Redis-backed usage tracker implementation."""
+"""Redis-backed usage tracker implementation.
+
+Usage is stored as counters rather than an event log, so every operation
+costs the same however many calls fall in the window:
+
+- ``{prefix}:{model}:{width}:{bucket}:input`` / ``:output`` — tokens used in
+  one fixed-width time bucket. Buckets are ``window / buckets_per_window``
+  seconds wide and expire once they can no longer fall inside the window.
+- ``{prefix}:{model}:lifetime`` — hash of lifetime input/output totals.
+- ``{prefix}:last_seen`` — sorted set scoring each model by the time of its
+  latest recorded usage.
+- ``{prefix}:models`` — set of every model with recorded usage.
+
+``record_usage`` is a single MULTI/EXEC. Every command in it is an increment
+or a ``ZADD GT`` (which only ever raises the score), so the result does not
+depend on the order concurrent workers' transactions land in and no server-side
+script is needed. Allowance checks are one MGET over the window's buckets.
+Usage drops out of the window at most one bucket early.
+
+Older deployments stored each model as a JSON blob at ``{prefix}:{model}``.
+Each tracker folds any such blobs into the counters before its first read or
+write, so lifetime totals carry over.
+"""
 
 import json
-from typing import Any, Iterable, Protocol
+import logging
+from datetime import datetime, timezone
+from math import ceil
+from typing import Any, Iterable, Protocol, Sequence
 
 import redis
 
 from memory.common import settings
 from memory.common.llms.usage.usage_tracker import (
     RateLimitConfig,
+    TokenAllowance,
+    UsageEvent,
     UsageState,
     UsageTracker,
+    allowance_for,
+    split_model_key,
 )
 
+logger = logging.getLogger(__name__)
+
+# Suffixes of the keys this tracker writes under ``{prefix}:``; anything else
+# there is a legacy JSON blob.
+_COUNTER_SUFFIXES = (":lifetime", ":input", ":output")
+_COUNTER_KEYS = ("models", "last_seen")
+
 
 class RedisClientProtocol(Protocol):
-    def get(self, name: str) -> Any:  # pragma: no cover - Protocol definition
+    def mget(self, keys: Sequence[str]) -> Any:  # pragma: no cover
         ...
 
-    def set(  # pragma: no cover - Protocol definition
-        self,
-        name: str,
-        value: Any,
-        ex: Any = None,
-        px: Any = None,
-        nx: bool = False,
-        xx: bool = False,
-        keepttl: bool = False,
-        get: bool = False,
-        exat: Any = None,
-        pxat: Any = None,
-    ) -> Any:
+    def smembers(self, name: str) -> Any:  # pragma: no cover
         ...
 
-    def scan_iter(
-        self, match: str
-    ) -> Iterable[Any]:  # pragma: no cover - Protocol definition
+    def scan_iter(self, match: str) -> Iterable[Any]:  # pragma: no cover
+        ...
+
+    def pipeline(self, transaction: bool = True) -> Any:  # pragma: no cover
         ...
 
 
@@ -50,6 +75,7 @@ class RedisUsageTracker(UsageTracker):
         *,
         redis_client: RedisClientProtocol | None = None,
         key_prefix: str | None = None,
+        buckets_per_window: int | None = None,
     ) -> None:
         super().__init__(configs=configs, default_config=default_config)
         if redis_client is None:
@@ -58,36 +84,252 @@ class RedisUsageTracker(UsageTracker):
             self._redis = redis_client
         prefix = key_prefix or settings.LLM_USAGE_REDIS_PREFIX
         self._key_prefix = prefix.rstrip(":")
+        self._buckets_per_window = (
+            buckets_per_window or settings.LLM_USAGE_BUCKETS_PER_WINDOW
+        )
+        self._legacy_migrated = False
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+    def record_usage(
+        self,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Record token usage for the given provider/model pair."""
 
+        if input_tokens < 0 or output_tokens < 0:
+            raise ValueError("Token counts must be non-negative")
+
+        timestamp = timestamp or datetime.now(timezone.utc)
+        split_model_key(model)
+        self._migrate_legacy()
+
+        pipe = self._redis.pipeline(transaction=True)
+        self._queue_lifetime(pipe, model, input_tokens, output_tokens, timestamp)
+        self._queue_window(pipe, model, input_tokens, output_tokens, timestamp)
+        pipe.execute()
+
+    def get_available_tokens(
+        self,
+        model: str,
+        timestamp: datetime | None = None,
+    ) -> TokenAllowance | None:
+        """Return the current token allowance in a single MGET round-trip."""
+
+        split_model_key(model)
+        config = self._get_config(model)
+        if config is None:
+            return None
+
+        self._migrate_legacy()
+        keys = self._window_keys(model, config, timestamp)
+        window_input, window_output = self._sum_window(self._redis.mget(keys))
+        return allowance_for(config, window_input, window_output)
+
+    # ------------------------------------------------------------------
+    # Storage hooks
+    # ------------------------------------------------------------------
     def get_state(self, key: str) -> UsageState:
-        redis_key = self._format_key(key)
-        payload = self._redis.get(redis_key)
-        if not payload:
-            return UsageState()
-        if isinstance(payload, bytes):
-            payload = payload.decode()
-        return UsageState.from_payload(json.loads(payload))
+        self._migrate_legacy()
+        return dict(self._load_states([key]))[key]
 
     def iter_state_items(self) -> Iterable[tuple[str, UsageState]]:
-        pattern = f"{self._key_prefix}:*"
-        for redis_key in self._redis.scan_iter(match=pattern):
-            state_key = self._ensure_str(redis_key)
-            payload = self._redis.get(state_key)
-            if not payload:
+        self._migrate_legacy()
+        members = self._redis.smembers(self._models_key)
+        return self._load_states(sorted(self._ensure_str(m) for m in members))
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    @property
+    def _models_key(self) -> str:
+        return f"{self._key_prefix}:models"
+
+    @property
+    def _last_seen_key(self) -> str:
+        return f"{self._key_prefix}:last_seen"
+
+    def _lifetime_key(self, model: str) -> str:
+        return f"{self._key_prefix}:{model}:lifetime"
+
+    def _bucket_key(self, model: str, width: int, bucket: int, direction: str) -> str:
+        return f"{self._key_prefix}:{model}:{width}:{bucket}:{direction}"
+
+    def _bucket_width(self, config: RateLimitConfig) -> int:
+        seconds = config.window.total_seconds()
+        return max(1, ceil(seconds / self._buckets_per_window))
+
+    @staticmethod
+    def _bucket_count(config: RateLimitConfig, width: int) -> int:
+        return max(1, ceil(config.window.total_seconds() / width))
+
+    @staticmethod
+    def _bucket(timestamp: datetime, width: int) -> int:
+        return int(timestamp.timestamp() // width)
+
+    def _queue_lifetime(
+        self,
+        pipe: Any,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        timestamp: datetime,
+    ) -> None:
+        pipe.sadd(self._models_key, model)
+        lifetime_key = self._lifetime_key(model)
+        pipe.hincrby(lifetime_key, "input", input_tokens)
+        pipe.hincrby(lifetime_key, "output", output_tokens)
+        pipe.zadd(self._last_seen_key, {model: timestamp.timestamp()}, gt=True)
+
+    def _queue_window(
+        self,
+        pipe: Any,
+        model: str,
+        input_tokens: int,
+        output_tokens: int,
+        timestamp: datetime,
+    ) -> None:
+        config = self._get_config(model)
+        if config is None:
+            return
+        width = self._bucket_width(config)
+        bucket = self._bucket(timestamp, width)
+        # Long enough for the bucket to leave the window
+        ttl = width * (self._bucket_count(config, width) + 1)
+        for direction, tokens in (
+            ("input", input_tokens),
+            ("output", output_tokens),
+        ):
+            key = self._bucket_key(model, width, bucket, direction)
+            pipe.incrby(key, tokens)
+            pipe.expire(key, ttl)
+
+    def _migrate_legacy(self) -> None:
+        """Fold pre-bucket JSON blobs into the counter keys, once per tracker."""
+        if self._legacy_migrated:
+            return
+        self._legacy_migrated = True
+
+        start = len(self._key_prefix) + 1
+        for raw_key in self._redis.scan_iter(match=f"{self._key_prefix}:*"):
+            key = self._ensure_str(raw_key)
+            model = key[start:]
+            if model in _COUNTER_KEYS or model.endswith(_COUNTER_SUFFIXES):
                 continue
-            if isinstance(payload, bytes):
-                payload = payload.decode()
-            state = UsageState.from_payload(json.loads(payload))
-            yield state_key[len(self._key_prefix) + 1 :], state
-
-    def save_state(self, key: str, state: UsageState) -> None:
-        redis_key = self._format_key(key)
-        self._redis.set(
-            redis_key, json.dumps(state.to_payload(), separators=(",", ":"))
-        )
+            self._migrate_legacy_key(key, model)
+
+    def _migrate_legacy_key(self, key: str, model: str) -> None:
+        """Move one legacy blob into the counters and delete it.
+
+        The blob is WATCHed, so if several trackers start at once only the
+        first to commit applies it; the rest see a WatchError and move on.
+        """
+        now = datetime.now(timezone.utc)
+        with self._redis.pipeline(transaction=True) as pipe:
+            try:
+                pipe.watch(key)
+                raw = pipe.get(key)
+                try:
+                    payload = json.loads(raw) if raw is not None else None
+                except (TypeError, ValueError):
+                    payload = None
+                if not isinstance(payload, dict):
+                    pipe.unwatch()
+                    return
+                state = UsageState.from_payload(payload)
+
+                pipe.multi()
+                pipe.sadd(self._models_key, model)
+                lifetime_key = self._lifetime_key(model)
+                pipe.hincrby(lifetime_key, "input", state.lifetime_input_tokens)
+                pipe.hincrby(lifetime_key, "output", state.lifetime_output_tokens)
+                config = self._get_config(model)
+                last: UsageEvent | None = None
+                for event in state.events:
+                    if last is None or event.timestamp > last.timestamp:
+                        last = event
+                    if config is not None and now - event.timestamp < config.window:
+                        self._queue_window(
+                            pipe,
+                            model,
+                            event.input_tokens,
+                            event.output_tokens,
+                            event.timestamp,
+                        )
+                if last is not None:
+                    pipe.zadd(
+                        self._last_seen_key,
+                        {model: last.timestamp.timestamp()},
+                        gt=True,
+                    )
+                pipe.delete(key)
+                pipe.execute()
+            except redis.WatchError:
+                logger.debug("Legacy usage key %s migrated concurrently", key)
+
+    def _window_keys(
+        self, model: str, config: RateLimitConfig, timestamp: datetime | None
+    ) -> list[str]:
+        """Input bucket keys for the window ending at ``timestamp``, then output keys."""
+        now = timestamp or datetime.now(timezone.utc)
+        width = self._bucket_width(config)
+        current = self._bucket(now, width)
+        buckets = range(current - self._bucket_count(config, width) + 1, current + 1)
+        return [
+            self._bucket_key(model, width, bucket, direction)
+            for direction in ("input", "output")
+            for bucket in buckets
+        ]
+
+    @staticmethod
+    def _sum_window(values: Sequence[Any]) -> tuple[int, int]:
+        half = len(values) // 2
+        counts = [int(v) if v is not None else 0 for v in values]
+        return sum(counts[:half]), sum(counts[half:])
+
+    def _load_states(self, models: Sequence[str]) -> list[tuple[str, UsageState]]:
+        """Lifetime and window totals for ``models``, two pipelined round-trips.
+
+        As with the in-memory tracker, the window reported is the one ending
+        at the model's most recent recorded usage.
+        """
+        if not models:
+            return []
+
+        pipe = self._redis.pipeline(transaction=False)
+        for model in models:
+            pipe.hmget(self._lifetime_key(model), ["input", "output"])
+            pipe.zscore(self._last_seen_key, model)
+        results = pipe.execute()
+        totals = zip(models, results[::2], results[1::2])
+
+        states: list[tuple[str, UsageState]] = []
+        pipe = self._redis.pipeline(transaction=False)
+        windowed: list[UsageState] = []
+        for model, (lifetime_in, lifetime_out), last_seen in totals:
+            state = UsageState(
+                lifetime_input_tokens=int(lifetime_in or 0),
+                lifetime_output_tokens=int(lifetime_out or 0),
+            )
+            states.append((model, state))
+            config = self._get_config(model)
+            if config is None or last_seen is None:
+                continue
+            last = datetime.fromtimestamp(float(last_seen), timezone.utc)
+            pipe.mget(self._window_keys(model, config, last))
+            windowed.append(state)
 
-    def _format_key(self, key: str) -> str:
-        return f"{self._key_prefix}:{key}"
+        if windowed:
+            for state, values in zip(windowed, pipe.execute()):
+                (
+                    state.window_input_tokens,
+                    state.window_output_tokens,
+                ) = self._sum_window(values)
+        return states
 
     @staticmethod
     def _ensure_str(value: Any) -> str:
@@ -234,27 +234,8 @@ class UsageTracker:
             self._prune_expired_events(state, config, now=timestamp)
             self.save_state(model, state)
 
-            if config.max_total_tokens is None:
-                total_remaining = None
-            else:
-                total_remaining = config.max_total_tokens - (
-                    state.window_input_tokens + state.window_output_tokens
-                )
-
-            if config.max_input_tokens is None:
-                input_remaining = None
-            else:
-                input_remaining = config.max_input_tokens - state.window_input_tokens
-
-            if config.max_output_tokens is None:
-                output_remaining = None
-            else:
-                output_remaining = config.max_output_tokens - state.window_output_tokens
-
-            return TokenAllowance(
-                input_tokens=clamp_non_negative(input_remaining),
-                output_tokens=clamp_non_negative(output_remaining),
-                total_tokens=clamp_non_negative(total_remaining),
+            return allowance_for(
+                config, state.window_input_tokens, state.window_output_tokens
             )
 
     def get_usage_breakdown(
@@ -354,6 +335,25 @@ class InMemoryUsageTracker(UsageTracker):
         return tuple(self._states.items())
 
 
+def allowance_for(
+    config: RateLimitConfig, window_input_tokens: int, window_output_tokens: int
+) -> TokenAllowance:
+    """Tokens still available under ``config`` given the usage in its window."""
+
+    def remaining(limit: int | None, used: int) -> int | None:
+        if limit is None:
+            return None
+        return clamp_non_negative(limit - used)
+
+    return TokenAllowance(
+        input_tokens=remaining(config.max_input_tokens, window_input_tokens),
+        output_tokens=remaining(config.max_output_tokens, window_output_tokens),
+        total_tokens=remaining(
+            config.max_total_tokens, window_input_tokens + window_output_tokens
+        ),
+    )
+
+
 def clamp_non_negative(value: int | None) -> int | None:
     if value is None:
         return None
@@ -0,0 +1,397 @@
+"""Shared cache for prediction market API responses.
+
+Search, history and order book lookups hit Manifold, Polymarket and Kalshi,
+which are slow and rate limited. Results are cached in a pluggable backend:
+
+- ``RedisCacheBackend`` (the default) is shared by every API worker and
+  Celery process and survives restarts. Values are stored as JSON.
+- ``LocalCacheBackend`` is a process-local ``TTLCache``, for running
+  without Redis.
+
+``MarketCache.get_or_fetch`` layers two things on top of the backend:
+
+- Single-flight: concurrent requests for the same key share one upstream
+  fetch. Within a process they await the same task; across processes the
+  Redis backend takes a short lock and the other processes wait for the
+  result to appear instead of fetching it themselves.
+- Stale-while-revalidate: once an entry is older than ``ttl`` but younger
+  than ``ttl + stale_ttl`` it is still served, and refreshed in the
+  background.
+
+Backends are synchronous. Those marked ``blocking`` (Redis) are driven from
+``get_or_fetch`` through ``asyncio.to_thread`` so a slow Redis round-trip or
+lock acquisition never stalls the event loop.
+
+Cache hits, stale hits and misses are recorded as ``market_cache`` metrics
+and every upstream fetch as a ``market_api`` metric, labelled with the
+cache name.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Protocol,
+    TypeVar,
+    cast,
+)
+
+import redis
+from cachetools import TTLCache
+
+from memory.common import settings
+from memory.common.metrics import record_metric
+from memory.common.redis_lock import distributed_lock
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# (value, time it was stored)
+CacheEntry = tuple[Any, float]
+
+
+class CacheBackend(Protocol):
+    # Whether calls do network I/O and must be kept off the event loop
+    blocking: bool
+
+    def get(self, key: str) -> CacheEntry | None:  # pragma: no cover
+        ...
+
+    def set(self, key: str, value: Any, stored_at: float) -> None:  # pragma: no cover
+        ...
+
+    def clear(self) -> None:  # pragma: no cover
+        ...
+
+    def __len__(self) -> int:  # pragma: no cover
+        ...
+
+    def fill_lock(self, key: str) -> ContextManager[Any]:  # pragma: no cover
+        """Held while fetching ``key``; yields a falsy value if someone else is."""
+        ...
+
+
+class LocalCacheBackend:
+    """Process-local backend. TTLCache is not thread-safe, hence the lock."""
+
+    blocking = False
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        # See markets.py for why TTLCache isn't parameterised
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            return self._cache.get(key)
+
+    def set(self, key: str, value: Any, stored_at: float) -> None:
+        with self._lock:
+            self._cache[key] = (value, stored_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._cache)
+
+    def fill_lock(self, key: str) -> ContextManager[Any]:
+        # In-process single-flight already covers the only process using it
+        return contextlib.nullcontext(True)
+
+
+class RedisCacheBackend:
+    """Backend shared across processes through Redis.
+
+    Entries live under ``{MARKET_CACHE_REDIS_PREFIX}:{namespace}:{key}`` and
+    expire after ``ttl`` seconds. Redis errors are logged and treated as
+    misses, so an unavailable Redis degrades to uncached fetches.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float,
+        *,
+        redis_client: redis.Redis | None = None,
+        lock_ttl: int | None = None,
+    ) -> None:
+        self._namespace = namespace
+        self._ttl = max(1, int(ttl))
+        self._redis = redis_client
+        self._lock_ttl = lock_ttl or settings.MARKET_CACHE_FILL_LOCK_SEC
+
+    @property
+    def client(self) -> redis.Redis:
+        # Created on first use rather than at import time
+        if self._redis is None:
+            self._redis = redis.Redis.from_url(settings.REDIS_URL)
+        return self._redis
+
+    @property
+    def _prefix(self) -> str:
+        return f"{settings.MARKET_CACHE_REDIS_PREFIX}:{self._namespace}"
+
+    def _key(self, key: str) -> str:
+        return f"{self._prefix}:{key}"
+
+    def get(self, key: str) -> CacheEntry | None:
+        try:
+            raw = self.client.get(self._key(key))
+        except redis.RedisError as e:
+            logger.warning("Market cache read failed for %s: %s", key, e)
+            return None
+        if raw is None:
+            return None
+        try:
+            entry = json.loads(cast(bytes, raw))
+            return entry["value"], float(entry["stored_at"])
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def set(self, key: str, value: Any, stored_at: float) -> None:
+        payload = json.dumps({"value": value, "stored_at": stored_at}, default=str)
+        try:
+            self.client.set(self._key(key), payload, ex=self._ttl)
+        except redis.RedisError as e:
+            logger.warning("Market cache write failed for %s: %s", key, e)
+
+    def _keys(self) -> list[Any]:
+        return list(self.client.scan_iter(match=f"{self._prefix}:*"))
+
+    def clear(self) -> None:
+        try:
+            keys = self._keys()
+            if keys:
+                self.client.delete(*keys)
+        except redis.RedisError as e:
+            logger.warning("Market cache clear failed for %s: %s", self._namespace, e)
+
+    def __len__(self) -> int:
+        try:
+            return len(self._keys())
+        except redis.RedisError:
+            return 0
+
+    @contextlib.contextmanager
+    def fill_lock(self, key: str):
+        try:
+            lock_cm = distributed_lock(
+                f"{self._prefix}:lock:{key}", self._lock_ttl, client=self.client
+            )
+            lock = lock_cm.__enter__()
+        except redis.RedisError as e:
+            logger.warning("Market cache lock failed for %s: %s", key, e)
+            yield True
+            return
+        try:
+            yield lock
+        finally:
+            try:
+                lock_cm.__exit__(None, None, None)
+            except redis.RedisError as e:
+                logger.warning("Market cache unlock failed for %s: %s", key, e)
+
+
+def make_backend(name: str, maxsize: int, ttl: float) -> CacheBackend:
+    """Build the backend selected by ``MARKET_CACHE_BACKEND``."""
+    if settings.MARKET_CACHE_BACKEND == "memory":
+        return LocalCacheBackend(maxsize=maxsize, ttl=ttl)
+    return RedisCacheBackend(name, ttl)
+
+
+class MarketCache:
+    """A named cache with single-flight fetches and stale-while-revalidate.
+
+    Args:
+        name: Cache name, used as the Redis namespace and metric name.
+        ttl: Seconds an entry is fresh.
+        stale_ttl: Further seconds an entry is served while being refreshed.
+        maxsize: Entry limit for the in-memory backend.
+        backend: Storage backend; chosen from settings on first use if omitted.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        ttl: float,
+        stale_ttl: float = 0,
+        maxsize: int = 100,
+        backend: CacheBackend | None = None,
+    ) -> None:
+        self.name = name
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.maxsize = maxsize
+        self._backend = backend
+        # key -> (task, whether it waits on other processes' fetches)
+        self._inflight: dict[str, tuple[asyncio.Task, bool]] = {}
+        self.stats: Counter[str] = Counter()
+
+    @property
+    def backend(self) -> CacheBackend:
+        if self._backend is None:
+            self._backend = make_backend(
+                self.name, self.maxsize, self.ttl + self.stale_ttl
+            )
+        return self._backend
+
+    def get(self, key: str) -> Any | None:
+        """Return a fresh cached value, or None."""
+        entry = self.backend.get(key)
+        if entry is None or time.time() - entry[1] >= self.ttl:
+            return None
+        return entry[0]
+
+    def set(self, key: str, value: Any) -> None:
+        self.backend.set(key, value, time.time())
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def __len__(self) -> int:
+        return len(self.backend)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        cacheable: Callable[[T], bool] = lambda value: True,
+    ) -> T:
+        """Return the cached value for ``key``, fetching it on a miss.
+
+        Values for which ``cacheable`` returns False (e.g. error responses)
+        are returned but not stored.
+        """
+        entry = await self._call(self.backend.get, key)
+        age = time.time() - entry[1] if entry is not None else None
+
+        if age is not None and age < self.ttl:
+            self._count("hit")
+            return entry[0]  # type: ignore[index]
+
+        if age is not None and age < self.ttl + self.stale_ttl:
+            self._count("stale")
+            self._shared_fetch(key, fetch, cacheable, wait_for_others=False)
+            return entry[0]  # type: ignore[index]
+
+        self._count("miss")
+        task = self._shared_fetch(key, fetch, cacheable, wait_for_others=True)
+        # Shielded so one caller being cancelled doesn't cancel the others
+        return await asyncio.shield(task)
+
+    async def _call(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a backend call, in a worker thread if the backend blocks."""
+        if self.backend.blocking:
+            return await asyncio.to_thread(func, *args)
+        return func(*args)
+
+    def _count(self, status: str) -> None:
+        self.stats[status] += 1
+        record_metric("market_cache", self.name, status=status)
+
+    def _shared_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        cacheable: Callable[[T], bool],
+        wait_for_others: bool,
+    ) -> asyncio.Task:
+        """Join the in-flight fetch of ``key`` in this event loop, or start one.
+
+        A background refresh gives up if another process holds the fill lock,
+        so callers that need the value don't join one.
+        """
+        loop = asyncio.get_running_loop()
+        task, waits = self._inflight.get(key, (None, False))
+        if (
+            task is not None
+            and not task.done()
+            and task.get_loop() is loop
+            and (waits or not wait_for_others)
+        ):
+            return task
+
+        task = loop.create_task(self._fill(key, fetch, cacheable, wait_for_others))
+        self._inflight[key] = (task, wait_for_others)
+
+        def done(finished: asyncio.Task) -> None:
+            if self._inflight.get(key, (None,))[0] is finished:
+                del self._inflight[key]
+            if not finished.cancelled() and finished.exception() is not None:
+                logger.warning(
+                    "Market cache %s fetch failed for %s: %s",
+                    self.name,
+                    key,
+                    finished.exception(),
+                )
+
+        task.add_done_callback(done)
+        return task
+
+    async def _fill(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        cacheable: Callable[[T], bool],
+        wait_for_others: bool,
+    ) -> T | None:
+        lock = self.backend.fill_lock(key)
+        owner = await self._call(lock.__enter__)
+        try:
+            if owner:
+                return await self._fetch(key, fetch, cacheable)
+        finally:
+            await self._call(lock.__exit__, None, None, None)
+        if not wait_for_others:
+            # Another process is already refreshing this entry
+            return None
+
+        deadline = time.monotonic() + settings.MARKET_CACHE_FILL_WAIT_SEC
+        while time.monotonic() < deadline:
+            await asyncio.sleep(settings.MARKET_CACHE_FILL_POLL_SEC)
+            entry = await self._call(self.backend.get, key)
+            if entry is not None and time.time() - entry[1] < self.ttl:
+                return entry[0]
+        # The other process is slow or died; don't keep the caller waiting
+        return await self._fetch(key, fetch, cacheable)
+
+    async def _fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[T]],
+        cacheable: Callable[[T], bool],
+    ) -> T:
+        self.stats["upstream"] += 1
+        start = time.perf_counter()
+        status = "success"
+        try:
+            value = await fetch()
+        except Exception:
+            status = "failure"
+            raise
+        finally:
+            record_metric(
+                "market_api",
+                self.name,
+                duration_ms=(time.perf_counter() - start) * 1000,
+                status=status,
+            )
+        if cacheable(value):
+            await self._call(self.set, key, value)
+        return value
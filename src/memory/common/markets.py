@@ -10,48 +10,50 @@ import json
 import logging
 import re
 import statistics
-import threading
 from datetime import datetime, timedelta, timezone
-from typing import Literal, NotRequired, TypedDict
+from typing import Awaitable, Callable, Literal, NotRequired, TypedDict
 
 import aiohttp
-from cachetools import TTLCache
+
+from memory.common.market_cache import MarketCache
 
 logger = logging.getLogger(__name__)
 
 
-def question_similarity(q1: str, q2: str) -> float:
-    """Calculate simple word-based similarity between two questions.
+# Words ignored when comparing questions
+_STOP_WORDS = frozenset({
+    "the", "a", "an", "will", "be", "is", "are", "was", "were",
+    "to", "of", "in", "on", "at", "by", "for", "with", "or", "and",
+    "this", "that", "it", "as", "if", "when", "than", "but", "not",
+    "what", "which", "who", "how", "before", "after", "during",
+})
 
-    Returns a value between 0 and 1, where 1 means identical word sets.
+
+def question_tokens(text: str) -> frozenset[str]:
+    """Normalize a question to its set of significant words.
+
+    Lowercases, strips punctuation and drops stop words.
     """
-    if not q1 or not q2:
+    text = re.sub(r"[^\w\s]", " ", (text or "").lower())
+    return frozenset(text.split()) - _STOP_WORDS
+
+
+def _jaccard(words1: frozenset[str], words2: frozenset[str]) -> float:
+    if not words1 or not words2:
         return 0.0
+    intersection = len(words1 & words2)
+    return intersection / (len(words1) + len(words2) - intersection)
 
-    # Normalize: lowercase, remove punctuation, split into words
-    def normalize(text: str) -> set[str]:
-        text = text.lower()
-        text = re.sub(r"[^\w\s]", " ", text)
-        words = set(text.split())
-        # Remove common stop words
-        stop_words = {
-            "the", "a", "an", "will", "be", "is", "are", "was", "were",
-            "to", "of", "in", "on", "at", "by", "for", "with", "or", "and",
-            "this", "that", "it", "as", "if", "when", "than", "but", "not",
-            "what", "which", "who", "how", "before", "after", "during",
-        }
-        return words - stop_words
 
-    words1 = normalize(q1)
-    words2 = normalize(q2)
+def question_similarity(q1: str, q2: str) -> float:
+    """Calculate simple word-based similarity between two questions.
 
-    if not words1 or not words2:
+    Returns a value between 0 and 1, where 1 means identical word sets.
+    """
+    if not q1 or not q2:
         return 0.0
+    return _jaccard(question_tokens(q1), question_tokens(q2))
 
-    # Jaccard similarity
-    intersection = len(words1 & words2)
-    union = len(words1 | words2)
-    return intersection / union if union > 0 else 0.0
 
 # --- Type definitions ---
 
@@ -102,23 +104,24 @@ class Market(TypedDict):
     details: NotRequired[MarketDetails]
 
 
+# --- API endpoints ---
+
+MANIFOLD_API_URL = "https://api.manifold.markets/v0"
+POLYMARKET_GAMMA_URL = "https://gamma-api.polymarket.com"
+POLYMARKET_CLOB_URL = "https://clob.polymarket.com"
+KALSHI_API_URL = "https://api.elections.kalshi.com/trade-api/v2"
+
+
 # --- Caching infrastructure ---
-# TTLCache is not thread-safe, so we use locks for concurrent access
-
-# Search results cache: 5 minute TTL
-# Note: ``cachetools.TTLCache``'s own stubs declare ``[_KT, _VT, _TT]``
-# (key, value, timer type) while typeshed has ``[_KT, _VT]``; pyright
-# disagrees with itself depending on which one it picks first. Skip the
-# generic parameterisation entirely and rely on the constructor's
-# overload-driven inference at use sites.
-_search_cache: TTLCache = TTLCache(maxsize=500, ttl=300)
-_search_cache_lock = threading.Lock()
-# Market details/history cache: 10 minute TTL
-_history_cache: TTLCache = TTLCache(maxsize=100, ttl=600)
-_history_cache_lock = threading.Lock()
-# Market depth cache: 1 minute TTL (more volatile)
-_depth_cache: TTLCache = TTLCache(maxsize=100, ttl=60)
-_depth_cache_lock = threading.Lock()
+# Shared across processes (see market_cache); stale entries are served while
+# being refreshed in the background.
+
+# Search results cache: 5 minute TTL, then stale for 10 more
+_search_cache = MarketCache("search", ttl=300, stale_ttl=600, maxsize=500)
+# Market details/history cache: 10 minute TTL, then stale for 30 more
+_history_cache = MarketCache("history", ttl=600, stale_ttl=1800)
+# Market depth cache: 1 minute TTL (more volatile), then stale for 30 seconds
+_depth_cache = MarketCache("depth", ttl=60, stale_ttl=30)
 
 
 def cache_key(*args: str) -> str:
@@ -131,49 +134,29 @@ def clear_all_caches() -> dict:
 
     Useful for debugging or when you know data has changed.
     """
-    with _search_cache_lock:
-        _search_cache.clear()
-    with _history_cache_lock:
-        _history_cache.clear()
-    with _depth_cache_lock:
-        _depth_cache.clear()
+    for cache in (_search_cache, _history_cache, _depth_cache):
+        cache.clear()
     return {"cleared": True}
 
 
-def get_cached_search(key: str) -> list[dict] | None:
-    """Get a cached search result."""
-    with _search_cache_lock:
-        return _search_cache.get(key)
-
-
-def set_cached_search(key: str, value: list[dict]) -> None:
-    """Set a cached search result."""
-    with _search_cache_lock:
-        _search_cache[key] = value
-
-
-def get_cached_history(key: str) -> dict | None:
-    """Get a cached history result."""
-    with _history_cache_lock:
-        return _history_cache.get(key)
-
+async def cached_search(key: str, fetch: Callable[[], Awaitable[list[dict]]]) -> list[dict]:
+    """Get a search result from the cache, fetching it on a miss."""
+    return await _search_cache.get_or_fetch(key, fetch)
 
-def set_cached_history(key: str, value: dict) -> None:
-    """Set a cached history result."""
-    with _history_cache_lock:
-        _history_cache[key] = value
 
+async def cached_history(key: str, fetch: Callable[[], Awaitable[dict]]) -> dict:
+    """Get a history result from the cache, fetching it on a miss."""
+    return await _history_cache.get_or_fetch(key, fetch)
 
-def get_cached_depth(key: str) -> dict | None:
-    """Get a cached depth result."""
-    with _depth_cache_lock:
-        return _depth_cache.get(key)
 
+async def cached_depth(key: str, fetch: Callable[[], Awaitable[dict]]) -> dict:
+    """Get a depth result from the cache, fetching it on a miss.
 
-def set_cached_depth(key: str, value: dict) -> None:
-    """Set a cached depth result."""
-    with _depth_cache_lock:
-        _depth_cache[key] = value
+    Error responses are returned but not cached.
+    """
+    return await _depth_cache.get_or_fetch(
+        key, fetch, cacheable=lambda result: "error" not in result
+    )
 
 
 # --- Helper functions ---
@@ -238,7 +221,7 @@ def parse_outcome_prices(outcome_prices: str | list) -> list:
 async def get_manifold_details(session: aiohttp.ClientSession, market_id: str):
     """Get detailed market info from Manifold."""
     async with session.get(
-        f"https://api.manifold.markets/v0/market/{market_id}"
+        f"{MANIFOLD_API_URL}/market/{market_id}"
     ) as resp:
         resp.raise_for_status()
         return await resp.json()
@@ -284,7 +267,7 @@ async def search_manifold_markets(
     """Search Manifold Markets for prediction markets matching the term."""
     async with aiohttp.ClientSession() as session:
         async with session.get(
-            "https://api.manifold.markets/v0/search-markets",
+            f"{MANIFOLD_API_URL}/search-markets",
             params={
                 "term": term,
                 "contractType": "BINARY" if binary else "ALL",
@@ -310,7 +293,7 @@ async def get_manifold_history(market_id: str, days: int = 7) -> list[dict]:
     async with aiohttp.ClientSession() as session:
         # Verify market exists
         async with session.get(
-            f"https://api.manifold.markets/v0/market/{market_id}"
+            f"{MANIFOLD_API_URL}/market/{market_id}"
         ) as resp:
             if resp.status != 200:
                 return []
@@ -321,7 +304,7 @@ async def get_manifold_history(market_id: str, days: int = 7) -> list[dict]:
         cutoff_ts = int(cutoff.timestamp() * 1000)
 
         async with session.get(
-            "https://api.manifold.markets/v0/bets",
+            f"{MANIFOLD_API_URL}/bets",
             params={
                 "contractId": market_id,
                 "afterTime": cutoff_ts,
@@ -373,7 +356,7 @@ async def get_manifold_resolved(
             params["term"] = term
 
         async with session.get(
-            "https://api.manifold.markets/v0/search-markets",
+            f"{MANIFOLD_API_URL}/search-markets",
             params=params,
         ) as resp:
             if resp.status != 200:
@@ -432,7 +415,7 @@ async def search_polymarket_markets(
             "events_status": "active",
         }
         async with session.get(
-            "https://gamma-api.polymarket.com/public-search",
+            f"{POLYMARKET_GAMMA_URL}/public-search",
             params=params,
         ) as resp:
             resp.raise_for_status()
@@ -515,7 +498,7 @@ async def get_polymarket_history(market_id: str, days: int = 7) -> list[dict]:
         # Try to get history from Polymarket's CLOB timeseries endpoint
         # Note: This endpoint may require different parameters
         async with session.get(
-            "https://clob.polymarket.com/prices-history",
+            f"{POLYMARKET_CLOB_URL}/prices-history",
             params={
                 "market": market_id,
                 "interval": "1d" if days > 7 else "1h",
@@ -634,7 +617,7 @@ async def search_kalshi_events(
 
         try:
             async with session.get(
-                "https://api.elections.kalshi.com/trade-api/v2/events",
+                f"{KALSHI_API_URL}/events",
                 params=params,
             ) as resp:
                 if resp.status != 200:
@@ -659,7 +642,7 @@ async def search_kalshi_events(
 
             try:
                 async with session.get(
-                    f"https://api.elections.kalshi.com/trade-api/v2/events/{event_ticker}"
+                    f"{KALSHI_API_URL}/events/{event_ticker}"
                 ) as resp:
                     if resp.status != 200:
                         continue
@@ -740,7 +723,7 @@ async def get_kalshi_history(
     async with aiohttp.ClientSession() as session:
         # Verify market exists
         async with session.get(
-            f"https://api.elections.kalshi.com/trade-api/v2/markets/{ticker}"
+            f"{KALSHI_API_URL}/markets/{ticker}"
         ) as resp:
             if resp.status != 200:
                 return []
@@ -748,7 +731,7 @@ async def get_kalshi_history(
 
         # Get candlesticks
         async with session.get(
-            f"https://api.elections.kalshi.com/trade-api/v2/markets/{ticker}/candlesticks",
+            f"{KALSHI_API_URL}/markets/{ticker}/candlesticks",
             params={
                 "period_interval": resolution,
                 "limit": limit,
@@ -792,7 +775,7 @@ async def get_kalshi_resolved(term: str | None, since: datetime | None) -> list[
                 params["cursor"] = cursor
 
             async with session.get(
-                "https://api.elections.kalshi.com/trade-api/v2/markets",
+                f"{KALSHI_API_URL}/markets",
                 params=params,
             ) as resp:
                 if resp.status != 200:
@@ -908,7 +891,7 @@ async def fetch_market_info(market_id: str, source: MarketSource) -> dict | None
     async with aiohttp.ClientSession() as session:
         if source == "manifold":
             async with session.get(
-                f"https://api.manifold.markets/v0/market/{market_id}"
+                f"{MANIFOLD_API_URL}/market/{market_id}"
             ) as resp:
                 if resp.status != 200:
                     return None
@@ -920,7 +903,7 @@ async def fetch_market_info(market_id: str, source: MarketSource) -> dict | None
                 }
         elif source == "kalshi":
             async with session.get(
-                f"https://api.elections.kalshi.com/trade-api/v2/markets/{market_id}"
+                f"{KALSHI_API_URL}/markets/{market_id}"
             ) as resp:
                 if resp.status != 200:
                     return None
@@ -935,7 +918,7 @@ async def fetch_market_info(market_id: str, source: MarketSource) -> dict | None
         else:  # polymarket
             # For Polymarket, try to get from Gamma API
             async with session.get(
-                f"https://gamma-api.polymarket.com/markets/{market_id}"
+                f"{POLYMARKET_GAMMA_URL}/markets/{market_id}"
             ) as resp:
                 if resp.status != 200:
                     return None
@@ -950,6 +933,115 @@ async def fetch_market_info(market_id: str, source: MarketSource) -> dict | None
 
 # --- Compare and analyze ---
 
+# Only flag arbitrage for >5% price gaps between questions with >40% word overlap
+ARBITRAGE_MIN_DIFFERENCE = 0.05
+ARBITRAGE_MIN_SIMILARITY = 0.4
+
+
+def _candidate_pairs(
+    tokens: list[frozenset[str]], sources: list[str], min_similarity: float
+) -> set[tuple[int, int]]:
+    """Index pairs from different sources that may reach ``min_similarity``.
+
+    Prefix filtering over an inverted token index (the AllPairs join): with
+    every token set ordered rarest-first, two sets sharing ``k`` tokens must
+    have a common token among the first ``len - k + 1`` of each. Jaccard
+    similarity >= t forces ``k >= t * len`` for the larger set and, visiting
+    sets smallest-first, ``k >= 2t / (1 + t) * len`` for the smaller one that
+    is already indexed. Only those prefixes are probed and indexed, so common
+    words like a year or a candidate's name don't pair up every market, and
+    no qualifying pair is missed. Candidates still need the full similarity
+    check.
+    """
+    frequency: dict[str, int] = {}
+    for words in tokens:
+        for word in words:
+            frequency[word] = frequency.get(word, 0) + 1
+
+    # int() floors, so prefixes are never shorter than required
+    index_overlap = 2 * min_similarity / (1 + min_similarity)
+    index: dict[str, list[int]] = {}
+    pairs: set[tuple[int, int]] = set()
+    for i in sorted(range(len(tokens)), key=lambda i: len(tokens[i])):
+        words = tokens[i]
+        if not words:
+            continue
+        size = len(words)
+        min_size = min_similarity * size
+        ordered = sorted(words, key=lambda w: (frequency[w], w))
+        for word in ordered[: size - int(min_similarity * size) + 1]:
+            pairs.update(
+                (min(i, j), max(i, j))
+                for j in index.get(word, ())
+                if sources[j] != sources[i] and len(tokens[j]) >= min_size
+            )
+        for word in ordered[: size - int(index_overlap * size) + 1]:
+            index.setdefault(word, []).append(i)
+    return pairs
+
+
+def find_arbitrage_opportunities(
+    markets: list[dict],
+    min_difference: float = ARBITRAGE_MIN_DIFFERENCE,
+    min_similarity: float = ARBITRAGE_MIN_SIMILARITY,
+    limit: int = 10,
+) -> list[dict]:
+    """Find the biggest price gaps between matching markets on different platforms.
+
+    Each question is normalized once and candidate pairs come from a token
+    index rather than comparing every market against every other, so this
+    stays fast for thousands of markets. All qualifying pairs are ranked,
+    largest price difference first and then by similarity.
+
+    Args:
+        markets: Markets with ``source``, ``question`` and ``probability``.
+        min_difference: Smallest probability gap worth reporting.
+        min_similarity: Smallest question similarity to treat as the same event.
+        limit: Maximum number of opportunities to return.
+    """
+    eligible = [
+        m for m in markets if m.get("source") and m.get("probability") is not None
+    ]
+    # Report each pair in the order its sources first appear
+    source_rank: dict[str, int] = {}
+    for m in eligible:
+        source_rank.setdefault(m["source"], len(source_rank))
+
+    tokens = [question_tokens(m.get("question", "")) for m in eligible]
+    sources = [m["source"] for m in eligible]
+
+    scored = []
+    for i, j in _candidate_pairs(tokens, sources, min_similarity):
+        m1, m2 = eligible[i], eligible[j]
+        diff = abs(m1["probability"] - m2["probability"])
+        if diff < min_difference:
+            continue
+        similarity = _jaccard(tokens[i], tokens[j])
+        if similarity < min_similarity:
+            continue
+        if source_rank[m1["source"]] > source_rank[m2["source"]]:
+            m1, m2 = m2, m1
+        scored.append((-diff, -similarity, i, j, m1, m2))
+    scored.sort(key=lambda item: item[:4])
+
+    def describe(m: dict) -> dict:
+        return {
+            "source": m["source"],
+            "id": m.get("id"),
+            "question": m.get("question", ""),
+            "probability": m["probability"],
+        }
+
+    return [
+        {
+            "market_1": describe(m1),
+            "market_2": describe(m2),
+            "difference": round(-neg_diff, 3),
+            "similarity": round(-neg_similarity, 3),
+        }
+        for neg_diff, neg_similarity, _, _, m1, m2 in scored[:limit]
+    ]
+
 
 async def compare_forecasts_data(
     term: str, min_volume: int = 1000
@@ -963,14 +1055,10 @@ async def compare_forecasts_data(
     Returns:
         Dict with markets, consensus, disagreement, and arbitrage_opportunities.
     """
-    # Check cache first
     key = cache_key("compare", term, str(min_volume))
-    cached = get_cached_search(key)
-    if cached is not None:
-        markets = cached
-    else:
-        markets = await search_markets(term, min_volume, binary=True)
-        set_cached_search(key, markets)
+    markets = await cached_search(
+        key, lambda: search_markets(term, min_volume, binary=True)
+    )
 
     if not markets:
         return {
@@ -1007,70 +1095,12 @@ async def compare_forecasts_data(
             # Standard deviation
             disagreement = round(statistics.stdev(probs), 3)
 
-    # Find arbitrage opportunities (>5% price difference between platforms)
-    # Only flag arbitrage if questions are semantically similar (>40% word overlap)
-    SIMILARITY_THRESHOLD = 0.4
-    arbitrage_opportunities = []
-    by_source: dict[str, list[dict]] = {}
-    for m in markets:
-        source = m.get("source")
-        if not source:
-            continue
-        if source not in by_source:
-            by_source[source] = []
-        by_source[source].append(m)
-
-    # Early exit once we have enough opportunities (limit O(n^4) impact)
-    MAX_OPPORTUNITIES = 20  # Collect up to 20, return top 10
-    sources = list(by_source.keys())
-    for i, s1 in enumerate(sources):
-        if len(arbitrage_opportunities) >= MAX_OPPORTUNITIES:
-            break
-        for s2 in sources[i + 1 :]:
-            if len(arbitrage_opportunities) >= MAX_OPPORTUNITIES:
-                break
-            for m1 in by_source[s1]:
-                if len(arbitrage_opportunities) >= MAX_OPPORTUNITIES:
-                    break
-                for m2 in by_source[s2]:
-                    if len(arbitrage_opportunities) >= MAX_OPPORTUNITIES:
-                        break
-                    p1 = m1.get("probability")
-                    p2 = m2.get("probability")
-                    if p1 is not None and p2 is not None:
-                        diff = abs(p1 - p2)
-                        if diff >= 0.05:  # 5% difference threshold
-                            # Check if questions are semantically similar
-                            q1 = m1.get("question", "")
-                            q2 = m2.get("question", "")
-                            similarity = question_similarity(q1, q2)
-                            if similarity < SIMILARITY_THRESHOLD:
-                                continue  # Skip if questions are too different
-
-                            arbitrage_opportunities.append({
-                                "market_1": {
-                                    "source": s1,
-                                    "id": m1.get("id"),
-                                    "question": q1,
-                                    "probability": p1,
-                                },
-                                "market_2": {
-                                    "source": s2,
-                                    "id": m2.get("id"),
-                                    "question": q2,
-                                    "probability": p2,
-                                },
-                                "difference": round(diff, 3),
-                                "similarity": round(similarity, 3),
-                            })
-
-    # Sort by largest difference
-    arbitrage_opportunities.sort(key=lambda x: x["difference"], reverse=True)
+    arbitrage_opportunities = find_arbitrage_opportunities(markets)
 
     return {
         "term": term,
         "markets": markets,
         "consensus": consensus,
         "disagreement": disagreement,
-        "arbitrage_opportunities": arbitrage_opportunities[:10],  # Top 10
+        "arbitrage_opportunities": arbitrage_opportunities,
     }
@@ -0,0 +1,162 @@
+"""Render PDF pages to image files, in parallel, one page at a time.
+
+Rendering is CPU-bound and PyMuPDF holds the GIL, so with ``workers > 1``
+pages are rendered in a process pool. Daemonic processes, such as Celery's
+prefork workers, may not start children, so they always render in-process,
+one page at a time. Each pool worker opens the document once and writes every page it
+renders straight to a PNG in ``spill_dir``; only the file path and page
+geometry travel back. At most ``2 * workers`` pages are in flight, and pages
+are yielded in order as they finish, so memory stays bounded by a handful
+of rasters however long the document is.
+
+Encoding the PNG costs far more than rasterizing the page, so it is done
+with Pillow at its fastest compression level: still lossless, so whatever
+reads a page back sees exactly the rendered pixels.
+
+This module deliberately imports nothing beyond PyMuPDF and Pillow: workers
+start from a fresh interpreter (forkserver/spawn), and importing the rest of
+the application there would cost more than rendering a short document.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import multiprocessing
+import pathlib
+import uuid
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Generator, Iterator
+
+import pymupdf  # PyMuPDF
+from PIL import Image
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RenderedPage:
+    number: int
+    path: pathlib.Path  # rendered PNG
+    pixel_size: tuple[int, int]
+    width: float  # page size in points
+    height: float
+    text: str | None  # embedded text layer, if requested
+
+
+def render_page(
+    pdf: pymupdf.Document,
+    number: int,
+    dpi: int,
+    spill_dir: pathlib.Path,
+    prefix: str,
+    with_text: bool = False,
+) -> RenderedPage:
+    """Render one page to ``{spill_dir}/{prefix}_{number}.png``."""
+    page = pdf[number]
+    pix = page.get_pixmap(dpi=dpi)  # type: ignore
+    path = spill_dir / f"{prefix}_{number}.png"
+    image = Image.frombytes("RGB", (pix.width, pix.height), pix.samples)
+    image.save(path, format="PNG", compress_level=1)
+
+    text = None
+    if with_text:
+        try:
+            text = page.get_text().strip()  # type: ignore
+        except Exception:
+            logger.warning("get_text failed for page %s; ingesting image-only", number)
+            text = ""
+
+    return RenderedPage(
+        number=number,
+        path=path,
+        pixel_size=(pix.width, pix.height),
+        width=page.rect.width,
+        height=page.rect.height,
+        text=text,
+    )
+
+
+# The document each pool worker renders from, opened once by the initializer
+_worker_pdf: pymupdf.Document | None = None
+
+
+def _open_worker_pdf(path: str) -> None:
+    global _worker_pdf
+    _worker_pdf = pymupdf.open(path)
+
+
+def _render_in_worker(number: int, *args) -> RenderedPage:
+    assert _worker_pdf is not None
+    return render_page(_worker_pdf, number, *args)
+
+
+def _pool_context():
+    # forkserver avoids forking a multi-threaded parent; spawn elsewhere
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
+
+
+def _render_in_pool(
+    path: pathlib.Path, page_count: int, workers: int, args: tuple
+) -> Iterator[RenderedPage]:
+    pool = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=_pool_context(),
+        initializer=_open_worker_pdf,
+        initargs=(str(path),),
+    )
+    numbers = iter(range(page_count))
+    pending: deque[Future[RenderedPage]] = deque(
+        pool.submit(_render_in_worker, n, *args)
+        for n in itertools.islice(numbers, workers * 2)
+    )
+    try:
+        while pending:
+            page = pending.popleft().result()
+            for number in itertools.islice(numbers, 1):
+                pending.append(pool.submit(_render_in_worker, number, *args))
+            yield page
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+        # Pages rendered ahead of a consumer that stopped early
+        for future in pending:
+            if not future.cancelled() and future.exception() is None:
+                future.result().path.unlink(missing_ok=True)
+
+
+def render_pages(
+    path: pathlib.Path,
+    spill_dir: pathlib.Path,
+    dpi: int = 72,
+    workers: int = 1,
+    with_text: bool = False,
+) -> Generator[RenderedPage, None, None]:
+    """Render every page of the PDF at ``path``, yielding them in page order.
+
+    Args:
+        path: PDF file (workers reopen it by path).
+        spill_dir: Directory the page PNGs are written to. They are left
+            there for the caller; each file name is unique to this call.
+        dpi: Render resolution (72 is PyMuPDF's default).
+        workers: Render processes; 1 renders in the calling process. It
+            only applies outside daemonic processes (which may not have
+            children, e.g. Celery's prefork workers): those always render
+            in-process, whatever ``workers`` is.
+        with_text: Also extract each page's embedded text layer.
+    """
+    spill_dir.mkdir(parents=True, exist_ok=True)
+    args = (dpi, spill_dir, f"page_{uuid.uuid4().hex}", with_text)
+
+    with pymupdf.open(path) as pdf:
+        page_count = pdf.page_count
+        workers = min(workers, page_count)
+        if workers <= 1 or multiprocessing.current_process().daemon:
+            for number in range(page_count):
+                yield render_page(pdf, number, *args)
+            return
+
+    yield from _render_in_pool(path, page_count, workers, args)
@@ -11,10 +11,22 @@ import logging
 import re
 from typing import TYPE_CHECKING, TypeAlias
 
-from sqlalchemy import func as sql_func
+from sqlalchemy import case, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session, scoped_session
 
 from memory.common.db.models import Person
+from memory.common.db.models.person_identifiers import (
+    ALIAS,
+    EMAIL,
+    GITHUB,
+    NAME,
+    SLACK,
+    PersonIdentifier,
+    identifier_keys,
+    normalize,
+    write_person_identifiers,
+)
 from memory.common.db.models.sources import GithubUser
 
 if TYPE_CHECKING:
@@ -40,6 +52,35 @@ def make_identifier(name: str) -> str:
     return "".join(c for c in identifier if c.isalnum() or c == "_")
 
 
+def find_person_by_identifier(
+    session: DBSession,
+    kinds: list[str],
+    value: str | None,
+    workspace: str = "",
+) -> Person | None:
+    """Find a Person through the ``person_identifiers`` index.
+
+    ``kinds`` are tried in the order given; ties within a kind go to the
+    oldest Person so the pick is stable across calls.
+    """
+    value = normalize(value)
+    if not value:
+        return None
+
+    rank = case({kind: i for i, kind in enumerate(kinds)}, value=PersonIdentifier.kind)
+    return (
+        session.query(Person)
+        .join(PersonIdentifier, PersonIdentifier.person_id == Person.id)
+        .filter(
+            PersonIdentifier.kind.in_(kinds),
+            PersonIdentifier.workspace == workspace,
+            PersonIdentifier.value == value,
+        )
+        .order_by(rank, Person.id)
+        .first()
+    )
+
+
 def find_person_by_name(session: DBSession, name: str | None) -> Person | None:
     """Try to find a Person record by name, alias, or email.
 
@@ -60,26 +101,11 @@ def find_person_by_name(session: DBSession, name: str | None) -> Person | None:
 
     name_lower = name.lower().strip()
 
-    # Try exact match on display_name first
-    person = (
-        session.query(Person)
-        .filter(sql_func.lower(Person.display_name) == name_lower)
-        .first()
-    )
+    # display_name matches win over alias matches
+    person = find_person_by_identifier(session, [NAME, ALIAS], name_lower)
     if person:
         return person
 
-    # Try matching aliases
-    people_with_aliases = (
-        session.query(Person)
-        .filter(Person.aliases.isnot(None))
-        .filter(sql_func.array_length(Person.aliases, 1) > 0)
-        .all()
-    )
-    for person in people_with_aliases:
-        if any(alias.lower() == name_lower for alias in (person.aliases or [])):
-            return person
-
     # If the input looks like an email, do an exact (case-insensitive)
     # match — NOT a substring match. The previous wildcards-on-both-sides
     # ilike turned `bob@x.com` into a query that also matched
@@ -108,12 +134,7 @@ def find_person_by_email(session: DBSession, email: str | None) -> Person | None
     if not email:
         return None
 
-    email_lower = email.lower().strip()
-    return (
-        session.query(Person)
-        .filter(Person.contact_info["email"].astext.ilike(escape_like(email_lower)))
-        .first()
-    )
+    return find_person_by_identifier(session, [EMAIL], email)
 
 
 def find_person_by_slack_id(
@@ -131,21 +152,10 @@ def find_person_by_slack_id(
     Returns:
         Matching Person or None
     """
-    # Query for people with Slack info for this workspace
-    people = (
-        session.query(Person)
-        .filter(Person.contact_info["slack"].isnot(None))
-        .all()
+    return find_person_by_identifier(
+        session, [SLACK], slack_user_id, workspace=workspace_id
     )
 
-    for person in people:
-        slack_info = person.contact_info.get("slack", {})
-        workspace_info = slack_info.get(workspace_id, {})
-        if workspace_info.get("user_id") == slack_user_id:
-            return person
-
-    return None
-
 
 def find_person_by_github(session: DBSession, login: str | None) -> Person | None:
     """Find a Person by their GitHub login.
@@ -170,14 +180,9 @@ def find_person_by_github(session: DBSession, login: str | None) -> Person | Non
     if github_user and github_user.person is not None:
         return github_user.person
 
-    # order_by keeps the pick deterministic across re-syncs if two People
-    # happen to carry the same handle (no DB uniqueness on the JSONB field).
-    return (
-        session.query(Person)
-        .filter(Person.contact_info["github"].astext == login)
-        .order_by(Person.id)
-        .first()
-    )
+    # Ties go to the oldest Person, keeping the pick deterministic across
+    # re-syncs if two People happen to carry the same handle.
+    return find_person_by_identifier(session, [GITHUB], login)
 
 
 def link_github_user_to_person(
@@ -324,6 +329,129 @@ def find_person(session: DBSession, identifier: str | None) -> Person | None:
     return session.query(Person).filter(Person.identifier == slug).first()
 
 
+# A lookup to try for an identifier: a person_identifiers kind, or
+# IDENTIFIER for a match on Person.identifier, plus the value to match.
+Candidate: TypeAlias = tuple[str, str]
+IDENTIFIER = "identifier"
+
+
+def _lookup_candidates(identifier: str) -> list[Candidate]:
+    """The lookups ``find_person`` tries for ``identifier``, in order."""
+    value = identifier.lower().strip()
+    candidates: list[Candidate] = [(EMAIL, value)] if "@" in value else []
+    return candidates + [
+        (NAME, value),
+        (ALIAS, value),
+        (IDENTIFIER, value),
+        (IDENTIFIER, make_identifier(identifier)),
+    ]
+
+
+def _new_person_fields(identifier: str) -> tuple[str, str | None]:
+    """``(name, email)`` for a Person created from an unmatched identifier."""
+    if "@" in identifier:
+        return identifier.split("@")[0], identifier
+    return identifier, None
+
+
+def _match_candidates(
+    session: DBSession, candidates: set[Candidate]
+) -> dict[Candidate, int]:
+    """Person id for every candidate that matches, in at most two queries.
+
+    Ties go to the oldest Person, as with the single-identifier lookups.
+    """
+    index_keys = {(kind, v) for kind, v in candidates if kind != IDENTIFIER and v}
+    slugs = {v for kind, v in candidates if kind == IDENTIFIER and v}
+
+    matches: dict[Candidate, int] = {}
+    if index_keys:
+        rows = (
+            session.query(
+                PersonIdentifier.kind, PersonIdentifier.value, PersonIdentifier.person_id
+            )
+            .filter(
+                PersonIdentifier.workspace == "",
+                tuple_(PersonIdentifier.kind, PersonIdentifier.value).in_(index_keys),
+            )
+            .order_by(PersonIdentifier.person_id)
+        )
+        for kind, value, person_id in rows:
+            matches.setdefault((kind, value), person_id)
+    if slugs:
+        rows = session.query(Person.id, Person.identifier).filter(
+            Person.identifier.in_(slugs)
+        )
+        for person_id, slug in rows:
+            matches[(IDENTIFIER, slug)] = person_id
+    return matches
+
+
+def _create_people(session: DBSession, identifiers: list[str]) -> dict[str, int]:
+    """Create People for unmatched identifiers in one multi-row insert.
+
+    Identifiers that slugify to the same Person.identifier share one
+    Person. A slug that already exists (e.g. created concurrently) resolves
+    to the existing row instead of failing the insert.
+
+    Returns:
+        Mapping of identifier to person id
+    """
+    slug_of: dict[str, str] = {}
+    rows: dict[str, dict] = {}
+    for identifier in identifiers:
+        name, email = _new_person_fields(identifier)
+        slug = make_identifier(name)
+        if not slug:
+            continue
+        slug_of[identifier] = slug
+        rows.setdefault(
+            slug,
+            {
+                "identifier": slug,
+                "display_name": name,
+                "aliases": [name],
+                "contact_info": {"email": email} if email else {},
+            },
+        )
+    if not rows:
+        return {}
+
+    created = session.execute(
+        pg_insert(Person)
+        .values(list(rows.values()))
+        .on_conflict_do_nothing(index_elements=["identifier"])
+        .returning(Person.id, Person.identifier)
+    ).all()
+    ids = {slug: person_id for person_id, slug in created}
+
+    # Core inserts bypass the flush listener that maintains the index
+    write_person_identifiers(
+        session,
+        {
+            ids[slug]: identifier_keys(
+                row["display_name"], row["aliases"], row["contact_info"]
+            )
+            for slug, row in rows.items()
+            if slug in ids
+        },
+    )
+    for slug in ids:
+        logger.info(f"Created person '{slug}'")
+
+    if conflicted := set(rows) - set(ids):
+        existing = session.query(Person.id, Person.identifier).filter(
+            Person.identifier.in_(conflicted)
+        )
+        ids.update({slug: person_id for person_id, slug in existing})
+
+    return {
+        identifier: ids[slug]
+        for identifier, slug in slug_of.items()
+        if slug in ids
+    }
+
+
 def resolve_people(
     session: DBSession,
     identifiers: set[str] | list[str],
@@ -331,32 +459,61 @@ def resolve_people(
 ) -> list["Person"]:
     """Resolve identifiers (emails, names, slugs) to Person records.
 
+    Each identifier resolves as ``find_person`` would (and, when creating,
+    as ``find_or_create_person`` would), but the whole collection is
+    resolved together: one index query, one identifier query, one insert
+    for any missing People and one load, however many identifiers there are.
+
     Args:
         session: Database session for person lookup
         identifiers: Collection of emails, names, or identifiers to look up
         create_if_missing: If True, create Person records for unmatched identifiers
 
     Returns:
-        Deduplicated list of resolved Person records
+        Deduplicated list of resolved Person records, in identifier order
     """
+    wanted = [i for i in dict.fromkeys(identifiers) if i]
+    if not wanted:
+        return []
+
+    plans = {identifier: _lookup_candidates(identifier) for identifier in wanted}
+    if create_if_missing:
+        # find_or_create_person looks up an email's local part before creating
+        for identifier, plan in plans.items():
+            name, email = _new_person_fields(identifier)
+            if email:
+                plan.extend(_lookup_candidates(name))
+
+    matches = _match_candidates(
+        session, {candidate for plan in plans.values() for candidate in plan}
+    )
+    person_ids: dict[str, int] = {}
+    for identifier, plan in plans.items():
+        person_id = next((matches[c] for c in plan if c in matches), None)
+        if person_id is not None:
+            person_ids[identifier] = person_id
+
+    if create_if_missing:
+        missing = [i for i in wanted if i not in person_ids]
+        if missing:
+            person_ids.update(_create_people(session, missing))
+
+    if not person_ids:
+        return []
+    people = {
+        person.id: person
+        for person in session.query(Person).filter(
+            Person.id.in_(set(person_ids.values()))
+        )
+    }
+
     resolved: list[Person] = []
     seen: set[int] = set()
-
-    for identifier in identifiers:
-        if not identifier:
-            continue
-
-        person = find_person(session, identifier)
-
-        if not person and create_if_missing:
-            email = identifier if "@" in identifier else None
-            name = identifier if "@" not in identifier else identifier.split("@")[0]
-            person, _ = find_or_create_person(session, name=name, email=email)
-
-        if person and person.id not in seen:
-            resolved.append(person)
-            seen.add(person.id)
-
+    for identifier in wanted:
+        person_id = person_ids.get(identifier)
+        if person_id in people and person_id not in seen:
+            resolved.append(people[person_id])
+            seen.add(person_id)
     return resolved
 
 
@@ -369,7 +526,9 @@ def link_people(
     """Link Person records to a SourceItem based on identifiers.
 
     For each identifier, tries to find a matching Person by email, name,
-    or identifier slug. Skips duplicates and None values.
+    or identifier slug. Skips duplicates and None values. Resolution is
+    bulk (see ``resolve_people``), and already-linked people are diffed
+    by id rather than scanned per identifier.
 
     Args:
         session: Database session for person lookup
@@ -380,24 +539,14 @@ def link_people(
     Returns:
         Number of people linked
     """
-    linked = 0
-    for identifier in identifiers:
-        if not identifier:
-            continue
-
-        person = find_person(session, identifier)
-
-        # Optionally create if not found and we have enough info
-        if not person and create_if_missing:
-            email = identifier if "@" in identifier else None
-            name = identifier if "@" not in identifier else identifier.split("@")[0]
-            person, _ = find_or_create_person(session, name=name, email=email)
-
-        if person and person not in source_item.people:
-            source_item.people.append(person)
-            linked += 1
+    people = resolve_people(session, identifiers, create_if_missing)
+    if not people:
+        return 0
 
-    return linked
+    linked_ids = {person.id for person in source_item.people}
+    new_people = [person for person in people if person.id not in linked_ids]
+    source_item.people.extend(new_people)
+    return len(new_people)
 
 
 def reconcile_people(
@@ -444,7 +593,9 @@ def link_slack_user_to_person(
     if not person.contact_info:
         person.contact_info = {}
 
-    slack_info = person.contact_info.get("slack", {})
+    # Copy rather than mutate in place: mutating the loaded dict would make
+    # the reassignment below compare equal and never be flushed.
+    slack_info = dict(person.contact_info.get("slack", {}))
     slack_info[workspace_id] = {
         "user_id": slack_user_id,
         "username": slack_username,
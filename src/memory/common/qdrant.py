@@ -337,6 +337,32 @@ def set_payload(
     logger.debug(f"Set payload for point {point_id} in {collection_name}")
 
 
+def set_payloads(
+    client: qdrant_client.QdrantClient,
+    collection_name: str,
+    point_ids: Sequence[str],
+    payload: dict[str, Any],
+    batch_size: int = 1000,
+) -> None:
+    """Set the same payload on many points, ``batch_size`` points per request.
+
+    Args:
+        client: Qdrant client
+        collection_name: Name of the collection
+        point_ids: Vector IDs (as strings)
+        payload: Payload keys to set on every point
+        batch_size: Points per request
+    """
+    for i in range(0, len(point_ids), batch_size):
+        client.set_payload(
+            collection_name=collection_name,
+            payload=payload,
+            points=list(point_ids[i : i + batch_size]),
+        )
+
+    logger.debug(f"Set payload for {len(point_ids)} points in {collection_name}")
+
+
 def get_payloads(
     client: qdrant_client.QdrantClient, collection_name: str, ids: list[str]
 ) -> dict[str, dict[str, Any]]:
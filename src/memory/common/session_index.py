@@ -0,0 +1,324 @@
+"""Sidecar index for session transcript JSONL files.
+
+Every ``<session>.jsonl`` transcript can have a ``<session>.index.sqlite``
+file next to it holding:
+
+- the set of event UUIDs already written, so appends can deduplicate a
+  batch in O(batch) rather than re-parsing the whole transcript;
+- a sparse line -> byte offset checkpoint every ``CHECKPOINT_INTERVAL``
+  lines, so paginated reads can seek close to their first line instead of
+  scanning from the top of the file;
+- the number of events, so the total shown alongside a page doesn't need a
+  full scan either.
+
+The JSONL file stays the source of truth. The index records how many bytes
+of the transcript it covers (plus the file's inode); when that doesn't
+match the file on disk the index is caught up from the recorded offset, or
+rebuilt from scratch if the transcript shrank or was replaced. A crash
+between writing the JSONL and committing the index therefore just costs a
+short catch-up scan on the next append.
+
+Writers (``sync_index``/``record_append``) assume the caller holds the
+transcript's exclusive ``flock`` — the index has no locking of its own.
+Readers go through ``read_index``, which never writes and ignores an index
+that doesn't describe the file currently on disk.
+
+Lives in ``common`` so the maintenance worker can remove sidecars when it
+deletes old transcripts without importing the api package.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import BinaryIO
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".index.sqlite"
+
+# Lines between stored checkpoints. A page read scans at most this many
+# lines before reaching its first row.
+CHECKPOINT_INTERVAL = 1000
+
+# SQLite's default SQLITE_MAX_VARIABLE_NUMBER is 999 on older builds.
+LOOKUP_CHUNK_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS uuids (uuid TEXT PRIMARY KEY) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS checkpoints (line INTEGER PRIMARY KEY, offset INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER NOT NULL);
+"""
+
+
+def index_path(transcript_file: Path) -> Path:
+    """Path of the sidecar index for ``transcript_file``."""
+    return transcript_file.with_suffix(INDEX_SUFFIX)
+
+
+def remove_index(transcript_file: Path) -> bool:
+    """Delete the sidecar index for a transcript. Returns True if one existed."""
+    try:
+        index_path(transcript_file).unlink()
+        return True
+    except FileNotFoundError:
+        return False
+
+
+@contextmanager
+def open_index(transcript_file: Path) -> Iterator[sqlite3.Connection]:
+    """Open (creating if needed) the sidecar index for ``transcript_file``."""
+    conn = sqlite3.connect(index_path(transcript_file), isolation_level=None)
+    try:
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(SCHEMA)
+        yield conn
+    finally:
+        conn.close()
+
+
+def _get_meta(conn: sqlite3.Connection, key: str) -> int | None:
+    row = conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def _set_meta(conn: sqlite3.Connection, key: str, value: int) -> None:
+    conn.execute(
+        "INSERT INTO meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, value),
+    )
+
+
+@dataclass
+class ScanResult:
+    """What ``scan_transcript`` learned about a stretch of transcript."""
+
+    end: int
+    lines: int = 0
+    events: int = 0
+    uuids: list[str] = field(default_factory=list)
+    checkpoints: list[tuple[int, int]] = field(default_factory=list)
+
+
+def scan_transcript(fh: BinaryIO, start: int = 0, first_line: int = 0) -> ScanResult:
+    """Scan ``fh`` from byte offset ``start``, which must begin line ``first_line``.
+
+    ``end`` in the result is the offset just past the last complete line. A
+    trailing line without a newline (a write that was cut off mid-way) is
+    not counted, so the next scan revisits it. ``lines`` counts every
+    complete line; ``events`` only the non-blank ones.
+    """
+    fh.seek(start)
+    result = ScanResult(end=start)
+    for line in fh:
+        if not line.endswith(b"\n"):
+            break
+        line_no = first_line + result.lines
+        if line_no % CHECKPOINT_INTERVAL == 0:
+            result.checkpoints.append((line_no, result.end))
+        result.end += len(line)
+        result.lines += 1
+        if not line.strip():
+            continue
+        result.events += 1
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, dict) and (uuid := data.get("uuid")):
+            result.uuids.append(uuid)
+    return result
+
+
+def _write(
+    conn: sqlite3.Connection,
+    uuids: Iterable[str],
+    checkpoints: Iterable[tuple[int, int]],
+    meta: dict[str, int],
+    rebuild: bool = False,
+) -> None:
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if rebuild:
+            conn.execute("DELETE FROM uuids")
+            conn.execute("DELETE FROM checkpoints")
+        conn.executemany(
+            "INSERT OR IGNORE INTO uuids (uuid) VALUES (?)", ((u,) for u in uuids)
+        )
+        conn.executemany(
+            "INSERT OR REPLACE INTO checkpoints (line, offset) VALUES (?, ?)",
+            checkpoints,
+        )
+        for key, value in meta.items():
+            _set_meta(conn, key, value)
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def sync_index(conn: sqlite3.Connection, fh: BinaryIO) -> int:
+    """Bring the index up to date with the transcript open as ``fh``.
+
+    Returns the byte offset the index now covers (the end of the last
+    complete line in the transcript).
+    """
+    st_size = fh.seek(0, 2)
+    inode = os.fstat(fh.fileno()).st_ino
+    indexed = _get_meta(conn, "indexed_bytes")
+    indexed_inode = _get_meta(conn, "inode")
+    lines = _get_meta(conn, "indexed_lines")
+    events = _get_meta(conn, "indexed_events")
+
+    if (
+        indexed is None
+        or lines is None
+        or events is None
+        or indexed > st_size
+        or indexed_inode != inode
+    ):
+        logger.info("Rebuilding session index for %s", getattr(fh, "name", fh))
+        rebuild, start, lines, events = True, 0, 0, 0
+    elif indexed == st_size:
+        return indexed
+    else:
+        rebuild, start = False, indexed
+
+    scan = scan_transcript(fh, start, lines)
+    _write(
+        conn,
+        scan.uuids,
+        scan.checkpoints,
+        {
+            "indexed_bytes": scan.end,
+            "indexed_lines": lines + scan.lines,
+            "indexed_events": events + scan.events,
+            "inode": inode,
+        },
+        rebuild=rebuild,
+    )
+    return scan.end
+
+
+def existing_uuids(conn: sqlite3.Connection, uuids: Iterable[str]) -> set[str]:
+    """Return the subset of ``uuids`` already present in the index."""
+    wanted = list(dict.fromkeys(uuids))
+    found: set[str] = set()
+    for i in range(0, len(wanted), LOOKUP_CHUNK_SIZE):
+        chunk = wanted[i : i + LOOKUP_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        found.update(
+            row[0]
+            for row in conn.execute(
+                f"SELECT uuid FROM uuids WHERE uuid IN ({placeholders})", chunk
+            )
+        )
+    return found
+
+
+def record_append(
+    conn: sqlite3.Connection, uuids: Iterable[str], payload: bytes, start: int
+) -> None:
+    """Record ``payload`` (newline-terminated JSONL) written at byte ``start``.
+
+    Must follow a ``sync_index`` under the same lock. Any bytes between the
+    indexed end and ``start`` are a cut-off partial line, which ``payload``
+    terminates with its leading newline.
+    """
+    line_start = _get_meta(conn, "indexed_bytes") or 0
+    line = _get_meta(conn, "indexed_lines") or 0
+    events = _get_meta(conn, "indexed_events") or 0
+
+    checkpoints = []
+    pos = start
+    for i, chunk in enumerate(payload.split(b"\n")[:-1]):
+        if line % CHECKPOINT_INTERVAL == 0:
+            checkpoints.append((line, line_start))
+        if chunk.strip() or (i == 0 and start > line_start):
+            events += 1
+        pos += len(chunk) + 1
+        line += 1
+        line_start = pos
+
+    _write(
+        conn,
+        uuids,
+        checkpoints,
+        {"indexed_bytes": pos, "indexed_lines": line, "indexed_events": events},
+    )
+
+
+@dataclass
+class IndexView:
+    """Read-only view of a sidecar index that matches its transcript."""
+
+    conn: sqlite3.Connection
+    indexed_bytes: int
+    indexed_lines: int
+    indexed_events: int
+    file_size: int
+
+    @property
+    def complete(self) -> bool:
+        """True when the index covers the whole transcript."""
+        return self.indexed_bytes == self.file_size
+
+    def checkpoint_before(self, line: int) -> tuple[int, int]:
+        """Nearest ``(line, byte offset)`` checkpoint at or before ``line``."""
+        row = self.conn.execute(
+            "SELECT line, offset FROM checkpoints WHERE line <= ? "
+            "ORDER BY line DESC LIMIT 1",
+            (line,),
+        ).fetchone()
+        return (row[0], row[1]) if row else (0, 0)
+
+
+@contextmanager
+def read_index(transcript_file: Path, fh: BinaryIO) -> Iterator[IndexView | None]:
+    """Open the sidecar index for reading, without creating or updating it.
+
+    Yields ``None`` when there is no usable index: missing, unreadable, or
+    describing a different (replaced or truncated) file than ``fh``.
+    Checkpoints in a stale-but-matching index are still valid, since the
+    transcript only ever grows.
+    """
+    path = index_path(transcript_file)
+    if not path.exists():
+        yield None
+        return
+
+    try:
+        conn = sqlite3.connect(f"{path.as_uri()}?mode=ro", uri=True)
+    except sqlite3.Error:
+        yield None
+        return
+
+    try:
+        try:
+            meta = dict(conn.execute("SELECT key, value FROM meta").fetchall())
+        except sqlite3.Error:
+            meta = {}
+        st = os.fstat(fh.fileno())
+        indexed = meta.get("indexed_bytes")
+        if (
+            indexed is None
+            or "indexed_lines" not in meta
+            or indexed > st.st_size
+            or meta.get("inode") != st.st_ino
+        ):
+            yield None
+            return
+        yield IndexView(
+            conn=conn,
+            indexed_bytes=indexed,
+            indexed_lines=meta.get("indexed_lines", 0),
+            indexed_events=meta.get("indexed_events", 0),
+            file_size=st.st_size,
+        )
+    finally:
+        conn.close()
@@ -81,6 +81,15 @@ if REDIS_PASSWORD:
 else:
     REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
 
+# Prediction market API cache: "redis" (shared across processes) or "memory"
+MARKET_CACHE_BACKEND = os.getenv("MARKET_CACHE_BACKEND", "redis")
+MARKET_CACHE_REDIS_PREFIX = os.getenv("MARKET_CACHE_REDIS_PREFIX", "markets:cache")
+# A process fetching a missing entry holds a lock this long at most; other
+# processes poll for its result for up to MARKET_CACHE_FILL_WAIT_SEC.
+MARKET_CACHE_FILL_LOCK_SEC = int(os.getenv("MARKET_CACHE_FILL_LOCK_SEC", 30))
+MARKET_CACHE_FILL_WAIT_SEC = float(os.getenv("MARKET_CACHE_FILL_WAIT_SEC", 15))
+MARKET_CACHE_FILL_POLL_SEC = float(os.getenv("MARKET_CACHE_FILL_POLL_SEC", 0.1))
+
 # Broker settings
 CELERY_QUEUE_PREFIX = os.getenv("CELERY_QUEUE_PREFIX", APP_NAME)
 CELERY_BROKER_TYPE = os.getenv("CELERY_BROKER_TYPE", "redis").lower()
@@ -106,6 +115,10 @@ EMAIL_STORAGE_DIR = pathlib.Path(
 EMAIL_SPOOL_DIR = pathlib.Path(
     os.getenv("EMAIL_SPOOL_DIR", FILE_STORAGE_DIR / "email_spool")
 )
+# Same handoff for Google Drive exports too large to send through the broker.
+GOOGLE_DRIVE_SPOOL_DIR = pathlib.Path(
+    os.getenv("GOOGLE_DRIVE_SPOOL_DIR", FILE_STORAGE_DIR / "google_drive_spool")
+)
 CHUNK_STORAGE_DIR = pathlib.Path(
     os.getenv("CHUNK_STORAGE_DIR", FILE_STORAGE_DIR / "chunks")
 )
@@ -171,7 +184,11 @@ storage_dirs = [
 ]
 
 # All storage directories (including non-backed-up ones)
-all_storage_dirs = storage_dirs + [CHUNK_STORAGE_DIR, EMAIL_SPOOL_DIR]
+all_storage_dirs = storage_dirs + [
+    CHUNK_STORAGE_DIR,
+    EMAIL_SPOOL_DIR,
+    GOOGLE_DRIVE_SPOOL_DIR,
+]
 
 for dir in all_storage_dirs:
     dir.mkdir(parents=True, exist_ok=True)
@@ -278,11 +295,38 @@ DEFAULT_LLM_RATE_LIMIT_MAX_OUTPUT_TOKENS = int(
     os.getenv("DEFAULT_LLM_RATE_LIMIT_MAX_OUTPUT_TOKENS", 1_000_000)
 )
 LLM_USAGE_REDIS_PREFIX = os.getenv("LLM_USAGE_REDIS_PREFIX", "llm_usage")
+# Rolling windows are tracked as this many fixed-width buckets; usage drops
+# out of the window at most one bucket early.
+LLM_USAGE_BUCKETS_PER_WINDOW = int(os.getenv("LLM_USAGE_BUCKETS_PER_WINDOW", 60))
+
+# Summaries and tags are cached in Redis by (model, prompt version, prompt
+# hash), so reingesting unchanged content doesn't call the summarizer again.
+# Entries expire this many days after they were last used.
+SUMMARY_CACHE_ENABLED = boolean_env("SUMMARY_CACHE_ENABLED", True)
+SUMMARY_CACHE_REDIS_PREFIX = os.getenv("SUMMARY_CACHE_REDIS_PREFIX", "summaries")
+SUMMARY_CACHE_TTL_DAYS = int(os.getenv("SUMMARY_CACHE_TTL_DAYS", 90))
+
+
+# Meeting transcripts longer than MEETING_SEGMENT_TOKENS are extracted in
+# windows of that size, overlapping by MEETING_SEGMENT_OVERLAP_TOKENS, up to
+# MEETING_EXTRACTION_CONCURRENCY at once, and the results merged. 0 extracts
+# every transcript in a single call.
+MEETING_SEGMENT_TOKENS = int(os.getenv("MEETING_SEGMENT_TOKENS", 30_000))
+MEETING_SEGMENT_OVERLAP_TOKENS = int(os.getenv("MEETING_SEGMENT_OVERLAP_TOKENS", 1_000))
+MEETING_EXTRACTION_CONCURRENCY = int(os.getenv("MEETING_EXTRACTION_CONCURRENCY", 4))
 
 
 # Search settings
 ENABLE_BM25_SEARCH = boolean_env("ENABLE_BM25_SEARCH", True)
 ENABLE_SEARCH_SCORING = boolean_env("ENABLE_SEARCH_SCORING", True)
+# "batch" scores many text results in one LLM call, "chunk" makes one call per
+# result. A batch holds at most SEARCH_SCORING_BATCH_SIZE results and
+# SEARCH_SCORING_BATCH_TOKENS of their text, each result cut to
+# SEARCH_SCORING_CHUNK_TOKENS.
+SEARCH_SCORING_MODE = os.getenv("SEARCH_SCORING_MODE", "batch")
+SEARCH_SCORING_BATCH_SIZE = int(os.getenv("SEARCH_SCORING_BATCH_SIZE", 20))
+SEARCH_SCORING_BATCH_TOKENS = int(os.getenv("SEARCH_SCORING_BATCH_TOKENS", 8000))
+SEARCH_SCORING_CHUNK_TOKENS = int(os.getenv("SEARCH_SCORING_CHUNK_TOKENS", 400))
 ENABLE_HYDE_EXPANSION = boolean_env("ENABLE_HYDE_EXPANSION", True)
 HYDE_TIMEOUT = float(os.getenv("HYDE_TIMEOUT", "3.0"))
 ENABLE_QUERY_ANALYSIS = boolean_env(
@@ -360,6 +404,10 @@ MAX_SCHEDULED_TASKS_PER_USER = int(os.getenv("MAX_SCHEDULED_TASKS_PER_USER", 20)
 MIN_CRON_INTERVAL_MINUTES = int(os.getenv("MIN_CRON_INTERVAL_MINUTES", 10))
 TASK_EXECUTION_RETENTION_DAYS = int(os.getenv("TASK_EXECUTION_RETENTION_DAYS", 30))
 SCHEDULED_TASK_RETENTION_DAYS = int(os.getenv("SCHEDULED_TASK_RETENTION_DAYS", 90))
+# Due tasks the scheduler tick claims per transaction. Each batch is locked,
+# turned into executions, committed and dispatched before the next is taken,
+# so a backlog of due tasks never sits in one long transaction.
+SCHEDULER_DISPATCH_BATCH_SIZE = int(os.getenv("SCHEDULER_DISPATCH_BATCH_SIZE", 500))
 
 # Maximum number of concurrently running Claude session containers a single
 # user may have. Bounds host CPU/memory usage. Enforced in the /claude/spawn
@@ -412,7 +460,9 @@ CHECK_RATE_LIMIT_PER_MIN = int(os.getenv("CHECK_RATE_LIMIT_PER_MIN", "60"))
 CHECK_ALLOW_PRIVATE_CALLBACKS = boolean_env("CHECK_ALLOW_PRIVATE_CALLBACKS", False)
 CHECK_DEFAULT_WAIT_SEC = int(os.getenv("CHECK_DEFAULT_WAIT_SEC", "60"))
 CHECK_MAX_WAIT_SEC = int(os.getenv("CHECK_MAX_WAIT_SEC", "300"))
-CHECK_WAIT_POLL_INTERVAL_SEC = float(os.getenv("CHECK_WAIT_POLL_INTERVAL_SEC", "2"))
+# wait_for_answer blocks on the job's completion doorbell; this only bounds how
+# long it goes without re-reading the job, as a fallback for a missed signal.
+CHECK_WAIT_POLL_INTERVAL_SEC = float(os.getenv("CHECK_WAIT_POLL_INTERVAL_SEC", "30"))
 
 # Reject images whose pixel count exceeds this before decoding them. PIL knows
 # the dimensions from the header at open time, so an oversized image (a
@@ -421,6 +471,36 @@ CHECK_WAIT_POLL_INTERVAL_SEC = float(os.getenv("CHECK_WAIT_POLL_INTERVAL_SEC", "
 # memory cap, which (with acks_late) gets the poison item redelivered forever.
 MAX_IMAGE_PIXELS = int(os.getenv("MAX_IMAGE_PIXELS", 100_000_000))
 
+# Article images are downloaded by a pool of this many threads, shared by
+# every article a process parses, with at most IMAGE_FETCH_PER_HOST
+# downloads from any one host at a time.
+IMAGE_FETCH_WORKERS = int(os.getenv("IMAGE_FETCH_WORKERS", 16))
+IMAGE_FETCH_PER_HOST = int(os.getenv("IMAGE_FETCH_PER_HOST", 6))
+
+# Feed and archive syncs check this many items against existing posts per
+# query, and queue new articles this many per sync_webpages task (which
+# fetches them over one HTTP session).
+ARTICLE_DEDUP_BATCH_SIZE = int(os.getenv("ARTICLE_DEDUP_BATCH_SIZE", 500))
+ARTICLE_SYNC_GROUP_SIZE = int(os.getenv("ARTICLE_SYNC_GROUP_SIZE", 20))
+
+# Archive crawls fetch up to this many numbered pages at once. Requests to a
+# host are still paced to the fetcher's delay_between_requests on average.
+ARCHIVE_FETCH_CONCURRENCY = int(os.getenv("ARCHIVE_FETCH_CONCURRENCY", 4))
+
+# ETag / Last-Modified / body hash of each feed page, kept so the next sync
+# can skip pages that haven't changed
+FETCH_VALIDATORS_REDIS_PREFIX = os.getenv("FETCH_VALIDATORS_REDIS_PREFIX", "fetch_validators")
+FETCH_VALIDATORS_TTL_DAYS = int(os.getenv("FETCH_VALIDATORS_TTL_DAYS", 30))
+
+# PDF pages are rendered at this resolution (PyMuPDF's default is 72 DPI) and
+# spilled to PDF_SPILL_DIR as they are rendered. Pages that end up in a chunk
+# are moved into CHUNK_STORAGE_DIR. PDF_RENDER_WORKERS > 1 renders in a pool of
+# that many processes, but only outside daemonic processes: Celery's prefork
+# workers are daemonic and always render in-process.
+PDF_RENDER_DPI = int(os.getenv("PDF_RENDER_DPI", 72))
+PDF_RENDER_WORKERS = int(os.getenv("PDF_RENDER_WORKERS", 1))
+PDF_SPILL_DIR = pathlib.Path(os.getenv("PDF_SPILL_DIR", "/tmp/memory_pdf_pages"))
+
 MAX_PHOTO_UPLOAD_BYTES = int(
     os.getenv("MAX_PHOTO_UPLOAD_BYTES", 50 * 1024 * 1024)
 )
@@ -521,6 +601,14 @@ GOOGLE_SCOPES = [
     "https://www.googleapis.com/auth/userinfo.profile",
 ]
 
+# Documents exported in parallel per folder sync
+GOOGLE_DRIVE_EXPORT_CONCURRENCY = int(os.getenv("GOOGLE_DRIVE_EXPORT_CONCURRENCY", 4))
+# Exported bodies larger than this are spooled to GOOGLE_DRIVE_SPOOL_DIR
+# rather than sent inline in the Celery message
+GOOGLE_DRIVE_SPOOL_THRESHOLD = int(
+    os.getenv("GOOGLE_DRIVE_SPOOL_THRESHOLD", 64 * 1024)
+)
+
 # Google Drive sync interval is configured at GOOGLE_DRIVE_SYNC_INTERVAL
 # (see "Source-syncing intervals" near the top of the file). The
 # previously-defined GOOGLE_SYNC_INTERVAL and GOOGLE_DRIVE_STORAGE_DIR
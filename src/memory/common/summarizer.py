@@ -1,14 +1,22 @@
+import hashlib
+import json
 import logging
 import traceback
-from typing import Any
+from collections import Counter
+from typing import Any, cast
 
+import redis
 from bs4 import BeautifulSoup
 
 from memory.common import settings, tokens, llms
+from memory.common.metrics import record_metric
 
 logger = logging.getLogger(__name__)
 
 MAX_TOKENS = 200000
+# Part of the summary cache key. Bump it when the prompts or the response
+# parsing change, so results from the old ones aren't served.
+PROMPT_VERSION = 1
 TAGS_PROMPT = """
 The following text is already concise. Please identify 3-5 relevant tags that capture the main topics or themes.
 
@@ -65,6 +73,80 @@ def parse_response(response: str) -> dict[str, Any]:
     return {"summary": summary, "tags": tags}
 
 
+# Summary cache lookups in this process, by "hit" or "miss"
+cache_stats: Counter[str] = Counter()
+_cache_client: redis.Redis | None = None
+
+
+def cache_key(model: str, prompt: str) -> str:
+    """Summary cache key. The prompt includes the content and target length."""
+    digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    return f"{settings.SUMMARY_CACHE_REDIS_PREFIX}:{model}:v{PROMPT_VERSION}:{digest}"
+
+
+def _get_cache() -> redis.Redis:
+    global _cache_client
+    if _cache_client is None:
+        _cache_client = redis.Redis.from_url(settings.REDIS_URL)
+    return _cache_client
+
+
+def _count(status: str, model: str) -> None:
+    cache_stats[status] += 1
+    record_metric("summary_cache", model, status=status)
+
+
+def _cache_ttl() -> int:
+    return settings.SUMMARY_CACHE_TTL_DAYS * 24 * 60 * 60
+
+
+def get_cached(key: str) -> dict[str, Any] | None:
+    """The cached summary and tags for ``key``, or None.
+
+    A hit restarts the entry's expiry, so content that keeps being
+    reingested stays cached. Redis errors are logged and treated as misses.
+    """
+    try:
+        cache = _get_cache()
+        raw = cache.get(key)
+        if raw is None:
+            return None
+        cache.expire(key, _cache_ttl())
+        return json.loads(cast(bytes, raw))
+    except (redis.RedisError, ValueError) as e:
+        logger.warning(f"Summary cache read failed: {e}")
+        return None
+
+
+def set_cached(key: str, result: dict[str, Any]) -> None:
+    try:
+        _get_cache().set(key, json.dumps(result), ex=_cache_ttl())
+    except redis.RedisError as e:
+        logger.warning(f"Summary cache write failed: {e}")
+
+
+def summarize_prompt(prompt: str, model: str) -> dict[str, Any]:
+    """Run a summary prompt, going through the summary cache.
+
+    Failed calls raise and empty responses aren't cached, so both are
+    retried next time.
+    """
+    if not settings.SUMMARY_CACHE_ENABLED:
+        return parse_response(llms.summarize(prompt, model))
+
+    key = cache_key(model, prompt)
+    cached = get_cached(key)
+    if cached is not None:
+        _count("hit", model)
+        return cached
+
+    _count("miss", model)
+    result = parse_response(llms.summarize(prompt, model))
+    if result["summary"] or result["tags"]:
+        set_cached(key, result)
+    return result
+
+
 def summarize(content: str, target_tokens: int | None = None) -> tuple[str, list[str]]:
     """
     Summarize content to approximately target_tokens length and generate tags.
@@ -105,8 +187,7 @@ def summarize(content: str, target_tokens: int | None = None) -> tuple[str, list
         prompt = llms.truncate(prompt, MAX_TOKENS - 20)
 
     try:
-        response = llms.summarize(prompt, settings.SUMMARIZER_MODEL)
-        result = parse_response(response)
+        result = summarize_prompt(prompt, settings.SUMMARIZER_MODEL)
 
         summary = result.get("summary", "")
         tags = result.get("tags", [])
@@ -1,12 +1,17 @@
+import itertools
 import logging
 import re
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Generator, cast
+from typing import Generator, Iterator, cast
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
 from bs4 import BeautifulSoup
 
+from memory.common import settings
 from memory.parsers.blogs import is_substack
 from memory.parsers.feeds import (
     DanluuParser,
@@ -21,66 +26,200 @@ from memory.parsers.html import extract_url, fetch_html, get_base_url
 logger = logging.getLogger(__name__)
 
 
+class TokenBucket:
+    """Paces requests to ``rate`` a second on average, with up to ``burst``
+    of them at once."""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take a token, waiting for one if there are none left.
+
+        Tokens are reserved under the lock, so concurrent callers queue up
+        behind each other rather than all waking at once.
+        """
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.burst, self.tokens + (now - self.updated) * self.rate
+            )
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate
+        if wait > 0:
+            time.sleep(wait)
+
+
+# Shared by every crawl in the process, so two crawls of one host don't get
+# twice its rate
+_host_buckets: dict[tuple[str, float, int], TokenBucket] = {}
+_host_buckets_lock = threading.Lock()
+
+
+def host_bucket(url: str, rate: float, burst: int) -> TokenBucket:
+    key = ((urlparse(url).hostname or "").lower(), rate, burst)
+    with _host_buckets_lock:
+        if key not in _host_buckets:
+            _host_buckets[key] = TokenBucket(rate, burst)
+        return _host_buckets[key]
+
+
 @dataclass
 class ArchiveFetcher:
-    """Fetches complete backlogs from sites with pagination."""
+    """Fetches complete backlogs from sites with pagination.
+
+    Pages linked by a "next" link are fetched one at a time, waiting
+    ``delay_between_requests`` between them. Where the page URLs can be
+    worked out up front (see :meth:`_page_urls`), up to ``concurrency`` pages
+    are fetched ahead at once, while requests to the host are still paced to
+    one per ``delay_between_requests`` on average.
+
+    With ``conditional`` set, pages are fetched conditionally (see
+    :class:`~memory.parsers.feeds.FeedParser`) and the crawl stops at the
+    first page that is unchanged since the last crawl: archives list the
+    newest posts first, so everything after it has been seen already. The
+    pages' validators are saved by :meth:`commit`, once the caller has
+    dispatched the items.
+    """
 
     parser_class: type[FeedParser]
     start_url: str
     max_pages: int = 100
     delay_between_requests: float = 1.0
     parser_kwargs: dict = field(default_factory=dict)
+    conditional: bool = False
+    concurrency: int = field(default_factory=lambda: settings.ARCHIVE_FETCH_CONCURRENCY)
+    # Pages whose items have all been yielded, for commit
+    parsed_pages: list[FeedParser] = field(default_factory=list, repr=False)
 
     def make_parser(self, url: str) -> FeedParser:
         parser = self.parser_class(url=url)
+        parser.conditional = self.conditional
         for key, value in self.parser_kwargs.items():
             setattr(parser, key, value)
         return parser
 
     def fetch_all_items(self) -> Generator[FeedItem, None, None]:
         """Fetch all items from all pages."""
-        visited_urls = set()
-        current_url = self.start_url
         page_count = 0
         total_items = 0
+        pages = self._pages()
 
-        while current_url and page_count < self.max_pages:
-            if current_url in visited_urls:
-                logger.warning(f"Already visited {current_url}, stopping")
-                break
-
-            logger.info(f"Fetching page {page_count + 1}: {current_url}")
-            visited_urls.add(current_url)
-
-            try:
-                parser = self.make_parser(current_url)
-
-                items = parser.parse_feed()
-                if not items:
-                    break
-
+        try:
+            for parser in pages:
+                page_count += 1
                 prev_items = total_items
-                for item in items:
+                for item in parser.parse_feed():
                     total_items += 1
                     yield item
+                self.parsed_pages.append(parser)
 
-                if prev_items == total_items:
-                    logger.warning(f"No new items found on page {page_count + 1}")
+                if parser.fetched and not parser.fetched.changed:
+                    logger.info(f"Page {page_count} unchanged since last crawl")
                     break
 
-                current_url = self._find_next_page(parser, page_count)
-                if not current_url:
-                    logger.info("No more pages found")
+                if prev_items == total_items:
+                    logger.warning(f"No new items found on page {page_count}")
                     break
+        except Exception as e:
+            logger.error(
+                f"Error crawling {self.start_url} after {page_count} pages: {e}"
+            )
+        finally:
+            # Stops any pages still being fetched ahead
+            pages.close()
+
+    def commit(self) -> None:
+        """Save the validators of every fully parsed page (see ``conditional``)."""
+        for parser in self.parsed_pages:
+            parser.commit_fetch()
+        self.parsed_pages.clear()
+
+    def _pages(self) -> Generator[FeedParser, None, None]:
+        """Parsers for the archive's pages, in order.
+
+        Each page after the first is only looked for once the previous one
+        has been parsed, so the caller stops the crawl by not asking for more.
+        """
+        logger.info(f"Fetching page 1: {self.start_url}")
+        parser = self.make_parser(self.start_url)
+        yield parser
+
+        urls = self._page_urls(parser)
+        if urls is None:
+            yield from self._follow_pages(parser)
+        else:
+            yield from self._prefetch_pages(urls)
+
+    def _follow_pages(self, parser: FeedParser) -> Generator[FeedParser, None, None]:
+        visited_urls = {self.start_url}
+        for page_count in range(1, self.max_pages):
+            url = self._find_next_page(parser, page_count - 1)
+            if not url:
+                logger.info("No more pages found")
+                return
+            if url in visited_urls:
+                logger.warning(f"Already visited {url}, stopping")
+                return
+            visited_urls.add(url)
+
+            if self.delay_between_requests > 0:
+                time.sleep(self.delay_between_requests)
+
+            logger.info(f"Fetching page {page_count + 1}: {url}")
+            parser = self.make_parser(url)
+            yield parser
+
+    def _prefetch_pages(self, urls: Iterator[str]) -> Generator[FeedParser, None, None]:
+        def unvisited() -> Iterator[str]:
+            visited_urls = {self.start_url}
+            for url in urls:
+                if url in visited_urls:
+                    logger.warning(f"Already visited {url}, stopping")
+                    return
+                visited_urls.add(url)
+                yield url
+
+        bucket = None
+        if self.delay_between_requests > 0:
+            bucket = host_bucket(
+                self.start_url, 1 / self.delay_between_requests, self.concurrency
+            )
+
+        workers = max(1, self.concurrency)
+        page_urls = itertools.islice(unvisited(), self.max_pages - 1)
+        pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="archive")
+        pending: deque[Future[FeedParser]] = deque(
+            pool.submit(self._fetch_page, url, bucket)
+            for url in itertools.islice(page_urls, workers)
+        )
+        try:
+            while pending:
+                parser = pending.popleft().result()
+                for url in itertools.islice(page_urls, 1):
+                    pending.append(pool.submit(self._fetch_page, url, bucket))
+                yield parser
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _fetch_page(self, url: str, bucket: TokenBucket | None) -> FeedParser:
+        if bucket:
+            bucket.acquire()
+        logger.info(f"Fetching page {url}")
+        parser = self.make_parser(url)
+        parser.fetch_content()
+        return parser
 
-                page_count += 1
-
-                if self.delay_between_requests > 0:
-                    time.sleep(self.delay_between_requests)
-
-            except Exception as e:
-                logger.error(f"Error processing {current_url}: {e}")
-                break
+    def _page_urls(self, parser: FeedParser) -> Iterator[str] | None:
+        """The URLs of the pages after ``parser``'s, if they are known in
+        advance, or None to follow :meth:`_find_next_page` from page to page.
+        """
+        return None
 
     def _find_next_page(self, parser: FeedParser, current_page: int = 0) -> str | None:
         return None
@@ -90,16 +229,21 @@ class ArchiveFetcher:
 class LinkFetcher(ArchiveFetcher):
     per_page: int = 10
 
-    def _find_next_page(self, parser: FeedParser, current_page: int = 0):
-        next_page = current_page + 1
+    def _page_url(self, page: int) -> str:
         parsed = urlparse(self.start_url)
         params = parse_qs(parsed.query)
-        params["offset"] = [str(next_page * self.per_page)]
+        params["offset"] = [str(page * self.per_page)]
         params["limit"] = [str(self.per_page)]
 
         new_query = urlencode(params, doseq=True)
         return urlunparse(parsed._replace(query=new_query))
 
+    def _find_next_page(self, parser: FeedParser, current_page: int = 0) -> str | None:
+        return self._page_url(current_page + 1)
+
+    def _page_urls(self, parser: FeedParser) -> Iterator[str]:
+        return (self._page_url(page) for page in itertools.count(1))
+
 
 @dataclass
 class HTMLArchiveFetcher(ArchiveFetcher):
@@ -143,15 +287,23 @@ class SubstackArchiveFetcher(LinkFetcher):
 
 @dataclass
 class ACOUPArchiveFetcher(HTMLArchiveFetcher):
-    def _find_next_page(self, parser: FeedParser, current_page: int = 0) -> str | None:
+    def _later_months(self, parser: FeedParser) -> list[str]:
+        """The archive widget's months after the one ``parser`` is on."""
         if not parser.content:
-            return None
+            return []
         soup = BeautifulSoup(parser.content, "html.parser")
         urls = reversed([i.attrs.get("href") for i in soup.select(".widget_archive a")])
         urls = (cast(str, u) for u in urls if u)
         for url in urls:
             if url.rstrip("/") == parser.url.rstrip("/"):
-                return next(urls, None)
+                return list(urls)
+        return []
+
+    def _find_next_page(self, parser: FeedParser, current_page: int = 0) -> str | None:
+        return next(iter(self._later_months(parser)), None)
+
+    def _page_urls(self, parser: FeedParser) -> Iterator[str]:
+        return iter(self._later_months(parser))
 
 
 @dataclass
@@ -164,8 +316,14 @@ class HTMLNextUrlArchiveFetcher(HTMLArchiveFetcher):
         if not self.next_url.startswith("http") and not self.next_url.startswith("/"):
             self.next_url = f"{self.start_url}/{self.next_url}"
 
+    def _page_url(self, page: int) -> str:
+        return f"{self.next_url}/{page}"
+
     def _find_next_page(self, parser: FeedParser, current_page: int = 0) -> str | None:
-        return f"{self.next_url}/{current_page + 1}"
+        return self._page_url(current_page + 1)
+
+    def _page_urls(self, parser: FeedParser) -> Iterator[str]:
+        return (self._page_url(page) for page in itertools.count(1))
 
 
 FETCHER_REGISTRY = {
@@ -4,6 +4,7 @@ from datetime import datetime
 from urllib.parse import urlparse
 from typing import cast
 
+import requests
 from bs4 import BeautifulSoup, Tag
 
 from memory.parsers.html import (
@@ -636,16 +637,17 @@ def get_parser_for_url(url: str, html: str) -> BaseHTMLParser:
     return BaseHTMLParser(url)
 
 
-def parse_webpage(url: str) -> Article:
+def parse_webpage(url: str, session: requests.Session | None = None) -> Article:
     """
     Parse a webpage and extract article content.
 
     Args:
         url: URL of the webpage to parse
+        session: Optional ``requests.Session`` to fetch the page through
 
     Returns:
         Article object with extracted content and metadata
     """
-    html = cast(str, fetch_html(url))
+    html = cast(str, fetch_html(url, session=session))
     parser = get_parser_for_url(url, html)
     return parser.parse(html, url)
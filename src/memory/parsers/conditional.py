@@ -0,0 +1,198 @@
+"""Conditional re-fetching of feeds and listing pages.
+
+Every feed sync re-fetches the same feeds, and most of them haven't changed
+since the last run. For each URL fetched through :func:`fetch_if_changed`
+the validators from its last fetch are kept in Redis: the ``ETag``, the
+``Last-Modified`` date and a hash of the body, plus the body size and how
+long the page took to parse. The next fetch sends ``If-None-Match`` /
+``If-Modified-Since``, and a ``304``, or a ``200`` whose body hashes the same
+as last time, comes back as unchanged with empty content, which the feed
+parsers turn into no items without parsing anything.
+
+Validators are only saved by :meth:`FetchResult.commit`, once the caller has
+dispatched everything found on the page, so a sync that fails half way
+through a page, or before its items are queued, fetches and parses it in
+full next time rather than skipping it. Pages that are only
+fetched to find the real feed are never committed, so they are never
+skipped either.
+
+Each fetch is recorded as a ``conditional_fetch`` metric, with the bytes
+that weren't downloaded as its value and the parse time saved as its
+duration.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import cast
+
+import redis
+import requests
+
+from memory.common import settings
+from memory.common.metrics import record_metric
+from memory.parsers.html import http_date, read_html_body, request_html
+
+logger = logging.getLogger(__name__)
+
+_client: redis.Redis | None = None
+
+
+@dataclass
+class Validators:
+    etag: str | None = None
+    last_modified: str | None = None
+    sha256: str | None = None  # hex digest of the body
+    size: int = 0  # body size in bytes
+    parse_ms: float = 0.0  # how long the body took to parse
+
+
+def _get_client() -> redis.Redis:
+    global _client
+    if _client is None:
+        _client = redis.Redis.from_url(settings.REDIS_URL)
+    return _client
+
+
+def validators_key(url: str) -> str:
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    return f"{settings.FETCH_VALIDATORS_REDIS_PREFIX}:{digest}"
+
+
+def load_validators(url: str) -> Validators | None:
+    """The validators saved for ``url``, or None. Redis errors count as none."""
+    try:
+        raw = _get_client().get(validators_key(url))
+        return Validators(**json.loads(cast(bytes, raw))) if raw else None
+    except (redis.RedisError, ValueError, TypeError) as e:
+        logger.warning(f"Reading fetch validators for {url} failed: {e}")
+        return None
+
+
+def save_validators(url: str, validators: Validators) -> None:
+    ttl = settings.FETCH_VALIDATORS_TTL_DAYS * 24 * 60 * 60
+    try:
+        _get_client().set(validators_key(url), json.dumps(asdict(validators)), ex=ttl)
+    except redis.RedisError as e:
+        logger.warning(f"Saving fetch validators for {url} failed: {e}")
+
+
+def conditional_headers(
+    validators: Validators | None, modified: datetime | None = None
+) -> dict[str, str]:
+    """Request headers revalidating ``validators``.
+
+    ``modified`` is used for ``If-Modified-Since`` when the server never
+    sent a ``Last-Modified`` date.
+    """
+    headers = {}
+    if validators and validators.etag:
+        headers["If-None-Match"] = validators.etag
+    if validators and validators.last_modified:
+        headers["If-Modified-Since"] = validators.last_modified
+    elif modified is not None:
+        headers["If-Modified-Since"] = http_date(modified)
+    return headers
+
+
+@dataclass
+class FetchResult:
+    url: str
+    content: str  # empty unless the page changed
+    status: str  # "fetched", "not_modified" (a 304) or "unchanged" (same hash)
+    previous: Validators | None
+    validators: Validators | None  # to save on commit
+    downloaded: int = 0  # body bytes received
+    fetch_ms: float = 0.0
+
+    @property
+    def changed(self) -> bool:
+        return self.status == "fetched"
+
+    @property
+    def bytes_saved(self) -> int:
+        if self.status == "not_modified" and self.previous:
+            return self.previous.size
+        return 0
+
+    @property
+    def parse_ms_saved(self) -> float:
+        if not self.changed and self.previous:
+            return self.previous.parse_ms
+        return 0.0
+
+    def commit(self, parse_ms: float | None = None) -> None:
+        """Save the validators, so the next fetch can skip an unchanged page.
+
+        Args:
+            parse_ms: How long the content took to parse, for a changed page.
+        """
+        if self.validators is None:
+            return
+        if parse_ms is not None and self.changed:
+            self.validators.parse_ms = parse_ms
+        save_validators(self.url, self.validators)
+
+
+def fetch_if_changed(
+    url: str,
+    modified: datetime | None = None,
+    session: requests.Session | None = None,
+) -> FetchResult:
+    """Fetch ``url`` unless it is unchanged since it was last committed.
+
+    Args:
+        url: The URL to fetch
+        modified: ``If-Modified-Since`` date to send if no ``Last-Modified``
+            date was saved for the URL
+        session: ``requests.Session`` to fetch through
+
+    Raises:
+        ValueError: If URL fails SSRF validation
+        requests.RequestException: On network errors
+    """
+    previous = load_validators(url)
+    start = time.perf_counter()
+    response = request_html(
+        url, headers=conditional_headers(previous, modified), session=session
+    )
+
+    if response.status_code == 304:
+        response.close()
+        result = FetchResult(url, "", "not_modified", previous, previous)
+    else:
+        body = read_html_body(response)
+        validators = Validators(
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            sha256=hashlib.sha256(body).hexdigest(),
+            size=len(body),
+            parse_ms=previous.parse_ms if previous else 0.0,
+        )
+        if previous and previous.sha256 == validators.sha256:
+            result = FetchResult(url, "", "unchanged", previous, validators)
+        else:
+            result = FetchResult(
+                url,
+                body.decode("utf-8", errors="replace"),
+                "fetched",
+                previous,
+                validators,
+            )
+        result.downloaded = len(body)
+    result.fetch_ms = (time.perf_counter() - start) * 1000
+
+    record_metric(
+        "conditional_fetch",
+        "feeds",
+        duration_ms=result.parse_ms_saved,
+        status=result.status,
+        value=result.bytes_saved,
+        labels={"downloaded": result.downloaded},
+    )
+    return result
@@ -2,6 +2,7 @@ from datetime import datetime
 import logging
 import json
 import re
+import time
 from dataclasses import dataclass, field
 from typing import Any, Generator, Sequence, cast
 from urllib.parse import urljoin, urlparse
@@ -10,6 +11,7 @@ import feedparser
 from bs4 import BeautifulSoup, Tag
 import requests
 
+from memory.parsers.conditional import FetchResult, fetch_if_changed
 from memory.parsers.html import (
     get_base_url,
     to_absolute_url,
@@ -50,17 +52,38 @@ class FeedItem:
 
 @dataclass
 class FeedParser:
-    """Base class for feed parsers."""
+    """Base class for feed parsers.
+
+    With ``conditional`` set the feed is fetched with
+    :func:`~memory.parsers.conditional.fetch_if_changed`: an unchanged feed
+    parses to no items, and ``fetched`` says how it went. Its validators
+    are only saved by :meth:`commit_fetch`, which the caller makes once the
+    parsed items have been handled.
+    """
 
     url: str
     content: str | None = None
     since: datetime | None = None
+    conditional: bool = False
+    fetched: FetchResult | None = field(default=None, repr=False)
+    parse_ms: float = field(default=0.0, repr=False)  # set by parse_feed
 
     @property
     def base_url(self) -> str:
         """Get the base URL of the feed."""
         return get_base_url(self.url)
 
+    def fetch_content(self, **kwargs: Any) -> str:
+        """Fetch the feed, unless ``content`` was given or a conditional fetch
+        already happened. kwargs go to the fetch."""
+        if not self.content and self.fetched is None:
+            if self.conditional:
+                self.fetched = fetch_if_changed(self.url, **kwargs)
+                self.content = self.fetched.content
+            else:
+                self.content = cast(str, fetch_html(self.url, **kwargs))
+        return self.content or ""
+
     def fetch_items(self) -> Sequence[Any]:
         """Fetch items from the feed. Override in subclasses."""
         return []
@@ -81,11 +104,29 @@ class FeedParser:
 
     def parse_feed(self) -> Generator[FeedItem, None, None]:
         """Parse feed content and return list of feed items."""
-        for item in self.fetch_items():
+        # Time spent parsing, excluding the fetch and the consumer
+        fetched_earlier = self.fetched
+        start = time.perf_counter()
+        items = self.fetch_items()
+        parse_seconds = time.perf_counter() - start
+        if self.fetched and self.fetched is not fetched_earlier:
+            parse_seconds -= self.fetched.fetch_ms / 1000
+        for item in items:
+            start = time.perf_counter()
             parsed_item = self.parse_item(item)
-            if self.valid_item(parsed_item):
+            valid = self.valid_item(parsed_item)
+            parse_seconds += time.perf_counter() - start
+            if valid:
                 yield parsed_item
 
+        self.parse_ms = max(0.0, parse_seconds * 1000)
+
+    def commit_fetch(self) -> None:
+        """Save the conditional fetch's validators, so an unchanged feed is
+        skipped next time. Call once the parsed items have been dispatched."""
+        if self.fetched:
+            self.fetched.commit(parse_ms=self.parse_ms)
+
     def extract_title(self, entry: Any) -> str:
         """Extract title from feed entry. Override in subclasses."""
         return "Untitled"
@@ -125,8 +166,9 @@ class JSONParser(FeedParser):
     metadata_path: ObjectPath = ["metadata"]
 
     def fetch_items(self) -> Sequence[Any]:
+        self.fetch_content()
         if not self.content:
-            self.content = cast(str, fetch_html(self.url))
+            return []
         try:
             return json.loads(self.content)
         except json.JSONDecodeError as e:
@@ -176,8 +218,7 @@ class RSSAtomParser(FeedParser):
         ``self.since`` and returns empty content on a 304, which parses to
         zero entries.
         """
-        if not self.content:
-            self.content = cast(str, fetch_html(self.url, modified=self.since))
+        self.fetch_content(modified=self.since)
         feed = feedparser.parse(self.content)
         return feed.entries
 
@@ -255,10 +296,10 @@ class HTMLListParser(FeedParser):
 
     def fetch_items(self) -> Sequence[Any]:
         """Fetch items from the HTML page."""
-        if not self.content:
-            self.content = cast(str, fetch_html(self.url))
+        if not (content := self.fetch_content()):
+            return []
 
-        soup = BeautifulSoup(self.content, "html.parser")
+        soup = BeautifulSoup(content, "html.parser")
         items = []
         seen_urls = set()
 
@@ -510,24 +551,46 @@ FEED_REGISTRY = {
 }
 
 
-def get_feed_parser(url: str, check_from: datetime | None = None) -> FeedParser | None:
+def get_feed_parser(
+    url: str, check_from: datetime | None = None, conditional: bool = False
+) -> FeedParser | None:
+    """Find a parser for the feed at ``url``.
+
+    With ``conditional`` set the parser (and the fetch of ``url`` itself,
+    which may be the feed) skips feeds that haven't changed since the last
+    time they were parsed; see :class:`FeedParser`.
+    """
     for pattern, parser_class in FEED_REGISTRY.items():
         if re.search(pattern, url.rstrip("/")):
-            return parser_class(url=url, since=check_from)
-
-    text = cast(str, fetch_html(url))
+            return parser_class(url=url, since=check_from, conditional=conditional)
+
+    fetched = None
+    if conditional:
+        fetched = fetch_if_changed(url)
+        if not fetched.changed:
+            # Only pages that were parsed as feeds have validators to match
+            return FeedParser(url=url, content="", conditional=True, fetched=fetched)
+        text = fetched.content
+    else:
+        text = cast(str, fetch_html(url))
     if is_rss_feed(text):
-        return RSSAtomParser(url=url, content=text, since=check_from)
+        return RSSAtomParser(
+            url=url,
+            content=text,
+            since=check_from,
+            conditional=conditional,
+            fetched=fetched,
+        )
 
     soup = BeautifulSoup(text, "html.parser")
     if feed_link := find_feed_link(url, soup):
-        return RSSAtomParser(url=feed_link, since=check_from)
+        return RSSAtomParser(url=feed_link, since=check_from, conditional=conditional)
 
     for path in ["/archive", "/posts", "/feed"]:
         if url.rstrip("/").endswith(path):
             continue
         try:
-            if parser := get_feed_parser(url + path, check_from):
+            if parser := get_feed_parser(url + path, check_from, conditional):
                 return parser
         except requests.HTTPError:
             continue
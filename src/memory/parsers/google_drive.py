@@ -3,10 +3,13 @@
 import hashlib
 import io
 import logging
+import threading
 import zipfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Generator, TypedDict
+from typing import Any, Generator, Iterable, TypedDict
 
 import defusedxml.ElementTree as DefusedElementTree
 
@@ -32,6 +35,11 @@ SUPPORTED_FILE_MIMES = {
     "text/csv",
 }
 
+FOLDER_MIME = "application/vnd.google-apps.folder"
+
+# Metadata requested for every file we might sync
+FILE_FIELDS = "id, name, mimeType, modifiedTime, createdTime, owners, lastModifyingUser, parents, size, permissions(emailAddress, type)"
+
 # Export mappings for Google native formats
 # These formats can't be downloaded directly - must use export
 EXPORT_MIMES = {
@@ -92,17 +100,23 @@ class GoogleDriveClient:
         client_id: str | None = None,
         client_secret: str | None = None,
         token_uri: str = "https://oauth2.googleapis.com/token",
+        api_endpoint: str | None = None,
     ):
         self.credentials = credentials
-        self._service = None
+        # The underlying httplib2 transport isn't thread-safe, so each thread
+        # (see fetch_files) gets its own service object.
+        self._local = threading.local()
+        self._folder_cache: dict[str, dict | None] = {}
         # Use provided values or fall back to settings
         self._client_id = client_id or settings.GOOGLE_CLIENT_ID
         self._client_secret = client_secret or settings.GOOGLE_CLIENT_SECRET
         self._token_uri = token_uri
+        self._api_endpoint = api_endpoint
 
     def _get_service(self):
-        """Lazily build the Drive service."""
-        if self._service is None:
+        """Lazily build the Drive service for the current thread."""
+        service = getattr(self._local, "service", None)
+        if service is None:
             from google.oauth2.credentials import Credentials
             from googleapiclient.discovery import build
 
@@ -114,8 +128,14 @@ class GoogleDriveClient:
                 client_secret=self._client_secret,
                 scopes=self.credentials.scopes,
             )
-            self._service = build("drive", "v3", credentials=creds)
-        return self._service
+            client_options = (
+                {"api_endpoint": self._api_endpoint} if self._api_endpoint else None
+            )
+            service = build(
+                "drive", "v3", credentials=creds, client_options=client_options
+            )
+            self._local.service = service
+        return service
 
     def get_file_metadata(self, file_id: str) -> dict:
         """Get metadata for a single file or folder."""
@@ -124,7 +144,7 @@ class GoogleDriveClient:
             service.files()
             .get(
                 fileId=file_id,
-                fields="id, name, mimeType, modifiedTime, createdTime, owners, lastModifyingUser, parents, size, permissions(emailAddress, type)",
+                fields=FILE_FIELDS,
                 supportsAllDrives=True,
             )
             .execute()
@@ -133,7 +153,134 @@ class GoogleDriveClient:
     def is_folder(self, file_id: str) -> bool:
         """Check if a file ID refers to a folder."""
         metadata = self.get_file_metadata(file_id)
-        return metadata.get("mimeType") == "application/vnd.google-apps.folder"
+        return metadata.get("mimeType") == FOLDER_MIME
+
+    def get_start_page_token(self) -> str:
+        """Get the Changes API token for "now".
+
+        Fetch this *before* a full listing, so anything modified while the
+        listing runs still shows up in the next ``list_changes``.
+        """
+        service = self._get_service()
+        response = service.changes().getStartPageToken(supportsAllDrives=True).execute()
+        return response["startPageToken"]
+
+    def list_changes(
+        self, page_token: str, page_size: int = 100
+    ) -> tuple[list[dict], str]:
+        """List every change since ``page_token``.
+
+        Returns:
+            Tuple of (changes, new start page token). Each change has
+            ``fileId``, ``removed`` and (unless removed) ``file`` metadata.
+        """
+        service = self._get_service()
+        changes: list[dict] = []
+        while True:
+            response = (
+                service.changes()
+                .list(
+                    pageToken=page_token,
+                    spaces="drive",
+                    fields=f"nextPageToken, newStartPageToken, changes(fileId, removed, file({FILE_FIELDS}, trashed))",
+                    pageSize=page_size,
+                    supportsAllDrives=True,
+                    includeItemsFromAllDrives=True,
+                )
+                .execute()
+            )
+            changes.extend(response.get("changes", []))
+            if new_token := response.get("newStartPageToken"):
+                return changes, new_token
+            page_token = response["nextPageToken"]
+
+    def _get_folder(self, folder_id: str) -> dict | None:
+        """Name and parents of a folder, cached for the client's lifetime."""
+        if folder_id not in self._folder_cache:
+            try:
+                self._folder_cache[folder_id] = (
+                    self._get_service()
+                    .files()
+                    .get(fileId=folder_id, fields="id, name, parents", supportsAllDrives=True)
+                    .execute()
+                )
+            except Exception as e:
+                logger.warning(f"Could not look up folder {folder_id}: {e}")
+                self._folder_cache[folder_id] = None
+        return self._folder_cache[folder_id]
+
+    def path_within_folder(
+        self,
+        file_metadata: dict,
+        root_id: str,
+        root_path: str,
+        recursive: bool = True,
+        exclude_folder_ids: set[str] | None = None,
+    ) -> str | None:
+        """Folder path of a file if it lives under ``root_id``, else None.
+
+        Walks up the file's parents (cached, so a batch of changes in the same
+        subtree costs one lookup per folder). Files inside excluded
+        subfolders, or below the top level when not ``recursive``, are
+        treated as outside the folder.
+        """
+        exclude_folder_ids = exclude_folder_ids or set()
+        names: list[str] = []
+        parents = file_metadata.get("parents") or []
+        current = parents[0] if parents else None
+
+        for _ in range(self.MAX_FOLDER_DEPTH):
+            if current is None:
+                return None
+            if current == root_id:
+                return "/".join([root_path, *reversed(names)])
+            # Not a direct child, so only reachable when recursing
+            if not recursive or current in exclude_folder_ids:
+                return None
+            folder = self._get_folder(current)
+            if folder is None:
+                return None
+            names.append(folder["name"])
+            folder_parents = folder.get("parents") or []
+            current = folder_parents[0] if folder_parents else None
+        return None
+
+    def list_changed_files(
+        self,
+        root_id: str,
+        page_token: str,
+        recursive: bool = True,
+        exclude_folder_ids: set[str] | None = None,
+    ) -> tuple[list[tuple[dict, str]], str]:
+        """Supported files under ``root_id`` that changed since ``page_token``.
+
+        The Changes API is account-wide, so changes are filtered down to the
+        folder. Removed and trashed files are skipped.
+
+        Returns:
+            Tuple of ([(file_metadata, folder_path), ...], new page token)
+        """
+        changes, new_token = self.list_changes(page_token)
+        supported = SUPPORTED_GOOGLE_MIMES | SUPPORTED_FILE_MIMES
+        root_path: str | None = None
+
+        files: dict[str, tuple[dict, str]] = {}
+        for change in changes:
+            file = change.get("file")
+            if change.get("removed") or not file or file.get("trashed"):
+                continue
+            if file.get("mimeType") not in supported:
+                continue
+            if root_path is None:
+                root_path = self.get_folder_path(root_id)
+            path = self.path_within_folder(
+                file, root_id, root_path, recursive, exclude_folder_ids
+            )
+            if path is not None:
+                # A file edited several times appears once per edit
+                files[file["id"]] = (file, path)
+
+        return list(files.values()), new_token
 
     # Maximum folder depth to prevent stack overflow on deep/circular structures
     MAX_FOLDER_DEPTH = 50
@@ -184,7 +331,7 @@ class GoogleDriveClient:
         query_parts = [
             f"'{folder_id}' in parents",
             "trashed=false",
-            f"({mime_conditions} or mimeType='application/vnd.google-apps.folder')",
+            f"({mime_conditions} or mimeType='{FOLDER_MIME}')",
         ]
 
         if since:
@@ -199,7 +346,7 @@ class GoogleDriveClient:
                 .list(
                     q=query,
                     spaces="drive",
-                    fields="nextPageToken, files(id, name, mimeType, modifiedTime, createdTime, owners, lastModifyingUser, parents, size, permissions(emailAddress, type))",
+                    fields=f"nextPageToken, files({FILE_FIELDS})",
                     pageToken=page_token,
                     pageSize=page_size,
                     supportsAllDrives=True,
@@ -209,7 +356,7 @@ class GoogleDriveClient:
             )
 
             for file in response.get("files", []):
-                if file["mimeType"] == "application/vnd.google-apps.folder":
+                if file["mimeType"] == FOLDER_MIME:
                     if recursive and file["id"] not in exclude_folder_ids:
                         # Recursively list files in subfolder with updated path
                         subfolder_path = f"{_current_path}/{file['name']}"
@@ -354,6 +501,46 @@ class GoogleDriveClient:
             word_count=len(content.split()),
         )
 
+    def _fetch_file_logged(
+        self, file_metadata: dict, folder_path: str | None
+    ) -> GoogleFileData | None:
+        try:
+            return self.fetch_file(file_metadata, folder_path)
+        except Exception as e:
+            logger.error(f"Error fetching file {file_metadata.get('name')}: {e}")
+            return None
+
+    def fetch_files(
+        self,
+        files: Iterable[tuple[dict, str | None]],
+        max_workers: int = 4,
+    ) -> Generator[tuple[dict, GoogleFileData | None], None, None]:
+        """Fetch many files, exporting up to ``max_workers`` at once.
+
+        Results are yielded in input order. At most ``2 * max_workers``
+        exports are held in memory at a time, so a huge folder doesn't pile
+        up every body before the caller gets to them. Files that fail to
+        fetch are logged and yielded with None.
+        """
+        max_workers = max(1, max_workers)
+        with ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="gdrive-export"
+        ) as pool:
+            pending: deque[tuple[dict, Future]] = deque()
+            for file_metadata, folder_path in files:
+                pending.append(
+                    (
+                        file_metadata,
+                        pool.submit(self._fetch_file_logged, file_metadata, folder_path),
+                    )
+                )
+                if len(pending) >= 2 * max_workers:
+                    file_metadata, future = pending.popleft()
+                    yield file_metadata, future.result()
+            while pending:
+                file_metadata, future = pending.popleft()
+                yield file_metadata, future.result()
+
     def _extract_pdf_text(self, pdf_bytes: bytes) -> str | None:
         """Extract text from PDF using PyMuPDF.
 
@@ -1,13 +1,18 @@
 import hashlib
 import logging
+import os
 import pathlib
 import re
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from email.utils import format_datetime
 from typing import Any
 from urllib.parse import urljoin, urlparse
 
+import requests
 from bs4 import BeautifulSoup, Tag
 from markdownify import markdownify as md
 from PIL import Image as PILImage
@@ -49,25 +54,28 @@ def is_safe_url(url: str) -> bool:
 MAX_HTML_SIZE = 10 * 1024 * 1024  # 10 MB limit for HTML/feed downloads
 
 
-def fetch_html(
+HTML_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:137.0) Gecko/20100101 Firefox/137.0"
+}
+
+
+def http_date(when: datetime) -> str:
+    """Format ``when`` as an RFC 7231 HTTP-date. Naive datetimes are assumed UTC."""
+    as_utc = when if when.tzinfo else when.replace(tzinfo=timezone.utc)
+    return format_datetime(as_utc.astimezone(timezone.utc), usegmt=True)
+
+
+def request_html(
     url: str,
-    as_bytes: bool = False,
+    headers: dict[str, str] | None = None,
     validate_url: bool = True,
-    modified: datetime | None = None,
-) -> str | bytes:
-    """Fetch HTML content from a URL.
+    session: requests.Session | None = None,
+) -> requests.Response:
+    """Start a streamed GET of ``url`` for :func:`fetch_html` and friends.
 
-    Args:
-        url: The URL to fetch
-        as_bytes: If True, return raw bytes instead of decoded string
-        validate_url: If True, check URL against SSRF protection (default True)
-        modified: If set, send a conditional ``If-Modified-Since`` request
-            and short-circuit to empty content on a ``304 Not Modified``.
-            This is how SSRF-gated feed callers keep feedparser's
-            incremental-fetch optimisation: feedparser's own ``modified=``
-            shortcut only fires when feedparser does the fetch itself, so
-            once the fetch is routed through ``safe_get`` the conditional
-            request has to be made here instead.
+    The caller checks the status and reads the body with
+    :func:`read_html_body`. ``headers`` are sent on top of
+    :data:`HTML_HEADERS`.
 
     Raises:
         ValueError: If URL fails SSRF validation
@@ -76,39 +84,25 @@ def fetch_html(
     if validate_url and not is_safe_url(url):
         raise ValueError(f"URL failed SSRF validation: {url}")
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:137.0) Gecko/20100101 Firefox/137.0"
-    }
-    if modified is not None:
-        # RFC 7231 HTTP-date. Naive datetimes are assumed UTC so that
-        # ``format_datetime(usegmt=True)`` has a well-defined offset.
-        as_utc = modified if modified.tzinfo else modified.replace(tzinfo=timezone.utc)
-        headers["If-Modified-Since"] = format_datetime(
-            as_utc.astimezone(timezone.utc), usegmt=True
-        )
-
     # ``safe_get`` follows redirects manually and re-validates each Location
     # target — without this an attacker-controlled public URL can 302 to
     # cloud IMDS or docker-network services. We pass ``validate_url=False``
     # because the initial URL was already validated above.
     try:
-        response = safe_get(
+        return safe_get(
             url,
             validate_url=False,
             timeout=30,
-            headers=headers,
+            headers=HTML_HEADERS | (headers or {}),
             stream=True,
+            session=session,
         )
     except UnsafeURLError as e:
         raise ValueError(f"URL failed SSRF validation during redirect: {e}") from e
 
-    # 304 Not Modified carries no body — nothing changed since ``modified``.
-    # ``raise_for_status`` would not catch this (304 is not 4xx/5xx), so
-    # short-circuit explicitly rather than iterating an empty stream.
-    if response.status_code == 304:
-        response.close()
-        return b"" if as_bytes else ""
 
+def read_html_body(response: requests.Response) -> bytes:
+    """Read a successful response's body, capped at ``MAX_HTML_SIZE``."""
     response.raise_for_status()
 
     # Check Content-Length header
@@ -124,8 +118,54 @@ def fetch_html(
         if size > MAX_HTML_SIZE:
             raise ValueError("Response exceeded size limit during download")
         chunks.append(chunk)
-    content = b"".join(chunks)
+    return b"".join(chunks)
+
+
+def fetch_html(
+    url: str,
+    as_bytes: bool = False,
+    validate_url: bool = True,
+    modified: datetime | None = None,
+    session: requests.Session | None = None,
+) -> str | bytes:
+    """Fetch HTML content from a URL.
+
+    Args:
+        url: The URL to fetch
+        as_bytes: If True, return raw bytes instead of decoded string
+        validate_url: If True, check URL against SSRF protection (default True)
+        modified: If set, send a conditional ``If-Modified-Since`` request
+            and short-circuit to empty content on a ``304 Not Modified``.
+            This is how SSRF-gated feed callers keep feedparser's
+            incremental-fetch optimisation: feedparser's own ``modified=``
+            shortcut only fires when feedparser does the fetch itself, so
+            once the fetch is routed through ``safe_get`` the conditional
+            request has to be made here instead. See
+            :mod:`memory.parsers.conditional` for fetches that remember
+            their validators between runs.
+        session: ``requests.Session`` to fetch through, so a batch of pages
+            from the same site share keep-alive connections.
+
+    Raises:
+        ValueError: If URL fails SSRF validation
+        requests.RequestException: On network errors
+    """
+    headers = {}
+    if modified is not None:
+        headers["If-Modified-Since"] = http_date(modified)
 
+    response = request_html(
+        url, headers=headers, validate_url=validate_url, session=session
+    )
+
+    # 304 Not Modified carries no body — nothing changed since ``modified``.
+    # ``raise_for_status`` would not catch this (304 is not 4xx/5xx), so
+    # short-circuit explicitly rather than iterating an empty stream.
+    if response.status_code == 304:
+        response.close()
+        return b"" if as_bytes else ""
+
+    content = read_html_body(response)
     if as_bytes:
         return content
     return content.decode("utf-8", errors="replace")
@@ -248,12 +288,8 @@ def extract_content_element(
     return soup.body
 
 
-def process_image(url: str, image_dir: pathlib.Path) -> PILImage.Image | None:
-    # SSRF protection: validate URL before fetching
-    if not is_safe_url(url):
-        logger.warning(f"Blocked potentially unsafe image URL: {url}")
-        return None
-
+def image_cache_path(url: str, image_dir: pathlib.Path) -> pathlib.Path:
+    """Where the image at ``url`` is cached in ``image_dir``."""
     # Use SHA256 instead of MD5 for filename hashing
     url_hash = hashlib.sha256(url.encode()).hexdigest()[:32]
 
@@ -261,20 +297,107 @@ def process_image(url: str, image_dir: pathlib.Path) -> PILImage.Image | None:
     raw_ext = pathlib.Path(urlparse(url).path).suffix.lower()
     ext = raw_ext if raw_ext in ALLOWED_IMAGE_EXTENSIONS else ".jpg"
 
-    filename = f"{url_hash}{ext}"
-    local_path = image_dir / filename
-    local_path.parent.mkdir(parents=True, exist_ok=True)
+    return image_dir / f"{url_hash}{ext}"
 
-    # Download if not already cached
-    if not local_path.exists():
-        ok = stream_download_to_path(
-            url,
-            local_path,
-            MAX_IMAGE_SIZE,
-            headers={"User-Agent": "Mozilla/5.0"},
-        )
+
+# Downloads in progress, by cache path, so concurrent requests for the same
+# image (from one article or several) share a single download
+_inflight: dict[pathlib.Path, Future] = {}
+_inflight_lock = threading.Lock()
+
+_host_slots: dict[str, threading.BoundedSemaphore] = {}
+_host_slots_lock = threading.Lock()
+
+# (pid, pool): a pool inherited from a forking parent has no threads
+_fetch_pool: tuple[int, ThreadPoolExecutor] | None = None
+_fetch_pool_lock = threading.Lock()
+
+
+def _host_slot(url: str) -> threading.BoundedSemaphore:
+    host = (urlparse(url).hostname or "").lower()
+    with _host_slots_lock:
+        if host not in _host_slots:
+            _host_slots[host] = threading.BoundedSemaphore(
+                settings.IMAGE_FETCH_PER_HOST
+            )
+        return _host_slots[host]
+
+
+def _image_fetch_pool() -> ThreadPoolExecutor:
+    global _fetch_pool
+    with _fetch_pool_lock:
+        if _fetch_pool is None or _fetch_pool[0] != os.getpid():
+            _fetch_pool = (
+                os.getpid(),
+                ThreadPoolExecutor(
+                    max_workers=settings.IMAGE_FETCH_WORKERS,
+                    thread_name_prefix="image-fetch",
+                ),
+            )
+        return _fetch_pool[1]
+
+
+def _download_image(url: str, local_path: pathlib.Path) -> pathlib.Path | None:
+    # Written under a temporary name so a partial file is never mistaken
+    # for a cached image
+    partial = local_path.with_name(f"{local_path.name}.{uuid.uuid4().hex}.part")
+    try:
+        with _host_slot(url):
+            ok = stream_download_to_path(
+                url,
+                partial,
+                MAX_IMAGE_SIZE,
+                headers={"User-Agent": "Mozilla/5.0"},
+                # Just checked by the caller; redirects are still validated
+                validate_url=False,
+            )
         if not ok:
             return None
+        os.replace(partial, local_path)
+        return local_path
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def fetch_image(url: str, image_dir: pathlib.Path) -> pathlib.Path | None:
+    """Download the image at ``url`` into ``image_dir``, unless it's cached.
+
+    Returns the local path, or None if the URL is unsafe or the download
+    failed. If the same image is already being downloaded, waits for that
+    download instead of starting another.
+    """
+    # SSRF protection: validate URL before fetching
+    if not is_safe_url(url):
+        logger.warning(f"Blocked potentially unsafe image URL: {url}")
+        return None
+
+    local_path = image_cache_path(url, image_dir)
+    if local_path.exists():
+        return local_path
+
+    future: Future = Future()
+    with _inflight_lock:
+        pending = _inflight.setdefault(local_path, future)
+    if pending is not future:
+        return pending.result()
+
+    try:
+        local_path.parent.mkdir(parents=True, exist_ok=True)
+        result = _download_image(url, local_path)
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[local_path]
+
+
+def process_image(url: str, image_dir: pathlib.Path) -> PILImage.Image | None:
+    local_path = fetch_image(url, image_dir)
+    if local_path is None:
+        return None
 
     try:
         return PILImage.open(local_path)
@@ -289,14 +412,16 @@ def process_images(
     """
     Process all images in content: download them, update URLs, and return PIL Images.
 
+    Images are fetched concurrently on a pool shared by all articles, each
+    distinct URL once.
+
     Returns:
         Tuple of (updated_content, dict_of_pil_images)
     """
     if not content:
         return content, {}
 
-    images = {}
-
+    tags: list[tuple[Tag, str, str]] = []
     for img_tag in content.find_all("img"):
         if not isinstance(img_tag, Tag):
             continue
@@ -306,8 +431,20 @@ def process_images(
             continue
 
         try:
-            url = to_absolute_url(str(src), base_url)
-            image = process_image(url, image_dir)
+            tags.append((img_tag, str(src), to_absolute_url(str(src), base_url)))
+        except Exception as e:
+            logger.warning(f"Failed to process image {src}: {e}")
+
+    pool = _image_fetch_pool()
+    fetches = {
+        url: pool.submit(process_image, url, image_dir)
+        for url in dict.fromkeys(url for _, _, url in tags)
+    }
+
+    images = {}
+    for img_tag, src, url in tags:
+        try:
+            image = fetches[url].result()
             if not image:
                 continue
 
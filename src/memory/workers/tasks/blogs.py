@@ -2,14 +2,20 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import Iterable, cast
 
+import requests
+from sqlalchemy.orm import Session
+
+from memory.common import settings
 from memory.common.db.connection import make_session
 from memory.common.db.models import ArticleFeed, BlogPost
 from memory.parsers.blogs import parse_webpage
+from memory.parsers.conditional import FetchResult
 from memory.parsers.feeds import get_feed_parser
 from memory.parsers.archives import get_archive_fetcher
 from memory.common.celery_app import (
     app,
     SYNC_WEBPAGE,
+    SYNC_WEBPAGES,
     SYNC_ARTICLE_FEED,
     SYNC_ALL_ARTICLE_FEEDS,
     ADD_ARTICLE_FEED,
@@ -21,27 +27,30 @@ from memory.common.content_processing import (
     create_task_result,
     process_content_item,
 )
+from memory.common.downloads import normalize_article_url
 from memory.common.jobs import tracked_task
 
 logger = logging.getLogger(__name__)
 
 
-@app.task(name=SYNC_WEBPAGE)
-@tracked_task
-def sync_webpage(url: str, tags: Iterable[str] | None = None) -> dict:
-    """
-    Synchronize a webpage from a URL.
+def ingest_webpage(
+    url: str,
+    tags: Iterable[str] | None = None,
+    http: requests.Session | None = None,
+) -> dict:
+    """Fetch, parse and store one webpage, unless it is already stored.
 
     Args:
         url: URL of the webpage to parse and store
         tags: Additional tags to apply to the content
+        http: Optional ``requests.Session`` to fetch the page through
 
     Returns:
         dict: Summary of what was processed
     """
     tags = tags or []
     logger.info(f"Syncing webpage: {url}")
-    article = parse_webpage(url)
+    article = parse_webpage(url, session=http)
     logger.debug(f"Article: {article.title} - {article.url}")
 
     if not article.content:
@@ -77,6 +86,144 @@ def sync_webpage(url: str, tags: Iterable[str] | None = None) -> dict:
         return process_content_item(blog_post, session)
 
 
+@app.task(name=SYNC_WEBPAGE)
+@tracked_task
+def sync_webpage(url: str, tags: Iterable[str] | None = None) -> dict:
+    """
+    Synchronize a webpage from a URL.
+
+    Args:
+        url: URL of the webpage to parse and store
+        tags: Additional tags to apply to the content
+
+    Returns:
+        dict: Summary of what was processed
+    """
+    return ingest_webpage(url, tags)
+
+
+@app.task(name=SYNC_WEBPAGES)
+@tracked_task
+def sync_webpages(urls: list[str], tags: Iterable[str] | None = None) -> dict:
+    """
+    Synchronize a group of webpages, fetched over one HTTP session.
+
+    Feed and archive syncs queue new articles in groups, so a large archive
+    costs one task (and one set of keep-alive connections to the site) per
+    group rather than per article. A page that fails doesn't stop the rest.
+
+    Args:
+        urls: URLs of the webpages to parse and store
+        tags: Additional tags to apply to the content
+
+    Returns:
+        dict: Summary including the result for each URL
+    """
+    results = []
+    with requests.Session() as http:
+        for url in urls:
+            try:
+                results.append(ingest_webpage(url, tags, http))
+            except Exception as e:
+                logger.exception(f"Error syncing webpage {url}")
+                results.append({"url": url, "status": "error", "error": str(e)})
+
+    return {
+        "status": "completed",
+        "urls": len(urls),
+        "errors": sum(r.get("status") == "error" for r in results),
+        "results": results,
+    }
+
+
+def new_article_urls(
+    session: Session, urls: Iterable[str], seen: set[str] | None = None
+) -> list[str]:
+    """Return those of ``urls`` that aren't stored as blog posts yet, in order.
+
+    One query for the whole batch, against the indexed normalized URL.
+    Links that normalize to the same key as an earlier one (in this batch,
+    or in ``seen``, which is updated) are dropped as well.
+    """
+    seen = set() if seen is None else seen
+    by_key: dict[str, str] = {}
+    for url in urls:
+        key = normalize_article_url(url)
+        if key not in seen:
+            by_key.setdefault(key, url)
+    seen.update(by_key)
+    if not by_key:
+        return []
+
+    existing = {
+        key
+        for (key,) in session.query(BlogPost.normalized_url).filter(
+            BlogPost.normalized_url.in_(list(by_key))
+        )
+    }
+    return [url for key, url in by_key.items() if key not in existing]
+
+
+class ArticleScheduler:
+    """Queues ``sync_webpages`` tasks for the new URLs among those added.
+
+    URLs are deduplicated ``ARTICLE_DEDUP_BATCH_SIZE`` at a time and queued
+    ``ARTICLE_SYNC_GROUP_SIZE`` per task. Call ``flush`` once all URLs have
+    been added (including after the source failed part way).
+    """
+
+    def __init__(self, session: Session, tags: Iterable[str]):
+        self.session = session
+        self.tags = list(tags)
+        self.articles_found = 0
+        self.new_articles = 0
+        self.task_ids: list[str] = []
+        self._seen: set[str] = set()
+        self._unchecked: list[str] = []
+        self._new: list[str] = []
+
+    def add(self, url: str) -> None:
+        self.articles_found += 1
+        self._unchecked.append(url)
+        if len(self._unchecked) >= settings.ARTICLE_DEDUP_BATCH_SIZE:
+            self._check()
+            self._dispatch(final=False)
+
+    def flush(self) -> None:
+        self._check()
+        self._dispatch(final=True)
+
+    def _check(self) -> None:
+        if self._unchecked:
+            self._new += new_article_urls(self.session, self._unchecked, self._seen)
+            self._unchecked = []
+
+    def _dispatch(self, final: bool) -> None:
+        size = max(1, settings.ARTICLE_SYNC_GROUP_SIZE)
+        while len(self._new) >= size or (final and self._new):
+            group, self._new = self._new[:size], self._new[size:]
+            self.task_ids.append(sync_webpages.delay(group, self.tags).id)  # type: ignore[attr-defined]
+            self.new_articles += len(group)
+            logger.info(f"Scheduled sync for {len(group)} articles")
+
+
+def fetch_stats(fetched: FetchResult | None) -> dict:
+    """How a conditional feed fetch went, and what it saved."""
+    if fetched is None:
+        return {
+            "fetch_status": None,
+            "bytes_downloaded": 0,
+            "bytes_saved": 0,
+            "parse_ms_saved": 0.0,
+        }
+    return {
+        "fetch_status": fetched.status,
+        "bytes_downloaded": fetched.downloaded,
+        "bytes_saved": fetched.bytes_saved,
+        "parse_ms_saved": round(fetched.parse_ms_saved, 1),
+    }
+
+
 @app.task(name=SYNC_ARTICLE_FEED)
 @tracked_task
 def sync_article_feed(feed_id: int) -> dict:
@@ -116,36 +263,25 @@ def sync_article_feed(feed_id: int) -> dict:
 
         logger.info(f"Syncing feed: {feed.title} ({feed.url})")
 
-        parser = get_feed_parser(cast(str, feed.url), last_checked_at)
+        parser = get_feed_parser(cast(str, feed.url), last_checked_at, conditional=True)
         if not parser:
             logger.error(f"No parser available for feed: {feed.url}")
             return {"status": "error", "error": "No parser available for feed"}
 
-        articles_found = 0
-        new_articles = 0
+        scheduler = ArticleScheduler(session, cast(list[str] | None, feed.tags) or [])
         errors = 0
-        task_ids = []
 
         try:
             for feed_item in parser.parse_feed():
-                if not feed_item.url:
-                    continue
-
-                articles_found += 1
-
-                existing = check_content_exists(session, BlogPost, url=feed_item.url)
-                if existing:
-                    continue
-
-                feed_tags = cast(list[str] | None, feed.tags) or []
-                task_ids.append(sync_webpage.delay(feed_item.url, feed_tags).id)  # type: ignore[attr-defined]
-                new_articles += 1
-
-                logger.info(f"Scheduled sync for: {feed_item.title} ({feed_item.url})")
-
+                if feed_item.url:
+                    scheduler.add(feed_item.url)
         except Exception as e:
             logger.error(f"Error parsing feed {feed.url}: {e}")
             errors += 1
+        scheduler.flush()
+        if not errors:
+            # Only now is it safe to skip this version of the feed next time
+            parser.commit_fetch()
 
         feed.last_checked_at = datetime.now(timezone.utc)  # type: ignore
         session.commit()
@@ -155,10 +291,11 @@ def sync_article_feed(feed_id: int) -> dict:
             "feed_id": feed_id,
             "feed_title": feed.title,
             "feed_url": feed.url,
-            "articles_found": articles_found,
-            "new_articles": new_articles,
+            "articles_found": scheduler.articles_found,
+            "new_articles": scheduler.new_articles,
             "errors": errors,
-            "task_ids": task_ids,
+            "task_ids": scheduler.task_ids,
+            **fetch_stats(parser.fetched),
         }
 
 
@@ -238,6 +375,7 @@ def sync_website_archive(
     tags: Iterable[str] | None = None,
     max_pages: int = 100,
     add_feed: bool = True,
+    incremental: bool = False,
 ) -> dict:
     """
     Synchronize all articles from a website's archive.
@@ -246,6 +384,9 @@ def sync_website_archive(
         url: Base URL of the website to sync
         tags: Additional tags to apply to all articles
         max_pages: Maximum number of pages to process
+        add_feed: Also add the website as an article feed
+        incremental: Stop at the first archive page that hasn't changed
+            since the last crawl
 
     Returns:
         dict: Summary of archive sync operation
@@ -273,29 +414,23 @@ def sync_website_archive(
 
     # Override max_pages if provided
     fetcher.max_pages = max_pages
-
-    articles_found = 0
-    new_articles = 0
-    task_ids = []
+    fetcher.conditional = incremental
 
     with make_session() as session:
-        for feed_item in fetcher.fetch_all_items():
-            articles_found += 1
-
-            existing = check_content_exists(session, BlogPost, url=feed_item.url)
-            if existing:
-                continue
-
-            task_ids.append(sync_webpage.delay(feed_item.url, list(tags)).id)  # type: ignore[attr-defined]
-            new_articles += 1
-
-            logger.info(f"Scheduled sync for: {feed_item.title} ({feed_item.url})")
+        scheduler = ArticleScheduler(session, tags)
+        try:
+            for feed_item in fetcher.fetch_all_items():
+                if feed_item.url:
+                    scheduler.add(feed_item.url)
+        finally:
+            scheduler.flush()
+        fetcher.commit()
 
     return {
         "status": "completed",
         "website_url": url,
-        "articles_found": articles_found,
-        "new_articles": new_articles,
-        "task_ids": task_ids,
+        "articles_found": scheduler.articles_found,
+        "new_articles": scheduler.new_articles,
+        "task_ids": scheduler.task_ids,
         "max_pages_processed": fetcher.max_pages,
     }
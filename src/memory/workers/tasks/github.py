@@ -2,7 +2,8 @@
 
 import logging
 from datetime import datetime, timedelta, timezone
-from typing import Any, cast
+from itertools import batched
+from typing import Any, Iterable, cast
 
 from memory.common import qdrant
 from memory.common.celery_app import (
@@ -22,6 +23,7 @@ from memory.common.db.models.sources import (
 )
 from memory.common.people import find_person_by_github, link_github_user_to_person
 from memory.common.github import (
+    PROJECT_FIELDS_BATCH_SIZE,
     GithubClient,
     GithubCredentials,
     GithubIssueData,
@@ -555,18 +557,45 @@ def sync_github_item(
         return process_content_item(github_item, session)
 
 
+def _dispatch_items(
+    client: GithubClient,
+    repo_id: int,
+    owner: str,
+    name: str,
+    items: Iterable[GithubIssueData],
+    kind: str,
+    track_project_fields: bool,
+) -> list[str]:
+    """Queue sync_github_item for each issue/PR, returning the task ids.
+
+    Project fields are fetched a page at a time with one aliased GraphQL
+    query, rather than one query per item.
+    """
+    task_ids = []
+    for page in batched(items, PROJECT_FIELDS_BATCH_SIZE):
+        if track_project_fields:
+            fields = client.fetch_project_fields_batch(
+                owner, name, [item["number"] for item in page], kind
+            )
+            for item in page:
+                item["project_fields"] = fields.get(item["number"])
+
+        for item in page:
+            task_id = sync_github_item.delay(repo_id, serialize_issue_data(item))  # type: ignore[attr-defined]
+            task_ids.append(task_id.id)
+    return task_ids
+
+
 @app.task(name=SYNC_GITHUB_REPO)
 @tracked_task
 def sync_github_repo(repo_id: int, force_full: bool = False) -> dict[str, Any]:
     """Sync all issues and PRs for a repository.
 
-    Note: every invocation makes a `client.get_repo(owner, name)` REST call
-    up front to detect archived/missing repos. That's one extra REST hit
-    per sync cycle on top of the per-issue/PR/milestone fetches. For a
-    fleet of N tracked repos that's N extra calls per cycle. Acceptable
-    for current scale; consider plumbing the fetched repo metadata down
-    to avoid re-fetching, or doing the archival check on a slower cadence,
-    if API rate limits become a concern.
+    REST calls are conditional (ETag/Last-Modified), so unchanged resources
+    come back as 304s that don't count against the rate limit. An
+    incremental sync of a repo with no changes costs three of them: the
+    repo itself (archived/missing check), a milestone probe and an issue
+    probe, and skips the GraphQL fetches entirely.
     """
     logger.info(f"Syncing GitHub repo {repo_id}")
 
@@ -641,10 +670,14 @@ def sync_github_repo(repo_id: int, force_full: bool = False) -> dict[str, Any]:
 
         milestones_synced = 0
         try:
-            for ms_data in client.fetch_milestones(owner, name):
-                _sync_milestone(session, repo, ms_data)
-                milestones_synced += 1
-            session.commit()
+            milestone_probe = client.probe_milestones(owner, name)
+            if force_full or milestone_probe is None or milestone_probe.changed:
+                for ms_data in client.fetch_milestones(owner, name):
+                    _sync_milestone(session, repo, ms_data)
+                    milestones_synced += 1
+                session.commit()
+                if milestone_probe:
+                    milestone_probe.commit()
             logger.info(f"Synced {milestones_synced} milestones for {repo.repo_path}")
         except Exception as e:
             logger.warning(
@@ -664,37 +697,45 @@ def sync_github_repo(repo_id: int, force_full: bool = False) -> dict[str, Any]:
         else:
             since = last_sync
 
-        issues_synced = 0
-        prs_synced = 0
-        task_ids = []
-
-        # Sync issues
-        if cast(bool, repo.track_issues):
-            for issue_data in client.fetch_issues(owner, name, since, state, labels):
-                # Fetch project fields if enabled
-                if track_project_fields:
-                    issue_data["project_fields"] = client.fetch_project_fields(
-                        owner, name, issue_data["number"]
-                    )
-
-                serialized = serialize_issue_data(issue_data)
-                task_id = sync_github_item.delay(repo.id, serialized)  # type: ignore[attr-defined]
-                task_ids.append(task_id.id)
-                issues_synced += 1
-
-        # Sync PRs
-        if cast(bool, repo.track_prs):
-            for pr_data in client.fetch_prs(owner, name, since, state):
-                # Fetch project fields if enabled
-                if track_project_fields:
-                    pr_data["project_fields"] = client.fetch_pr_project_fields(
-                        owner, name, pr_data["number"]
-                    )
-
-                serialized = serialize_issue_data(pr_data)
-                task_id = sync_github_item.delay(repo.id, serialized)  # type: ignore[attr-defined]
-                task_ids.append(task_id.id)
-                prs_synced += 1
+        # Incremental syncs skip the GraphQL fetches when nothing changed.
+        # The probe's validators are only stored once everything it reported
+        # has been queued, so a failed sync is retried in full next time.
+        issue_probe = client.probe_issues(owner, name) if since else None
+        unchanged = issue_probe is not None and not issue_probe.changed
+        if unchanged:
+            logger.info(f"No issue/PR changes in {repo.repo_path}")
+
+        issue_task_ids: list[str] = []
+        pr_task_ids: list[str] = []
+
+        if cast(bool, repo.track_issues) and not unchanged:
+            issue_task_ids = _dispatch_items(
+                client,
+                repo_id,
+                owner,
+                name,
+                client.fetch_issues(owner, name, since, state, labels),
+                "issue",
+                track_project_fields,
+            )
+
+        if cast(bool, repo.track_prs) and not unchanged:
+            pr_task_ids = _dispatch_items(
+                client,
+                repo_id,
+                owner,
+                name,
+                client.fetch_prs(owner, name, since, state),
+                "pullRequest",
+                track_project_fields,
+            )
+
+        if issue_probe:
+            issue_probe.commit()
+
+        issues_synced = len(issue_task_ids)
+        prs_synced = len(pr_task_ids)
+        task_ids = issue_task_ids + pr_task_ids
 
         # Update sync timestamps
         repo.last_sync_at = now  # type: ignore
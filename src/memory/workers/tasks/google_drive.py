@@ -1,13 +1,15 @@
 """Celery tasks for Google Drive document syncing."""
 
 import logging
+import pathlib
 from datetime import datetime, timedelta, timezone
-from typing import Any, cast
+from typing import Any, Iterable, cast
 
-from memory.common import qdrant
+from memory.common import qdrant, settings
 from memory.common.celery_app import app
 from memory.common.db.connection import make_session
 from memory.common.db.models import GoogleDoc
+from memory.common.db.models.source_item import clean_filename
 from memory.common.db.models.sources import GoogleAccount, GoogleFolder
 from memory.parsers.google_drive import (
     GoogleDriveClient,
@@ -53,6 +55,45 @@ def _serialize_file_data(data: GoogleFileData) -> dict[str, Any]:
     }
 
 
+def spool_filename(folder_id: int, file_id: str, content_hash: str) -> str:
+    """Deterministic spool filename for an exported document.
+
+    Re-syncing the same revision overwrites its own file rather than leaking
+    a new one.
+    """
+    return f"{folder_id}-{clean_filename(file_id)}-{content_hash[:16]}.txt"
+
+
+def spool_path(filename: str) -> pathlib.Path:
+    """Resolve a spool filename under GOOGLE_DRIVE_SPOOL_DIR (basename only)."""
+    return settings.GOOGLE_DRIVE_SPOOL_DIR / pathlib.Path(filename).name
+
+
+def _task_payload(folder_id: int, data: GoogleFileData) -> dict[str, Any]:
+    """Serialize file data for sync_google_doc, spooling large bodies.
+
+    Bodies over GOOGLE_DRIVE_SPOOL_THRESHOLD bytes are written to the spool
+    dir and only the filename goes through the broker, as with raw emails.
+    """
+    serialized = _serialize_file_data(data)
+    if data["size"] <= settings.GOOGLE_DRIVE_SPOOL_THRESHOLD:
+        return serialized
+
+    name = spool_filename(folder_id, data["file_id"], data["content_hash"])
+    path = spool_path(name)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(data["content"], encoding="utf-8")
+    return {**serialized, "content": None, "content_spool": name}
+
+
+def read_spooled_content(filename: str) -> str | None:
+    """Read a spooled document body, or None if it is no longer present."""
+    try:
+        return spool_path(filename).read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+
+
 def _deserialize_file_data(data: dict[str, Any]) -> GoogleFileData:
     """Deserialize file data from Celery task."""
     from memory.parsers.google_drive import parse_google_date
@@ -181,8 +222,27 @@ def sync_google_doc(
     folder_id: int,
     file_data_serialized: dict[str, Any],
 ) -> dict[str, Any]:
-    """Sync a single Google Drive document."""
-    file_data = _deserialize_file_data(file_data_serialized)
+    """Sync a single Google Drive document.
+
+    Large bodies arrive as a ``content_spool`` filename instead of inline
+    ``content``; the spool file is deleted once the document is handled.
+    """
+    spool_name = file_data_serialized.get("content_spool")
+    if spool_name:
+        content = read_spooled_content(spool_name)
+        if content is None:
+            # The next folder sync that sees the file re-exports it
+            logger.warning(f"Spool file missing for Google Doc: {spool_name}")
+            return {"status": "skipped", "reason": "spool_missing"}
+        file_data_serialized = {**file_data_serialized, "content": content}
+
+    result = _store_google_doc(folder_id, _deserialize_file_data(file_data_serialized))
+    if spool_name:
+        spool_path(spool_name).unlink(missing_ok=True)
+    return result
+
+
+def _store_google_doc(folder_id: int, file_data: GoogleFileData) -> dict[str, Any]:
     logger.info(f"Syncing Google Doc: {file_data['title']}")
 
     with make_session() as session:
@@ -219,7 +279,15 @@ def sync_google_doc(
 @app.task(name=SYNC_GOOGLE_FOLDER)
 @tracked_task
 def sync_google_folder(folder_id: int, force_full: bool = False) -> dict[str, Any]:
-    """Sync all documents in a Google Drive folder."""
+    """Sync all documents in a Google Drive folder.
+
+    Folders are synced incrementally through the Drive Changes API: the
+    folder's ``changes_page_token`` marks where the last run stopped, so a
+    run only exports files that changed since. Without a token (first sync,
+    forced full sync, or after the folder's scope changed) the folder is
+    listed instead, and a fresh token is stored for next time. Exports run
+    in parallel, GOOGLE_DRIVE_EXPORT_CONCURRENCY at a time.
+    """
     logger.info(f"Syncing Google folder {folder_id}")
 
     with make_session() as session:
@@ -274,28 +342,42 @@ def sync_google_folder(folder_id: int, force_full: bool = False) -> dict[str, An
             is_single_doc = not is_folder
 
             if is_folder:
-                # It's a folder - list and sync all files inside
+                # It's a folder - sync changed files inside
                 # Get excluded folder IDs
                 exclude_ids = set(cast(list[str], folder.exclude_folder_ids) or [])
                 if exclude_ids:
                     logger.info(f"Excluding {len(exclude_ids)} folder(s) from sync")
-
-                for file_meta, file_folder_path in client.list_files_in_folder(
-                    google_id,
-                    recursive=cast(bool, folder.recursive),
-                    since=since,
-                    exclude_folder_ids=exclude_ids,
+                recursive = cast(bool, folder.recursive)
+
+                page_token = None if force_full else cast(str | None, folder.changes_page_token)
+                files: Iterable[tuple[dict, str | None]]
+                if page_token:
+                    files, new_page_token = client.list_changed_files(
+                        google_id,
+                        page_token,
+                        recursive=recursive,
+                        exclude_folder_ids=exclude_ids,
+                    )
+                    logger.info(f"{len(files)} changed file(s) in {folder.folder_name}")
+                else:
+                    new_page_token = client.get_start_page_token()
+                    files = client.list_files_in_folder(
+                        google_id,
+                        recursive=recursive,
+                        since=since,
+                        exclude_folder_ids=exclude_ids,
+                    )
+
+                for _, file_data in client.fetch_files(
+                    files, max_workers=settings.GOOGLE_DRIVE_EXPORT_CONCURRENCY
                 ):
-                    try:
-                        file_data = client.fetch_file(file_meta, file_folder_path)
-                        if file_data:
-                            serialized = _serialize_file_data(file_data)
-                            task = sync_google_doc.delay(folder.id, serialized)  # type: ignore[attr-defined]
-                            task_ids.append(task.id)
-                            docs_synced += 1
-                    except Exception as e:
-                        logger.error(f"Error fetching file {file_meta.get('name')}: {e}")
-                        continue
+                    if file_data:
+                        payload = _task_payload(cast(int, folder.id), file_data)
+                        task = sync_google_doc.delay(folder.id, payload)  # type: ignore[attr-defined]
+                        task_ids.append(task.id)
+                        docs_synced += 1
+
+                folder.changes_page_token = new_page_token
             else:
                 # It's a single document - sync it directly
                 logger.info(f"Syncing single document: {file_metadata.get('name')}")
@@ -322,8 +404,8 @@ def sync_google_folder(folder_id: int, force_full: bool = False) -> dict[str, An
                 try:
                     file_data = client.fetch_file(file_metadata, folder_path)
                     if file_data:
-                        serialized = _serialize_file_data(file_data)
-                        task = sync_google_doc.delay(folder.id, serialized)  # type: ignore[attr-defined]
+                        payload = _task_payload(cast(int, folder.id), file_data)
+                        task = sync_google_doc.delay(folder.id, payload)  # type: ignore[attr-defined]
                         task_ids.append(task.id)
                         docs_synced = 1
                 except Exception as e:
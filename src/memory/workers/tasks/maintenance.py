@@ -9,7 +9,7 @@ from sqlalchemy import delete, func, inspect as sa_inspect, or_
 from sqlalchemy import select
 from sqlalchemy.orm import contains_eager, selectinload, with_polymorphic
 
-from memory.common import collections, embedding, extract, qdrant, settings
+from memory.common import collections, embedding, extract, qdrant, session_index, settings
 from memory.common.db.models.discord import DiscordChannel
 from memory.common.db.models.slack import SlackChannel
 from memory.common.celery_app import (
@@ -705,6 +705,7 @@ def cleanup_old_claude_sessions(max_age_days: int | None = None):
             if transcript_file.exists():
                 try:
                     transcript_file.unlink()
+                    session_index.remove_index(transcript_file)
                     deleted_files += 1
                 except OSError as e:
                     logger.warning(f"Failed to delete transcript file {transcript_file}: {e}")
@@ -3,12 +3,14 @@
 import hashlib
 import json
 import logging
+import re
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 
 from dateutil import parser as date_parser
 
-from memory.common import llms, settings, jobs as job_utils
+from memory.common import llms, settings, tokens, jobs as job_utils
 from memory.common.db.connection import DBSession, make_session
 from memory.common.db.models import Task
 from memory.common.db.models.source_items import Meeting
@@ -105,21 +107,179 @@ def make_task_sha256(meeting_id: int, description: str) -> bytes:
     return hashlib.sha256(content.encode()).digest()
 
 
+MERGE_SUMMARIES_PROMPT = """These are summaries of consecutive parts of one long meeting, in order. Combine them into a concise 2-3 sentence summary of the whole meeting's main purpose and outcomes.
+
+Return your summary as JSON with this exact structure:
+{{
+    "summary": "Brief summary of the meeting"
+}}
+
+IMPORTANT: Return ONLY valid JSON, no markdown formatting or extra text.
+
+Summaries of the meeting's parts:
+{summaries}
+"""
+
+
+def split_transcript(
+    transcript: str, max_tokens: int, overlap_tokens: int = 0
+) -> list[str]:
+    """Split a transcript into windows of at most ``max_tokens``.
+
+    Windows break between lines (speaker turns), and each one starts with
+    the last ``overlap_tokens`` worth of lines of the one before, so an
+    exchange that straddles a break is seen whole by at least one window.
+    Lines too long for a window are split between words.
+    """
+    max_chars = max_tokens * tokens.CHARS_PER_TOKEN
+    if max_tokens <= 0 or len(transcript) <= max_chars:
+        return [transcript]
+    overlap_chars = min(overlap_tokens * tokens.CHARS_PER_TOKEN, max_chars // 2)
+    line_chars = max_chars - overlap_chars
+
+    lines = []
+    for line in transcript.splitlines(keepends=True):
+        while len(line) > line_chars:
+            cut = line.rfind(" ", 0, line_chars)
+            cut = cut if cut > 0 else line_chars
+            lines.append(line[:cut])
+            line = line[cut:]
+        lines.append(line)
+
+    segments = []
+    current: list[str] = []
+    size = 0
+    for line in lines:
+        if current and size + len(line) > max_chars:
+            segments.append("".join(current))
+            overlap: list[str] = []
+            size = 0
+            for previous in reversed(current):
+                if size + len(previous) > overlap_chars:
+                    break
+                overlap.insert(0, previous)
+                size += len(previous)
+            current = overlap
+        current.append(line)
+        size += len(line)
+    segments.append("".join(current))
+    return segments
+
+
+def _dedup_key(text: str) -> str:
+    return re.sub(r"\W+", " ", text.lower()).strip()
+
+
+def merge_action_items(action_items: list[dict]) -> list[dict]:
+    """Drop repeated action items, e.g. from overlapping segments.
+
+    Items are the same if their descriptions match ignoring case and
+    punctuation. The first one is kept, with any fields it is missing
+    filled in from its repeats.
+    """
+    merged: dict[str, dict] = {}
+    for item in action_items:
+        description = item.get("description") or ""
+        key = _dedup_key(description)
+        if not key:
+            continue
+        if key not in merged:
+            merged[key] = dict(item)
+            continue
+        for field, value in item.items():
+            if value and not merged[key].get(field):
+                merged[key][field] = value
+    return list(merged.values())
+
+
+def merge_notes(notes: Sequence[str]) -> str:
+    """Join the notes of consecutive segments, dropping repeated lines."""
+    seen = set()
+    lines = []
+    for note in notes:
+        for line in (note or "").splitlines():
+            key = _dedup_key(line)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            lines.append(line)
+    return "\n".join(lines)
+
+
+def merge_extractions(
+    parts: list[dict], model: str, system_prompt: str | None = None
+) -> dict:
+    """Reduce the extractions of a transcript's segments to one.
+
+    Summaries are combined by the LLM; notes and action items are merged
+    here, without another call.
+    """
+    summaries = [part.get("summary") or "" for part in parts]
+    summaries = [summary for summary in summaries if summary.strip()]
+    summary = summaries[0] if summaries else ""
+    if len(summaries) > 1:
+        prompt = MERGE_SUMMARIES_PROMPT.format(
+            summaries="\n\n".join(
+                f"Part {i}: {summary}" for i, summary in enumerate(summaries, 1)
+            )
+        )
+        response = llms.summarize(
+            prompt, model=model, system_prompt=system_prompt or DEFAULT_SYSTEM_PROMPT
+        )
+        summary = parse_extraction_response(response).get("summary") or " ".join(
+            summaries
+        )
+
+    return {
+        "summary": summary,
+        "notes": merge_notes([part.get("notes") or "" for part in parts]),
+        "action_items": merge_action_items(
+            [item for part in parts for item in part.get("action_items") or []]
+        ),
+    }
+
+
 def call_extraction_llm(
     transcript: str,
     extraction_prompt: str | None = None,
     system_prompt: str | None = None,
     model: str | None = None,
 ) -> dict:
-    """Call LLM to extract structured information from transcript."""
+    """Call LLM to extract structured information from transcript.
+
+    Transcripts longer than ``MEETING_SEGMENT_TOKENS`` are split into
+    overlapping segments that are extracted concurrently, then merged by
+    :func:`merge_extractions`.
+    """
     prompt_template = extraction_prompt or DEFAULT_EXTRACTION_PROMPT
     sys_prompt = system_prompt or DEFAULT_SYSTEM_PROMPT
     llm_model = model or getattr(settings, "MEETING_MODEL", settings.SUMMARIZER_MODEL)
 
-    prompt = prompt_template.format(transcript=transcript)
-    logger.info(f"Calling LLM for meeting extraction using {llm_model}")
-    response = llms.summarize(prompt, model=llm_model, system_prompt=sys_prompt)
-    return parse_extraction_response(response)
+    def extract(segment: str) -> dict:
+        prompt = prompt_template.format(transcript=segment)
+        response = llms.summarize(prompt, model=llm_model, system_prompt=sys_prompt)
+        return parse_extraction_response(response)
+
+    segments = split_transcript(
+        transcript,
+        settings.MEETING_SEGMENT_TOKENS,
+        settings.MEETING_SEGMENT_OVERLAP_TOKENS,
+    )
+    if len(segments) == 1:
+        logger.info(f"Calling LLM for meeting extraction using {llm_model}")
+        return extract(transcript)
+
+    logger.info(
+        f"Calling LLM for meeting extraction in {len(segments)} segments using {llm_model}"
+    )
+    segments = [
+        f"[Part {i} of {len(segments)} of a longer meeting]\n{segment}"
+        for i, segment in enumerate(segments, 1)
+    ]
+    workers = max(1, min(settings.MEETING_EXTRACTION_CONCURRENCY, len(segments)))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = list(pool.map(extract, segments))
+    return merge_extractions(parts, llm_model, sys_prompt)
 
 
 def normalize_attendee_names(attendee_names: Sequence[str | None]) -> list[str]:
@@ -10,12 +10,14 @@ import concurrent.futures
 import copy
 import logging
 import re
+import uuid
 from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
 import requests
+from sqlalchemy import exists
 
 from memory.common import discord as discord_utils
 from memory.common import settings
@@ -499,10 +501,72 @@ def execute_scheduled_task(self, execution_id: str):
         }
 
 
+def dispatch_executions(execution_ids: list[str]) -> None:
+    """Send an ``execute_scheduled_task`` message for each execution.
+
+    The messages share one producer, so a batch is published over a single
+    broker connection, while each execution still runs as its own task.
+    """
+    if not execution_ids:
+        return
+    with app.producer_or_acquire() as producer:
+        for execution_id in execution_ids:
+            app.send_task(
+                EXECUTE_SCHEDULED_TASK, args=[execution_id], producer=producer
+            )
+
+
+def claim_due_tasks(session, now: datetime, limit: int) -> list[ScheduledTask]:
+    """Lock up to ``limit`` due tasks, earliest first.
+
+    Tasks with a pending or running execution are left alone until it
+    finishes. The scan walks the partial index on ``next_scheduled_time``,
+    so it costs the number of due tasks rather than the number of
+    schedules, and ``SKIP LOCKED`` lets overlapping ticks split the work.
+    """
+    active = exists().where(
+        TaskExecution.task_id == ScheduledTask.id,
+        TaskExecution.status.in_([ExecutionStatus.PENDING, ExecutionStatus.RUNNING]),
+    )
+    return (
+        session.query(ScheduledTask)
+        .filter(ScheduledTask.next_scheduled_time < now, ~active)
+        .order_by(ScheduledTask.next_scheduled_time)
+        .limit(limit)
+        .with_for_update(skip_locked=True, of=ScheduledTask)
+        .all()
+    )
+
+
+def create_execution(session, task: ScheduledTask, now: datetime) -> str:
+    """Add a pending execution of ``task`` and move it to its next run.
+
+    Returns the new execution's id. Nothing is flushed, so a whole batch
+    goes to the database in one round of inserts on commit.
+    """
+    execution = TaskExecution(
+        id=str(uuid.uuid4()),
+        task_id=task.id,
+        scheduled_time=task.next_scheduled_time,
+        status=ExecutionStatus.PENDING,
+    )
+    session.add(execution)
+
+    if task.cron_expression:
+        task.next_scheduled_time = compute_next_cron(task.cron_expression, now)
+    else:
+        task.next_scheduled_time = None
+    return execution.id
+
+
 @app.task(name=RUN_SCHEDULED_TASKS)
 @tracked_task
 def run_scheduled_tasks():
-    """Find and dispatch due scheduled tasks."""
+    """Find and dispatch due scheduled tasks.
+
+    Due tasks are claimed :data:`settings.SCHEDULER_DISPATCH_BATCH_SIZE` at a
+    time, each batch committed and dispatched before the next is claimed.
+    """
     now = datetime.now(timezone.utc).replace(tzinfo=None)
 
     with make_session() as session:
@@ -544,6 +608,8 @@ def run_scheduled_tasks():
         )
 
         recovered_pending_count = 0
+        # Ids read now, before the commits below expire the rows
+        stuck_pending_ids = [stuck.id for stuck in stuck_pending]
         for stuck in stuck_pending:
             logger.warning(
                 f"Re-dispatching stuck pending execution {stuck.id} (scheduled for {stuck.scheduled_time})"
@@ -559,54 +625,24 @@ def run_scheduled_tasks():
                     f"Found {recovered_pending_count} stuck pending executions to re-dispatch"
                 )
 
-        # 2. Find due tasks without pending or running executions
-        active_executions_subq = (
-            session.query(TaskExecution.task_id)
-            .filter(
-                TaskExecution.status.in_(
-                    [ExecutionStatus.PENDING, ExecutionStatus.RUNNING]
-                )
-            )
-            .subquery()
-        )
-
-        due_tasks = (
-            session.query(ScheduledTask)
-            .filter(
-                ScheduledTask.next_scheduled_time < now,
-                ~ScheduledTask.id.in_(session.query(active_executions_subq.c.task_id)),
-            )
-            .with_for_update(skip_locked=True)
-            .all()
-        )
-
-        # 3. Create executions and dispatch
+        # 2. Claim due tasks a batch at a time: create their executions,
+        # commit and dispatch, then take the next batch
         execution_ids = []
-        for task in due_tasks:
-            execution = TaskExecution(
-                task_id=task.id,
-                scheduled_time=task.next_scheduled_time,
-                status=ExecutionStatus.PENDING,
-            )
-            session.add(execution)
-
-            if task.cron_expression:
-                task.next_scheduled_time = compute_next_cron(task.cron_expression, now)
-            else:
-                task.next_scheduled_time = None
+        batch_size = settings.SCHEDULER_DISPATCH_BATCH_SIZE
+        while True:
+            due_tasks = claim_due_tasks(session, now, batch_size)
+            batch_ids = [create_execution(session, task, now) for task in due_tasks]
+            session.commit()
 
-            session.flush()
-            execution_ids.append(execution.id)
+            dispatch_executions(batch_ids)
+            execution_ids += batch_ids
 
-        session.commit()
-
-        # Dispatch new executions
-        for execution_id in execution_ids:
-            app.send_task(EXECUTE_SCHEDULED_TASK, args=[execution_id])
+            if len(due_tasks) < batch_size:
+                break
 
         # Re-dispatch stuck pending executions
-        for stuck in stuck_pending:
-            app.send_task(EXECUTE_SCHEDULED_TASK, args=[stuck.id])
+        for start in range(0, len(stuck_pending_ids), batch_size):
+            dispatch_executions(stuck_pending_ids[start : start + batch_size])
 
         return {
             "executions": execution_ids,
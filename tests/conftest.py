@@ -138,6 +138,50 @@ class MockRedis:
         self._data[key] = current
         return current
 
+    def incrby(self, key: str, amount: int = 1) -> int:
+        return self.incr(key, amount)
+
+    def mget(self, keys) -> list:
+        return [self._data.get(key) for key in keys]
+
+    def hincrby(self, key: str, field: str, amount: int = 1) -> int:
+        hash_ = self._data.setdefault(key, {})
+        hash_[field] = int(hash_.get(field, 0)) + amount
+        return hash_[field]
+
+    def hset(self, key: str, field: str, value) -> int:
+        hash_ = self._data.setdefault(key, {})
+        added = int(field not in hash_)
+        hash_[field] = value
+        return added
+
+    def hmget(self, key: str, fields) -> list:
+        hash_ = self._data.get(key) or {}
+        return [hash_.get(field) for field in fields]
+
+    def sadd(self, key: str, *values) -> int:
+        members = self._data.setdefault(key, set())
+        added = len(set(values) - members)
+        members.update(values)
+        return added
+
+    def smembers(self, key: str) -> set:
+        return set(self._data.get(key) or ())
+
+    def zadd(self, key: str, mapping: dict, gt: bool = False) -> int:
+        scores = self._data.setdefault(key, {})
+        added = 0
+        for member, score in mapping.items():
+            if member not in scores:
+                added += 1
+            elif gt and score <= scores[member]:
+                continue
+            scores[member] = float(score)
+        return added
+
+    def zscore(self, key: str, member: str) -> float | None:
+        return (self._data.get(key) or {}).get(member)
+
     def llen(self, key: str) -> int:
         """List length — return 0 for any key (queues are empty in mock)."""
         v = self._data.get(key, [])
@@ -712,6 +756,7 @@ def mock_file_storage(tmp_path: Path):
     misc_storage_dir.mkdir(parents=True, exist_ok=True)
     email_spool_dir = tmp_path / "email_spool"
     email_spool_dir.mkdir(parents=True, exist_ok=True)
+    pdf_spill_dir = tmp_path / "pdf_pages"
     with (
         patch.object(settings, "FILE_STORAGE_DIR", tmp_path),
         patch.object(settings, "CHUNK_STORAGE_DIR", chunk_storage_dir),
@@ -722,6 +767,7 @@ def mock_file_storage(tmp_path: Path):
         patch.object(settings, "REPORT_STORAGE_DIR", report_storage_dir),
         patch.object(settings, "MISC_STORAGE_DIR", misc_storage_dir),
         patch.object(settings, "EMAIL_SPOOL_DIR", email_spool_dir),
+        patch.object(settings, "PDF_SPILL_DIR", pdf_spill_dir),
     ):
         yield
 
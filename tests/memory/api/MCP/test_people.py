@@ -1406,6 +1406,102 @@ async def test_merge_three_people(db_session, admin_session, sample_people):
     assert "field2" in primary.contact_info
 
 
+@pytest.mark.asyncio
+async def test_merge_people_source_items_and_teams_in_bulk(
+    db_session, admin_session, sample_people
+):
+    """Overlapping links end up on the primary once, with the best team role."""
+    import uuid
+
+    from memory.api.MCP.servers.people import merge
+    from memory.common.db.models import SourceItem, Team, team_members
+    from memory.common.db.models.source_item import Chunk, source_item_people
+
+    merge_fn = get_fn(merge)
+
+    alice = db_session.query(Person).filter(Person.identifier == "alice_chen").first()
+    dup1 = Person(identifier="alice_bulk_one", display_name="Alice B1", aliases=[], contact_info={})
+    dup2 = Person(identifier="alice_bulk_two", display_name="Alice B2", aliases=[], contact_info={})
+    db_session.add_all([dup1, dup2])
+    db_session.flush()
+
+    items = [
+        SourceItem(
+            modality="text",
+            sha256=create_content_hash(f"merge-bulk-{i}"),
+            content=f"merge-bulk-{i}",
+        )
+        for i in range(3)
+    ]
+    db_session.add_all(items)
+    db_session.flush()
+    # item 0: alice + dup1, item 1: dup1 + dup2, item 2: dup2 only
+    links = [(0, alice), (0, dup1), (1, dup1), (1, dup2), (2, dup2)]
+    for i, person in links:
+        db_session.execute(
+            source_item_people.insert().values(source_item_id=items[i].id, person_id=person.id)
+        )
+    chunks = [
+        Chunk(id=str(uuid.uuid4()), source_id=item.id, content="c", collection_name="text")
+        for item in items
+    ]
+    db_session.add_all(chunks)
+
+    teams = [Team(slug=f"merge-bulk-{i}", name=f"Merge Bulk {i}") for i in range(2)]
+    db_session.add_all(teams)
+    db_session.flush()
+    memberships = [
+        (teams[0], alice, "member"),
+        (teams[0], dup2, "lead"),
+        (teams[1], dup1, "member"),
+        (teams[1], dup2, "admin"),
+    ]
+    for team, person, role in memberships:
+        db_session.execute(
+            team_members.insert().values(team_id=team.id, person_id=person.id, role=role)
+        )
+    db_session.commit()
+    alice_id = alice.id
+
+    with (
+        mcp_auth_context(admin_session.id),
+        patch("memory.api.MCP.servers.people.qdrant") as mock_qdrant,
+    ):
+        result = await merge_fn(
+            identifiers=["alice_chen", "alice_bulk_one", "alice_bulk_two"],
+            primary_identifier="alice_chen",
+        )
+
+    assert result["stats"]["source_items_moved"] == 4
+    assert result["stats"]["team_memberships_moved"] == 3
+    assert result["stats"]["chunks_updated"] == 3
+
+    db_session.expire_all()
+    linked = db_session.execute(
+        source_item_people.select().where(
+            source_item_people.c.source_item_id.in_([item.id for item in items])
+        )
+    ).fetchall()
+    assert sorted((row.source_item_id, row.person_id) for row in linked) == sorted(
+        (item.id, alice_id) for item in items
+    )
+
+    roles = {
+        row.team_id: (row.person_id, row.role)
+        for row in db_session.execute(
+            team_members.select().where(team_members.c.team_id.in_([t.id for t in teams]))
+        )
+    }
+    assert roles == {teams[0].id: (alice_id, "lead"), teams[1].id: (alice_id, "admin")}
+
+    # Every affected chunk now has just the primary, in one Qdrant call
+    (call,) = mock_qdrant.set_payloads.call_args_list
+    _, collection, chunk_ids, payload = call.args
+    assert collection == "text"
+    assert sorted(chunk_ids) == sorted(str(chunk.id) for chunk in chunks)
+    assert payload == {"people": [alice_id]}
+
+
 # =============================================================================
 # require_can_write_at_sensitivity / sensitivity-vs-role enforcement
 # =============================================================================
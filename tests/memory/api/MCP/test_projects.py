@@ -1,10 +1,12 @@
 """Tests for Projects MCP tools with access control."""
 
 from datetime import datetime, timedelta
+import time
 from unittest.mock import MagicMock, patch
 import uuid
 
 import pytest
+from sqlalchemy import insert, text
 
 from memory.common.db.models import Person, Team, HumanUser, UserSession
 from memory.common.db.models.sources import GithubRepo, Project, team_members, project_teams
@@ -891,6 +893,112 @@ async def test_project_tree_nesting(db_session, user_session, teams_and_projects
     assert project_one["children"][0]["title"] == "Child Project"
 
 
+@pytest.fixture
+def project_forest(db_session):
+    """Roots "Root 0".."Root 4", each with a chain of three descendants."""
+    projects = []
+    for r in range(5):
+        parent_id = None
+        for level in range(4):
+            project_id = -(1000 + r * 10 + level)
+            projects.append(
+                Project(
+                    id=project_id,
+                    title=f"Root {r}" if level == 0 else f"Root {r} level {level}",
+                    state="open",
+                    parent_id=parent_id,
+                )
+            )
+            parent_id = project_id
+    db_session.add_all(projects)
+    db_session.commit()
+    return projects
+
+
+async def list_tree(db_session, admin_session, **kwargs):
+    from memory.api.MCP.servers.projects import list_all as project_list_all
+
+    mock_token = make_mock_access_token(admin_session.id)
+    with (
+        patch("memory.api.MCP.access.get_access_token", return_value=mock_token),
+        patch("memory.api.MCP.servers.projects.make_session") as mock_make_session,
+    ):
+        mock_make_session.return_value.__enter__.return_value = db_session
+        return await get_fn(project_list_all)(as_tree=True, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_project_tree_paginates_roots(db_session, admin_session, project_forest):
+    result = await list_tree(
+        db_session, admin_session, search="Root", limit=2, offset=1
+    )
+
+    # Descendants matching the search have their parents in it, so only the
+    # five chain heads are roots
+    assert result["total"] == 20
+    assert result["total_roots"] == 5
+    assert [node["title"] for node in result["tree"]] == ["Root 1", "Root 2"]
+    assert result["count"] == 8
+
+
+@pytest.mark.asyncio
+async def test_project_tree_depth_is_bounded(db_session, admin_session, project_forest):
+    result = await list_tree(
+        db_session, admin_session, search="Root", limit=1, tree_depth=1
+    )
+
+    (root,) = result["tree"]
+    assert root["title"] == "Root 0"
+    (child,) = root["children"]
+    assert child["title"] == "Root 0 level 1"
+    # Below the depth limit children are counted but not fetched
+    assert child["children"] == []
+    assert child["children_count"] == 1
+    assert root["children_count"] == 1
+    assert result["count"] == 2
+
+
+@pytest.fixture
+def large_project_forest(db_session):
+    """2000 roots with five children each."""
+    roots = [
+        {"id": -(100_000 + r), "title": f"Big {r:04d}", "state": "open"}
+        for r in range(2000)
+    ]
+    children = [
+        {
+            "id": -(200_000 + r * 10 + c),
+            "title": f"Big {r:04d} child {c}",
+            "state": "open",
+            "parent_id": -(100_000 + r),
+        }
+        for r in range(2000)
+        for c in range(5)
+    ]
+    db_session.execute(insert(Project), roots)
+    db_session.execute(insert(Project), children)
+    db_session.commit()
+    db_session.execute(text("ANALYZE projects"))
+
+
+@pytest.mark.asyncio
+async def test_project_tree_latency_on_large_table(
+    db_session, admin_session, large_project_forest
+):
+    start = time.perf_counter()
+    result = await list_tree(
+        db_session, admin_session, search="Big", limit=10, offset=1000, tree_depth=0
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result["total"] == 12000
+    assert result["total_roots"] == 2000
+    assert [node["title"] for node in result["tree"]][:2] == ["Big 1000", "Big 1001"]
+    assert all(node["children_count"] == 5 for node in result["tree"])
+    # Scanning the visible set once per root took seconds at this size
+    assert elapsed < 1.0
+
+
 # =============================================================================
 # Repo-level project tests (new functionality)
 # =============================================================================
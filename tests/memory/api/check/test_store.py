@@ -5,18 +5,23 @@
 # pyright: reportOptionalSubscript=false, reportOptionalMemberAccess=false
 import asyncio
 import json
+import time
 
 import pytest
 
 from memory.common.check import store
 from memory.common.check.redis_client import (
+    done_key,
     job_key,
     jobs_index_key,
     lease_key,
+    mode_open_key,
+    mode_sets_ready_key,
     open_key,
     wake_key,
 )
 from memory.common.check.schemas import (
+    Mode,
     SubmitRequest,
     QueueFull,
     JobGone,
@@ -101,6 +106,17 @@ async def test_claim_empty_returns_none(r):
     assert await store.claim_next(r, user_id=5, wait=0) is None
 
 
+async def test_claim_script_registered_once_per_client(r, monkeypatch):
+    calls = []
+    register = r.register_script
+    monkeypatch.setattr(
+        r, "register_script", lambda script: calls.append(script) or register(script)
+    )
+    for _ in range(3):
+        await store.claim_next(r, user_id=5, wait=0)
+    assert len(calls) == 1
+
+
 async def test_claim_only_own_user(r):
     await store.submit_job(r, user_id=5, req=SubmitRequest(text="mine"))
     assert await store.claim_next(r, user_id=6, wait=0) is None
@@ -221,6 +237,127 @@ async def test_claim_mode_filter_picks_up_later_matching_submit(r):
     assert claimed.job_id == dd
 
 
+async def test_submit_indexes_job_by_mode(r):
+    job_id = await store.submit_job(
+        r, user_id=5, req=SubmitRequest(text="d", mode="deep-dive")
+    )
+    assert await r.zrange(mode_open_key(5, "deep-dive"), 0, -1) == [job_id]
+    assert await r.zrange(mode_open_key(5, "research"), 0, -1) == []
+
+
+async def test_claim_is_one_round_trip_past_deep_other_mode_queue(r, monkeypatch):
+    monkeypatch.setattr("memory.common.settings.CHECK_QUEUE_MAX_DEPTH", 1000)
+    for i in range(200):
+        await store.submit_job(r, user_id=5, req=SubmitRequest(text=str(i)))
+    dd = await store.submit_job(
+        r, user_id=5, req=SubmitRequest(text="d", mode="deep-dive")
+    )
+
+    # The first call after startup also loads the script (NOSCRIPT fallback)
+    await store.claim_next(r, user_id=6, wait=0)
+    commands = []
+    original = r.execute_command
+
+    async def record(*args, **kwargs):
+        commands.append(args[0])
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(r, "execute_command", record)
+    claimed = await store.claim_next(r, user_id=5, wait=0, modes=frozenset({"deep-dive"}))
+
+    assert claimed.job_id == dd
+    assert len(commands) == 1
+    # None of the research jobs were touched
+    assert await r.get(lease_key(dd)) == claimed.lease_id
+    assert await r.zcard(mode_open_key(5, "research")) == 200
+
+
+async def test_claim_mode_filter_sees_jobs_missing_from_mode_sets(r):
+    # Jobs submitted before the per-mode sets existed
+    order: list[Mode] = ["research", "deep-dive"]
+    old = []
+    for mode in order:
+        req = SubmitRequest(text=mode, mode=mode)
+        old.append(await store.submit_job(r, user_id=5, req=req))
+        await r.delete(mode_open_key(5, mode))
+    new = await store.submit_job(
+        r, user_id=5, req=SubmitRequest(text="new", mode="deep-dive")
+    )
+
+    modes = frozenset({"deep-dive"})
+    first = await store.claim_next(r, user_id=5, wait=0, modes=modes)
+    second = await store.claim_next(r, user_id=5, wait=0, modes=modes)
+
+    assert [first.job_id, second.job_id] == [old[1], new]
+    assert await r.zrange(mode_open_key(5, "research"), 0, -1) == [old[0]]
+    assert await r.ttl(mode_open_key(5, "research")) > 0
+    assert await r.get(mode_sets_ready_key(5)) == "1"
+
+
+async def test_mode_sets_backfilled_once(r):
+    job_id = await store.submit_job(r, user_id=5, req=SubmitRequest(text="r"))
+    modes = frozenset({"deep-dive"})
+    assert await store.claim_next(r, user_id=5, wait=0, modes=modes) is None
+
+    # Removed after the backfill: not copied back while the marker lives
+    await r.zrem(mode_open_key(5, "research"), job_id)
+    assert await store.claim_next(r, user_id=5, wait=0, modes=modes) is None
+    assert await r.zrange(mode_open_key(5, "research"), 0, -1) == []
+
+
+async def test_claim_skips_leased_jobs_across_scan_batches(r, monkeypatch):
+    monkeypatch.setattr(store, "_CLAIM_SCAN_BATCH", 2)
+    ids = [
+        await store.submit_job(r, user_id=5, req=SubmitRequest(text=str(i)))
+        for i in range(7)
+    ]
+    for job_id in ids[:3]:
+        await r.delete(job_key(job_id))  # tombstones shift the zset under the scan
+    claimed = [await store.claim_next(r, user_id=5, wait=0) for _ in range(4)]
+    assert [c.job_id for c in claimed] == ids[3:]
+    assert await store.claim_next(r, user_id=5, wait=0) is None
+    assert await r.zrange(open_key(5), 0, -1) == ids[3:]
+
+
+async def test_claim_mode_filter_merges_modes_oldest_first(r):
+    order: list[Mode] = ["verify", "deep-dive", "research", "deep-dive", "verify"]
+    ids = [
+        await store.submit_job(r, user_id=5, req=SubmitRequest(text=m, mode=m))
+        for m in order
+    ]
+    modes = frozenset({"verify", "deep-dive"})
+    claimed = [
+        await store.claim_next(r, user_id=5, wait=0, modes=modes) for _ in range(4)
+    ]
+    assert [c.job_id for c in claimed] == [ids[0], ids[1], ids[3], ids[4]]
+
+
+async def test_poison_job_removed_from_mode_set(r, monkeypatch):
+    monkeypatch.setattr("memory.common.settings.CHECK_MAX_REQUEUE_ATTEMPTS", 1)
+    job_id = await store.submit_job(
+        r, user_id=5, req=SubmitRequest(text="d", mode="deep-dive")
+    )
+    modes = frozenset({"deep-dive"})
+    await store.claim_next(r, user_id=5, wait=0, modes=modes)
+    await r.delete(lease_key(job_id))
+    assert await store.claim_next(r, user_id=5, wait=0, modes=modes) is None
+    assert (await store.get_job(r, job_id))["status"] == "expired"
+    assert await r.zrange(open_key(5), 0, -1) == []
+    assert await r.zrange(mode_open_key(5, "deep-dive"), 0, -1) == []
+
+
+async def test_concurrent_claims_lease_each_job_once(r):
+    ids = {
+        await store.submit_job(r, user_id=5, req=SubmitRequest(text=str(i)))
+        for i in range(20)
+    }
+    claims = await asyncio.gather(
+        *(store.claim_next(r, user_id=5, wait=0) for _ in range(30))
+    )
+    claimed = [c.job_id for c in claims if c is not None]
+    assert sorted(claimed) == sorted(ids)
+
+
 async def _claim(r, user_id=5, text="hi"):
     job_id = await store.submit_job(r, user_id=user_id, req=SubmitRequest(text=text))
     claimed = await store.claim_next(r, user_id=user_id, wait=0)
@@ -236,6 +373,7 @@ async def test_complete_ok_stores_result(r):
     assert json.loads(job["result"]) == {"summary": "done"}
     assert job["completed_at"]
     assert await r.zrange(open_key(5), 0, -1) == []
+    assert await r.zrange(mode_open_key(5, "research"), 0, -1) == []
     assert await r.get(lease_key(job_id)) is None
 
 
@@ -385,6 +523,69 @@ async def test_wait_for_answer_clamped_to_max(r, monkeypatch):
     assert rec is not None and rec["status"] == "queued"
 
 
+async def test_wait_for_answer_wakes_on_completion(r):
+    job_id, lease = await _claim(r)
+    waiters = [
+        asyncio.create_task(store.wait_for_answer(r, job_id, timeout=10, interval=10))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.1)  # let the waiters block on the doorbell
+
+    start = time.monotonic()
+    await store.complete_job(r, job_id, lease, status="ok", result={"v": 1}, error=None)
+    recs = await asyncio.wait_for(asyncio.gather(*waiters), timeout=5)
+
+    # Every waiter got the answer well inside the fallback poll interval
+    assert time.monotonic() - start < 2
+    assert [rec["status"] for rec in recs] == ["ok", "ok", "ok"]
+
+
+async def test_wait_for_answer_idle_waiter_only_blocks(r, monkeypatch):
+    job_id = await store.submit_job(r, user_id=5, req=SubmitRequest(text="x"))
+    commands = []
+    original = r.execute_command
+
+    async def record(*args, **kwargs):
+        commands.append(args[0])
+        return await original(*args, **kwargs)
+
+    monkeypatch.setattr(r, "execute_command", record)
+    rec = await store.wait_for_answer(r, job_id, timeout=2, interval=10)
+
+    # One blocking wait for the whole timeout; the only other commands are
+    # reads around it (the last for the sub-second remainder BLPOP can't wait)
+    assert rec["status"] == "queued"
+    assert commands.count("BLPOP") == 1
+    assert set(commands) == {"HGETALL", "BLPOP"}
+    assert len(commands) <= 4
+
+
+async def test_wait_for_answer_wakes_on_poison(r, monkeypatch):
+    monkeypatch.setattr("memory.common.settings.CHECK_MAX_REQUEUE_ATTEMPTS", 1)
+    job_id, _ = await _claim(r)
+    await r.delete(lease_key(job_id))
+    waiter = asyncio.create_task(
+        store.wait_for_answer(r, job_id, timeout=10, interval=10)
+    )
+    await asyncio.sleep(0.1)
+    assert await store.claim_next(r, user_id=5, wait=0) is None  # poisons it
+    rec = await asyncio.wait_for(waiter, timeout=3)
+    assert rec["status"] == "expired"
+
+
+async def test_wait_for_answer_wakes_on_delete(r):
+    job_id = await store.submit_job(r, user_id=5, req=SubmitRequest(text="x"))
+    waiter = asyncio.create_task(
+        store.wait_for_answer(r, job_id, timeout=10, interval=10)
+    )
+    await asyncio.sleep(0.1)
+    job = await store.get_job(r, job_id)
+    assert job is not None
+    await store.delete_job(r, job)
+    assert await asyncio.wait_for(waiter, timeout=3) is None
+    assert await r.ttl(done_key(job_id)) > 0
+
+
 async def test_delete_job_removes_all_structures(r):
     job_id = await store.submit_job(r, user_id=5, req=SubmitRequest(text="x"))
     await store.claim_next(r, user_id=5, wait=0)  # leased + in open + index
@@ -393,5 +594,6 @@ async def test_delete_job_removes_all_structures(r):
     await store.delete_job(r, job)
     assert await store.get_job(r, job_id) is None
     assert await r.zscore(open_key(5), job_id) is None
+    assert await r.zscore(mode_open_key(5, "research"), job_id) is None
     assert await r.zscore(jobs_index_key(5), job_id) is None
     assert await r.get(lease_key(job_id)) is None
@@ -1,9 +1,21 @@
 """Tests for scorer module."""
 
+import re
+import threading
+import time
+
 import pytest
+from PIL import Image
 from unittest.mock import MagicMock, patch
 
-from memory.api.search.scorer import score_chunk, rank_chunks
+from memory.api.search.scorer import (
+    pack_batches,
+    parse_batch_scores,
+    rank_chunks,
+    score_chunk,
+)
+from memory.common import settings
+from memory.common.tokens import approx_token_count
 
 
 @pytest.fixture
@@ -70,7 +82,7 @@ async def test_rank_chunks_sorts_by_relevance_score():
         return chunk
 
     with patch("memory.api.search.scorer.score_chunk", side_effect=mock_score_chunk):
-        result = await rank_chunks("query", chunks)
+        result = await rank_chunks("query", chunks, mode="chunk")
 
     assert result[0].relevance_score == 0.9
     assert result[1].relevance_score == 0.5
@@ -89,7 +101,155 @@ async def test_rank_chunks_filters_by_min_score():
         return chunk
 
     with patch("memory.api.search.scorer.score_chunk", side_effect=mock_score_chunk):
-        result = await rank_chunks("query", chunks, min_score=0.4)
+        result = await rank_chunks("query", chunks, min_score=0.4, mode="chunk")
 
     assert len(result) == 2
     assert all(c.relevance_score >= 0.4 for c in result)
+
+
+class FakeRankerProvider:
+    """Local stand-in for the ranker model.
+
+    A chunk is relevant if it mentions the query's first word. Each call
+    takes ``latency`` seconds and at most ``concurrency`` calls run at once,
+    like a rate-limited API. ``batch_reply`` overrides batch replies.
+    """
+
+    def __init__(self, latency=0.02, concurrency=4):
+        self.latency = latency
+        self.slots = threading.Semaphore(concurrency)
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.batch_reply = None
+        self.lock = threading.Lock()
+
+    def run_with_tools(self, messages, system_prompt=None, **kwargs):
+        prompt = messages[0].content[0].text
+        with self.lock:
+            self.calls += 1
+            self.prompt_tokens += approx_token_count(prompt + (system_prompt or ""))
+        with self.slots:
+            time.sleep(self.latency)
+
+        match = re.search(r"<query>(\w+)", prompt)
+        assert match is not None
+        word = match.group(1)
+        chunks = re.findall(r'<chunk(?: id="(\d+)")?>(.*?)</chunk>', prompt, re.S)
+        if chunks[0][0] and self.batch_reply is not None:
+            return MagicMock(response=self.batch_reply(chunks))
+        replies = []
+        for chunk_id, text in chunks:
+            attrs = f' id="{chunk_id}"' if chunk_id else ""
+            replies.append(f"<score{attrs}>{0.9 if word in text else 0.1}</score>")
+        return MagicMock(response="\n".join(replies))
+
+
+@pytest.fixture
+def fake_ranker():
+    provider = FakeRankerProvider()
+    with patch("memory.common.llms.create_provider", return_value=provider):
+        yield provider
+
+
+def text_chunks(count):
+    return [
+        MagicMock(
+            data=[f"Result {i} about " + ("caching" if i % 5 == 0 else "gardening")],
+            relevance_score=None,
+        )
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_scoring_is_cheaper_and_faster(fake_ranker):
+    chunks = text_chunks(50)
+
+    start = time.perf_counter()
+    per_chunk = await rank_chunks("caching", chunks, min_score=0.5, mode="chunk")
+    per_chunk_time = time.perf_counter() - start
+    per_chunk_calls, per_chunk_tokens = fake_ranker.calls, fake_ranker.prompt_tokens
+
+    fake_ranker.calls = fake_ranker.prompt_tokens = 0
+    start = time.perf_counter()
+    batched = await rank_chunks("caching", chunks, min_score=0.5, mode="batch")
+    batch_time = time.perf_counter() - start
+
+    assert [c.data for c in batched] == [c.data for c in per_chunk]
+    assert len(batched) == 10
+    assert (per_chunk_calls, fake_ranker.calls) == (50, 3)
+    assert fake_ranker.prompt_tokens < per_chunk_tokens / 2
+    assert batch_time < per_chunk_time / 2
+
+
+@pytest.mark.asyncio
+async def test_batch_scoring_falls_back_when_reply_unparseable(fake_ranker):
+    fake_ranker.batch_reply = lambda chunks: "I think they are all relevant!"
+    chunks = text_chunks(10)
+
+    result = await rank_chunks("caching", chunks, min_score=0.5, mode="batch")
+
+    assert len(result) == 2
+    assert fake_ranker.calls == 11  # one batch, then every chunk alone
+
+
+@pytest.mark.asyncio
+async def test_batch_scoring_rescores_only_missing_chunks(fake_ranker):
+    # Only the first half of the chunks get a score back
+    fake_ranker.batch_reply = lambda chunks: "".join(
+        f'<score id="{i}">0.5</score>' for i, _ in chunks[: len(chunks) // 2]
+    )
+    chunks = text_chunks(10)
+
+    await rank_chunks("caching", chunks, mode="batch")
+
+    assert [c.relevance_score for c in chunks] == [0.5] * 5 + [0.9] + [0.1] * 4
+    assert fake_ranker.calls == 6
+
+
+@pytest.mark.asyncio
+async def test_batch_scoring_sends_image_chunks_individually(fake_ranker):
+    chunks = text_chunks(4)
+    image_chunk = MagicMock(
+        data=["A diagram about caching", Image.new("RGB", (4, 4))],
+        relevance_score=None,
+    )
+
+    await rank_chunks("caching", chunks + [image_chunk], mode="batch")
+
+    assert image_chunk.relevance_score == 0.9
+    assert fake_ranker.calls == 2
+
+
+def test_pack_batches_respects_size_and_token_budget(monkeypatch):
+    monkeypatch.setattr(settings, "SEARCH_SCORING_BATCH_SIZE", 3)
+    monkeypatch.setattr(settings, "SEARCH_SCORING_BATCH_TOKENS", 100)
+    items = [(MagicMock(), "x" * 4 * n) for n in (10, 10, 10, 10, 90, 20, 200)]
+
+    batches = pack_batches(items)
+
+    assert [[approx_token_count(t) for _, t in b] for b in batches] == [
+        [10, 10, 10],
+        [10, 90],
+        [20],
+        [200],
+    ]
+
+
+@pytest.mark.parametrize(
+    "response, expected",
+    [
+        ('<score id="0">0.2</score><score id="1">0.9</score>', {0: 0.2, 1: 0.9}),
+        ("<score id=1> 0.4 </score><SCORE ID='0'>1</SCORE>", {0: 1.0, 1: 0.4}),
+        ('<score id="0">high</score><score id="1">0.3</score>', {1: 0.3}),
+        ('<score id="0">0.1</score><score id="0">0.8</score>', {0: 0.1}),
+        ('<score id="0">1.5</score><score id="1">-0.2</score>', {}),
+        ('<score id="0">nan</score><score id="1">0</score>', {1: 0.0}),
+        ('<score id="7">0.5</score>', {}),
+        ("<score>0.5</score>", {}),
+        ("", {}),
+        (None, {}),
+    ],
+)
+def test_parse_batch_scores(response, expected):
+    assert parse_batch_scores(response, count=2) == expected
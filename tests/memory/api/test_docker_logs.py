@@ -80,3 +80,147 @@ def test_get_logs_allowed_for_admin(client):
         assert body["container"] == "memory-api"
         assert body["lines"] == 0
         docker_client.get.assert_called_once()
+
+
+def _frame(text: str, stream: int = 1) -> bytes:
+    data = text.encode()
+    return bytes([stream, 0, 0, 0]) + len(data).to_bytes(4, "big") + data
+
+
+def _follow_client(chunks: list[bytes], requests: list, status: int = 200):
+    """An async Docker client whose log stream yields ``chunks``."""
+    import httpx
+
+    async def body():
+        for chunk in chunks:
+            yield chunk
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(status, content=body())
+
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://docker"
+    )
+
+
+def _events(text: str) -> list[tuple[str | None, str]]:
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = [line.partition(": ") for line in block.split("\n")]
+        event_id = next((v for k, _, v in fields if k == "id"), None)
+        data = "\n".join(v for k, _, v in fields if k == "data")
+        events.append((event_id, data))
+    return events
+
+
+def test_decoder_handles_frames_split_across_chunks():
+    from memory.api.docker_logs import DockerLogDecoder
+
+    data = _frame("first line\nsecond ") + _frame("half\n", 2) + _frame("tail")
+    decoder = DockerLogDecoder()
+    lines = []
+    for i in range(0, len(data), 5):
+        lines += decoder.feed(data[i : i + 5])
+
+    assert lines == ["first line", "second half"]
+    assert decoder.flush() == ["tail"]
+    assert decoder.buffer == b"" and decoder.line == b""
+
+
+def test_decoder_handles_raw_tty_output():
+    from memory.api.docker_logs import DockerLogDecoder
+
+    decoder = DockerLogDecoder()
+    assert decoder.feed(b"abc") == []
+    assert decoder.feed(b"defghij\nkl") == ["abcdefghij"]
+    assert decoder.flush() == ["kl"]
+
+
+def test_decoder_bounds_unterminated_lines(monkeypatch):
+    import memory.api.docker_logs as docker_logs
+
+    monkeypatch.setattr(docker_logs, "MAX_FOLLOW_LINE_BYTES", 10)
+    decoder = docker_logs.DockerLogDecoder()
+
+    assert decoder.feed(_frame("x" * 25)) == ["x" * 25]
+    assert len(decoder.line) == 0
+
+
+def test_docker_since_keeps_nanoseconds():
+    from memory.api.docker_logs import docker_since
+
+    assert docker_since("2024-01-02T03:04:05.123456789Z") == "1704164645.123456789"
+    assert docker_since("2024-01-02T03:04:05Z") == "1704164645.000000000"
+
+
+def test_follow_logs_forbidden_for_non_admin(regular_client):
+    with patch("memory.api.docker_logs.get_async_docker_client") as factory:
+        response = regular_client.get("/api/docker/logs/memory-api/follow")
+
+    assert response.status_code == 403
+    factory.assert_not_called()
+
+
+def test_follow_logs_streams_new_lines_as_events(client):
+    stream = _frame("2024-01-01T00:00:01.000000001Z starting\n") + _frame(
+        "2024-01-01T00:00:02.000000002Z ready\n2024-01-01T00:00:03.000000003Z GET /"
+    )
+    requests = []
+    chunks = [stream[:20], stream[20:50], stream[50:], _frame("\n")]
+    with patch(
+        "memory.api.docker_logs.get_async_docker_client",
+        return_value=_follow_client(chunks, requests),
+    ):
+        response = client.get(
+            "/api/docker/logs/memory-api/follow?tail=5&timestamps=false"
+        )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert _events(response.text) == [
+        ("2024-01-01T00:00:01.000000001Z", "starting"),
+        ("2024-01-01T00:00:02.000000002Z", "ready"),
+        # Held back until its frame's newline arrived
+        ("2024-01-01T00:00:03.000000003Z", "GET /"),
+    ]
+    params = requests[0].url.params
+    assert params["follow"] == "true"
+    assert params["tail"] == "5"
+
+
+def test_follow_logs_resumes_from_last_event_id(client):
+    chunks = [
+        _frame("2024-01-01T00:00:02.000000002Z seen\n"),
+        _frame("2024-01-01T00:00:03.000000000Z error: new\n"),
+        _frame("2024-01-01T00:00:04.000000000Z ok\n"),
+    ]
+    requests = []
+    with patch(
+        "memory.api.docker_logs.get_async_docker_client",
+        return_value=_follow_client(chunks, requests),
+    ):
+        response = client.get(
+            "/api/docker/logs/memory-api/follow?filter_text=ERROR",
+            headers={"Last-Event-ID": "2024-01-01T00:00:02.000000002Z"},
+        )
+
+    assert _events(response.text) == [
+        (
+            "2024-01-01T00:00:03.000000000Z",
+            "2024-01-01T00:00:03.000000000Z error: new",
+        )
+    ]
+    params = requests[0].url.params
+    assert params["since"] == "1704067202.000000002"
+    assert params["tail"] == "all"
+
+
+def test_follow_logs_missing_container_is_404(client):
+    with patch(
+        "memory.api.docker_logs.get_async_docker_client",
+        return_value=_follow_client([], [], status=404),
+    ):
+        response = client.get("/api/docker/logs/memory-api/follow")
+
+    assert response.status_code == 404
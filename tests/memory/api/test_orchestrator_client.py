@@ -294,3 +294,105 @@ def test_tail_log_text_handles_invalid_utf8(tmp_path):
     # \xff\xfe gets replaced with U+FFFD; structure is preserved.
     assert "line1" in result
     assert "line3" in result
+
+
+# =============================================================================
+# read_log_from / follow_logs: reading only what was appended
+# =============================================================================
+
+
+def test_read_log_from_returns_only_complete_new_lines(tmp_path):
+    from memory.api.orchestrator_client import read_log_from
+
+    log = tmp_path / "follow.log"
+    log.write_bytes(b"one\ntwo\nthr")
+
+    text, offset = read_log_from(log, 0)
+    assert (text, offset) == ("one\ntwo\n", 8)
+
+    # The partial line isn't returned until it's finished
+    assert read_log_from(log, offset) == ("", 8)
+    with log.open("ab") as f:
+        f.write(b"ee\nfour\n")
+    assert read_log_from(log, offset) == ("three\nfour\n", 19)
+
+
+def test_read_log_from_restarts_after_truncation(tmp_path):
+    from memory.api.orchestrator_client import read_log_from
+
+    log = tmp_path / "rotated.log"
+    log.write_text("fresh\n")
+
+    assert read_log_from(log, 1000) == ("fresh\n", 6)
+
+
+def test_read_log_from_skips_backlog_over_the_cap(tmp_path, monkeypatch):
+    import memory.api.orchestrator_client as oc
+
+    monkeypatch.setattr(oc, "LOG_TAIL_MAX_BYTES", 20)
+    log = tmp_path / "chatty.log"
+    log.write_text("".join(f"line{i:03d}\n" for i in range(100)))
+
+    text, offset = oc.read_log_from(log, 0)
+    assert text == "line098\nline099\n"
+    assert offset == log.stat().st_size
+
+
+@pytest.mark.asyncio
+async def test_get_logs_with_offset_returns_new_output(tmp_path, monkeypatch):
+    import memory.api.orchestrator_client as oc
+
+    monkeypatch.setattr(oc, "LOG_DIR", tmp_path)
+    log = tmp_path / "u1-x-abc123.log"
+    log.write_text("a\nb\nc\n")
+    client = OrchestratorClient()
+
+    first = await client.get_logs("u1-x-abc123", tail=2)
+    assert first is not None
+    assert first["logs"] == "b\nc"
+    assert first["offset"] == 6
+
+    with log.open("a") as f:
+        f.write("d\n")
+    second = await client.get_logs("u1-x-abc123", offset=first["offset"])
+    assert second is not None
+    assert second["logs"] == "d\n"
+    assert second["offset"] == 8
+
+
+@pytest.mark.asyncio
+async def test_follow_logs_yields_appended_lines(tmp_path, monkeypatch):
+    import memory.api.orchestrator_client as oc
+
+    monkeypatch.setattr(oc, "LOG_DIR", tmp_path)
+    monkeypatch.setattr(oc, "LOG_FOLLOW_HEARTBEAT_SECONDS", 0.02)
+    log = tmp_path / "u1-x-abc123.log"
+    log.write_text("a\nb\n")
+
+    follow = OrchestratorClient().follow_logs("u1-x-abc123", tail=1, poll_interval=0.01)
+    assert await follow.__anext__() == ("b", 4)
+
+    with log.open("a") as f:
+        f.write("c\nd\n")
+    assert await follow.__anext__() == ("c\nd\n", 8)
+    # Nothing new: a keep-alive at the same offset
+    assert await follow.__anext__() == ("", 8)
+    await follow.aclose()
+
+
+@pytest.mark.asyncio
+async def test_follow_logs_resumes_from_offset(tmp_path, monkeypatch):
+    import memory.api.orchestrator_client as oc
+
+    monkeypatch.setattr(oc, "LOG_DIR", tmp_path)
+    (tmp_path / "u1-x-abc123.log").write_text("a\nb\nc\n")
+
+    follow = OrchestratorClient().follow_logs("u1-x-abc123", offset=2)
+    assert await follow.__anext__() == ("b\nc\n", 6)
+    await follow.aclose()
+
+
+@pytest.mark.asyncio
+async def test_follow_logs_rejects_malformed_session_id():
+    follow = OrchestratorClient().follow_logs("u1-x-../../../etc/hosts")
+    assert [item async for item in follow] == []
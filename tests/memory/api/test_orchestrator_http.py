@@ -0,0 +1,258 @@
+"""Tests for the orchestrator client's keep-alive Unix-socket transport,
+against a stub orchestrator served on a local socket."""
+
+import asyncio
+import json
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+import pytest_asyncio
+from aiohttp import web
+
+from memory.api.orchestrator_client import (
+    OrchestratorClient,
+    OrchestratorError,
+    UnixSocketPool,
+    http_request,
+)
+
+
+STATS = {"containers": 3, "cpu": 12.5, "memory": {"used": 1024}}
+
+
+class StubOrchestrator:
+    """The endpoints the sessions dashboard polls, plus a few odd ones."""
+
+    def __init__(self):
+        self.transports: set = set()
+        self.delay = 0.0
+        self.path = ""
+
+    @property
+    def connections(self) -> int:
+        return len(self.transports)
+
+    @web.middleware
+    async def track_connections(self, request, handler):
+        self.transports.add(request.transport)
+        return await handler(request)
+
+    async def stats(self, request):
+        await asyncio.sleep(self.delay)
+        return web.json_response(STATS)
+
+    async def containers(self, request):
+        return web.json_response(
+            [{"id": f"u1-e{i}-abc", "status": "running"} for i in range(20)]
+        )
+
+    async def panes(self, request):
+        # Streamed with chunked transfer encoding
+        response = web.StreamResponse()
+        response.content_type = "application/json"
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+        body = json.dumps({"panes": [{"id": i} for i in range(500)]}).encode()
+        for start in range(0, len(body), 1000):
+            await response.write(body[start : start + 1000])
+        await response.write_eof()
+        return response
+
+    async def echo(self, request):
+        return web.json_response({"got": await request.json()}, status=201)
+
+    async def closing(self, request):
+        return web.json_response({"ok": True}, headers={"Connection": "close"})
+
+    async def delete(self, request):
+        return web.Response(status=204)
+
+    async def not_json(self, request):
+        return web.Response(text="<html>oops</html>", status=502)
+
+
+@pytest.fixture
+def socket_dir():
+    # Unix socket paths are limited to ~100 characters, too few for tmp_path
+    path = Path(tempfile.mkdtemp(prefix="orch"))
+    yield path
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@pytest_asyncio.fixture
+async def orchestrator(socket_dir):
+    stub = StubOrchestrator()
+    app = web.Application(middlewares=[stub.track_connections])
+    app.router.add_get("/stats", stub.stats)
+    app.router.add_get("/containers", stub.containers)
+    app.router.add_get("/relay/{session}/panes", stub.panes)
+    app.router.add_post("/echo", stub.echo)
+    app.router.add_get("/closing", stub.closing)
+    app.router.add_delete("/containers/{session}", stub.delete)
+    app.router.add_get("/broken", stub.not_json)
+
+    runner = web.AppRunner(app)
+    await runner.setup()
+    path = str(socket_dir / "orch.sock")
+    await web.UnixSite(runner, path).start()
+    stub.path = path
+    yield stub
+    await runner.cleanup()
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_one_connection(orchestrator):
+    client = OrchestratorClient(orchestrator.path)
+
+    for _ in range(10):
+        assert await client.stats() == STATS
+    await client.list_containers()
+
+    assert orchestrator.connections == 1
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_open_parallel_connections(orchestrator):
+    orchestrator.delay = 0.05
+    client = OrchestratorClient(orchestrator.path)
+
+    results = await asyncio.gather(*[client.stats() for _ in range(5)])
+    await asyncio.gather(*[client.stats() for _ in range(5)])
+
+    assert results == [STATS] * 5
+    assert orchestrator.connections == 5
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_chunked_responses_are_decoded(orchestrator):
+    pool = UnixSocketPool(orchestrator.path)
+
+    status, data = await http_request(
+        orchestrator.path, "GET", "/relay/u1-e1-abc/panes", pool=pool
+    )
+    await http_request(orchestrator.path, "GET", "/stats", pool=pool)
+
+    assert status == 200
+    assert [p["id"] for p in data["panes"]] == list(range(500))
+    assert orchestrator.connections == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_post_body_and_empty_responses(orchestrator):
+    pool = UnixSocketPool(orchestrator.path)
+
+    assert await http_request(
+        orchestrator.path, "POST", "/echo", {"name": "vol"}, pool=pool
+    ) == (201, {"got": {"name": "vol"}})
+    assert await http_request(
+        orchestrator.path, "DELETE", "/containers/u1-e1-abc", pool=pool
+    ) == (204, {})
+    assert orchestrator.connections == 1
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_connection_close_is_honoured(orchestrator):
+    pool = UnixSocketPool(orchestrator.path)
+
+    await http_request(orchestrator.path, "GET", "/closing", pool=pool)
+    await http_request(orchestrator.path, "GET", "/stats", pool=pool)
+
+    assert orchestrator.connections == 2
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_server_dropping_kept_alive_connection_is_retried(socket_dir):
+    """A reused connection the server hangs up on is replaced, once."""
+    path = str(socket_dir / "raw.sock")
+    connections = 0
+
+    async def handle(reader, writer):
+        nonlocal connections
+        connections += 1
+        await reader.readuntil(b"\r\n\r\n")
+        body = b'{"n": %d}' % connections
+        writer.write(
+            b"HTTP/1.1 200 OK\r\nContent-Length: %d\r\n\r\n%s" % (len(body), body)
+        )
+        await writer.drain()
+        # Claims keep-alive, then drops the next request unanswered
+        await reader.readuntil(b"\r\n\r\n")
+        writer.close()
+
+    server = await asyncio.start_unix_server(handle, path)
+    pool = UnixSocketPool(path)
+    try:
+        assert await http_request(path, "GET", "/stats", pool=pool) == (200, {"n": 1})
+        assert await http_request(path, "GET", "/stats", pool=pool) == (200, {"n": 2})
+        assert connections == 2
+    finally:
+        await pool.close()
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_responses_without_framing_are_read_to_eof(socket_dir):
+    path = str(socket_dir / "raw.sock")
+
+    async def handle(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b'HTTP/1.0 200 OK\r\n\r\n{"old": "school"}')
+        await writer.drain()
+        writer.close()
+
+    server = await asyncio.start_unix_server(handle, path)
+    try:
+        assert await http_request(path, "GET", "/x") == (200, {"old": "school"})
+    finally:
+        server.close()
+
+
+@pytest.mark.asyncio
+async def test_request_timeout(orchestrator):
+    orchestrator.delay = 1
+    client = OrchestratorClient(orchestrator.path, timeout=0.1)
+
+    with pytest.raises(OrchestratorError, match="Timeout"):
+        await client.stats()
+
+    # The timed out connection isn't handed out again
+    orchestrator.delay = 0
+    assert await client.stats() == STATS
+    assert orchestrator.connections == 2
+    await client.close()
+
+
+@pytest.mark.asyncio
+async def test_non_json_body_raises(orchestrator):
+    with pytest.raises(OrchestratorError, match="Invalid JSON"):
+        await http_request(orchestrator.path, "GET", "/broken")
+
+
+@pytest.mark.asyncio
+async def test_missing_socket_raises(socket_dir):
+    with pytest.raises(OrchestratorError, match="socket not found"):
+        await http_request(str(socket_dir / "missing.sock"), "GET", "/health")
+
+
+@pytest.mark.asyncio
+async def test_pooled_client_polls_over_one_connection(orchestrator):
+    """Dashboard-style polling: pooled keep-alive versus a connection per call."""
+    requests = 50
+
+    for _ in range(requests):
+        await http_request(orchestrator.path, "GET", "/stats")
+    assert orchestrator.connections == requests
+
+    orchestrator.transports.clear()
+    client = OrchestratorClient(orchestrator.path)
+    for _ in range(requests):
+        assert await client.stats() == STATS
+    await client.close()
+    assert orchestrator.connections == 1
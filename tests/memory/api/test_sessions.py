@@ -676,3 +676,208 @@ def test_safe_loads_still_returns_a_list(tmp_path):
     items = safe_loads(transcript)
     assert isinstance(items, list)
     assert [e["i"] for e in items] == [0, 1, 2]
+
+
+# ====== append_events_to_transcript dedup index ======
+
+
+def make_event(uuid: str):
+    from memory.api.sessions import SessionEvent
+
+    return SessionEvent(uuid=uuid, timestamp="2024-01-01T00:00:00Z", type="user")
+
+
+def test_append_events_skips_existing_and_batch_duplicates(sessions_storage_dir):
+    from memory.api.sessions import append_events_to_transcript
+
+    session = Session(transcript_path="1/s.jsonl")
+    assert append_events_to_transcript(session, [make_event("a"), make_event("b")]) == 2
+    assert (
+        append_events_to_transcript(
+            session, [make_event("b"), make_event("c"), make_event("c")]
+        )
+        == 1
+    )
+
+    lines = (sessions_storage_dir / "1/s.jsonl").read_text().splitlines()
+    assert [json.loads(line)["uuid"] for line in lines] == ["a", "b", "c"]
+
+
+def test_append_events_rebuilds_missing_index(sessions_storage_dir):
+    from memory.api.sessions import append_events_to_transcript
+    from memory.common import session_index
+
+    transcript = sessions_storage_dir / "1/s.jsonl"
+    transcript.parent.mkdir(parents=True)
+    transcript.write_text(json.dumps({"uuid": "a"}) + "\n")
+
+    session = Session(transcript_path="1/s.jsonl")
+    assert append_events_to_transcript(session, [make_event("a")]) == 0
+    assert session_index.index_path(transcript).exists()
+
+    session_index.remove_index(transcript)
+    assert append_events_to_transcript(session, [make_event("a"), make_event("b")]) == 1
+
+
+def test_append_events_starts_new_line_after_truncated_write(sessions_storage_dir):
+    from memory.api.sessions import append_events_to_transcript
+
+    transcript = sessions_storage_dir / "1/s.jsonl"
+    transcript.parent.mkdir(parents=True)
+    transcript.write_text(json.dumps({"uuid": "a"}) + '\n{"uuid": "cut-o')
+
+    session = Session(transcript_path="1/s.jsonl")
+    assert append_events_to_transcript(session, [make_event("b")]) == 1
+
+    lines = transcript.read_text().splitlines()
+    assert json.loads(lines[-1])["uuid"] == "b"
+    assert append_events_to_transcript(session, [make_event("b")]) == 0
+
+
+def test_append_events_does_not_rescan_large_transcript(sessions_storage_dir):
+    """Regression for a 100k-event transcript: the first append scans the
+    JSONL once to build the index, later appends only use the index."""
+    from memory.api.sessions import append_events_to_transcript
+    from memory.common import session_index
+
+    transcript = sessions_storage_dir / "1/s.jsonl"
+    transcript.parent.mkdir(parents=True)
+    with open(transcript, "w") as f:
+        for i in range(100_000):
+            f.write(json.dumps({"uuid": f"old-{i}", "type": "user"}) + "\n")
+
+    session = Session(transcript_path="1/s.jsonl")
+    batch = [make_event(f"new-{i}") for i in range(50)] + [make_event("old-42")]
+    with patch.object(
+        session_index, "scan_transcript", wraps=session_index.scan_transcript
+    ) as scan:
+        append_events_to_transcript(session, [make_event("warmup")])
+        assert scan.call_count == 1
+
+        assert append_events_to_transcript(session, batch) == 50
+        assert append_events_to_transcript(session, batch) == 0
+
+    # Both later appends were answered from the index without a rescan
+    assert scan.call_count == 1
+
+
+# ====== read_transcript cursors ======
+
+
+def write_transcript(sessions_storage_dir, count, path="1/s.jsonl"):
+    transcript = sessions_storage_dir / path
+    transcript.parent.mkdir(parents=True, exist_ok=True)
+    with open(transcript, "w") as f:
+        for i in range(count):
+            f.write(json.dumps({"uuid": f"e{i}", "i": i}) + "\n")
+    return transcript
+
+
+def test_read_transcript_cursor_pages_through_everything(sessions_storage_dir):
+    from memory.api.sessions import read_transcript
+
+    write_transcript(sessions_storage_dir, 7)
+
+    seen, cursor = [], None
+    for _ in range(4):
+        page = read_transcript("1/s.jsonl", limit=3, cursor=cursor)
+        seen.extend(e["i"] for e in page.events)
+        cursor = page.next_cursor
+
+    assert seen == list(range(7))
+    # At EOF the cursor stays put, ready for tailing
+    assert read_transcript("1/s.jsonl", cursor=cursor).events == []
+
+
+def test_read_transcript_cursor_tails_new_events(sessions_storage_dir):
+    from memory.api.sessions import read_transcript
+
+    transcript = write_transcript(sessions_storage_dir, 2)
+    cursor = read_transcript("1/s.jsonl").next_cursor
+
+    with open(transcript, "a") as f:
+        f.write(json.dumps({"i": 2}) + "\n" + '{"i": 3')  # 3 is still being written
+
+    page = read_transcript("1/s.jsonl", cursor=cursor)
+    assert [e["i"] for e in page.events] == [2]
+
+    with open(transcript, "a") as f:
+        f.write("}\n")
+    assert [e["i"] for e in read_transcript("1/s.jsonl", cursor=page.next_cursor).events] == [3]
+
+
+def test_read_transcript_line_offset_uses_checkpoints(sessions_storage_dir):
+    from memory.api.sessions import append_events_to_transcript, read_transcript
+    from memory.common import session_index
+
+    write_transcript(sessions_storage_dir, 2500)
+    # Any append builds the index for the existing transcript
+    append_events_to_transcript(Session(transcript_path="1/s.jsonl"), [make_event("x")])
+
+    page = read_transcript("1/s.jsonl", offset=2010, limit=5)
+    assert [e["i"] for e in page.events] == [2010, 2011, 2012, 2013, 2014]
+
+    # Continuing from the cursor picks up exactly where the offset page ended
+    page = read_transcript("1/s.jsonl", limit=2, cursor=page.next_cursor)
+    assert [e["i"] for e in page.events] == [2015, 2016]
+
+    transcript = sessions_storage_dir / "1/s.jsonl"
+    with open(transcript, "rb") as f, session_index.read_index(transcript, f) as index:
+        assert index is not None
+        assert index.checkpoint_before(2010)[0] == 2000
+
+
+def test_read_transcript_line_offset_without_index(sessions_storage_dir):
+    from memory.api.sessions import read_transcript
+
+    write_transcript(sessions_storage_dir, 10)
+
+    page = read_transcript("1/s.jsonl", offset=8, limit=5)
+    assert [e["i"] for e in page.events] == [8, 9]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    ["garbage", "djE6LTE=", "djI6MA==", "djE6NQ==", "djE6OTk5OTk="],
+    ids=["not-base64", "negative", "wrong-version", "mid-line", "past-eof"],
+)
+def test_read_transcript_rejects_bad_cursors(sessions_storage_dir, cursor):
+    from memory.api.sessions import read_transcript
+
+    write_transcript(sessions_storage_dir, 3)
+
+    with pytest.raises(ValueError):
+        read_transcript("1/s.jsonl", cursor=cursor)
+
+
+def test_count_transcript_events_uses_complete_index(sessions_storage_dir):
+    from memory.api.sessions import append_events_to_transcript, count_transcript_events
+
+    transcript = write_transcript(sessions_storage_dir, 4)
+    append_events_to_transcript(Session(transcript_path="1/s.jsonl"), [make_event("x")])
+
+    assert count_transcript_events("1/s.jsonl") == 5
+
+    # Appended behind the index's back: fall back to counting lines
+    with open(transcript, "a") as f:
+        f.write(json.dumps({"i": 99}) + "\n")
+    assert count_transcript_events("1/s.jsonl") == 6
+
+
+def test_get_session_transcript_cursor(
+    client: TestClient, session_for_user, sessions_storage_dir
+):
+    """The endpoint hands out next_cursor and accepts it back."""
+    write_transcript(sessions_storage_dir, 5, session_for_user.transcript_path)
+
+    first = client.get(f"/sessions/{session_for_user.id}?limit=2").json()
+    second = client.get(
+        f"/sessions/{session_for_user.id}?limit=2&cursor={first['next_cursor']}"
+    ).json()
+
+    assert [e["i"] for e in first["events"]] == [0, 1]
+    assert [e["i"] for e in second["events"]] == [2, 3]
+    assert second["total_events"] == 5
+
+    response = client.get(f"/sessions/{session_for_user.id}?cursor=nonsense")
+    assert response.status_code == 400
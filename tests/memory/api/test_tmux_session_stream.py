@@ -0,0 +1,183 @@
+"""Tests for the shared tmux screen stream and row-level screen diffs."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from memory.api import tmux_session
+from memory.api.tmux_session import (
+    ScreenStream,
+    attach_screen_stream,
+    diff_screen_rows,
+    send_screen_update,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_streams():
+    tmux_session._screen_streams.clear()
+    yield
+    tmux_session._screen_streams.clear()
+
+
+def make_websocket():
+    websocket = MagicMock()
+    websocket.send_json = AsyncMock()
+    return websocket
+
+
+def sent(websocket):
+    return [call.args[0] for call in websocket.send_json.call_args_list]
+
+
+def screen_result(screen, cols=80, rows=3):
+    return {"status": "ok", "screen": screen, "cols": cols, "rows": rows}
+
+
+@pytest.mark.parametrize(
+    "previous, current, expected",
+    [
+        (None, ["a"], None),
+        (["a", "b"], ["a"], None),
+        (["a", "b", "c", "d"], ["a", "B", "c", "d"], [(1, "B")]),
+        (["a", "b", "c", "d"], ["a", "b", "c", "d"], []),
+        (["a", "b", "c", "d"], ["A", "B", "C", "d"], None),
+    ],
+    ids=["no-baseline", "row-count-changed", "one-row", "unchanged", "mostly-changed"],
+)
+def test_diff_screen_rows(previous, current, expected):
+    assert diff_screen_rows(previous, current) == expected
+
+
+@pytest.mark.asyncio
+async def test_send_screen_update_sends_diffs_after_first_frame():
+    websocket = make_websocket()
+    state = {"diff": True}
+
+    await send_screen_update(websocket, state, "a\nb\nc", cols=80, rows=3)
+    await send_screen_update(websocket, state, "a\nB\nc", cols=80, rows=3)
+
+    first, second = sent(websocket)
+    assert first["type"] == "screen"
+    assert first["data"] == "a\nb\nc"
+    assert second["type"] == "screen_diff"
+    assert second["changes"] == [(1, "B")]
+    assert "data" not in second
+
+
+@pytest.mark.asyncio
+async def test_send_screen_update_full_frame_on_resize_or_without_diff():
+    websocket = make_websocket()
+    diff_state = {"diff": True}
+    await send_screen_update(websocket, diff_state, "a\nb\nc", cols=80, rows=3)
+    await send_screen_update(websocket, diff_state, "a\nB\nc", cols=100, rows=3)
+
+    plain_state = {}
+    await send_screen_update(websocket, plain_state, "a\nb\nc", cols=80, rows=3)
+    await send_screen_update(websocket, plain_state, "a\nB\nc", cols=80, rows=3)
+
+    assert [m["type"] for m in sent(websocket)] == ["screen"] * 4
+
+
+@pytest.mark.asyncio
+async def test_stream_shares_one_capture_loop_between_viewers():
+    relay = MagicMock()
+    relay.capture_screen = AsyncMock(return_value=screen_result("x\ny\nz"))
+    relay.close = AsyncMock()
+    factory = MagicMock(return_value=relay)
+    client = MagicMock()
+
+    stream = attach_screen_stream("s1", client, factory)
+    assert attach_screen_stream("s1", client, factory) is stream
+    factory.assert_called_once()
+
+    first, second = make_websocket(), make_websocket()
+    await stream.add_viewer(first)
+    await asyncio.sleep(0.01)
+    await stream.add_viewer(second, diff=True)
+
+    # Late joiner gets the phase and current screen immediately
+    assert [m["type"] for m in sent(second)] == ["phase", "screen"]
+    assert any(m["type"] == "screen" for m in sent(first))
+
+    task = stream.task
+    assert task is not None
+    await stream.remove_viewer(first)
+    assert not task.done()
+    relay.close.assert_not_called()
+
+    await stream.remove_viewer(second)
+    assert task.done()
+    relay.close.assert_awaited_once()
+    assert "s1" not in tmux_session._screen_streams
+
+
+@pytest.mark.asyncio
+async def test_attach_registers_viewer_before_last_viewer_leaves():
+    relay = MagicMock()
+    relay.capture_screen = AsyncMock(return_value=screen_result("x\ny\nz"))
+    relay.close = AsyncMock()
+    factory = MagicMock(return_value=relay)
+    client = MagicMock()
+    client.get_logs = AsyncMock(return_value=None)
+
+    first, second = make_websocket(), make_websocket()
+    stream = attach_screen_stream("s2", client, factory, first)
+    await asyncio.sleep(0.01)
+
+    # The second viewer attaches, then the first leaves before the second
+    # gets round to add_viewer
+    assert attach_screen_stream("s2", client, factory, second) is stream
+    await stream.remove_viewer(first)
+
+    assert stream.task is not None and not stream.task.done()
+    assert tmux_session._screen_streams["s2"] is stream
+    relay.close.assert_not_called()
+
+    await stream.add_viewer(second)
+    assert list(stream.viewers) == [second]
+    await stream.remove_viewer(second)
+    assert stream.task.done()
+
+
+@pytest.mark.asyncio
+async def test_stream_skips_scrolled_back_viewers():
+    stream = ScreenStream("s1", MagicMock(), MagicMock())
+    live, scrolled = make_websocket(), make_websocket()
+    stream.viewers[live] = {}
+    stream.viewers[scrolled] = {"scroll_offset": 5}
+
+    assert await stream.send_screen("a", cols=80, rows=1) is True
+    assert len(sent(live)) == 1
+    assert sent(scrolled) == []
+
+    stream.viewers.pop(live)
+    assert await stream.send_screen("b", cols=80, rows=1) is False
+
+
+@pytest.mark.asyncio
+async def test_stream_drops_viewer_whose_socket_fails():
+    stream = ScreenStream("s1", MagicMock(), MagicMock())
+    good, dead = make_websocket(), make_websocket()
+    dead.send_json.side_effect = RuntimeError("closed")
+    stream.viewers[good] = {}
+    stream.viewers[dead] = {}
+
+    await stream.send_json({"type": "status"})
+
+    assert dead not in stream.viewers
+    assert sent(good) == [{"type": "status"}]
+
+
+@pytest.mark.asyncio
+async def test_stream_update_state_reaches_current_and_future_viewers():
+    stream = ScreenStream("s1", MagicMock(), MagicMock())
+    stream.task = MagicMock()  # don't start a real loop
+    existing = await stream.add_viewer(make_websocket())
+
+    stream.update_state(phase="startup", terminal_rows=40)
+    later = await stream.add_viewer(make_websocket())
+
+    assert existing["terminal_rows"] == later["terminal_rows"] == 40
+    assert existing["input_event"] is later["input_event"] is stream.input_event
@@ -0,0 +1,147 @@
+"""Tests for the person_identifiers lookup index."""
+
+import pytest
+from sqlalchemy import update
+
+from memory.common.db.models import Person, PersonIdentifier, rebuild_person_identifiers
+from memory.common.db.models.person_identifiers import identifier_keys, normalize
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("Alice", "alice"),
+        ("  Bob Smith ", "bob smith"),
+        ("   ", None),
+        ("", None),
+        (None, None),
+        (123, None),
+    ],
+)
+def test_normalize(value, expected):
+    assert normalize(value) == expected
+
+
+def test_identifier_keys_covers_all_kinds():
+    keys = identifier_keys(
+        "Alice Chen",
+        ["@alice_c", "Alice Chen"],
+        {
+            "email": "Alice@Example.com",
+            "github": "AliceC",
+            "phone": "555-1234",
+            "slack": {
+                "T1": {"user_id": "U123", "username": "alice"},
+                "T2": {"user_id": "U999"},
+            },
+        },
+    )
+
+    assert keys == {
+        ("name", "", "alice chen"),
+        ("alias", "", "@alice_c"),
+        ("alias", "", "alice chen"),
+        ("email", "", "alice@example.com"),
+        ("github", "", "alicec"),
+        ("slack", "T1", "u123"),
+        ("slack", "T2", "u999"),
+    }
+
+
+def test_identifier_keys_accepts_email_lists():
+    keys = identifier_keys("A", [], {"email": ["a@x.com", "A@Y.com"]})
+    assert {v for k, _, v in keys if k == "email"} == {"a@x.com", "a@y.com"}
+
+
+@pytest.mark.parametrize(
+    "contact_info",
+    [
+        None,
+        {},
+        {"email": None, "github": ""},
+        {"slack": "not-a-dict"},
+        {"slack": {"T1": "not-a-dict"}},
+        {"slack": {"T1": {"username": "no id"}}},
+    ],
+)
+def test_identifier_keys_skips_missing_or_malformed(contact_info):
+    assert identifier_keys("Alice", None, contact_info) == {("name", "", "alice")}
+
+
+def rows_for(db_session, person):
+    return {
+        (r.kind, r.workspace, r.value)
+        for r in db_session.query(PersonIdentifier).filter_by(person_id=person.id)
+    }
+
+
+def test_identifiers_written_on_insert(db_session):
+    person = Person(
+        identifier="alice",
+        display_name="Alice",
+        aliases=["Ally"],
+        contact_info={"email": "alice@example.com"},
+    )
+    db_session.add(person)
+    db_session.commit()
+
+    assert rows_for(db_session, person) == {
+        ("name", "", "alice"),
+        ("alias", "", "ally"),
+        ("email", "", "alice@example.com"),
+    }
+
+
+def test_identifiers_rewritten_on_update(db_session):
+    person = Person(identifier="alice", display_name="Alice", aliases=["Ally"])
+    db_session.add(person)
+    db_session.commit()
+
+    person.aliases = ["Al"]
+    person.contact_info = {"slack": {"T1": {"user_id": "U1"}}}
+    db_session.commit()
+
+    assert rows_for(db_session, person) == {
+        ("name", "", "alice"),
+        ("alias", "", "al"),
+        ("slack", "T1", "u1"),
+    }
+
+
+def test_identifiers_untouched_by_unrelated_update(db_session):
+    person = Person(identifier="alice", display_name="Alice")
+    db_session.add(person)
+    db_session.commit()
+    db_session.query(PersonIdentifier).delete()
+
+    person.identifier = "alice_2"
+    db_session.commit()
+
+    assert rows_for(db_session, person) == set()
+
+
+def test_identifiers_removed_with_person(db_session):
+    person = Person(identifier="alice", display_name="Alice")
+    db_session.add(person)
+    db_session.commit()
+    person_id = person.id
+
+    db_session.delete(person)
+    db_session.commit()
+
+    assert db_session.query(PersonIdentifier).filter_by(person_id=person_id).count() == 0
+
+
+def test_rebuild_repairs_bulk_updates(db_session):
+    person = Person(identifier="alice", display_name="Alice")
+    db_session.add(person)
+    db_session.commit()
+
+    # Core UPDATEs bypass the flush listener
+    db_session.execute(
+        update(Person).where(Person.id == person.id).values(display_name="Alicia")
+    )
+    assert ("name", "", "alice") in rows_for(db_session, person)
+
+    assert rebuild_person_identifiers(db_session) == 1
+    assert rows_for(db_session, person) == {("name", "", "alicia")}
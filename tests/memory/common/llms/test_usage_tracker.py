@@ -1,10 +1,14 @@
+import json
+import multiprocessing
+import threading
 from datetime import datetime, timedelta, timezone
-from typing import Any, Iterable, cast
+from typing import Any, cast
 
+import fakeredis
 import pytest
 
 try:
-    import redis  # noqa: F401  # pragma: no cover - optional test dependency
+    import redis.client  # noqa: F401  # pragma: no cover - optional test dependency
 except ModuleNotFoundError:  # pragma: no cover - import guard for test envs
     import sys
     from types import SimpleNamespace
@@ -16,7 +20,7 @@ except ModuleNotFoundError:  # pragma: no cover - import guard for test envs
                     "The 'redis' package is required to use RedisUsageTracker"
                 )
 
-    sys.modules.setdefault("redis", cast(Any, _RedisStub()))
+    redis = sys.modules.setdefault("redis", cast(Any, _RedisStub()))
 
 from memory.common.llms.usage import (
     InMemoryUsageTracker,
@@ -26,24 +30,6 @@ from memory.common.llms.usage import (
 )
 
 
-class FakeRedis:
-    def __init__(self) -> None:
-        self._store: dict[str, str] = {}
-
-    def get(self, key: str) -> str | None:
-        return self._store.get(key)
-
-    def set(self, key: str, value: str) -> None:
-        self._store[key] = value
-
-    def scan_iter(self, match: str) -> Iterable[str]:
-        from fnmatch import fnmatch
-
-        for key in list(self._store.keys()):
-            if fnmatch(key, match):
-                yield key
-
-
 @pytest.fixture
 def tracker() -> InMemoryUsageTracker:
     config = RateLimitConfig(
@@ -73,7 +59,7 @@ def redis_tracker() -> RedisUsageTracker:
             "anthropic/claude-3": config,
             "anthropic/haiku": config,
         },
-        redis_client=cast(Any, FakeRedis()),
+        redis_client=cast(Any, fakeredis.FakeRedis()),
     )
 
 
@@ -220,3 +206,178 @@ def test_usage_tracker_base_not_instantiable() -> None:
 
     with pytest.raises(NotImplementedError):
         DummyTracker({}).record_usage("provider/model", 1, 1)
+
+
+def test_redis_usage_tracker_window_expires(redis_tracker: RedisUsageTracker) -> None:
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    redis_tracker.record_usage("anthropic/claude-3", 800, 1_700, timestamp=now)
+
+    assert redis_tracker.is_rate_limited("anthropic/claude-3", timestamp=now)
+
+    later = now + timedelta(minutes=2)
+    allowance = redis_tracker.get_available_tokens(
+        "anthropic/claude-3", timestamp=later
+    )
+    assert allowance is not None
+    assert (allowance.input_tokens, allowance.total_tokens) == (1_000, 2_500)
+
+    # Lifetime totals survive the window
+    usage = redis_tracker.get_usage_breakdown()["anthropic"]["claude-3"]
+    assert usage.lifetime_input_tokens == 800
+
+
+def test_redis_usage_tracker_sums_buckets_across_window() -> None:
+    config = RateLimitConfig(window=timedelta(minutes=1), max_input_tokens=1_000)
+    tracker = RedisUsageTracker(
+        {"openai/gpt-4o": config},
+        redis_client=cast(Any, fakeredis.FakeRedis()),
+        buckets_per_window=6,
+    )
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for seconds in range(0, 60, 5):
+        tracker.record_usage(
+            "openai/gpt-4o", 10, 0, timestamp=start + timedelta(seconds=seconds)
+        )
+
+    end = start + timedelta(seconds=59)
+    allowance = tracker.get_available_tokens("openai/gpt-4o", timestamp=end)
+    assert allowance is not None and allowance.input_tokens == 1_000 - 120
+
+    # The first 10s bucket has left the window 65s in
+    later = start + timedelta(seconds=65)
+    allowance = tracker.get_available_tokens("openai/gpt-4o", timestamp=later)
+    assert allowance is not None and allowance.input_tokens == 1_000 - 100
+
+
+def test_redis_usage_tracker_last_seen_never_goes_backwards(
+    redis_tracker: RedisUsageTracker,
+) -> None:
+    now = datetime.now(timezone.utc)
+    redis_tracker.record_usage("anthropic/claude-3", 100, 0, timestamp=now)
+    # A slow worker recording an older call must not move the window back
+    redis_tracker.record_usage(
+        "anthropic/claude-3", 10, 0, timestamp=now - timedelta(minutes=5)
+    )
+
+    state = redis_tracker.get_state("anthropic/claude-3")
+    assert state.lifetime_input_tokens == 110
+    assert state.window_input_tokens == 100
+
+
+def test_redis_usage_tracker_migrates_legacy_json_state() -> None:
+    client = fakeredis.FakeRedis()
+    now = datetime.now(timezone.utc)
+    legacy = {
+        "lifetime_input_tokens": 5_000,
+        "lifetime_output_tokens": 7_000,
+        "events": [
+            {
+                "timestamp": (now - timedelta(hours=2)).isoformat(),
+                "input_tokens": 4_000,
+                "output_tokens": 6_000,
+            },
+            {
+                "timestamp": (now - timedelta(seconds=10)).isoformat(),
+                "input_tokens": 100,
+                "output_tokens": 200,
+            },
+        ],
+    }
+    client.set("llm_usage:anthropic/claude-3", json.dumps(legacy))
+
+    tracker = RedisUsageTracker(
+        {
+            "anthropic/claude-3": RateLimitConfig(
+                window=timedelta(minutes=1), max_input_tokens=1_000
+            )
+        },
+        redis_client=cast(Any, client),
+        key_prefix="llm_usage",
+    )
+    tracker.record_usage("anthropic/claude-3", 1, 2, timestamp=now)
+
+    usage = tracker.get_usage_breakdown()["anthropic"]["claude-3"]
+    assert (usage.lifetime_input_tokens, usage.lifetime_output_tokens) == (
+        5_001,
+        7_002,
+    )
+    assert (usage.window_input_tokens, usage.window_output_tokens) == (101, 202)
+    assert client.get("llm_usage:anthropic/claude-3") is None
+
+    # A second tracker finds nothing left to migrate
+    again = RedisUsageTracker(redis_client=cast(Any, client), key_prefix="llm_usage")
+    state = again.get_state("anthropic/claude-3")
+    assert state.lifetime_input_tokens == 5_001
+
+
+def test_redis_usage_tracker_checks_cost_one_command() -> None:
+    client = fakeredis.FakeRedis()
+    tracker = RedisUsageTracker(
+        {
+            "openai/gpt-4o": RateLimitConfig(
+                window=timedelta(minutes=1), max_input_tokens=10**9
+            )
+        },
+        redis_client=cast(Any, client),
+    )
+    now = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(1_000):
+        tracker.record_usage(
+            "openai/gpt-4o", 1, 1, timestamp=now + timedelta(milliseconds=i)
+        )
+
+    commands: list[tuple] = []
+    original = client.execute_command
+
+    def record(*args, **kwargs):
+        commands.append(args)
+        return original(*args, **kwargs)
+
+    client.execute_command = record  # type: ignore[method-assign]
+    assert not tracker.is_rate_limited(
+        "openai/gpt-4o", timestamp=now + timedelta(seconds=1)
+    )
+    assert [c[0] for c in commands] == ["MGET"]
+
+
+def _record_from_process(port: int, count: int) -> None:
+    # redis.Redis is patched with an in-process mock in tests; go through
+    # the real client class so every process talks to the shared server
+    # (which only speaks RESP3).
+    client = redis.client.Redis(host="127.0.0.1", port=port, protocol=3)
+    config = RateLimitConfig(window=timedelta(hours=1), max_total_tokens=10**9)
+    tracker = RedisUsageTracker({"openai/gpt-4o": config}, redis_client=client)
+    for _ in range(count):
+        tracker.record_usage("openai/gpt-4o", 1, 2)
+
+
+def test_redis_usage_tracker_concurrent_processes_lose_no_updates() -> None:
+    server = fakeredis.TcpFakeServer(("127.0.0.1", 0), server_type="redis")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    port = server.server_address[1]
+    try:
+        ctx = multiprocessing.get_context("fork")
+        workers = [
+            ctx.Process(target=_record_from_process, args=(port, 50)) for _ in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+        assert all(worker.exitcode == 0 for worker in workers)
+
+        tracker = RedisUsageTracker(
+            {
+                "openai/gpt-4o": RateLimitConfig(
+                    window=timedelta(hours=1), max_total_tokens=10**9
+                )
+            },
+            redis_client=redis.client.Redis(host="127.0.0.1", port=port, protocol=3),
+        )
+        usage = tracker.get_usage_breakdown()["openai"]["gpt-4o"]
+        assert (usage.lifetime_input_tokens, usage.lifetime_output_tokens) == (200, 400)
+        assert (usage.window_input_tokens, usage.window_output_tokens) == (200, 400)
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -14,4 +14,4 @@ def test_check_defaults():
     assert settings.CHECK_ALLOW_PRIVATE_CALLBACKS is False
     assert settings.CHECK_DEFAULT_WAIT_SEC == 60
     assert settings.CHECK_MAX_WAIT_SEC == 300
-    assert settings.CHECK_WAIT_POLL_INTERVAL_SEC == 2.0
+    assert settings.CHECK_WAIT_POLL_INTERVAL_SEC == 30.0
@@ -11,6 +11,7 @@ import requests
 
 from memory.common.downloads import (
     canonicalize_url_for_loop_detection,
+    normalize_article_url,
     safe_get,
     stream_download_to_bytes,
     stream_download_to_path,
@@ -814,3 +815,66 @@ def test_safe_get_detects_loop_across_query_param_reorder():
             safe_get("http://start.example/?a=1&b=2")
 
 
+
+
+# --- safe_get over a shared session ---------------------------------------
+
+
+def test_safe_get_uses_session_for_every_hop():
+    hop = _FakeChunkResponse([], status_code=302, location="http://b.example/2")
+    final = _FakeChunkResponse([b"final"], status_code=200)
+    session = requests.Session()
+
+    with (
+        patch.object(session, "get", side_effect=[hop, final]) as session_get,
+        patch("memory.common.downloads.requests.get") as module_get,
+    ):
+        response = safe_get("http://a.example/1", validate_url=False, session=session)
+
+    assert response is final
+    assert [c.args[0] for c in session_get.call_args_list] == [
+        "http://a.example/1",
+        "http://b.example/2",
+    ]
+    module_get.assert_not_called()
+
+
+# --- normalize_article_url ------------------------------------------------
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.com/post",
+        "http://example.com/post",
+        "https://www.example.com/post",
+        "https://EXAMPLE.com/post/",
+        "https://example.com:443/post",
+        "https://example.com/post#comments",
+        "https://example.com/post?utm_source=rss&utm_medium=feed",
+        " https://example.com/post ",
+    ],
+)
+def test_normalize_article_url_collapses_link_variants(url):
+    assert normalize_article_url(url) == "example.com/post"
+
+
+@pytest.mark.parametrize(
+    "url_a,url_b",
+    [
+        ("https://example.com/a", "https://example.com/b"),
+        ("https://example.com/Post", "https://example.com/post"),
+        ("https://blog.example.com/post", "https://example.com/post"),
+        ("https://example.com:8443/post", "https://example.com/post"),
+        ("https://example.com/?p=1", "https://example.com/?p=2"),
+    ],
+)
+def test_normalize_article_url_keeps_distinct_articles_distinct(url_a, url_b):
+    assert normalize_article_url(url_a) != normalize_article_url(url_b)
+
+
+def test_normalize_article_url_sorts_query():
+    assert (
+        normalize_article_url("https://example.com/?b=2&a=1&utm_campaign=x")
+        == "example.com?a=1&b=2"
+    )
@@ -1,7 +1,9 @@
 # pyright: reportAttributeAccessIssue=false
 # PyMuPDF's `pymupdf.open` (== Document) ships incomplete stubs that omit
 # Document.new_page; the methods exist at runtime.
+import gc
 import pathlib
+from typing import cast
 import pytest
 import pymupdf
 from PIL import Image
@@ -23,7 +25,9 @@ from memory.common.extract import (
     merge_metadata,
     MIN_PDF_PAGE_TEXT_CHARS,
     DataChunk,
+    SpilledImage,
 )
+from memory.common.db.models.source_item import image_filenames
 
 
 REGULAMIN = pathlib.Path(__file__).parent.parent.parent / "data" / "regulamin.pdf"
@@ -87,7 +91,9 @@ def test_doc_to_images():
         for page, pdf_page in zip(result, pdf.pages()):
             pix = pdf_page.get_pixmap()
             img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-            assert page.data == [img]
+            (image,) = page.data
+            assert image.size == img.size
+            assert image.tobytes() == img.tobytes()
             assert page.metadata == {
                 "page": pdf_page.number,
                 "width": pdf_page.rect.width,
@@ -98,7 +104,7 @@ def test_doc_to_images():
 def test_extract_pdf_born_digital_includes_text():
     """A born-digital PDF yields one image chunk per page PLUS text chunks from
     its embedded text layer (so it is text-searchable, not image-only)."""
-    result = extract_pdf(REGULAMIN)
+    result = list(extract_pdf(REGULAMIN))
 
     images = [c for c in result if any(isinstance(d, Image.Image) for d in c.data)]
     texts = [c for c in result if any(isinstance(d, str) for d in c.data)]
@@ -119,7 +125,7 @@ def test_extract_pdf_image_only_when_no_text_layer():
     pdf_bytes = doc.tobytes()
     doc.close()
 
-    result = extract_pdf(pdf_bytes)
+    result = list(extract_pdf(pdf_bytes))
 
     assert len(result) == 1
     assert any(isinstance(d, Image.Image) for d in result[0].data)
@@ -134,13 +140,96 @@ def test_extract_pdf_short_text_below_threshold_is_skipped():
     pdf_bytes = doc.tobytes()
     doc.close()
 
-    result = extract_pdf(pdf_bytes)
+    result = list(extract_pdf(pdf_bytes))
 
     assert not any(
         isinstance(d, str) for c in result for d in c.data
     )
 
 
+def make_pdf(pages: int) -> bytes:
+    doc = pymupdf.open()
+    for i in range(pages):
+        page = doc.new_page(width=300, height=400)
+        page.insert_text((50, 50), f"This is the text layer of page number {i}")
+        page.draw_rect(pymupdf.Rect(20, 80 + i % 10, 280, 380), color=(i % 3 / 2, 0, 1))
+    content = doc.tobytes()
+    doc.close()
+    return content
+
+
+def test_extract_pdf_yields_pages_lazily():
+    chunks = extract_pdf(make_pdf(3))
+
+    first = next(chunks)
+    assert first.metadata["page"] == 0
+    # Only the first page has been rendered so far
+    assert len(list(settings.PDF_SPILL_DIR.glob("page_*.png"))) == 1
+    assert [c.metadata["page"] for c in chunks] == [0, 1, 1, 2, 2]
+
+
+def test_extract_pdf_images_point_at_spilled_files():
+    chunks = list(extract_pdf(make_pdf(2)))
+
+    image_chunks = [c for c in chunks if isinstance(c.data[0], Image.Image)]
+    images = [cast(SpilledImage, c.data[0]) for c in image_chunks]
+    assert len(images) == 2
+    assert all(c.mime_type == "image/png" for c in image_chunks)
+    for image in images:
+        assert image.path.parent == settings.PDF_SPILL_DIR
+        assert not image.filename  # not in the chunk store until persisted
+        with Image.open(image.path) as on_disk:
+            assert image.tobytes() == on_disk.convert("RGB").tobytes()
+            assert image.convert("RGB").tobytes() == on_disk.tobytes()
+        # Using the pixels doesn't leave the raster on the image
+        assert image.im is None
+
+
+def test_spilled_pages_are_moved_into_chunk_store_when_persisted():
+    chunks = list(extract_pdf(make_pdf(2)))
+    first, second = [
+        cast(SpilledImage, c.data[0]) for c in chunks if c.mime_type == "image/png"
+    ]
+    spilled = first.path
+
+    (name,) = image_filenames("abc", [first])
+
+    assert name == str(settings.CHUNK_STORAGE_DIR / "abc_0.png")
+    assert first.filename == name and pathlib.Path(name).exists()
+    assert not spilled.exists()
+
+    # Pages never persisted are removed along with their image
+    unused = second.path
+    del chunks, first, second
+    gc.collect()
+    assert pathlib.Path(name).exists()
+    assert not unused.exists()
+
+
+@pytest.mark.parametrize("dpi", [72, 144])
+def test_extract_pdf_renders_at_configured_dpi(monkeypatch, dpi):
+    monkeypatch.setattr(settings, "PDF_RENDER_DPI", dpi)
+
+    (image_chunk, *_) = extract_pdf(make_pdf(1))
+
+    assert image_chunk.data[0].size == (300 * dpi // 72, 400 * dpi // 72)
+    # Page geometry stays in points whatever the resolution
+    assert image_chunk.metadata["width"] == 300
+
+
+def test_extract_pdf_parallel_matches_in_process(monkeypatch):
+    content = make_pdf(12)
+
+    def render(workers):
+        monkeypatch.setattr(settings, "PDF_RENDER_WORKERS", workers)
+        return [
+            (c.metadata, c.data[0].tobytes() if c.mime_type == "image/png" else c.data)
+            for c in extract_pdf(content)
+        ]
+
+    assert render(3) == render(1)
+
+
 def test_extract_image_with_path(tmp_path):
     img = Image.new("RGB", (100, 100), color="red")
     img_path = tmp_path / "test.png"
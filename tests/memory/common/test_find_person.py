@@ -1,12 +1,21 @@
 """Tests for memory.common.people lookup helpers."""
 
+import time
+
 import pytest
+from sqlalchemy import event, insert, text
 
-from memory.common.db.models import Person
+from memory.common.db.models import Note, Person, rebuild_person_identifiers
 from memory.common.people import (
     find_person_by_email,
+    find_person_by_github,
     find_person_by_name,
+    find_person_by_slack_id,
     find_or_create_person,
+    find_person,
+    link_people,
+    link_slack_user_to_person,
+    resolve_people,
 )
 
 
@@ -68,3 +77,173 @@ def test_find_person_by_email_exact_match_baseline(db_session, alice_person):
     assert find_person_by_email(db_session, "alice@company.com") is alice_person
     # A substring-like attacker query must miss.
     assert find_person_by_email(db_session, "alice@company.com.attacker.tld") is None
+
+
+@pytest.fixture
+def indexed_people(db_session):
+    people = [
+        Person(
+            identifier="bob",
+            display_name="Bob",
+            aliases=["Robert"],
+            contact_info={
+                "email": "Bob@Example.com",
+                "github": "BobDev",
+                "slack": {"T1": {"user_id": "U1"}},
+            },
+        ),
+        # Carries Bob's display name as an alias: the display name must win
+        Person(identifier="bob_2", display_name="Bobby", aliases=["Bob"]),
+    ]
+    db_session.add_all(people)
+    db_session.commit()
+    return people
+
+
+def test_find_person_by_name_prefers_display_name_over_alias(
+    db_session, indexed_people
+):
+    bob, bobby = indexed_people
+    assert find_person_by_name(db_session, " BOB ") == bob
+    assert find_person_by_name(db_session, "robert") == bob
+    assert find_person_by_name(db_session, "bobby") == bobby
+
+
+def test_find_person_by_platform_ids(db_session, indexed_people):
+    bob, _ = indexed_people
+    assert find_person_by_email(db_session, "bob@example.COM") == bob
+    assert find_person_by_github(db_session, "bobdev") == bob
+    assert find_person_by_slack_id(db_session, "T1", "U1") == bob
+    # Slack ids are scoped to their workspace
+    assert find_person_by_slack_id(db_session, "T2", "U1") is None
+
+
+def test_find_person_by_slack_id_after_relink(db_session, indexed_people):
+    bob, _ = indexed_people
+    link_slack_user_to_person(db_session, bob, "T1", "U2")
+    db_session.commit()
+
+    assert find_person_by_slack_id(db_session, "T1", "U2") == bob
+    assert find_person_by_slack_id(db_session, "T1", "U1") is None
+
+
+def test_person_lookups_with_100k_people(db_session):
+    """Every lookup is an index probe, so it stays fast with many People."""
+    count = 100_000
+    db_session.execute(
+        insert(Person),
+        [
+            {
+                "identifier": f"person_{i}",
+                "display_name": f"Person {i}",
+                "aliases": [f"alias {i}"],
+                "contact_info": {
+                    "email": f"person{i}@example.com",
+                    "slack": {"T1": {"user_id": f"U{i}"}},
+                },
+            }
+            for i in range(count)
+        ],
+    )
+    rebuild_person_identifiers(db_session)
+    db_session.execute(text("ANALYZE people; ANALYZE person_identifiers"))
+
+    lookups = [
+        lambda i: find_person_by_name(db_session, f"person {i}"),
+        lambda i: find_person_by_name(db_session, f"ALIAS {i}"),
+        lambda i: find_person_by_email(db_session, f"person{i}@example.com"),
+        lambda i: find_person_by_slack_id(db_session, "T1", f"U{i}"),
+    ]
+    samples = range(0, count, count // 100)
+
+    start = time.perf_counter()
+    for lookup in lookups:
+        for i in samples:
+            person = lookup(i)
+            assert person is not None and person.identifier == f"person_{i}"
+    per_lookup = (time.perf_counter() - start) / (len(lookups) * len(samples))
+
+    # A sequential scan of 100k rows takes tens of milliseconds
+    assert per_lookup < 0.005, f"{per_lookup * 1000:.2f}ms per lookup"
+
+
+@pytest.fixture
+def count_queries(db_session):
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    bind = db_session.get_bind()
+    event.listen(bind, "before_cursor_execute", record)
+    yield statements
+    event.remove(bind, "before_cursor_execute", record)
+
+
+def test_resolve_people_matches_like_find_person(db_session, indexed_people):
+    bob, bobby = indexed_people
+    identifiers = ["bob@example.com", "Robert", "bobby", "bob_2", "nobody", "", "BOB"]
+
+    resolved = resolve_people(db_session, identifiers)
+
+    one_by_one = [find_person(db_session, i) for i in identifiers if i]
+    assert resolved == list(dict.fromkeys(p for p in one_by_one if p))
+    assert resolved == [bob, bobby]
+
+
+def test_resolve_people_creates_missing_in_bulk(db_session, indexed_people):
+    bob, _ = indexed_people
+
+    resolved = resolve_people(
+        db_session,
+        ["carol@example.com", "Carol@other.com", "Dan Brown", "bob@example.com"],
+        create_if_missing=True,
+    )
+
+    carol, dan, resolved_bob = resolved
+    assert resolved_bob == bob
+    assert (carol.identifier, carol.display_name) == ("carol", "carol")
+    assert carol.contact_info == {"email": "carol@example.com"}
+    assert (dan.identifier, dan.aliases) == ("dan_brown", ["Dan Brown"])
+    # Created people are immediately findable through the index
+    assert find_person_by_email(db_session, "carol@example.com") == carol
+    assert find_person_by_name(db_session, "dan brown") == dan
+
+
+def test_resolve_people_create_uses_existing_on_slug_conflict(db_session):
+    # Matches by identifier slug only, so the lookup misses it and the insert
+    # conflicts on Person.identifier.
+    existing = Person(identifier="erin", display_name="Erin Q")
+    db_session.add(existing)
+    db_session.commit()
+
+    resolved = resolve_people(
+        db_session, ["erin@example.com"], create_if_missing=True
+    )
+
+    assert resolved == [existing]
+
+
+def test_resolve_people_uses_fixed_number_of_queries(
+    db_session, indexed_people, count_queries
+):
+    emails = [f"person{i}@example.com" for i in range(100)]
+
+    resolved = resolve_people(db_session, emails + ["bob"], create_if_missing=True)
+
+    assert len(resolved) == 101
+    assert len(count_queries) <= 6
+
+
+def test_link_people_adds_only_new_associations(db_session, indexed_people):
+    bob, bobby = indexed_people
+    note = Note(sha256=b"link-people-test", content="note")
+    note.people.append(bob)
+    db_session.add(note)
+    db_session.commit()
+
+    linked = link_people(db_session, note, ["bob", "bobby", "BOBBY", "nobody"])
+    db_session.commit()
+
+    assert linked == 1
+    assert {p.id for p in note.people} == {bob.id, bobby.id}
@@ -0,0 +1,331 @@
+"""Tests for the shared prediction market cache, against a local stub market API."""
+
+import asyncio
+import threading
+import time
+from typing import cast
+from unittest.mock import MagicMock, patch
+
+import fakeredis
+import pytest
+import pytest_asyncio
+import redis
+from aiohttp import web
+
+from memory.common import markets, settings
+from memory.common.market_cache import (
+    LocalCacheBackend,
+    MarketCache,
+    RedisCacheBackend,
+    make_backend,
+)
+from memory.api.MCP.servers import forecast
+
+
+class StubMarketServer:
+    """Minimal Manifold search and Kalshi order book endpoints."""
+
+    def __init__(self):
+        self.requests: list[str] = []
+        self.delay = 0.0
+        self.probability = 0.4
+        self.orderbook_status = 200
+
+    async def search(self, request):
+        self.requests.append("search")
+        await asyncio.sleep(self.delay)
+        return web.json_response(
+            [
+                {
+                    "id": "m1",
+                    "question": "Will it rain?",
+                    "volume": 5000,
+                    "probability": self.probability,
+                    "outcomeType": "BINARY",
+                }
+            ]
+        )
+
+    async def orderbook(self, request):
+        self.requests.append("orderbook")
+        await asyncio.sleep(self.delay)
+        if self.orderbook_status != 200:
+            return web.json_response({}, status=self.orderbook_status)
+        return web.json_response({"orderbook": {"yes": [[50, 10]], "no": [[48, 5]]}})
+
+
+@pytest_asyncio.fixture
+async def stub_markets(monkeypatch):
+    stub = StubMarketServer()
+    app = web.Application()
+    app.router.add_get("/v0/search-markets", stub.search)
+    app.router.add_get("/v2/markets/{ticker}/orderbook", stub.orderbook)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]  # type: ignore[union-attr]
+
+    monkeypatch.setattr(markets, "MANIFOLD_API_URL", f"http://127.0.0.1:{port}/v0")
+    monkeypatch.setattr(forecast, "KALSHI_API_URL", f"http://127.0.0.1:{port}/v2")
+    yield stub
+    await runner.cleanup()
+
+
+@pytest.fixture
+def shared_redis():
+    """One Redis server, standing in for the one every process connects to."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def metrics():
+    with patch("memory.common.market_cache.record_metric") as record:
+        yield record
+
+
+def make_cache(server, **kwargs):
+    backend = RedisCacheBackend(
+        "test", ttl=60, redis_client=fakeredis.FakeRedis(server=server)
+    )
+    kwargs.setdefault("ttl", 30)
+    return MarketCache("test", backend=backend, **kwargs)
+
+
+def search():
+    return markets.search_manifold_markets("rain")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_upstream_fetch(
+    stub_markets, shared_redis, metrics
+):
+    stub_markets.delay = 0.2
+    cache = make_cache(shared_redis)
+
+    results = await asyncio.gather(*[cache.get_or_fetch("k", search) for _ in range(10)])
+
+    assert all(r == results[0] for r in results)
+    assert results[0][0]["id"] == "m1"
+    assert stub_markets.requests.count("search") == 1
+    assert cache.stats == {"miss": 10, "upstream": 1}
+
+    assert await cache.get_or_fetch("k", search) == results[0]
+    assert cache.stats["hit"] == 1
+    assert stub_markets.requests.count("search") == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_coalesce_across_processes(
+    stub_markets, shared_redis, metrics, monkeypatch
+):
+    monkeypatch.setattr(settings, "MARKET_CACHE_FILL_POLL_SEC", 0.02)
+    stub_markets.delay = 0.2
+    caches = [make_cache(shared_redis) for _ in range(4)]
+
+    results = await asyncio.gather(*[c.get_or_fetch("k", search) for c in caches])
+
+    assert all(r == results[0] for r in results)
+    assert stub_markets.requests.count("search") == 1
+    assert sum(c.stats["upstream"] for c in caches) == 1
+
+
+@pytest.mark.asyncio
+async def test_waiting_process_fetches_itself_if_owner_is_slow(
+    stub_markets, shared_redis, metrics, monkeypatch
+):
+    monkeypatch.setattr(settings, "MARKET_CACHE_FILL_POLL_SEC", 0.02)
+    monkeypatch.setattr(settings, "MARKET_CACHE_FILL_WAIT_SEC", 0.1)
+    owner, waiter = make_cache(shared_redis), make_cache(shared_redis)
+    # Another process holds the fill lock but never stores a result
+    fakeredis.FakeRedis(server=shared_redis).set(
+        f"{settings.MARKET_CACHE_REDIS_PREFIX}:test:lock:k", "someone", ex=30
+    )
+
+    result = await waiter.get_or_fetch("k", search)
+
+    assert result[0]["id"] == "m1"
+    assert waiter.stats["upstream"] == 1
+    assert owner.stats["upstream"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_served_while_refreshing(
+    stub_markets, shared_redis, metrics
+):
+    cache = make_cache(shared_redis, ttl=0.1, stale_ttl=60)
+    first = await cache.get_or_fetch("k", search)
+    stub_markets.probability = 0.9
+    await asyncio.sleep(0.15)
+
+    stale = await cache.get_or_fetch("k", search)
+
+    assert stale == first
+    assert cache.stats["stale"] == 1
+    # The refresh runs in the background
+    await asyncio.gather(*[task for task, _ in cache._inflight.values()])
+    refreshed = cache.get("k")
+    assert refreshed is not None
+    assert refreshed[0]["probability"] == 0.9
+    assert stub_markets.requests.count("search") == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_fetched_again(stub_markets, shared_redis, metrics):
+    cache = make_cache(shared_redis, ttl=0.05, stale_ttl=0.05)
+    await cache.get_or_fetch("k", search)
+    stub_markets.probability = 0.9
+    await asyncio.sleep(0.15)
+
+    result = await cache.get_or_fetch("k", search)
+
+    assert result[0]["probability"] == 0.9
+    assert cache.stats["miss"] == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_errors_reach_every_waiter(shared_redis, metrics):
+    cache = make_cache(shared_redis)
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        raise ValueError("upstream down")
+
+    results = await asyncio.gather(
+        *[cache.get_or_fetch("k", failing) for _ in range(3)], return_exceptions=True
+    )
+
+    assert calls == 1
+    assert all(isinstance(r, ValueError) for r in results)
+    assert cache.get("k") is None
+    assert metrics.call_args.kwargs["status"] == "failure"
+
+
+@pytest.mark.asyncio
+async def test_metrics_record_hits_misses_and_upstream_calls(
+    stub_markets, shared_redis, metrics
+):
+    cache = make_cache(shared_redis)
+
+    await cache.get_or_fetch("k", search)
+    await cache.get_or_fetch("k", search)
+
+    calls = [(c.args, c.kwargs.get("status")) for c in metrics.call_args_list]
+    assert calls == [
+        (("market_cache", "test"), "miss"),
+        (("market_api", "test"), "success"),
+        (("market_cache", "test"), "hit"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_get_market_depth_does_not_cache_errors(
+    stub_markets, metrics, monkeypatch
+):
+    monkeypatch.setattr(
+        markets,
+        "_depth_cache",
+        MarketCache("depth", ttl=60, backend=LocalCacheBackend(maxsize=10, ttl=60)),
+    )
+    stub_markets.orderbook_status = 500
+
+    with patch.object(forecast, "_check_forecast_scope", return_value=True):
+        error = await forecast.get_market_depth.fn(market_id="RAIN")
+        stub_markets.orderbook_status = 200
+        ok = await forecast.get_market_depth.fn(market_id="RAIN")
+        again = await forecast.get_market_depth.fn(market_id="RAIN")
+
+    assert "error" in error
+    assert ok["midpoint"] == 0.51
+    assert again == ok
+    assert stub_markets.requests.count("orderbook") == 2
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_fetching(stub_markets, metrics):
+    client = MagicMock()
+    client.get.side_effect = redis.ConnectionError("down")
+    client.set.side_effect = redis.ConnectionError("down")
+    cache = MarketCache(
+        "test", ttl=30, backend=RedisCacheBackend("test", 30, redis_client=client)
+    )
+
+    result = await cache.get_or_fetch("k", search)
+
+    assert result[0]["id"] == "m1"
+
+
+@pytest.mark.asyncio
+async def test_redis_calls_run_off_the_event_loop(shared_redis, metrics):
+    client = fakeredis.FakeRedis(server=shared_redis)
+    loop_thread = threading.get_ident()
+    threads: list[int] = []
+    get, set_ = client.get, client.set
+
+    def record_get(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return get(*args, **kwargs)
+
+    def record_set(*args, **kwargs):
+        threads.append(threading.get_ident())
+        return set_(*args, **kwargs)
+
+    client.get = record_get  # type: ignore[method-assign]
+    client.set = record_set  # type: ignore[method-assign]
+    cache = MarketCache(
+        "test", ttl=30, backend=RedisCacheBackend("test", 60, redis_client=client)
+    )
+
+    async def fetch():
+        return [1]
+
+    assert await cache.get_or_fetch("k", fetch) == [1]
+    # Entry read, fill lock, entry write
+    assert len(threads) == 3
+    assert loop_thread not in threads
+
+
+def test_clear_removes_only_this_cache(shared_redis):
+    search_cache = make_cache(shared_redis)
+    other = MarketCache(
+        "other",
+        ttl=30,
+        backend=RedisCacheBackend(
+            "other", 30, redis_client=fakeredis.FakeRedis(server=shared_redis)
+        ),
+    )
+    search_cache.set("a", [1])
+    search_cache.set("b", [2])
+    other.set("a", [3])
+    assert len(search_cache) == 2
+
+    search_cache.clear()
+
+    assert len(search_cache) == 0
+    assert search_cache.get("a") is None
+    assert other.get("a") == [3]
+
+
+def test_redis_entries_expire_after_fresh_and_stale_windows(shared_redis):
+    client = fakeredis.FakeRedis(server=shared_redis)
+    backend = RedisCacheBackend("test", ttl=90, redis_client=client)
+    backend.set("k", {"a": 1}, time.time())
+
+    ttl = cast(int, client.ttl(f"{settings.MARKET_CACHE_REDIS_PREFIX}:test:k"))
+    assert 0 < ttl <= 90
+    entry = backend.get("k")
+    assert entry is not None
+    assert entry[0] == {"a": 1}
+
+
+@pytest.mark.parametrize(
+    "setting, backend_type",
+    [("memory", LocalCacheBackend), ("redis", RedisCacheBackend)],
+)
+def test_make_backend_follows_setting(monkeypatch, setting, backend_type):
+    monkeypatch.setattr(settings, "MARKET_CACHE_BACKEND", setting)
+
+    assert isinstance(make_backend("search", 10, 60), backend_type)
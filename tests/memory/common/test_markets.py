@@ -1,8 +1,15 @@
 """Tests for prediction market utilities."""
 
+import random
+import time
+
 import pytest
 
-from memory.common.markets import question_similarity
+from memory.common.markets import (
+    find_arbitrage_opportunities,
+    question_similarity,
+    question_tokens,
+)
 
 
 @pytest.mark.parametrize(
@@ -61,3 +68,137 @@ def test_question_similarity_case_insensitive():
     q1 = "TRUMP WINS 2024"
     q2 = "trump wins 2024"
     assert question_similarity(q1, q2) == 1.0
+
+
+def test_question_tokens_drops_punctuation_and_stop_words():
+    assert question_tokens("Will Trump win the 2024 election?") == {
+        "trump",
+        "win",
+        "2024",
+        "election",
+    }
+    assert question_tokens("") == frozenset()
+
+
+def make_market(source, id, question, probability):
+    return {"source": source, "id": id, "question": question, "probability": probability}
+
+
+def brute_force_arbitrage(markets, min_difference=0.05, min_similarity=0.4):
+    sources = list(dict.fromkeys(m["source"] for m in markets))
+    pairs = []
+    for a, s1 in enumerate(sources):
+        for s2 in sources[a + 1 :]:
+            for m1 in (m for m in markets if m["source"] == s1):
+                for m2 in (m for m in markets if m["source"] == s2):
+                    diff = abs(m1["probability"] - m2["probability"])
+                    similarity = question_similarity(m1["question"], m2["question"])
+                    if diff >= min_difference and similarity >= min_similarity:
+                        pairs.append((round(diff, 3), round(similarity, 3), m1["id"], m2["id"]))
+    return sorted(pairs, reverse=True)
+
+
+def test_find_arbitrage_opportunities_ranks_largest_gap_first():
+    markets = [
+        make_market("manifold", "m1", "Will Bitcoin hit 100k in 2025?", 0.5),
+        make_market("manifold", "m2", "Will Ethereum flip Bitcoin?", 0.2),
+        make_market("polymarket", "p1", "Bitcoin hit 100k 2025", 0.58),
+        make_market("polymarket", "p2", "Ethereum overtakes Bitcoin market cap", 0.6),
+        make_market("kalshi", "k1", "Will Bitcoin hit 100k in 2025?", 0.9),
+    ]
+
+    result = find_arbitrage_opportunities(markets)
+
+    assert [
+        (r["market_1"]["id"], r["market_2"]["id"], r["difference"]) for r in result
+    ] == [("m1", "k1", 0.4), ("p1", "k1", 0.32), ("m1", "p1", 0.08)]
+    assert result[0]["market_1"] == {
+        "source": "manifold",
+        "id": "m1",
+        "question": "Will Bitcoin hit 100k in 2025?",
+        "probability": 0.5,
+    }
+    assert result[0]["similarity"] == 1.0
+
+
+def test_find_arbitrage_opportunities_skips_same_source_and_small_gaps():
+    markets = [
+        make_market("manifold", "a", "Will it rain in Paris tomorrow?", 0.1),
+        make_market("manifold", "b", "Will it rain in Paris tomorrow?", 0.9),
+        make_market("kalshi", "c", "Will it rain in Paris tomorrow?", 0.12),
+        make_market("kalshi", "d", "Rain Paris tomorrow", None),
+        make_market(None, "e", "Will it rain in Paris tomorrow?", 0.5),
+    ]
+
+    result = find_arbitrage_opportunities(markets)
+
+    assert [(r["market_1"]["id"], r["market_2"]["id"]) for r in result] == [("b", "c")]
+
+
+def test_find_arbitrage_opportunities_returns_true_top_matches():
+    """The best pairs are found even when many weaker ones come first."""
+    markets = [
+        make_market("manifold", f"weak{i}", f"Will team {i} win the 2026 cup?", 0.5)
+        for i in range(50)
+    ] + [
+        make_market("polymarket", f"weak{i}", f"Team {i} wins 2026 cup", 0.56)
+        for i in range(50)
+    ]
+    markets.append(make_market("manifold", "best", "Will Mars landing happen 2030?", 0.1))
+    markets.append(make_market("kalshi", "best", "Mars landing happen 2030", 0.8))
+
+    result = find_arbitrage_opportunities(markets, limit=3)
+
+    assert result[0]["difference"] == 0.7
+    assert result[0]["market_1"]["id"] == result[0]["market_2"]["id"] == "best"
+    assert len(result) == 3
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_find_arbitrage_opportunities_matches_brute_force(seed):
+    rng = random.Random(seed)
+    vocabulary = [f"word{i}" for i in range(30)] + ["2025", "trump", "bitcoin"]
+    markets = [
+        make_market(
+            rng.choice(["manifold", "polymarket", "kalshi"]),
+            str(i),
+            " ".join(rng.sample(vocabulary, rng.randint(1, 6))),
+            round(rng.random(), 2),
+        )
+        for i in range(120)
+    ]
+
+    result = find_arbitrage_opportunities(markets, limit=10_000)
+
+    assert sorted(
+        (
+            r["difference"],
+            r["similarity"],
+            r["market_1"]["id"],
+            r["market_2"]["id"],
+        )
+        for r in result
+    ) == sorted(brute_force_arbitrage(markets))
+    assert [r["difference"] for r in result] == sorted(
+        (r["difference"] for r in result), reverse=True
+    )
+
+
+def test_find_arbitrage_opportunities_scales_to_thousands_of_markets():
+    rng = random.Random(0)
+    vocabulary = [f"topic{i}" for i in range(2000)]
+    markets = [
+        make_market(
+            source,
+            f"{source}{i}",
+            "Will " + " ".join(rng.sample(vocabulary, 5)) + " happen by 2026?",
+            rng.random(),
+        )
+        for source in ("manifold", "polymarket", "kalshi")
+        for i in range(2000)
+    ]
+
+    start = time.monotonic()
+    find_arbitrage_opportunities(markets)
+
+    assert time.monotonic() - start < 2
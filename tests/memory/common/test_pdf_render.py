@@ -0,0 +1,93 @@
+# pyright: reportAttributeAccessIssue=false
+# PyMuPDF's `pymupdf.open` (== Document) ships incomplete stubs that omit
+# Document.new_page; the methods exist at runtime.
+from unittest.mock import patch
+
+import psutil
+import pymupdf
+import pytest
+
+from memory.common.pdf_render import render_pages
+
+
+def make_pdf(path, pages: int):
+    doc = pymupdf.open()
+    for i in range(pages):
+        page = doc.new_page(width=612, height=792)
+        page.insert_text((72, 72), f"Page {i} " + "lorem ipsum " * 20, fontsize=9)
+        for j in range(20):
+            page.draw_rect(
+                pymupdf.Rect(72, 100 + j * 30, 540, 120 + j * 30),
+                color=(j / 20, i % 7 / 7, 0.5),
+                fill=(0.9, j / 20, i % 5 / 5),
+            )
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_render_pages_in_order(tmp_path, workers):
+    pdf = make_pdf(tmp_path / "doc.pdf", 7)
+
+    pages = list(render_pages(pdf, tmp_path / "out", workers=workers, with_text=True))
+
+    assert [p.number for p in pages] == list(range(7))
+    assert all(p.path.exists() for p in pages)
+    assert all(p.text and p.text.startswith(f"Page {p.number}") for p in pages)
+    assert len({p.path for p in pages}) == 7
+
+
+def test_render_pages_without_text(tmp_path):
+    pdf = make_pdf(tmp_path / "doc.pdf", 1)
+
+    (page,) = render_pages(pdf, tmp_path / "out")
+
+    assert page.text is None
+    assert page.pixel_size == (612, 792)
+    assert (page.width, page.height) == (612, 792)
+
+
+def test_daemonic_process_renders_in_process(tmp_path):
+    pdf = make_pdf(tmp_path / "doc.pdf", 3)
+
+    with (
+        patch("multiprocessing.current_process") as current_process,
+        patch("memory.common.pdf_render._render_in_pool") as render_in_pool,
+    ):
+        current_process.return_value.daemon = True
+        pages = list(render_pages(pdf, tmp_path / "out", workers=4))
+
+    render_in_pool.assert_not_called()
+    assert [p.number for p in pages] == [0, 1, 2]
+    assert all(p.path.exists() for p in pages)
+
+
+def test_stopping_early_removes_pages_rendered_ahead(tmp_path):
+    pdf = make_pdf(tmp_path / "doc.pdf", 20)
+    out = tmp_path / "out"
+
+    pages = render_pages(pdf, out, workers=2)
+    first = next(pages)
+    pages.close()
+
+    assert list(out.iterdir()) == [first.path]
+
+
+def test_render_pages_memory_stays_flat(tmp_path):
+    """A long document renders in parallel with flat memory use.
+
+    Peak memory is sampled while pages stream through, and must not grow with
+    the page count: the rendered rasters go to disk, not into the process.
+    """
+    pdf = make_pdf(tmp_path / "long.pdf", 300)
+    process = psutil.Process()
+
+    baseline = process.memory_info().rss
+    peak = baseline
+    for page in render_pages(pdf, tmp_path / "out", workers=4):
+        peak = max(peak, process.memory_info().rss)
+        page.path.unlink()
+
+    # Each page is ~1.4 MiB of RGB; holding all of them would be ~400 MiB
+    assert (peak - baseline) / 2**20 < 64
@@ -12,6 +12,7 @@ from memory.common.qdrant import (
     upsert_vectors,
     delete_points,
     batch_ids,
+    set_payloads,
 )
 
 
@@ -109,3 +110,15 @@ def test_batch_ids(mock_qdrant_client):
         ["1", "2"],
         ["3", "4"],
     ]
+
+
+def test_set_payloads_batches_points(mock_qdrant_client):
+    ids = [str(i) for i in range(5)]
+
+    set_payloads(mock_qdrant_client, "test_collection", ids, {"people": [1]}, batch_size=2)
+
+    calls = mock_qdrant_client.set_payload.call_args_list
+    assert [call.kwargs["points"] for call in calls] == [["0", "1"], ["2", "3"], ["4"]]
+    for call in calls:
+        assert call.kwargs["collection_name"] == "test_collection"
+        assert call.kwargs["payload"] == {"people": [1]}
@@ -0,0 +1,221 @@
+"""Tests for the session transcript sidecar index."""
+
+import json
+import os
+from unittest.mock import patch
+
+from memory.common import session_index
+
+
+def write_events(path, uuids, mode="w"):
+    with open(path, mode) as f:
+        for u in uuids:
+            f.write(json.dumps({"uuid": u, "type": "user"}) + "\n")
+
+
+def test_index_path_sits_next_to_transcript(tmp_path):
+    transcript = tmp_path / "1" / "abc.jsonl"
+    assert session_index.index_path(transcript) == tmp_path / "1" / "abc.index.sqlite"
+
+
+def test_sync_index_builds_from_scratch(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a", "b", "c"])
+
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        end = session_index.sync_index(idx, fh)
+        assert end == transcript.stat().st_size
+        assert session_index.existing_uuids(idx, ["a", "c", "z"]) == {"a", "c"}
+
+
+def test_sync_index_catches_up_from_recorded_offset(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a"])
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+
+    # Appended by something that didn't update the index
+    write_events(transcript, ["b"], mode="a")
+
+    with (
+        open(transcript, "rb") as fh,
+        session_index.open_index(transcript) as idx,
+        patch.object(
+            session_index, "scan_transcript", wraps=session_index.scan_transcript
+        ) as scan,
+    ):
+        session_index.sync_index(idx, fh)
+        assert session_index.existing_uuids(idx, ["a", "b"]) == {"a", "b"}
+
+    first_line = len(json.dumps({"uuid": "a", "type": "user"})) + 1
+    scan.assert_called_once_with(fh, first_line, 1)
+
+
+def test_sync_index_rebuilds_when_transcript_shrinks(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a", "b"])
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+
+    write_events(transcript, ["c"])
+
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+        assert session_index.existing_uuids(idx, ["a", "b", "c"]) == {"c"}
+
+
+def test_sync_index_rebuilds_when_transcript_replaced(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a", "b"])
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+
+    # Same length, different file (e.g. restored from backup)
+    replacement = tmp_path / "new.jsonl"
+    write_events(replacement, ["x", "y"])
+    os.replace(replacement, transcript)
+
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+        assert session_index.existing_uuids(idx, ["a", "b", "x", "y"]) == {"x", "y"}
+
+
+def test_scan_transcript_ignores_partial_trailing_line(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a"])
+    with open(transcript, "a") as f:
+        f.write('{"uuid": "half')
+
+    with open(transcript, "rb") as fh:
+        scan = session_index.scan_transcript(fh)
+
+    assert scan.uuids == ["a"]
+    assert scan.end == len(json.dumps({"uuid": "a", "type": "user"})) + 1
+    assert scan.lines == 1
+
+
+def test_scan_transcript_skips_malformed_lines(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text('not json\n\n[1, 2]\n{"uuid": "a"}\n{"no_uuid": 1}\n')
+
+    with open(transcript, "rb") as fh:
+        scan = session_index.scan_transcript(fh)
+
+    assert scan.uuids == ["a"]
+    assert scan.lines == 5
+    assert scan.events == 4
+
+
+def test_scan_transcript_records_checkpoints(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text("".join(f"{i:04d}\n" for i in range(25)))
+
+    with (
+        patch.object(session_index, "CHECKPOINT_INTERVAL", 10),
+        open(transcript, "rb") as fh,
+    ):
+        scan = session_index.scan_transcript(fh, start=15, first_line=3)
+
+    # line 3 starts at byte 15; lines 10 and 20 fall 7 and 17 lines later
+    assert scan.checkpoints == [(10, 50), (20, 100)]
+
+
+def test_existing_uuids_handles_more_than_one_chunk(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    uuids = [f"u{i}" for i in range(session_index.LOOKUP_CHUNK_SIZE * 2 + 7)]
+    write_events(transcript, uuids[::2])
+
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+        assert session_index.existing_uuids(idx, uuids) == set(uuids[::2])
+
+
+def test_record_append_advances_offset(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a"])
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+
+    start = transcript.stat().st_size
+    write_events(transcript, ["b"], mode="a")
+    with session_index.open_index(transcript) as idx:
+        session_index.record_append(
+            idx, ["b"], b'{"uuid": "b", "type": "user"}\n', start
+        )
+
+    with (
+        open(transcript, "rb") as fh,
+        session_index.open_index(transcript) as idx,
+        patch.object(session_index, "scan_transcript") as scan,
+    ):
+        session_index.sync_index(idx, fh)
+        assert session_index.existing_uuids(idx, ["a", "b"]) == {"a", "b"}
+
+    scan.assert_not_called()
+
+
+def test_remove_index(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a"])
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+
+    assert session_index.remove_index(transcript) is True
+    assert not session_index.index_path(transcript).exists()
+    assert session_index.remove_index(transcript) is False
+
+
+def test_record_append_tracks_lines_and_checkpoints(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    transcript.write_text("".join(f"{i:04d}\n" for i in range(9)) + "part")
+
+    with (
+        patch.object(session_index, "CHECKPOINT_INTERVAL", 10),
+        open(transcript, "a+b") as fh,
+        session_index.open_index(transcript) as idx,
+    ):
+        assert session_index.sync_index(idx, fh) == 45
+        start = fh.seek(0, 2)
+        # The leading newline terminates the cut-off "part" line (line 9),
+        # so the first appended line is line 10 at byte 50.
+        payload = b"\n" + b"".join(f"{i:04d}\n".encode() for i in range(3))
+        fh.write(payload)
+        fh.flush()
+        session_index.record_append(idx, [], payload, start)
+
+        with session_index.read_index(transcript, fh) as view:
+            assert view is not None
+            assert view.complete
+            assert view.indexed_lines == 13
+            assert view.indexed_events == 13
+            assert view.checkpoint_before(12) == (10, 50)
+            assert view.checkpoint_before(9) == (0, 0)
+
+
+def test_read_index_ignores_missing_or_mismatched_index(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a", "b"])
+
+    with open(transcript, "rb") as fh, session_index.read_index(transcript, fh) as view:
+        assert view is None
+    assert not session_index.index_path(transcript).exists()
+
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+
+    write_events(transcript, ["c"])
+    with open(transcript, "rb") as fh, session_index.read_index(transcript, fh) as view:
+        assert view is None
+
+
+def test_read_index_reports_stale_index_as_incomplete(tmp_path):
+    transcript = tmp_path / "t.jsonl"
+    write_events(transcript, ["a"])
+    with open(transcript, "rb") as fh, session_index.open_index(transcript) as idx:
+        session_index.sync_index(idx, fh)
+    write_events(transcript, ["b"], mode="a")
+
+    with open(transcript, "rb") as fh, session_index.read_index(transcript, fh) as view:
+        assert view is not None
+        assert not view.complete
+        assert view.checkpoint_before(1) == (0, 0)
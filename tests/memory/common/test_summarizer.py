@@ -1,5 +1,10 @@
-from memory.common import summarizer
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
 import pytest
+import redis
+
+from memory.common import settings, summarizer
 
 
 @pytest.mark.parametrize(
@@ -149,3 +154,86 @@ import pytest
 )
 def test_parse_response(response, expected):
     assert summarizer.parse_response(response) == expected
+
+
+RESPONSE = "<summary>short</summary><tags><tag>tag1</tag><tag>tag2</tag></tags>"
+LONG_TEXT = "A sentence about the ingest pipeline. " * 300
+
+
+@pytest.fixture
+def llm():
+    with patch.object(summarizer.llms, "summarize", return_value=RESPONSE) as mock:
+        yield mock
+
+
+@pytest.fixture(autouse=True)
+def reset_cache(monkeypatch):
+    # The autouse MockRedis is patched in per test, so don't reuse a client
+    monkeypatch.setattr(summarizer, "_cache_client", None)
+    monkeypatch.setattr(summarizer, "cache_stats", Counter())
+
+
+@pytest.mark.parametrize("content", ["A short note about caching.", LONG_TEXT])
+def test_summarize_reuses_cached_result(llm, content):
+    first = summarizer.summarize(content)
+    second = summarizer.summarize(content)
+
+    assert first == second == ("short", ["tag1", "tag2"])
+    assert llm.call_count == 1
+    assert summarizer.cache_stats == {"miss": 1, "hit": 1}
+
+
+def test_reingesting_unchanged_corpus_makes_no_llm_calls(llm):
+    corpus = [f"Document {i}. " + LONG_TEXT for i in range(5)]
+    for doc in corpus:
+        summarizer.summarize(doc)
+    llm.reset_mock()
+
+    for doc in corpus:
+        summarizer.summarize(doc)
+
+    llm.assert_not_called()
+    assert summarizer.cache_stats["hit"] == 5
+
+
+def test_cache_is_keyed_by_content_model_and_prompt_version(llm, monkeypatch):
+    summarizer.summarize(LONG_TEXT)
+    summarizer.summarize(LONG_TEXT + " One more sentence.")
+    summarizer.summarize(LONG_TEXT, target_tokens=50)
+    monkeypatch.setattr(settings, "SUMMARIZER_MODEL", "openai/gpt-4o-mini")
+    summarizer.summarize(LONG_TEXT)
+    monkeypatch.setattr(summarizer, "PROMPT_VERSION", summarizer.PROMPT_VERSION + 1)
+    summarizer.summarize(LONG_TEXT)
+
+    assert llm.call_count == 5
+
+
+def test_failed_and_empty_responses_are_not_cached(llm):
+    llm.side_effect = [RuntimeError("overloaded"), "", RESPONSE, RESPONSE]
+
+    assert summarizer.summarize("Some text to tag.") == ("Some text to tag.", [])
+    assert summarizer.summarize("Some text to tag.") == ("", [])
+    assert summarizer.summarize("Some text to tag.") == ("short", ["tag1", "tag2"])
+    assert summarizer.summarize("Some text to tag.") == ("short", ["tag1", "tag2"])
+
+    assert llm.call_count == 3
+
+
+def test_cache_can_be_disabled(llm, monkeypatch):
+    monkeypatch.setattr(settings, "SUMMARY_CACHE_ENABLED", False)
+
+    summarizer.summarize(LONG_TEXT)
+    summarizer.summarize(LONG_TEXT)
+
+    assert llm.call_count == 2
+    assert not summarizer.cache_stats
+
+
+def test_redis_errors_fall_back_to_llm(llm, monkeypatch):
+    client = MagicMock()
+    client.get.side_effect = redis.ConnectionError("down")
+    client.set.side_effect = redis.ConnectionError("down")
+    monkeypatch.setattr(summarizer, "_cache_client", client)
+
+    assert summarizer.summarize(LONG_TEXT) == ("short", ["tag1", "tag2"])
+    assert llm.call_count == 1
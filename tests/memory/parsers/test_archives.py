@@ -1,8 +1,12 @@
+import itertools
+import threading
+import time
 from unittest.mock import patch
 from urllib.parse import urlparse, parse_qs
 
 import pytest
 
+from memory.parsers import archives
 from memory.parsers.archives import (
     ArchiveFetcher,
     LinkFetcher,
@@ -13,6 +17,8 @@ from memory.parsers.archives import (
     html_parser,
     get_archive_fetcher,
     FETCHER_REGISTRY,
+    TokenBucket,
+    host_bucket,
 )
 from typing import Generator
 
@@ -512,3 +518,193 @@ def test_registry_pattern_matching(pattern, test_url, should_match):
 
     match = re.search(pattern, test_url.rstrip("/"))
     assert bool(match) == should_match
+
+
+class SlowPages:
+    """Numbered archive pages that take ``latency`` seconds each to fetch,
+    ``pages`` of them with one item each."""
+
+    def __init__(self, pages: int, latency: float = 0.0):
+        self.pages = pages
+        self.latency = latency
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.started: list[float] = []
+        self.fetched: list[str] = []
+
+    def parser(self):
+        pages = self
+
+        class SlowParser(MockParser):
+            def __init__(self, url: str):
+                super().__init__(url)
+
+            def fetch_content(self, **kwargs) -> str:
+                if not self.content:
+                    self.content = pages.fetch(self.url)
+                return self.content
+
+            def parse_feed(self):
+                page = int(self.fetch_content())
+                if page < pages.pages:
+                    yield FeedItem(title=f"Post {page}", url=f"{self.url}#post")
+
+        return SlowParser
+
+    def fetch(self, url: str) -> str:
+        with self.lock:
+            self.started.append(time.monotonic())
+            self.fetched.append(url)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.latency)
+        with self.lock:
+            self.in_flight -= 1
+        return parse_qs(urlparse(url).query).get("page", ["0"])[0]
+
+
+def paged_fetcher(pages: SlowPages, **kwargs) -> HTMLNextUrlArchiveFetcher:
+    class PagedFetcher(HTMLNextUrlArchiveFetcher):
+        def _page_url(self, page: int) -> str:
+            return f"https://example.com/archive?page={page}"
+
+    return PagedFetcher(pages.parser(), "https://example.com/archive", **kwargs)
+
+
+@pytest.fixture(autouse=True)
+def clear_host_buckets():
+    archives._host_buckets.clear()
+    yield
+    archives._host_buckets.clear()
+
+
+def test_token_bucket_allows_a_burst_then_paces():
+    clock = [100.0]
+    with (
+        patch("memory.parsers.archives.time.monotonic", side_effect=lambda: clock[0]),
+        patch("memory.parsers.archives.time.sleep") as mock_sleep,
+    ):
+        bucket = TokenBucket(rate=2.0, burst=3)
+        for _ in range(5):
+            bucket.acquire()
+        waits = [c.args[0] for c in mock_sleep.call_args_list]
+        assert waits == [0.5, 1.0]
+
+        # Tokens refill while idle, up to the burst
+        clock[0] += 60
+        mock_sleep.reset_mock()
+        for _ in range(3):
+            bucket.acquire()
+        mock_sleep.assert_not_called()
+
+
+def test_host_bucket_is_shared_per_host():
+    a = host_bucket("https://Example.com/archive", 1.0, 4)
+    assert host_bucket("https://example.com/other", 1.0, 4) is a
+    assert host_bucket("https://other.com/archive", 1.0, 4) is not a
+
+
+def test_numbered_pages_are_fetched_concurrently():
+    pages = SlowPages(pages=13, latency=0.1)
+    fetcher = paged_fetcher(pages, delay_between_requests=0, concurrency=4)
+
+    start = time.monotonic()
+    items = list(fetcher.fetch_all_items())
+    elapsed = time.monotonic() - start
+
+    # Items come out in page order, however the fetches finished
+    assert [item.title for item in items] == [f"Post {i}" for i in range(13)]
+    assert pages.max_in_flight == 4
+    # 14 pages one at a time would take 1.4s
+    assert elapsed < 0.8
+
+
+def test_concurrent_crawl_respects_the_host_rate():
+    pages = SlowPages(pages=12)
+    fetcher = paged_fetcher(pages, delay_between_requests=0.05, concurrency=4)
+
+    assert len(list(fetcher.fetch_all_items())) == 12
+
+    # The 12 prefetched pages: a burst of 4, then one per 50ms
+    prefetched = pages.started[1:]
+    assert prefetched[-1] - prefetched[0] >= (len(prefetched) - 4) * 0.05 * 0.9
+
+
+def test_concurrent_crawl_stops_fetching_ahead_when_done():
+    pages = SlowPages(pages=3, latency=0.02)
+    fetcher = paged_fetcher(
+        pages, max_pages=100, delay_between_requests=0, concurrency=4
+    )
+
+    assert len(list(fetcher.fetch_all_items())) == 3
+    # Page 3 is empty; at most a window's worth of pages past it were fetched
+    assert len(pages.fetched) <= 4 + 4
+
+
+def test_concurrent_crawl_stops_at_max_pages():
+    pages = SlowPages(pages=100)
+    fetcher = paged_fetcher(pages, max_pages=5, delay_between_requests=0)
+
+    assert len(list(fetcher.fetch_all_items())) == 5
+    assert len(pages.fetched) == 5
+
+
+def test_concurrent_crawl_error_stops_the_crawl():
+    pages = SlowPages(pages=10)
+    fetcher = paged_fetcher(pages, delay_between_requests=0, concurrency=2)
+
+    def fetch(url):
+        if url.endswith("page=3"):
+            raise ValueError("Network error")
+        return SlowPages.fetch(pages, url)
+
+    with patch.object(pages, "fetch", side_effect=fetch):
+        items = list(fetcher.fetch_all_items())
+
+    assert [item.title for item in items] == ["Post 0", "Post 1", "Post 2"]
+
+
+@pytest.mark.parametrize(
+    "fetcher, expected",
+    [
+        (
+            LinkFetcher(MockParser, "https://example.com/api", per_page=5),
+            [
+                "https://example.com/api?offset=5&limit=5",
+                "https://example.com/api?offset=10&limit=5",
+            ],
+        ),
+        (
+            HTMLNextUrlArchiveFetcher(
+                MockParser, "https://example.com", next_url="archive"
+            ),
+            ["https://example.com/archive/1", "https://example.com/archive/2"],
+        ),
+    ],
+)
+def test_numbered_page_urls(fetcher, expected):
+    urls = fetcher._page_urls(MockParser(fetcher.start_url))
+    assert list(itertools.islice(urls, 2)) == expected
+
+
+def test_acoup_page_urls_are_the_later_months():
+    html = """
+    <div class="widget_archive">
+        <a href="https://acoup.blog/2019/07/">July 2019</a>
+        <a href="https://acoup.blog/2019/06/">June 2019</a>
+        <a href="https://acoup.blog/2019/05/">May 2019</a>
+    </div>
+    """
+    fetcher = ACOUPArchiveFetcher(MockParser, "https://acoup.blog/2019/05/")
+    parser = MockParser("https://acoup.blog/2019/05/", content=html)
+
+    assert list(fetcher._page_urls(parser)) == [
+        "https://acoup.blog/2019/06/",
+        "https://acoup.blog/2019/07/",
+    ]
+
+
+def test_next_link_archives_are_crawled_one_page_at_a_time():
+    fetcher = HTMLArchiveFetcher(MockParser, "https://example.com")
+    assert fetcher._page_urls(MockParser("https://example.com")) is None
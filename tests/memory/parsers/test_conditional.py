@@ -0,0 +1,346 @@
+"""Tests for conditional feed fetching, against a local stub feed host."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from memory.parsers import conditional
+from memory.parsers.archives import ArchiveFetcher, HTMLNextUrlArchiveFetcher
+from memory.parsers.conditional import (
+    Validators,
+    conditional_headers,
+    fetch_if_changed,
+    load_validators,
+    save_validators,
+)
+from memory.parsers.feeds import FeedParser, JSONParser, RSSAtomParser, get_feed_parser
+
+LAST_MODIFIED = "Mon, 02 Jan 2023 03:04:05 GMT"
+
+
+def rss(count: int, start: int = 0) -> str:
+    items = "".join(
+        f"<item><title>Post {i}</title><link>https://example.com/{i}</link>"
+        f"<description>{'words ' * 50}</description></item>"
+        for i in range(start, start + count)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>T</title>{items}</channel></rss>'
+
+
+class FeedServer(ThreadingHTTPServer):
+    """Serves ``pages``: path -> (body, validators), where validators is
+    "etag", "last-modified" or "none" (always a full 200)."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), FeedHandler)
+        self.pages: dict[str, tuple[str, str]] = {}
+        self.responses: list[tuple[str, int, int]] = []  # path, status, bytes
+        self.lock = threading.Lock()
+        self.metrics = MagicMock()  # the patched record_metric, once serving
+
+    def url(self, path: str) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}{path}"
+
+    def statuses(self, path: str) -> list[int]:
+        return [status for p, status, _ in self.responses if p == path]
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = cast(FeedServer, self.server)
+        body, validators = server.pages[self.path]
+        etag = f'"{abs(hash(body))}"'
+        not_modified = (
+            validators == "etag" and self.headers.get("If-None-Match") == etag
+        ) or (
+            validators == "last-modified"
+            and self.headers.get("If-Modified-Since") == LAST_MODIFIED
+        )
+        data = b"" if not_modified else body.encode()
+        with server.lock:
+            server.responses.append(
+                (self.path, 304 if not_modified else 200, len(data))
+            )
+
+        self.send_response(304 if not_modified else 200)
+        if validators == "etag":
+            self.send_header("ETag", etag)
+        if validators == "last-modified":
+            self.send_header("Last-Modified", LAST_MODIFIED)
+        if not not_modified:
+            self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def feeds():
+    server = FeedServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    with (
+        patch("memory.parsers.html.is_safe_url", return_value=True),
+        patch("memory.parsers.conditional.record_metric") as record,
+    ):
+        server.metrics = record
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize("validators", ["etag", "last-modified"])
+def test_committed_validators_turn_refetch_into_304(feeds, validators):
+    feeds.pages["/feed.xml"] = (rss(5), validators)
+    url = feeds.url("/feed.xml")
+
+    first = fetch_if_changed(url)
+    first.commit(parse_ms=12.5)
+    second = fetch_if_changed(url)
+
+    assert first.status == "fetched"
+    assert first.content == rss(5)
+    assert second.status == "not_modified"
+    assert second.content == ""
+    assert second.bytes_saved == len(rss(5))
+    assert second.parse_ms_saved == 12.5
+    assert feeds.statuses("/feed.xml") == [200, 304]
+
+
+def test_uncommitted_fetch_is_not_skipped(feeds):
+    feeds.pages["/feed.xml"] = (rss(5), "etag")
+    url = feeds.url("/feed.xml")
+
+    fetch_if_changed(url)
+    again = fetch_if_changed(url)
+
+    assert again.status == "fetched"
+    assert again.content == rss(5)
+
+
+def test_same_body_without_validators_is_unchanged(feeds):
+    feeds.pages["/feed.json"] = (json.dumps([{"url": "https://example.com/1"}]), "none")
+    url = feeds.url("/feed.json")
+
+    fetch_if_changed(url).commit(parse_ms=3.0)
+    again = fetch_if_changed(url)
+
+    assert again.status == "unchanged"
+    assert again.content == ""
+    assert again.bytes_saved == 0
+    assert again.parse_ms_saved == 3.0
+    assert again.downloaded > 0
+
+
+def test_changed_body_is_fetched(feeds):
+    feeds.pages["/feed.xml"] = (rss(5), "etag")
+    url = feeds.url("/feed.xml")
+    fetch_if_changed(url).commit()
+
+    feeds.pages["/feed.xml"] = (rss(6), "etag")
+    again = fetch_if_changed(url)
+
+    assert again.status == "fetched"
+    assert again.content == rss(6)
+    assert again.validators and again.previous
+    assert again.validators.sha256 != again.previous.sha256
+
+
+def test_fetches_are_recorded_as_metrics(feeds):
+    feeds.pages["/feed.xml"] = (rss(5), "etag")
+    url = feeds.url("/feed.xml")
+    fetch_if_changed(url).commit(parse_ms=4.0)
+    fetch_if_changed(url)
+
+    calls = [
+        (c.kwargs["status"], c.kwargs["value"], c.kwargs["duration_ms"])
+        for c in feeds.metrics.call_args_list
+    ]
+    assert calls == [("fetched", 0, 0.0), ("not_modified", len(rss(5)), 4.0)]
+
+
+def test_conditional_headers():
+    assert conditional_headers(None) == {}
+    assert conditional_headers(
+        Validators(etag='"abc"', last_modified=LAST_MODIFIED)
+    ) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": LAST_MODIFIED,
+    }
+    # The caller's date is only used when the server never sent one
+    from datetime import datetime
+
+    assert conditional_headers(
+        Validators(etag='"abc"'), datetime(2023, 1, 2, 3, 4, 5)
+    ) == {
+        "If-None-Match": '"abc"',
+        "If-Modified-Since": LAST_MODIFIED,
+    }
+
+
+def test_redis_errors_mean_no_validators():
+    with patch.object(conditional, "_get_client") as get_client:
+        get_client.return_value.get.side_effect = redis.ConnectionError("down")
+        get_client.return_value.set.side_effect = redis.ConnectionError("down")
+        save_validators("https://example.com/feed", Validators(sha256="x"))
+        assert load_validators("https://example.com/feed") is None
+
+
+def test_json_feed_parses_nothing_when_unchanged(feeds):
+    feeds.pages["/feed.json"] = (
+        json.dumps(
+            [{"url": f"https://example.com/{i}", "title": "t"} for i in range(3)]
+        ),
+        "none",
+    )
+    url = feeds.url("/feed.json")
+
+    first = JSONParser(url=url, conditional=True)
+    assert [item.url for item in first.parse_feed()] == [
+        f"https://example.com/{i}" for i in range(3)
+    ]
+    first.commit_fetch()
+    second = JSONParser(url=url, conditional=True)
+    assert list(second.parse_feed()) == []
+
+    assert first.fetched and first.fetched.status == "fetched"
+    assert second.fetched and second.fetched.status == "unchanged"
+    saved = load_validators(url)
+    assert saved is not None and saved.parse_ms > 0
+
+
+def test_validators_are_saved_only_when_the_parser_commits(feeds):
+    feeds.pages["/feed.xml"] = (rss(3), "etag")
+    url = feeds.url("/feed.xml")
+
+    parser = RSSAtomParser(url=url, conditional=True)
+    assert len(list(parser.parse_feed())) == 3
+    # Parsed, but the items may not have been dispatched yet
+    assert load_validators(url) is None
+
+    parser.commit_fetch()
+    assert load_validators(url) is not None
+
+
+def test_get_feed_parser_skips_unchanged_feed(feeds):
+    feeds.pages["/feed.xml"] = (rss(3), "etag")
+    url = feeds.url("/feed.xml")
+
+    parser = get_feed_parser(url, conditional=True)
+    assert isinstance(parser, RSSAtomParser)
+    assert len(list(parser.parse_feed())) == 3
+    parser.commit_fetch()
+
+    parser = get_feed_parser(url, conditional=True)
+    assert type(parser) is FeedParser
+    assert list(parser.parse_feed()) == []
+    assert parser.fetched and parser.fetched.status == "not_modified"
+    assert feeds.statuses("/feed.xml") == [200, 304]
+
+
+def test_get_feed_parser_never_skips_the_page_linking_to_the_feed(feeds):
+    feeds.pages["/feed.xml"] = (rss(3), "etag")
+    feeds.pages["/blog"] = (
+        '<html><head><link rel="alternate" type="application/rss+xml" '
+        'href="/feed.xml"></head><body></body></html>',
+        "none",
+    )
+    url = feeds.url("/blog")
+
+    for _ in range(2):
+        parser = get_feed_parser(url, conditional=True)
+        assert isinstance(parser, RSSAtomParser)
+        list(parser.parse_feed())
+        parser.commit_fetch()
+
+    assert feeds.statuses("/blog") == [200, 200]
+    assert feeds.statuses("/feed.xml") == [200, 304]
+
+
+def test_conditional_archive_crawl_stops_at_unchanged_page(feeds):
+    feeds.pages["/archive"] = (rss(3), "etag")
+    fetcher = ArchiveFetcher(
+        RSSAtomParser, feeds.url("/archive"), delay_between_requests=0, conditional=True
+    )
+
+    assert len(list(fetcher.fetch_all_items())) == 3
+    fetcher.commit()
+    assert list(fetcher.fetch_all_items()) == []
+    assert feeds.statuses("/archive") == [200, 304]
+
+
+def test_uncommitted_archive_crawl_is_repeated_in_full(feeds):
+    feeds.pages["/archive"] = (rss(3), "etag")
+    fetcher = ArchiveFetcher(
+        RSSAtomParser, feeds.url("/archive"), delay_between_requests=0, conditional=True
+    )
+
+    assert len(list(fetcher.fetch_all_items())) == 3
+    fetcher.parsed_pages.clear()  # as if dispatching the items failed
+    assert len(list(fetcher.fetch_all_items())) == 3
+    assert feeds.statuses("/archive") == [200, 200]
+
+
+def test_unchanged_prefetched_page_is_fetched_once(feeds):
+    feeds.pages["/archive"] = (rss(3), "etag")
+    feeds.pages["/archive/1"] = (rss(3, start=3), "etag")
+    fetcher = HTMLNextUrlArchiveFetcher(
+        RSSAtomParser,
+        feeds.url("/archive"),
+        max_pages=2,
+        delay_between_requests=0,
+        conditional=True,
+        concurrency=1,
+    )
+
+    assert len(list(fetcher.fetch_all_items())) == 6
+    fetcher.commit()
+    feeds.pages["/archive"] = (rss(4), "etag")
+    assert len(list(fetcher.fetch_all_items())) == 4
+
+    assert feeds.statuses("/archive") == [200, 200]
+    assert feeds.statuses("/archive/1") == [200, 304]
+
+
+def test_sync_cycle_savings(feeds):
+    """A cycle over 40 unchanged feeds, with and without saved validators."""
+    for i in range(40):
+        validators = "etag" if i % 2 else "none"
+        feeds.pages[f"/{i}.xml"] = (rss(100, start=i * 100), validators)
+    urls = [feeds.url(f"/{i}.xml") for i in range(40)]
+
+    def cycle():
+        parsers = [get_feed_parser(url, conditional=True) for url in urls]
+        assert all(parsers)
+        items = 0
+        for parser in cast(list[FeedParser], parsers):
+            items += len(list(parser.parse_feed()))
+            parser.commit_fetch()
+        return items, [p.fetched for p in cast(list[FeedParser], parsers)]
+
+    first_items, _ = cycle()
+    feeds.responses.clear()
+    second_items, fetched = cycle()
+
+    assert first_items == 4000
+    assert second_items == 0
+    assert all(fetched)
+    results = [f for f in fetched if f]
+    assert {f.status for f in results} == {"not_modified", "unchanged"}
+    # Every etag feed came back as an empty 304
+    downloaded = sum(size for _, _, size in feeds.responses)
+    assert sum(f.bytes_saved for f in results) == sum(
+        len(rss(100, start=i * 100)) for i in range(1, 40, 2)
+    )
+    assert downloaded == sum(len(rss(100, start=i * 100)) for i in range(0, 40, 2))
+    # No feed was parsed again, and the time that saved is reported
+    assert all(f.parse_ms_saved > 0 for f in results)
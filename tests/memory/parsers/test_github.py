@@ -742,6 +742,217 @@ def test_fetch_project_fields_graphql_error():
     assert fields is None
 
 
+def project_items(project, status):
+    return {
+        "projectItems": {
+            "nodes": [
+                {
+                    "project": {"title": project},
+                    "fieldValues": {
+                        "nodes": [{"name": status, "field": {"name": "Status"}}]
+                    },
+                }
+            ]
+        }
+    }
+
+
+def test_fetch_project_fields_batch_uses_one_aliased_query():
+    """Test project fields for a page of issues come from a single query."""
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+
+    graphql_data = {
+        "repository": {
+            "item_1": project_items("Board", "Todo"),
+            "item_2": {"projectItems": {"nodes": []}},
+            "item_3": None,  # deleted
+        }
+    }
+
+    with patch.object(requests.Session, "post") as mock_post:
+        mock_post.return_value = mock_graphql_response(graphql_data)
+        client = GithubClient(credentials)
+        fields = client.fetch_project_fields_batch("owner", "repo", [1, 2, 3])
+
+    assert fields == {1: {"Board.Status": "Todo"}, 2: None, 3: None}
+    mock_post.assert_called_once()
+    query = mock_post.call_args.kwargs["json"]["query"]
+    assert "item_1: issue(number: 1)" in query
+    assert "item_3: issue(number: 3)" in query
+
+
+def test_fetch_project_fields_batch_treats_errored_items_as_missing():
+    """Test an item with a GraphQL error isn't parsed from its partial data."""
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+
+    graphql_data = {
+        "repository": {
+            "item_1": project_items("Board", "Todo"),
+            "item_2": project_items("Board", "Done"),
+        }
+    }
+    errors = [{"message": "boom", "path": ["repository", "item_2", "projectItems"]}]
+
+    with patch.object(requests.Session, "post") as mock_post:
+        mock_post.return_value = mock_graphql_response(graphql_data, errors)
+        client = GithubClient(credentials)
+        fields = client.fetch_project_fields_batch("owner", "repo", [1, 2])
+
+    assert fields == {1: {"Board.Status": "Todo"}, 2: None}
+
+
+def test_fetch_project_fields_batch_query_error_fails_whole_chunk():
+    """Test an error without a path marks every item in the query missing."""
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+
+    graphql_data = {"repository": {"item_1": project_items("Board", "Todo")}}
+    errors = [{"message": "Something went wrong"}]
+
+    with patch.object(requests.Session, "post") as mock_post:
+        mock_post.return_value = mock_graphql_response(graphql_data, errors)
+        client = GithubClient(credentials)
+        fields = client.fetch_project_fields_batch("owner", "repo", [1])
+
+    assert fields == {1: None}
+
+
+def test_fetch_project_fields_batch_chunks_large_pages():
+    """Test batches are split at PROJECT_FIELDS_BATCH_SIZE."""
+    from memory.common.github import PROJECT_FIELDS_BATCH_SIZE
+
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+    numbers = list(range(1, PROJECT_FIELDS_BATCH_SIZE + 6))
+
+    with patch.object(requests.Session, "post") as mock_post:
+        mock_post.return_value = mock_graphql_response({"repository": {}})
+        client = GithubClient(credentials)
+        fields = client.fetch_project_fields_batch(
+            "owner", "repo", numbers, "pullRequest"
+        )
+
+    assert mock_post.call_count == 2
+    assert set(fields) == set(numbers)
+    assert "pullRequest(number: 1)" in mock_post.call_args_list[0].kwargs["json"]["query"]
+
+
+# =============================================================================
+# Tests for conditional requests
+# =============================================================================
+
+
+def cacheable_response(data, etag='"v1"', status_code=200):
+    response = mock_rest_response(data, status_code)
+    response.headers = {"X-RateLimit-Remaining": "4999", "ETag": etag}
+    return response
+
+
+def test_get_repo_revalidates_with_etag():
+    """Test get_repo sends If-None-Match and serves 304s from the cache."""
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+    repo_data = {"id": 1, "name": "repo", "archived": False}
+
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.side_effect = [
+            cacheable_response(repo_data),
+            mock_rest_response(status_code=304),
+        ]
+        client = GithubClient(credentials)
+        first = client.get_repo("owner", "repo")
+        second = client.get_repo("owner", "repo")
+
+    assert first == second == repo_data
+    assert mock_get.call_args_list[0].kwargs["headers"] is None
+    assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_get_repo_not_found():
+    """Test get_repo returns None for a missing repo."""
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.return_value = mock_rest_response(status_code=404)
+        client = GithubClient(credentials)
+        assert client.get_repo("owner", "missing") is None
+
+
+def test_conditional_validators_are_per_credential():
+    """Test one token's cached responses are never revalidated by another."""
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.return_value = cacheable_response({"id": 1})
+        GithubClient(GithubCredentials(auth_type="pat", access_token="a")).get_repo(
+            "owner", "repo"
+        )
+        GithubClient(GithubCredentials(auth_type="pat", access_token="b")).get_repo(
+            "owner", "repo"
+        )
+
+    assert mock_get.call_args_list[1].kwargs["headers"] is None
+
+
+def test_conditional_get_without_redis_is_unconditional():
+    """Test Redis errors just mean unconditional requests."""
+    import redis
+
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+    broken = Mock()
+    broken.get.side_effect = redis.ConnectionError("down")
+    broken.set.side_effect = redis.ConnectionError("down")
+
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.return_value = cacheable_response({"id": 1})
+        client = GithubClient(credentials)
+        client.validators._client = broken
+        assert client.get_repo("owner", "repo") == {"id": 1}
+        assert client.get_repo("owner", "repo") == {"id": 1}
+
+    assert all(c.kwargs["headers"] is None for c in mock_get.call_args_list)
+
+
+def test_probe_issues_stores_validators_only_on_commit():
+    """Test probe validators are deferred until the sync succeeds."""
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.side_effect = [
+            cacheable_response([{"number": 1}]),
+            cacheable_response([{"number": 1}]),
+            mock_rest_response(status_code=304),
+        ]
+        client = GithubClient(credentials)
+
+        probe = client.probe_issues("owner", "repo")
+        assert probe is not None and probe.changed
+        # Sync "failed": nothing committed, so the next probe is unconditional
+        probe = client.probe_issues("owner", "repo")
+        assert mock_get.call_args_list[1].kwargs["headers"] is None
+
+        assert probe is not None
+        probe.commit()
+        probe = client.probe_issues("owner", "repo")
+
+    assert probe is not None and probe.not_modified
+    assert mock_get.call_args_list[2].kwargs["params"]["per_page"] == 1
+
+
+def test_probe_milestones_full_page_always_changed():
+    """Test a full page of milestones is reported as changed even on 304."""
+    credentials = GithubCredentials(auth_type="pat", access_token="token")
+    milestones = [{"number": i} for i in range(100)]
+
+    with patch.object(requests.Session, "get") as mock_get:
+        mock_get.side_effect = [
+            cacheable_response(milestones),
+            mock_rest_response(status_code=304),
+        ]
+        client = GithubClient(credentials)
+        first = client.probe_milestones("owner", "repo")
+        assert first is not None
+        first.commit()
+        probe = client.probe_milestones("owner", "repo")
+
+    assert probe is not None and probe.changed
+
+
 def test_update_project_field_value_success():
     """A clean mutation returns (True, None)."""
     credentials = GithubCredentials(auth_type="pat", access_token="token")
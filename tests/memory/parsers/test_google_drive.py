@@ -0,0 +1,298 @@
+"""Tests for the Google Drive client, run against a local fake Drive server.
+
+The fake speaks just enough of the Drive v3 REST API (files.get/list/export,
+media downloads and the Changes API) for the real googleapiclient service
+to talk to it over HTTP.
+"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from memory.parsers.google_drive import (
+    FOLDER_MIME,
+    GoogleCredentials,
+    GoogleDriveClient,
+)
+
+DOC_MIME = "application/vnd.google-apps.document"
+
+
+class FakeDrive:
+    """In-memory Drive state: files plus an append-only change log."""
+
+    def __init__(self):
+        self.files: dict[str, dict] = {}
+        self.content: dict[str, bytes] = {}
+        self.changes: list[dict] = []
+        self.requests: list[str] = []
+        self.export_delay = 0.0
+        self.active_exports = 0
+        self.max_active_exports = 0
+        self.lock = threading.Lock()
+        self.endpoint = ""  # set once the fake server is listening
+
+    def add(self, file_id, name, parent=None, mime=DOC_MIME, content=b""):
+        self.files[file_id] = {
+            "id": file_id,
+            "name": name,
+            "mimeType": mime,
+            "parents": [parent] if parent else [],
+            "modifiedTime": "2024-01-01T00:00:00Z",
+            "createdTime": "2024-01-01T00:00:00Z",
+            "owners": [{"emailAddress": "owner@example.com"}],
+            "permissions": [{"type": "user", "emailAddress": "owner@example.com"}],
+        }
+        self.content[file_id] = content
+        self.changes.append({"fileId": file_id, "removed": False})
+
+    def edit(self, file_id, content):
+        self.content[file_id] = content
+        self.changes.append({"fileId": file_id, "removed": False})
+
+    def trash(self, file_id):
+        self.files[file_id]["trashed"] = True
+        self.changes.append({"fileId": file_id, "removed": False})
+
+    def change_entry(self, change):
+        entry = dict(change)
+        if not change["removed"]:
+            entry["file"] = self.files[change["fileId"]]
+        return entry
+
+
+def make_handler(drive: FakeDrive):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+        def send_json(self, data, status=200):
+            body = json.dumps(data).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_bytes(self, body):
+            self.send_response(200)
+            self.send_header("Content-Type", "application/octet-stream")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def export(self, file_id):
+            with drive.lock:
+                drive.active_exports += 1
+                drive.max_active_exports = max(
+                    drive.max_active_exports, drive.active_exports
+                )
+            try:
+                time.sleep(drive.export_delay)
+                self.send_bytes(drive.content[file_id])
+            finally:
+                with drive.lock:
+                    drive.active_exports -= 1
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            parts = url.path.removeprefix("/drive/v3/").strip("/").split("/")
+            drive.requests.append("/".join(parts))
+
+            if parts == ["changes", "startPageToken"]:
+                return self.send_json({"startPageToken": str(len(drive.changes))})
+
+            if parts == ["changes"]:
+                start = int(params["pageToken"])
+                size = int(params.get("pageSize", 100))
+                page = drive.changes[start : start + size]
+                response: dict[str, Any] = {
+                    "changes": [drive.change_entry(c) for c in page]
+                }
+                if start + size < len(drive.changes):
+                    response["nextPageToken"] = str(start + size)
+                else:
+                    response["newStartPageToken"] = str(len(drive.changes))
+                return self.send_json(response)
+
+            if parts == ["files"]:
+                parent = params["q"].split("'")[1]
+                children = [
+                    f
+                    for f in drive.files.values()
+                    if parent in f["parents"] and not f.get("trashed")
+                ]
+                return self.send_json({"files": children})
+
+            if parts[0] == "files" and len(parts) == 3 and parts[2] == "export":
+                return self.export(parts[1])
+
+            if parts[0] == "files" and len(parts) == 2:
+                file_id = parts[1]
+                if file_id not in drive.files:
+                    return self.send_json({"error": {"code": 404}}, status=404)
+                if params.get("alt") == "media":
+                    return self.export(file_id)
+                return self.send_json(drive.files[file_id])
+
+            self.send_json({"error": {"code": 404}}, status=404)
+
+    return Handler
+
+
+@pytest.fixture
+def fake_drive():
+    drive = FakeDrive()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(drive))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    drive.endpoint = f"http://127.0.0.1:{server.server_address[1]}/drive/v3/"
+    yield drive
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def drive_tree(fake_drive):
+    """root/ with a doc, a subfolder holding a doc, and an excluded folder."""
+    fake_drive.add("root", "Root", mime=FOLDER_MIME)
+    fake_drive.add("doc1", "Doc 1", parent="root", content=b"one")
+    fake_drive.add("sub", "Sub", parent="root", mime=FOLDER_MIME)
+    fake_drive.add("doc2", "Doc 2", parent="sub", content=b"two")
+    fake_drive.add("skip", "Skip", parent="root", mime=FOLDER_MIME)
+    fake_drive.add("doc3", "Doc 3", parent="skip", content=b"three")
+    fake_drive.add("elsewhere", "Elsewhere", content=b"outside")
+    return fake_drive
+
+
+def make_client(drive):
+    credentials = GoogleCredentials(
+        access_token="token", refresh_token=None, token_expires_at=None, scopes=[]
+    )
+    return GoogleDriveClient(
+        credentials,
+        client_id="id",
+        client_secret="secret",
+        api_endpoint=drive.endpoint,
+    )
+
+
+def test_list_changed_files_returns_only_changes_inside_folder(drive_tree):
+    client = make_client(drive_tree)
+    token = client.get_start_page_token()
+
+    drive_tree.edit("doc2", b"two v2")
+    drive_tree.edit("doc2", b"two v3")
+    drive_tree.edit("doc3", b"three v2")
+    drive_tree.edit("elsewhere", b"outside v2")
+    drive_tree.add("sub", "Sub", parent="root", mime=FOLDER_MIME)
+
+    files, new_token = client.list_changed_files(
+        "root", token, exclude_folder_ids={"skip"}
+    )
+
+    assert [(f["id"], path) for f, path in files] == [("doc2", "Root/Sub")]
+    assert new_token == str(len(drive_tree.changes))
+
+    # Nothing changed since the new token
+    assert client.list_changed_files("root", new_token) == ([], new_token)
+
+
+def test_list_changed_files_non_recursive_skips_subfolders(drive_tree):
+    client = make_client(drive_tree)
+    token = client.get_start_page_token()
+    drive_tree.edit("doc1", b"one v2")
+    drive_tree.edit("doc2", b"two v2")
+
+    files, _ = client.list_changed_files("root", token, recursive=False)
+
+    assert [f["id"] for f, _ in files] == ["doc1"]
+
+
+def test_list_changed_files_skips_trashed(drive_tree):
+    client = make_client(drive_tree)
+    token = client.get_start_page_token()
+    drive_tree.trash("doc1")
+
+    files, _ = client.list_changed_files("root", token)
+
+    assert files == []
+
+
+def test_list_changes_follows_pages(drive_tree):
+    client = make_client(drive_tree)
+    changes, token = client.list_changes("0", page_size=2)
+
+    assert [c["fileId"] for c in changes] == [
+        "root",
+        "doc1",
+        "sub",
+        "doc2",
+        "skip",
+        "doc3",
+        "elsewhere",
+    ]
+    assert token == "7"
+
+
+def test_folder_lookups_are_cached(drive_tree):
+    client = make_client(drive_tree)
+    token = client.get_start_page_token()
+    for i in range(3):
+        drive_tree.edit("doc2", b"x")
+        drive_tree.add(f"new{i}", "New", parent="sub", content=b"y")
+
+    files, _ = client.list_changed_files("root", token)
+
+    assert {f["id"] for f, _ in files} == {"doc2", "new0", "new1", "new2"}
+    assert drive_tree.requests.count("files/sub") == 1
+
+
+def test_fetch_files_exports_in_parallel_and_keeps_order(fake_drive):
+    fake_drive.add("root", "Root", mime=FOLDER_MIME)
+    for i in range(6):
+        fake_drive.add(f"d{i}", f"Doc {i}", parent="root", content=f"body {i}".encode())
+    fake_drive.export_delay = 0.2
+
+    client = make_client(fake_drive)
+    files = [(fake_drive.files[f"d{i}"], "Root") for i in range(6)]
+
+    start = time.monotonic()
+    results = list(client.fetch_files(files, max_workers=3))
+    elapsed = time.monotonic() - start
+
+    assert [data and data["content"] for _, data in results] == [
+        f"body {i}" for i in range(6)
+    ]
+    assert fake_drive.max_active_exports == 3
+    assert elapsed < 6 * fake_drive.export_delay
+
+
+def test_fetch_files_yields_none_for_failures(fake_drive):
+    fake_drive.add("root", "Root", mime=FOLDER_MIME)
+    fake_drive.add("ok", "OK", parent="root", content=b"fine")
+    client = make_client(fake_drive)
+    missing = {"id": "gone", "name": "Gone", "mimeType": "text/plain"}
+
+    results = list(client.fetch_files([(missing, "Root"), (fake_drive.files["ok"], "Root")]))
+
+    assert results[0] == (missing, None)
+    ok = results[1][1]
+    assert ok is not None and ok["content"] == "fine"
+
+
+def test_list_files_in_folder_against_fake_server(drive_tree):
+    client = make_client(drive_tree)
+
+    files = list(client.list_files_in_folder("root", exclude_folder_ids={"skip"}))
+
+    assert sorted((f["id"], path) for f, path in files) == [
+        ("doc1", "Root"),
+        ("doc2", "Root/Sub"),
+    ]
@@ -1,9 +1,14 @@
 import hashlib
+import io
 import pathlib
 import re
 import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import cast
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, cast
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -11,6 +16,7 @@ from bs4 import BeautifulSoup, Tag
 from PIL import Image as PILImage
 
 from memory.common import settings
+from memory.parsers import html as html_parser
 from memory.parsers.html import (
     BaseHTMLParser,
     convert_to_markdown,
@@ -454,9 +460,7 @@ def test_fetch_html_no_if_modified_since_without_modified(mock_safe_get, mock_is
 @pytest.mark.parametrize("as_bytes, expected", [(False, ""), (True, b"")])
 @patch("memory.parsers.html.is_safe_url", return_value=True)
 @patch("memory.parsers.html.safe_get")
-def test_fetch_html_304_short_circuits(
-    mock_safe_get, mock_is_safe, as_bytes, expected
-):
+def test_fetch_html_304_short_circuits(mock_safe_get, mock_is_safe, as_bytes, expected):
     """A 304 returns empty content without touching the (empty) body."""
     from memory.parsers.html import fetch_html
 
@@ -525,7 +529,13 @@ def test_process_images_basic(mock_process_image):
         mock_img.filename = str(settings.WEBPAGE_STORAGE_DIR / f"image{i + 1}.jpg")
         mock_images.append(mock_img)
 
-    mock_process_image.side_effect = mock_images
+    # Images are fetched concurrently, so match them up by URL, not call order
+    urls = [
+        "https://example.com/image1.jpg",
+        "https://example.com/relative/image2.png",
+        "https://other.com/image3.gif",
+    ]
+    mock_process_image.side_effect = lambda url, _: mock_images[urls.index(url)]
 
     updated_content, images = process_images(
         content, base_url, settings.WEBPAGE_STORAGE_DIR
@@ -573,7 +583,9 @@ def test_process_images_with_failures(mock_process_image):
     # First image succeeds, second fails
     mock_good_image = MagicMock(spec=PILImage.Image)
     mock_good_image.filename = settings.WEBPAGE_STORAGE_DIR / "good.jpg"
-    mock_process_image.side_effect = [mock_good_image, None]
+    mock_process_image.side_effect = lambda url, _: (
+        mock_good_image if url.endswith("good.jpg") else None
+    )
 
     updated_content, images = process_images(
         content, "https://example.com", settings.WEBPAGE_STORAGE_DIR
@@ -605,6 +617,133 @@ def test_process_images_no_filename(mock_process_image):
     assert not images
 
 
+class ImageServer(ThreadingHTTPServer):
+    """Local image host. ``/<delay>/<name>.png`` answers after ``delay`` seconds."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), ImageHandler)
+        self.requests: list[str] = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def url(self, path: str, host: str = "127.0.0.1") -> str:
+        return f"http://{host}:{self.server_address[1]}{path}"
+
+
+class ImageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = cast(ImageServer, self.server)
+        with server.lock:
+            server.requests.append(self.path)
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(float(self.path.split("/")[1]))
+            buffer = io.BytesIO()
+            PILImage.new("RGB", (4, 4), "red").save(buffer, format="PNG")
+            self.send_response(200)
+            self.send_header("Content-Type", "image/png")
+            self.send_header("Content-Length", str(len(buffer.getvalue())))
+            self.end_headers()
+            self.wfile.write(buffer.getvalue())
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@pytest.fixture
+def image_server():
+    server = ImageServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    # The stub runs on localhost, which the SSRF check rightly refuses
+    with patch("memory.parsers.html.is_safe_url", return_value=True):
+        yield server
+    server.shutdown()
+    server.server_close()
+
+
+def article(*urls: str) -> Tag:
+    html = "".join(f'<p>Text</p><img src="{url}">' for url in urls)
+    return cast(Tag, BeautifulSoup(f"<div>{html}</div>", "html.parser").div)
+
+
+def test_process_images_fetches_concurrently(image_server, tmp_path):
+    delays = [0.05, 0.1, 0.3, 0.1, 0.2, 0.05, 0.25, 0.15]
+    urls = [image_server.url(f"/{d}/img{i}.png") for i, d in enumerate(delays)]
+
+    start = time.perf_counter()
+    content, images = process_images(article(*urls), "", tmp_path)
+    elapsed = time.perf_counter() - start
+
+    assert len(images) == len(urls)
+    assert all(img["src"] in images for img in content.find_all("img"))  # type: ignore
+    # Close to the slowest image, far from the sum of them all (1.2s)
+    assert elapsed < max(delays) + 0.25
+
+
+def test_process_images_limits_connections_per_host(
+    image_server, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(settings, "IMAGE_FETCH_PER_HOST", 2)
+    monkeypatch.setattr(html_parser, "_host_slots", {})
+    urls = [image_server.url(f"/0.1/a{i}.png") for i in range(6)]
+    urls += [image_server.url(f"/0.1/b{i}.png", host="localhost") for i in range(2)]
+
+    _, images = process_images(article(*urls), "", tmp_path)
+
+    assert len(images) == 8
+    # Two for 127.0.0.1 plus two for localhost, which is another host
+    assert image_server.max_active == 4
+
+
+def test_process_images_fetches_each_url_once(image_server, tmp_path):
+    shared = image_server.url("/0.2/shared.png")
+    first = article(shared, image_server.url("/0/a.png"), shared)
+    second = article(shared, image_server.url("/0/b.png"))
+
+    with ThreadPoolExecutor(2) as pool:
+        results = list(
+            pool.map(
+                lambda content: process_images(content, "", tmp_path), [first, second]
+            )
+        )
+
+    # Once while both articles wanted it at the same time...
+    assert image_server.requests.count("/0.2/shared.png") == 1
+    assert all(len(images) == 2 for _, images in results)
+
+    # ...and not again for a later article: it's cached on disk
+    process_images(article(shared), "", tmp_path)
+    assert image_server.requests.count("/0.2/shared.png") == 1
+
+
+def test_process_images_keeps_size_cap(image_server, tmp_path, monkeypatch):
+    image_dir = tmp_path / "images"
+    monkeypatch.setattr(html_parser, "MAX_IMAGE_SIZE", 10)
+
+    _, images = process_images(article(image_server.url("/0/big.png")), "", image_dir)
+
+    assert images == {}
+    assert list(image_dir.iterdir()) == []
+
+
+def test_process_images_still_blocks_unsafe_urls(tmp_path):
+    with patch("memory.parsers.html.stream_download_to_path") as download:
+        _, images = process_images(
+            article("http://169.254.169.254/latest/meta-data/x.png"), "", tmp_path
+        )
+
+    assert images == {}
+    download.assert_not_called()
+
+
 @pytest.mark.parametrize(
     "html, selectors, base_url, expected",
     [
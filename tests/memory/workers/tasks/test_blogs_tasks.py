@@ -1,7 +1,10 @@
 import pytest
 from datetime import datetime, timedelta, timezone
+from typing import cast
 from unittest.mock import Mock, patch
 
+from sqlalchemy.orm import Session
+
 from memory.common.db.models import ArticleFeed, BlogPost
 from memory.workers.tasks import blogs
 from memory.parsers.blogs import Article
@@ -76,7 +79,7 @@ def mock_feed_item():
 @pytest.fixture
 def mock_feed_parser():
     """Mock feed parser for testing."""
-    parser = Mock()
+    parser = Mock(fetched=None)
     parser.parse_feed.return_value = [
         Mock(url="https://example.com/article/1", title="Test Article")
     ]
@@ -102,7 +105,7 @@ def test_sync_webpage_success(mock_parse, mock_article, db_session, qdrant):
 
     result = blogs.sync_webpage("https://example.com/article/1", ["test", "blog"])
 
-    mock_parse.assert_called_once_with("https://example.com/article/1")
+    mock_parse.assert_called_once_with("https://example.com/article/1", session=None)
 
     # Verify the BlogPost was created in the database
     blog_post = (
@@ -185,8 +188,8 @@ def test_sync_article_feed_success(
     """Test successful article feed synchronization."""
     mock_get_parser.return_value = mock_feed_parser
 
-    with patch("memory.workers.tasks.blogs.sync_webpage") as mock_sync_webpage:
-        mock_sync_webpage.delay.return_value = Mock(id="task-123")
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.return_value = Mock(id="task-123")
 
         result = blogs.sync_article_feed(sample_article_feed.id)
 
@@ -199,9 +202,9 @@ def test_sync_article_feed_success(
         assert result["errors"] == 0
         assert result["task_ids"] == ["task-123"]
 
-        # Verify sync_webpage was called with correct arguments
-        mock_sync_webpage.delay.assert_called_once_with(
-            "https://example.com/article/1", ["test", "blog"]
+        # Verify sync_webpages was called with correct arguments
+        mock_sync_webpages.delay.assert_called_once_with(
+            ["https://example.com/article/1"], ["test", "blog"]
         )
 
     # Verify last_checked_at was updated
@@ -253,15 +256,15 @@ def test_sync_article_feed_with_existing_articles(
     db_session.commit()
 
     # Mock parser with multiple items
-    mock_parser = Mock()
+    mock_parser = Mock(fetched=None)
     mock_parser.parse_feed.return_value = [
         Mock(url="https://example.com/article/1", title="Existing Article"),
         Mock(url="https://example.com/article/2", title="New Article"),
     ]
     mock_get_parser.return_value = mock_parser
 
-    with patch("memory.workers.tasks.blogs.sync_webpage") as mock_sync_webpage:
-        mock_sync_webpage.delay.return_value = Mock(id="task-456")
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.return_value = Mock(id="task-456")
 
         result = blogs.sync_article_feed(sample_article_feed.id)
 
@@ -269,9 +272,9 @@ def test_sync_article_feed_with_existing_articles(
         assert result["new_articles"] == 1  # Only one new article
         assert result["task_ids"] == ["task-456"]
 
-        # Verify sync_webpage was only called for the new article
-        mock_sync_webpage.delay.assert_called_once_with(
-            "https://example.com/article/2", ["test", "blog"]
+        # Verify sync_webpages was only called for the new article
+        mock_sync_webpages.delay.assert_called_once_with(
+            ["https://example.com/article/2"], ["test", "blog"]
         )
 
 
@@ -280,7 +283,7 @@ def test_sync_article_feed_parser_error(
     mock_get_parser, sample_article_feed, db_session
 ):
     """Test sync when parser raises an exception."""
-    mock_parser = Mock()
+    mock_parser = Mock(fetched=None)
     mock_parser.parse_feed.side_effect = Exception("Parser error")
     mock_get_parser.return_value = mock_parser
 
@@ -290,6 +293,29 @@ def test_sync_article_feed_parser_error(
     assert result["articles_found"] == 0
     assert result["new_articles"] == 0
     assert result["errors"] == 1
+    mock_parser.commit_fetch.assert_not_called()
+
+
+@patch("memory.workers.tasks.blogs.get_feed_parser")
+def test_sync_article_feed_commits_fetch_after_dispatch(
+    mock_get_parser, sample_article_feed, db_session
+):
+    mock_parser = Mock(fetched=None)
+    mock_parser.parse_feed.return_value = [Mock(url="https://example.com/new")]
+    mock_get_parser.return_value = mock_parser
+
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.side_effect = ConnectionError("broker down")
+        with pytest.raises(ConnectionError):
+            blogs.sync_article_feed(sample_article_feed.id)
+        # The feed wasn't queued, so it mustn't be skipped next time
+        mock_parser.commit_fetch.assert_not_called()
+
+        mock_sync_webpages.delay.side_effect = None
+        mock_sync_webpages.delay.return_value = Mock(id="task-1")
+        blogs.sync_article_feed(sample_article_feed.id)
+
+    mock_parser.commit_fetch.assert_called_once_with()
 
 
 @patch("memory.workers.tasks.blogs.sync_article_feed")
@@ -336,8 +362,8 @@ def test_sync_website_archive_success(
     """Test successful website archive synchronization."""
     mock_get_fetcher.return_value = mock_archive_fetcher
 
-    with patch("memory.workers.tasks.blogs.sync_webpage") as mock_sync_webpage:
-        mock_sync_webpage.delay.side_effect = [Mock(id="task-1"), Mock(id="task-2")]
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.return_value = Mock(id="task-1")
 
         result = blogs.sync_website_archive("https://example.com", ["archive"], 50)
 
@@ -345,17 +371,14 @@ def test_sync_website_archive_success(
         assert result["website_url"] == "https://example.com"
         assert result["articles_found"] == 2
         assert result["new_articles"] == 2
-        assert result["task_ids"] == ["task-1", "task-2"]
+        assert result["task_ids"] == ["task-1"]
         assert result["max_pages_processed"] == 50
         assert mock_archive_fetcher.max_pages == 50
 
-        # Verify sync_webpage was called for both articles
-        assert mock_sync_webpage.delay.call_count == 2
-        mock_sync_webpage.delay.assert_any_call(
-            "https://example.com/archive/1", ["archive"]
-        )
-        mock_sync_webpage.delay.assert_any_call(
-            "https://example.com/archive/2", ["archive"]
+        # Both articles are synced by one task
+        mock_sync_webpages.delay.assert_called_once_with(
+            ["https://example.com/archive/1", "https://example.com/archive/2"],
+            ["archive"],
         )
 
 
@@ -388,8 +411,8 @@ def test_sync_website_archive_persists_feed_when_add_feed_true(
         db_session.query(ArticleFeed).filter(ArticleFeed.url == url).first() is None
     )
 
-    with patch("memory.workers.tasks.blogs.sync_webpage") as mock_sync_webpage:
-        mock_sync_webpage.delay.side_effect = [Mock(id="t-1"), Mock(id="t-2")]
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.side_effect = [Mock(id="t-1"), Mock(id="t-2")]
         blogs.sync_website_archive(url, ["archive"], 50, add_feed=True)
 
     db_session.expire_all()
@@ -420,8 +443,8 @@ def test_sync_website_archive_does_not_duplicate_existing_feed(
     db_session.commit()
     existing_id = existing.id
 
-    with patch("memory.workers.tasks.blogs.sync_webpage") as mock_sync_webpage:
-        mock_sync_webpage.delay.side_effect = [Mock(id="t-1"), Mock(id="t-2")]
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.side_effect = [Mock(id="t-1"), Mock(id="t-2")]
         blogs.sync_website_archive(url, ["archive"], 50, add_feed=True)
 
     feeds = db_session.query(ArticleFeed).filter(ArticleFeed.url == url).all()
@@ -438,8 +461,8 @@ def test_sync_website_archive_skips_feed_creation_when_add_feed_false(
     mock_get_fetcher.return_value = mock_archive_fetcher
     url = "https://example.com"
 
-    with patch("memory.workers.tasks.blogs.sync_webpage") as mock_sync_webpage:
-        mock_sync_webpage.delay.side_effect = [Mock(id="t-1"), Mock(id="t-2")]
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.side_effect = [Mock(id="t-1"), Mock(id="t-2")]
         blogs.sync_website_archive(url, ["archive"], 50, add_feed=False)
 
     assert (
@@ -473,8 +496,8 @@ def test_sync_website_archive_with_existing_articles(mock_get_fetcher, db_sessio
     ]
     mock_get_fetcher.return_value = mock_fetcher
 
-    with patch("memory.workers.tasks.blogs.sync_webpage") as mock_sync_webpage:
-        mock_sync_webpage.delay.return_value = Mock(id="task-new")
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.return_value = Mock(id="task-new")
 
         result = blogs.sync_website_archive("https://example.com", ["archive"])
 
@@ -482,9 +505,9 @@ def test_sync_website_archive_with_existing_articles(mock_get_fetcher, db_sessio
         assert result["new_articles"] == 1  # Only one new article
         assert result["task_ids"] == ["task-new"]
 
-        # Verify sync_webpage was only called for the new article
-        mock_sync_webpage.delay.assert_called_once_with(
-            "https://example.com/archive/2", ["archive"]
+        # Verify sync_webpages was only called for the new article
+        mock_sync_webpages.delay.assert_called_once_with(
+            ["https://example.com/archive/2"], ["archive"]
         )
 
 
@@ -529,7 +552,7 @@ def test_sync_webpage_parse_error(mock_parse, db_session):
 def test_sync_article_feed_tags_handling(
     mock_get_parser, feed_tags, expected_tags, db_session
 ):
-    """Test that feed tags are properly passed to sync_webpage."""
+    """Test that feed tags are properly passed to sync_webpages."""
     # Create feed with specific tags
     feed = ArticleFeed(
         url="https://example.com/feed.xml",
@@ -542,20 +565,20 @@ def test_sync_article_feed_tags_handling(
     db_session.add(feed)
     db_session.commit()
 
-    mock_parser = Mock()
+    mock_parser = Mock(fetched=None)
     mock_parser.parse_feed.return_value = [
         Mock(url="https://example.com/article/1", title="Test")
     ]
     mock_get_parser.return_value = mock_parser
 
-    with patch("memory.workers.tasks.blogs.sync_webpage") as mock_sync_webpage:
-        mock_sync_webpage.delay.return_value = Mock(id="task-123")
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.return_value = Mock(id="task-123")
 
         blogs.sync_article_feed(feed.id)
 
-        # Verify sync_webpage was called with correct tags
-        mock_sync_webpage.delay.assert_called_once_with(
-            "https://example.com/article/1", expected_tags
+        # Verify sync_webpages was called with correct tags
+        mock_sync_webpages.delay.assert_called_once_with(
+            ["https://example.com/article/1"], expected_tags
         )
 
 
@@ -576,7 +599,7 @@ def test_sync_all_article_feeds_no_active_feeds(db_session):
     assert result == []
 
 
-@patch("memory.workers.tasks.blogs.sync_webpage")
+@patch("memory.workers.tasks.blogs.sync_webpages")
 @patch("memory.workers.tasks.blogs.get_archive_fetcher")
 def test_sync_website_archive_default_max_pages(
     mock_get_fetcher, mock_sync_delay, db_session
@@ -593,7 +616,7 @@ def test_sync_website_archive_default_max_pages(
     assert mock_fetcher.max_pages == 100  # Should be set to default
 
 
-@patch("memory.workers.tasks.blogs.sync_webpage")
+@patch("memory.workers.tasks.blogs.sync_webpages")
 @patch("memory.workers.tasks.blogs.get_archive_fetcher")
 def test_sync_website_archive_empty_results(
     mock_get_fetcher, mock_sync_delay, db_session
@@ -671,3 +694,161 @@ def test_sync_article_feed_check_interval(
         assert result["error"] == "No parser available for feed"
         # get_feed_parser should be called when not skipping
         mock_get_parser.assert_called_once()
+
+
+class RecordingSession:
+    """Stands in for a DB session, answering normalized URL lookups from a set."""
+
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.lookups: list[list[str]] = []
+
+    def query(self, *columns):
+        return self
+
+    def filter(self, clause):
+        keys = list(clause.right.value)
+        self.lookups.append(keys)
+        return [(key,) for key in keys if key in self.existing]
+
+    def as_session(self) -> Session:
+        return cast(Session, self)
+
+
+def test_new_article_urls_dedups_in_one_query():
+    session = RecordingSession(existing={"example.com/old"})
+
+    new = blogs.new_article_urls(
+        session.as_session(),
+        [
+            "https://example.com/old/",
+            "https://example.com/a",
+            "http://www.example.com/a",
+            "https://example.com/b?utm_source=rss",
+        ],
+    )
+
+    assert new == ["https://example.com/a", "https://example.com/b?utm_source=rss"]
+    assert len(session.lookups) == 1
+
+
+def test_new_article_urls_skips_already_seen():
+    session = RecordingSession()
+    seen = {"example.com/a"}
+
+    assert blogs.new_article_urls(
+        session.as_session(), ["https://example.com/a", "https://example.com/b"], seen
+    ) == ["https://example.com/b"]
+    assert seen == {"example.com/a", "example.com/b"}
+    assert (
+        blogs.new_article_urls(session.as_session(), ["https://example.com/b"], seen)
+        == []
+    )
+    assert len(session.lookups) == 1
+
+
+def test_article_scheduler_batches_large_archive(monkeypatch):
+    """A 5,000 post backfill costs a handful of queries and messages."""
+    monkeypatch.setattr(blogs.settings, "ARTICLE_DEDUP_BATCH_SIZE", 500)
+    monkeypatch.setattr(blogs.settings, "ARTICLE_SYNC_GROUP_SIZE", 20)
+    urls = [f"https://example.com/archive/{i}" for i in range(5000)]
+    session = RecordingSession(existing={f"example.com/archive/{i}" for i in range(10)})
+
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.side_effect = lambda urls, tags: Mock(id=urls[0])
+        scheduler = blogs.ArticleScheduler(session.as_session(), ["archive"])
+        for url in urls:
+            scheduler.add(url)
+        scheduler.flush()
+
+    groups = [c.args[0] for c in mock_sync_webpages.delay.call_args_list]
+    assert scheduler.articles_found == 5000
+    assert scheduler.new_articles == 4990
+    assert len(session.lookups) == 10
+    assert len(groups) == 250
+    assert all(len(group) <= 20 for group in groups)
+    assert sum(groups, []) == urls[10:]
+    assert scheduler.task_ids == [group[0] for group in groups]
+
+
+def test_article_scheduler_flushes_partial_group(monkeypatch):
+    monkeypatch.setattr(blogs.settings, "ARTICLE_SYNC_GROUP_SIZE", 20)
+    session = RecordingSession()
+
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.return_value = Mock(id="task-1")
+        scheduler = blogs.ArticleScheduler(session.as_session(), ["a"])
+        scheduler.add("https://example.com/1")
+        scheduler.add("https://example.com/2")
+        mock_sync_webpages.delay.assert_not_called()
+        scheduler.flush()
+
+    mock_sync_webpages.delay.assert_called_once_with(
+        ["https://example.com/1", "https://example.com/2"], ["a"]
+    )
+
+
+@patch("memory.workers.tasks.blogs.ingest_webpage")
+def test_sync_webpages_shares_one_http_session(mock_ingest):
+    def ingest(url, tags, http):
+        if url.endswith("broken"):
+            raise ValueError("no content")
+        return {"url": url, "status": "processed"}
+
+    mock_ingest.side_effect = ingest
+    urls = ["https://example.com/1", "https://example.com/broken", "https://example.com/2"]
+
+    result = blogs.sync_webpages(urls, ["tag"])
+
+    sessions = {id(c.args[2]) for c in mock_ingest.call_args_list}
+    assert len(sessions) == 1
+    assert [c.args[:2] for c in mock_ingest.call_args_list] == [(u, ["tag"]) for u in urls]
+    assert result["status"] == "completed"
+    assert result["urls"] == 3
+    assert result["errors"] == 1
+    assert [r["status"] for r in result["results"]] == ["processed", "error", "processed"]
+
+
+def test_blog_post_normalized_url_follows_url():
+    post = BlogPost(url="https://www.example.com/post/")
+    assert post.normalized_url == "example.com/post"
+
+    post.url = "http://example.com/other?utm_source=rss"
+    assert post.normalized_url == "example.com/other"
+
+
+@patch("memory.workers.tasks.blogs.get_feed_parser")
+def test_sync_article_feed_matches_existing_posts_by_normalized_url(
+    mock_get_parser, sample_article_feed, db_session
+):
+    db_session.add(
+        BlogPost(
+            url="https://example.com/article/1",
+            title="Existing Article",
+            content="Existing content",
+            sha256=b"existing_hash" + bytes(24),
+            modality="blog",
+            tags=["test"],
+            mime_type="text/markdown",
+            size=100,
+        )
+    )
+    db_session.commit()
+
+    mock_parser = Mock(fetched=None)
+    mock_parser.parse_feed.return_value = [
+        Mock(url="http://www.example.com/article/1/?utm_source=rss"),
+        Mock(url="https://example.com/article/2"),
+        Mock(url="https://example.com/article/2#comments"),
+    ]
+    mock_get_parser.return_value = mock_parser
+
+    with patch("memory.workers.tasks.blogs.sync_webpages") as mock_sync_webpages:
+        mock_sync_webpages.delay.return_value = Mock(id="task-1")
+        result = blogs.sync_article_feed(sample_article_feed.id)
+
+    assert result["articles_found"] == 3
+    assert result["new_articles"] == 1
+    mock_sync_webpages.delay.assert_called_once_with(
+        ["https://example.com/article/2"], ["test", "blog"]
+    )
@@ -946,6 +946,67 @@ def test_sync_github_repo_prs_only(mock_client_class, github_account, db_session
     mock_client.fetch_prs.assert_called_once()
 
 
+@patch("memory.workers.tasks.github.GithubClient")
+def test_sync_github_repo_skips_fetch_when_probe_unchanged(
+    mock_client_class, github_repo, db_session
+):
+    """Test an incremental sync with no upstream changes makes no GraphQL fetches."""
+    from sqlalchemy import text
+
+    mock_client = Mock()
+    mock_client.get_repo.return_value = {"archived": False}
+    mock_client.probe_milestones.return_value = Mock(changed=False)
+    issue_probe = Mock(changed=False)
+    mock_client.probe_issues.return_value = issue_probe
+    mock_client_class.return_value = mock_client
+
+    last_sync_time = datetime.now(timezone.utc) - timedelta(days=1)
+    db_session.execute(
+        text("UPDATE github_repos SET last_sync_at = :timestamp WHERE id = :repo_id"),
+        {"timestamp": last_sync_time, "repo_id": github_repo.id},
+    )
+    db_session.commit()
+
+    result = github.sync_github_repo(github_repo.id)
+
+    assert result["status"] == "completed"
+    assert result["issues_synced"] == result["prs_synced"] == 0
+    mock_client.fetch_milestones.assert_not_called()
+    mock_client.fetch_issues.assert_not_called()
+    mock_client.fetch_prs.assert_not_called()
+    issue_probe.commit.assert_called_once()
+
+
+@patch("memory.workers.tasks.github.GithubClient")
+def test_sync_github_repo_batches_project_fields(
+    mock_client_class, mock_issue_data, github_repo_with_project_fields, db_session
+):
+    """Test project fields are fetched per page, not per issue."""
+    issues = [{**mock_issue_data, "number": n} for n in (1, 2, 3)]
+    mock_client = Mock()
+    mock_client.get_repo.return_value = {"archived": False}
+    mock_client.fetch_issues.return_value = iter(issues)
+    mock_client.fetch_prs.return_value = iter([])
+    mock_client.fetch_project_fields_batch.return_value = {2: {"Board.Status": "Done"}}
+    mock_client_class.return_value = mock_client
+
+    with patch("memory.workers.tasks.github.sync_github_item") as mock_sync_item:
+        mock_sync_item.delay.return_value = Mock(id="task")
+        result = github.sync_github_repo(github_repo_with_project_fields.id)
+
+    assert result["issues_synced"] == 3
+    mock_client.fetch_project_fields_batch.assert_called_once_with(
+        "testorg", github_repo_with_project_fields.name, [1, 2, 3], "issue"
+    )
+    mock_client.fetch_project_fields.assert_not_called()
+    sent = [c.args[1] for c in mock_sync_item.delay.call_args_list]
+    assert [item["project_fields"] for item in sent] == [
+        None,
+        {"Board.Status": "Done"},
+        None,
+    ]
+
+
 # =============================================================================
 # Tests for sync_all_github_repos
 # =============================================================================
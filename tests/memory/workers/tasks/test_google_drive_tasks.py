@@ -4,13 +4,18 @@ import pytest
 from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
+from memory.common import settings
 from memory.common.db.models import GoogleDoc
 from memory.workers.tasks.google_drive import (
     _serialize_file_data,
     _deserialize_file_data,
     _needs_reindex,
     _create_google_doc,
+    _task_payload,
     _update_existing_doc,
+    read_spooled_content,
+    spool_path,
+    sync_google_doc,
 )
 from memory.parsers.google_drive import GoogleFileData
 from memory.common.db import connection as db_connection
@@ -292,3 +297,55 @@ def test_update_existing_doc_raises_on_qdrant_error(
     # Should raise to prevent partial state (orphaned vectors)
     with pytest.raises(IOError, match="Connection failed"):
         _update_existing_doc(session, mock_existing_doc, mock_folder, sample_file_data)
+
+
+# Tests for spooling large exports
+
+
+def test_task_payload_keeps_small_content_inline(sample_file_data):
+    """Small bodies travel in the task kwargs as before."""
+    sample_file_data["size"] = 10
+
+    payload = _task_payload(1, sample_file_data)
+
+    assert payload["content"] == "This is the document content."
+    assert "content_spool" not in payload
+
+
+def test_task_payload_spools_large_content(sample_file_data):
+    """Bodies over the threshold go to the spool dir, not the broker."""
+    sample_file_data["size"] = settings.GOOGLE_DRIVE_SPOOL_THRESHOLD + 1
+
+    payload = _task_payload(1, sample_file_data)
+
+    assert payload["content"] is None
+    assert read_spooled_content(payload["content_spool"]) == sample_file_data["content"]
+    assert spool_path(payload["content_spool"]).parent == settings.GOOGLE_DRIVE_SPOOL_DIR
+    spool_path(payload["content_spool"]).unlink()
+
+
+def test_spool_path_stays_in_spool_dir():
+    """A crafted filename can't escape the spool directory."""
+    assert spool_path("../../etc/passwd") == settings.GOOGLE_DRIVE_SPOOL_DIR / "passwd"
+
+
+@patch("memory.workers.tasks.google_drive._store_google_doc")
+def test_sync_google_doc_reads_and_removes_spool(mock_store, sample_file_data, db_session):
+    """The spooled body is handed to the sync and the file deleted afterwards."""
+    mock_store.return_value = {"status": "processed"}
+    sample_file_data["size"] = settings.GOOGLE_DRIVE_SPOOL_THRESHOLD + 1
+    payload = _task_payload(1, sample_file_data)
+
+    result = sync_google_doc(1, payload)
+
+    assert result == {"status": "processed"}
+    assert mock_store.call_args.args[1]["content"] == sample_file_data["content"]
+    assert not spool_path(payload["content_spool"]).exists()
+
+
+def test_sync_google_doc_missing_spool_is_noop(sample_file_data, db_session):
+    """A vanished spool file is skipped rather than failing the task."""
+    payload = {**_serialize_file_data(sample_file_data), "content": None}
+    payload["content_spool"] = "does-not-exist.txt"
+
+    assert sync_google_doc(1, payload) == {"status": "skipped", "reason": "spool_missing"}
@@ -1,8 +1,12 @@
 """Tests for meeting Celery tasks."""
 
+import json
+import re
+import threading
+import time
 import uuid
 from contextlib import contextmanager
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -869,6 +873,196 @@ def test_call_extraction_llm_uses_custom_prompts(mock_summarize):
     assert call_args[1]["model"] == "custom-model"
 
 
+def long_transcript(turns: int) -> str:
+    """A transcript of ``turns`` speaker turns, every tenth assigning a task."""
+    lines = []
+    for i in range(turns):
+        if i % 10 == 0:
+            lines.append(f"Alice: Bob, please handle task {i} by Friday.")
+        else:
+            lines.append(f"Bob: Talking about topic {i}. " + "More detail. " * 10)
+    return "\n".join(lines)
+
+
+class FakeExtractionProvider:
+    """Stand-in for the meeting model.
+
+    Extraction calls take ``seconds_per_kchar`` per thousand prompt
+    characters and report one action item per task assigned in the prompt;
+    summary merges report how many parts they merged. ``max_active`` is the
+    most calls that were ever in flight at once.
+    """
+
+    def __init__(self, seconds_per_kchar=0.002):
+        self.seconds_per_kchar = seconds_per_kchar
+        self.prompts = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def run_with_tools(self, messages, system_prompt=None, **kwargs):
+        prompt = messages[0].content[0].text
+        with self.lock:
+            self.prompts.append(prompt)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            time.sleep(len(prompt) / 1000 * self.seconds_per_kchar)
+        finally:
+            with self.lock:
+                self.active -= 1
+
+        if "Summaries of the meeting's parts" in prompt:
+            parts = len(re.findall(r"^Part \d+:", prompt, re.M))
+            return MagicMock(response=json.dumps({"summary": f"Merged {parts} parts"}))
+
+        tasks = re.findall(r"handle (task \d+)", prompt)
+        topics = re.findall(r"(topic \d+)", prompt)
+        return MagicMock(
+            response=json.dumps(
+                {
+                    "summary": f"Discussed {topics[0] if topics else 'nothing'}",
+                    "notes": "\n".join(f"- Discussed {t}" for t in topics),
+                    "action_items": [
+                        {"description": f"Handle {t}", "assignee": "Bob"}
+                        for t in tasks
+                    ],
+                }
+            )
+        )
+
+
+@pytest.fixture
+def fake_meeting_llm():
+    provider = FakeExtractionProvider()
+    with patch("memory.common.llms.create_provider", return_value=provider):
+        yield provider
+
+
+def test_split_transcript_short_is_one_segment():
+    assert meetings.split_transcript("Alice: Hi", 100, 10) == ["Alice: Hi"]
+    assert meetings.split_transcript("x " * 1000, 0, 10) == ["x " * 1000]
+
+
+def test_split_transcript_windows_overlap_between_lines():
+    transcript = long_transcript(200)
+
+    segments = meetings.split_transcript(transcript, 1000, 100)
+
+    assert len(segments) > 1
+    assert all(len(s) <= 1000 * 4 for s in segments)
+    # Every line is in some segment, and segments break between lines
+    lines = transcript.splitlines()
+    assert {line for s in segments for line in s.splitlines()} == set(lines)
+    for previous, segment in zip(segments, segments[1:]):
+        first_line = segment.splitlines()[0]
+        assert first_line in previous.splitlines()
+
+
+def test_split_transcript_splits_overlong_lines():
+    transcript = "Alice: " + "word " * 2000
+
+    segments = meetings.split_transcript(transcript, 500, 50)
+
+    assert len(segments) > 1
+    assert all(len(s) <= 500 * 4 for s in segments)
+    assert "".join(segments).count("word") >= 2000
+
+
+def test_merge_action_items_dedups_and_fills_fields():
+    merged = meetings.merge_action_items(
+        [
+            {"description": "Draft the proposal.", "assignee": None},
+            {"description": "Fix the bug", "assignee": "Bob"},
+            {"description": "draft the Proposal", "assignee": "Alice", "priority": "high"},
+            {"description": ""},
+        ]
+    )
+
+    assert merged == [
+        {"description": "Draft the proposal.", "assignee": "Alice", "priority": "high"},
+        {"description": "Fix the bug", "assignee": "Bob"},
+    ]
+
+
+def test_merge_notes_drops_repeated_lines():
+    assert meetings.merge_notes(["- A\n- B", "- b\n- C", ""]) == "- A\n- B\n- C"
+
+
+@patch("memory.workers.tasks.meetings.llms.summarize")
+def test_merge_extractions_falls_back_to_joined_summaries(mock_summarize):
+    mock_summarize.return_value = "not json"
+
+    merged = meetings.merge_extractions(
+        [{"summary": "First half."}, {"summary": "Second half."}], "model"
+    )
+
+    assert merged == {
+        "summary": "First half. Second half.",
+        "notes": "",
+        "action_items": [],
+    }
+
+
+def test_call_extraction_llm_segments_long_transcripts(fake_meeting_llm):
+    transcript = long_transcript(300)
+
+    with (
+        patch.object(meetings.settings, "MEETING_SEGMENT_TOKENS", 2000),
+        patch.object(meetings.settings, "MEETING_SEGMENT_OVERLAP_TOKENS", 200),
+    ):
+        result = meetings.call_extraction_llm(transcript)
+
+    segments = len(fake_meeting_llm.prompts) - 1
+    assert segments > 1
+    assert result["summary"] == f"Merged {segments} parts"
+    # Items seen by two overlapping segments are only reported once
+    assert [item["description"] for item in result["action_items"]] == [
+        f"Handle task {i}" for i in range(0, 300, 10)
+    ]
+    notes = result["notes"].splitlines()
+    assert len(notes) == len(set(notes)) == 270
+
+
+def test_call_extraction_llm_segment_failure_fails_extraction(fake_meeting_llm):
+    def fail_on_second_part(messages, **kwargs):
+        if "[Part 2 of" in messages[0].content[0].text:
+            raise RuntimeError("context window exceeded")
+        return FakeExtractionProvider.run_with_tools(
+            fake_meeting_llm, messages, **kwargs
+        )
+
+    with (
+        patch.object(meetings.settings, "MEETING_SEGMENT_TOKENS", 2000),
+        patch.object(fake_meeting_llm, "run_with_tools", fail_on_second_part),
+    ):
+        with pytest.raises(RuntimeError):
+            meetings.call_extraction_llm(long_transcript(300))
+
+
+def test_segmented_extraction_runs_segments_concurrently(fake_meeting_llm):
+    """Segments run concurrently, so a long meeting takes about as long as
+    its longest segment rather than the whole transcript."""
+    transcript = long_transcript(600)
+    fake_meeting_llm.seconds_per_kchar = 0.005
+
+    with patch.object(meetings.settings, "MEETING_SEGMENT_TOKENS", 0):
+        single = meetings.call_extraction_llm(transcript)
+    assert fake_meeting_llm.max_active == 1
+
+    with (
+        patch.object(meetings.settings, "MEETING_SEGMENT_TOKENS", 5000),
+        patch.object(meetings.settings, "MEETING_SEGMENT_OVERLAP_TOKENS", 200),
+        patch.object(meetings.settings, "MEETING_EXTRACTION_CONCURRENCY", 8),
+    ):
+        segmented = meetings.call_extraction_llm(transcript)
+
+    segments = len(fake_meeting_llm.prompts) - 2
+    assert segments >= 4
+    assert segmented["action_items"] == single["action_items"]
+    assert 1 < fake_meeting_llm.max_active <= 8
+
+
 # ============================================================================
 # Tests for process_meeting task
 # ============================================================================
@@ -2,7 +2,7 @@ import re
 import uuid
 from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, MagicMock, Mock, call, patch
 
 import pytest
 
@@ -452,7 +452,7 @@ def test_run_scheduled_tasks_with_due_tasks(mock_delay, db_session, sample_user)
     assert result["count"] == 2
     assert len(result["executions"]) == 2
 
-    # Verify execute_scheduled_task.delay was called for both executions
+    # Verify execute_scheduled_task was sent for both executions
     assert mock_delay.call_count == 2
 
 
@@ -965,7 +965,112 @@ def test_run_scheduled_tasks_recovers_stuck_pending_executions(
     # Verify the execution was re-dispatched (send_task called with its ID)
     from memory.common.celery_app import EXECUTE_SCHEDULED_TASK
 
-    mock_delay.assert_any_call(EXECUTE_SCHEDULED_TASK, args=[stuck_pending.id])
+    mock_delay.assert_any_call(
+        EXECUTE_SCHEDULED_TASK, args=[stuck_pending.id], producer=ANY
+    )
+
+
+def _bulk_schedules(db_session, user_id, count, due, now):
+    """Insert ``count`` notification tasks, the first ``due`` of them due."""
+    from sqlalchemy import insert
+
+    rows = [
+        {
+            "id": str(uuid.uuid4()),
+            "user_id": user_id,
+            "task_type": "notification",
+            "notification_channel": "discord",
+            "notification_target": "123456789",
+            "cron_expression": "*/10 * * * *" if i % 2 else None,
+            "next_scheduled_time": (
+                now - timedelta(minutes=due - i)
+                if i < due
+                else now + timedelta(minutes=i)
+            ),
+        }
+        for i in range(count)
+    ]
+    db_session.execute(insert(ScheduledTask), rows)
+    db_session.commit()
+    return rows
+
+
+@patch("memory.workers.tasks.scheduled_tasks.app.send_task")
+def test_run_scheduled_tasks_dispatches_in_batches(mock_send, db_session, sample_user):
+    """Each batch is committed before it is dispatched, earliest due first.
+
+    Every execution is its own message, but a batch shares one producer.
+    """
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    rows = _bulk_schedules(db_session, sample_user.id, count=10, due=5, now=now)
+    dispatched = []
+
+    def send(name, args, producer):
+        assert db_session.get(TaskExecution, args[0]) is not None
+        dispatched.append((args[0], producer))
+
+    mock_send.side_effect = send
+    with (
+        patch.object(scheduled_tasks.settings, "SCHEDULER_DISPATCH_BATCH_SIZE", 2),
+        patch.object(scheduled_tasks.app, "producer_or_acquire") as mock_producer,
+    ):
+        producers = [MagicMock() for _ in range(3)]
+        mock_producer.side_effect = producers
+        result = scheduled_tasks.run_scheduled_tasks()
+
+    assert result["count"] == 5
+    assert [execution_id for execution_id, _ in dispatched] == result["executions"]
+    batch_producers = [p.__enter__.return_value for p in producers]
+    assert [producer for _, producer in dispatched] == [
+        batch_producers[0],
+        batch_producers[0],
+        batch_producers[1],
+        batch_producers[1],
+        batch_producers[2],
+    ]
+    executions = {e.id: e.task_id for e in db_session.query(TaskExecution).all()}
+    assert [executions[i] for i in result["executions"]] == [
+        row["id"] for row in rows[:5]
+    ]
+
+
+@patch("memory.workers.tasks.scheduled_tasks.app.send_task")
+def test_run_scheduled_tasks_with_many_schedules(mock_send, db_session, sample_user):
+    """A tick over 50k schedules only claims and dispatches the due ones."""
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    _bulk_schedules(db_session, sample_user.id, count=50_000, due=200, now=now)
+
+    first = scheduled_tasks.run_scheduled_tasks()
+    idle = scheduled_tasks.run_scheduled_tasks()
+
+    assert first["count"] == 200
+    assert idle["count"] == 0
+    assert mock_send.call_count == 200
+    assert db_session.query(TaskExecution).count() == 200
+
+
+@patch("memory.workers.tasks.scheduled_tasks.app.send_task")
+def test_dispatch_executions_sends_each_over_one_producer(mock_send):
+    from memory.common.celery_app import EXECUTE_SCHEDULED_TASK
+
+    with patch.object(scheduled_tasks.app, "producer_or_acquire") as mock_producer:
+        scheduled_tasks.dispatch_executions(["a", "b", "c"])
+
+    mock_producer.assert_called_once()
+    producer = mock_producer.return_value.__enter__.return_value
+    assert mock_send.call_args_list == [
+        call(EXECUTE_SCHEDULED_TASK, args=[execution_id], producer=producer)
+        for execution_id in ["a", "b", "c"]
+    ]
+
+
+@patch("memory.workers.tasks.scheduled_tasks.app.send_task")
+def test_dispatch_executions_skips_empty_batch(mock_send):
+    with patch.object(scheduled_tasks.app, "producer_or_acquire") as mock_producer:
+        scheduled_tasks.dispatch_executions([])
+
+    mock_producer.assert_not_called()
+    mock_send.assert_not_called()
 
 
 # --- Claude session spawning tests ---